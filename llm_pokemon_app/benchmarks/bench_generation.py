@@ -0,0 +1,84 @@
+"""
+End-to-end benchmarks of get_response against stubbed LLMs: RAGModel with an
+in-process fake completions client (measuring everything but the network) and
+the deterministic LocalStubModel backend.
+"""
+
+import itertools
+from types import SimpleNamespace
+
+from llm_pokemon_app.benchmarks.bench_retrieval import QUESTIONS, retriever
+from llm_pokemon_app.benchmarks.harness import benchmark
+from llm_pokemon_app.src.models.local_stub_model import LocalStubModel
+from llm_pokemon_app.src.models.rag_model import RAGModel
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
+
+BATCH_SIZE = 64
+
+
+class StubCompletions:
+    """Answers chat completion requests in-process with a canned response."""
+
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Stubbed answer."))]
+    )
+
+    def create(self, **_request):
+        """
+        Return the canned completion.
+
+        Args:
+            **_request: The ignored request.
+
+        Returns:
+            SimpleNamespace: An object shaped like a chat completion.
+        """
+        return self.response
+
+
+def stubbed_rag_model(context, cache=None) -> RAGModel:
+    """
+    A RAGModel whose client never leaves the process.
+
+    Args:
+        context (BenchmarkContext): The benchmark context.
+        cache (ResponseCache): Optional response cache.
+
+    Returns:
+        RAGModel: The model.
+    """
+    model = RAGModel("benchmark-key", retriever(context), cache=cache)
+    model.client = SimpleNamespace(chat=SimpleNamespace(completions=StubCompletions()))
+    return model
+
+
+@benchmark("rag.get_response_stubbed")
+def rag_get_response(context):
+    """RAG get_response with retrieval and prompt building, no network."""
+    model = stubbed_rag_model(context)
+    questions = itertools.cycle(QUESTIONS)
+    return lambda: model.get_response(next(questions))
+
+
+@benchmark("rag.get_response_cached")
+def rag_get_response_cached(context):
+    """RAG get_response answered from the response cache."""
+    model = stubbed_rag_model(context, ResponseCache())
+    questions = itertools.cycle(QUESTIONS)
+    return lambda: model.get_response(next(questions))
+
+
+@benchmark("stub.get_response")
+def stub_get_response(context):
+    """LocalStubModel get_response."""
+    model = LocalStubModel(retriever(context))
+    questions = itertools.cycle(QUESTIONS)
+    return lambda: model.get_response(next(questions))
+
+
+@benchmark("stub.get_responses_batch")
+def stub_get_responses(context):
+    """LocalStubModel answering a batch of questions concurrently."""
+    model = LocalStubModel(retriever(context))
+    batch = list(itertools.islice(itertools.cycle(QUESTIONS), BATCH_SIZE))
+    return lambda: model.get_responses(batch)
@@ -0,0 +1,71 @@
+"""
+Benchmarks for PokemonDataLoader across file formats and the snapshot cache.
+"""
+
+import pandas as pd
+
+from llm_pokemon_app.benchmarks.harness import benchmark
+from llm_pokemon_app.src.data.chunked_dataset import build_retriever
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+
+# Small enough that even the x1 dataset streams in several chunks.
+CHUNK_ROWS = 4096
+
+
+def checked(load):
+    """
+    Verify a loader call succeeds before timing it.
+
+    The loaders report failures as strings, which would otherwise be timed
+    as a suspiciously fast success.
+
+    Args:
+        load (Callable[[], Any]): The loader call.
+
+    Returns:
+        Callable[[], Any]: The same call.
+
+    Raises:
+        ValueError: If the loader returns an error.
+    """
+    result = load()
+    if not isinstance(result, pd.DataFrame):
+        raise ValueError(result)
+    return load
+
+
+@benchmark("loader.load_csv")
+def load_csv(context):
+    """Parse the CSV."""
+    path = context.file("csv")
+    return checked(lambda: PokemonDataLoader.load_csv(path))
+
+
+@benchmark("loader.load_csv_cached")
+def load_csv_cached(context):
+    """Read the CSV through a warm snapshot."""
+    path = context.file("csv")
+    PokemonDataLoader.load_csv_cached(path, context.directory)
+    return checked(lambda: PokemonDataLoader.load_csv_cached(path, context.directory))
+
+
+@benchmark("loader.load_parquet")
+def load_parquet(context):
+    """Read the Parquet file."""
+    path = context.file("parquet")
+    return checked(lambda: PokemonDataLoader.load_parquet(path))
+
+
+# Excel I/O takes seconds per call even at the original size.
+@benchmark("loader.load_excel", scales=(1,))
+def load_excel(context):
+    """Read the Excel workbook."""
+    path = context.file("xlsx")
+    return checked(lambda: PokemonDataLoader.load_excel(path))
+
+
+@benchmark("loader.build_retriever_chunked")
+def build_retriever_chunked(context):
+    """Stream the CSV in chunks and build the retriever (compare load_csv + retriever.build)."""
+    path = context.file("csv")
+    return lambda: build_retriever(PokemonDataLoader.iter_chunks(path, CHUNK_ROWS))
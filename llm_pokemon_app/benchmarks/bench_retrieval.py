@@ -0,0 +1,128 @@
+"""
+Benchmarks for PokemonRetriever lookups and RAG context retrieval.
+"""
+
+import itertools
+
+from llm_pokemon_app.benchmarks.harness import benchmark
+from llm_pokemon_app.src.data.dataset_diff import diff_datasets
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.utils.query_router import QueryRouter
+from llm_pokemon_app.src.utils.team_search import DEFAULT_CANDIDATES
+
+QUESTIONS = (
+    "What is the highest DPS Pokémon?",
+    "What are Charizard's moves?",
+    "top 10 fire attackers",
+    "best dragon fast move",
+    "Does Garchomp learn Earthquake?",
+    "Which Pokémon know Hydro Cannon?",
+    "What are Mewtwo's moves?",
+    "What are Rayquaz moves?",
+    "What counters Dragonite?",
+)
+
+
+def retriever(context) -> PokemonRetriever:
+    """
+    The retriever of a scale, built once.
+
+    Args:
+        context (BenchmarkContext): The benchmark context.
+
+    Returns:
+        PokemonRetriever: The retriever.
+    """
+    return context.shared("retriever", lambda: PokemonRetriever(context.data))
+
+
+@benchmark("retriever.build")
+def build(context):
+    """Build every index of the retriever."""
+    return lambda: PokemonRetriever(context.data)
+
+
+@benchmark("retriever.patch")
+def patch(context):
+    """Diff a reload changing 1% of the rows and patch the retriever's indexes."""
+    instance = retriever(context)
+    data = context.data
+    start, stop = len(data) // 2, len(data) // 2 + max(len(data) // 100, 1)
+    # A contiguous block is updated and its last tenth deleted, as an edit of one region would.
+    edited = data.copy()
+    edited.iloc[start:stop, edited.columns.get_loc("FAST_MOVE_POWER")] += 1
+    edited = edited.drop(edited.index[stop - (stop - start) // 10:stop]).reset_index(drop=True)
+    return lambda: instance.patched(edited, diff_datasets(data, edited))
+
+
+@benchmark("retriever.retrieve_by_name")
+def retrieve_by_name(context):
+    """Substring name lookup."""
+    instance = retriever(context)
+    return lambda: instance.retrieve_by_name("charizard")
+
+
+@benchmark("retriever.retrieve_by_name_exact")
+def retrieve_by_name_exact(context):
+    """Exact name lookup."""
+    instance = retriever(context)
+    return lambda: instance.retrieve_by_name("Charizard", exact=True)
+
+
+@benchmark("retriever.retrieve_highest_dps")
+def retrieve_highest_dps(context):
+    """Highest-DPS lookup."""
+    instance = retriever(context)
+    return instance.retrieve_highest_dps
+
+
+@benchmark("retriever.retrieve_top_dps_filtered")
+def retrieve_top_dps_filtered(context):
+    """Filtered top-10 ranking."""
+    instance = retriever(context)
+    return lambda: instance.retrieve_top_dps(10, pokemon_type="fire")
+
+
+@benchmark("retriever.retrieve_lexical")
+def retrieve_lexical(context):
+    """BM25 search across the dataset."""
+    instance = retriever(context)
+    return lambda: instance.retrieve_lexical("hydro cannon water", 5)
+
+
+@benchmark("retriever.retrieve_counters")
+def retrieve_counters(context):
+    """Counters to a named Pokémon, with the matchup cached."""
+    instance = retriever(context)
+    return lambda: instance.retrieve_counters("Dragonite")
+
+
+@benchmark("matchups.evaluate")
+def evaluate_matchup(context):
+    """One uncached evaluation of every moveset against a dual typing."""
+    engine = retriever(context).matchups
+    # pylint: disable-next=protected-access
+    return lambda: engine._evaluate(engine.defender_key(("Dragon", "Flying")))
+
+
+@benchmark("energy_cycle.evaluate")
+def evaluate_energy_cycles(context):
+    """Cycle DPS, battle damage and energy rate of every moveset."""
+    simulator = retriever(context).matchups.cycles
+    return simulator.evaluate
+
+
+@benchmark("teams.search")
+def search_teams(context):
+    """Uncached top-3 team search over the default candidates, in this process."""
+    search = retriever(context).team_search
+    # pylint: disable-next=protected-access
+    return lambda: search._search(3, None, 1, DEFAULT_CANDIDATES)
+
+
+@benchmark("rag.retrieve_context")
+def retrieve_context(context):
+    """Routed retrieval over a mix of question types."""
+    router = QueryRouter(retriever(context))
+    questions = itertools.cycle(QUESTIONS)
+    return lambda: router.route(next(questions))
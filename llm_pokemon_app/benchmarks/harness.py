@@ -0,0 +1,278 @@
+"""
+This module provides a small benchmark harness with stored baselines.
+Benchmarks register a setup function per name; the setup receives a context
+(synthetic dataset at the requested scale, scratch directory) and returns the
+callable to time. Results are compared against a JSON baseline file and any
+benchmark slower than its baseline by more than the tolerance is a regression.
+"""
+
+import json
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+
+BENCHMARKS = {}
+DEFAULT_SCALES = (1, 10)
+# Scales of a full run; 100x takes several minutes, so it is not in the default run.
+FULL_SCALES = (1, 10, 100)
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_TOLERANCE = 0.5
+# Differences below this many milliseconds are treated as noise.
+DEFAULT_FLOOR_MS = 0.05
+NUMERIC_JITTER_COLUMNS = ("FAST_MOVE_POWER", "CHARGE_MOVE_POWER")
+
+
+def benchmark(name: str, scales: tuple = None):
+    """
+    Register a benchmark setup function.
+
+    Args:
+        name (str): Benchmark name, e.g. "retriever.retrieve_by_name".
+        scales (tuple): Dataset scales the benchmark runs at (defaults to all
+            requested scales).
+
+    Returns:
+        Callable: A decorator registering ``setup(context) -> Callable[[], Any]``.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, scales)
+        return setup
+    return register
+
+
+def synthetic_dataset(base: pd.DataFrame, scale: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Scale a dataset up by cloning its Pokémon under new names.
+
+    Clone ``k`` renames every Pokémon to "<name> Clone k" and jitters move
+    power by up to ±10%, so name indexes, rankings and text indexes grow
+    like a real dataset would rather than repeating identical rows.
+
+    Args:
+        base (pd.DataFrame): The original dataset.
+        scale (int): Number of copies (1 returns a copy of the base).
+        seed (int): Seed for the numeric jitter.
+
+    Returns:
+        pd.DataFrame: The scaled dataset.
+    """
+    rng = np.random.default_rng(seed)
+    frames = [base]
+    for copy in range(1, scale):
+        frame = base.assign(NAME=base["NAME"].astype(str) + f" Clone {copy}")
+        for column in NUMERIC_JITTER_COLUMNS:
+            if column in frame.columns:
+                frame[column] = frame[column] * rng.uniform(0.9, 1.1, len(frame))
+        frames.append(frame)
+    # Restore the loader's dtypes, which renaming and jitter widen.
+    return PokemonDataLoader.apply_schema(pd.concat(frames, ignore_index=True))
+
+
+class BenchmarkContext:
+    """
+    Resources shared by the benchmarks of one scale.
+
+    Files derived from the dataset are written on first request and reused.
+    """
+
+    def __init__(self, data: pd.DataFrame, scale: int, directory: str):
+        """
+        Initialize the context.
+
+        Args:
+            data (pd.DataFrame): The dataset at this scale.
+            scale (int): The scale factor.
+            directory (str): Scratch directory for generated files.
+        """
+        self.data = data
+        self.scale = scale
+        self.directory = directory
+        self._files = {}
+        self._shared = {}
+
+    def shared(self, key: str, factory):
+        """
+        Build a resource once per scale (e.g. a retriever) and reuse it.
+
+        Args:
+            key (str): Identifies the resource.
+            factory (Callable[[], Any]): Creates the resource.
+
+        Returns:
+            Any: The resource.
+        """
+        if key not in self._shared:
+            self._shared[key] = factory()
+        return self._shared[key]
+
+    def file(self, extension: str) -> str:
+        """
+        Write the dataset in a format once and return its path.
+
+        Args:
+            extension (str): "csv", "parquet" or "xlsx".
+
+        Returns:
+            str: Path of the written file.
+        """
+        if extension not in self._files:
+            path = os.path.join(self.directory, f"pokemon_x{self.scale}.{extension}")
+            if extension == "csv":
+                self.data.to_csv(path, index=False)
+            elif extension == "parquet":
+                self.data.to_parquet(path, index=False)
+            else:
+                self.data.to_excel(path, index=False)
+            self._files[extension] = path
+        return self._files[extension]
+
+
+def measure(function, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> dict:
+    """
+    Time a callable, calibrating the loop count like ``timeit.autorange``.
+
+    Args:
+        function (Callable[[], Any]): The code to time.
+        repeat (int): Number of timed rounds.
+        min_time (float): Minimum seconds per round.
+
+    Returns:
+        dict: Per-call milliseconds (min, median, mean), the loop count and rounds.
+    """
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - started) / number)
+    return {
+        "min_ms": round(min(samples) * 1000, 6),
+        "median_ms": round(statistics.median(samples) * 1000, 6),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 6),
+        "number": number,
+        "rounds": repeat,
+    }
+
+
+def result_key(name: str, scale: int) -> str:
+    """
+    Build the result/baseline key of a benchmark at a scale.
+
+    Args:
+        name (str): The benchmark name.
+        scale (int): The scale factor.
+
+    Returns:
+        str: The key, e.g. "retriever.build[x10]".
+    """
+    return f"{name}[x{scale}]"
+
+
+def run_benchmarks(base: pd.DataFrame, scales=DEFAULT_SCALES, names=None,
+                   repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME,
+                   report=None) -> dict:
+    """
+    Run registered benchmarks at each scale.
+
+    Args:
+        base (pd.DataFrame): The dataset scaled for each run.
+        scales (Iterable[int]): Scale factors.
+        names (Iterable[str]): Substrings selecting benchmarks (all if None).
+        repeat (int): Timed rounds per benchmark.
+        min_time (float): Minimum seconds per round.
+        report (Callable[[str, dict], None]): Called with each result as it completes.
+
+    Returns:
+        dict: Results keyed by ``result_key``.
+    """
+    selected = {
+        name: entry for name, entry in BENCHMARKS.items()
+        if not names or any(pattern in name for pattern in names)
+    }
+    results = {}
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as directory:
+            context = BenchmarkContext(synthetic_dataset(base, scale), scale, directory)
+            for name, (setup, benchmark_scales) in selected.items():
+                if benchmark_scales is not None and scale not in benchmark_scales:
+                    continue
+                stats = measure(setup(context), repeat, min_time)
+                stats["rows"] = len(context.data)
+                results[result_key(name, scale)] = stats
+                if report is not None:
+                    report(result_key(name, scale), stats)
+    return results
+
+
+def load_baselines(path: str) -> dict:
+    """
+    Read stored baselines.
+
+    Args:
+        path (str): The baseline JSON file.
+
+    Returns:
+        dict: Baselines keyed by ``result_key``; empty if the file is missing.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save_baselines(path: str, results: dict, baselines: dict = None):
+    """
+    Store results as baselines, keeping baselines of benchmarks not rerun.
+
+    Args:
+        path (str): The baseline JSON file.
+        results (dict): New results keyed by ``result_key``.
+        baselines (dict): Existing baselines to merge into.
+    """
+    merged = dict(baselines or {})
+    merged.update({key: {"median_ms": stats["median_ms"]} for key, stats in results.items()})
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(dict(sorted(merged.items())), handle, indent=2)
+        handle.write("\n")
+
+
+def compare(results: dict, baselines: dict, tolerance: float = DEFAULT_TOLERANCE,
+            floor_ms: float = DEFAULT_FLOOR_MS) -> list:
+    """
+    Find benchmarks slower than their baseline beyond the tolerance.
+
+    Args:
+        results (dict): Results keyed by ``result_key``.
+        baselines (dict): Baselines keyed by ``result_key``.
+        tolerance (float): Allowed relative slowdown (0.5 = 50%).
+        floor_ms (float): Allowed absolute slowdown, for very fast benchmarks.
+
+    Returns:
+        list: ``(key, baseline_ms, current_ms)`` tuples for each regression.
+    """
+    regressions = []
+    for key, stats in results.items():
+        baseline = baselines.get(key)
+        if baseline is None:
+            continue
+        allowed = max(baseline["median_ms"] * (1 + tolerance), baseline["median_ms"] + floor_ms)
+        if stats["median_ms"] > allowed:
+            regressions.append((key, baseline["median_ms"], stats["median_ms"]))
+    return regressions
@@ -0,0 +1,187 @@
+"""
+A closed-loop load test of the HTTP API against the offline stub backend.
+
+Starts ``llm_pokemon_app.src.server`` with the given number of worker processes
+(or targets a running server with ``--url``), keeps ``--concurrency`` requests
+in flight for ``--duration`` seconds and reports throughput, throughput per
+worker and latency percentiles. The stub answers without a network call, so
+the numbers measure the serving stack: HTTP, admission, retrieval and routing.
+
+Usage:
+    python -m llm_pokemon_app.benchmarks.load_test --workers 2 --concurrency 32 --duration 10
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+from llm_pokemon_app.benchmarks.bench_retrieval import QUESTIONS
+
+STARTUP_TIMEOUT_S = 120.0
+
+
+def free_port() -> int:
+    """
+    Find a free local TCP port.
+
+    Returns:
+        int: The port.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(port: int, workers: int, extra_args: list = ()) -> subprocess.Popen:
+    """
+    Start the API server in a subprocess with the stub backend preloaded.
+
+    Args:
+        port (int): The port to serve on.
+        workers (int): Worker processes.
+        extra_args (list): Additional server arguments.
+
+    Returns:
+        subprocess.Popen: The server process.
+    """
+    command = [
+        sys.executable, "-m", "llm_pokemon_app.src.server", "--port", str(port),
+        "--workers", str(workers), "--preload", "stub", *extra_args,
+    ]
+    return subprocess.Popen(command)  # pylint: disable=consider-using-with
+
+
+def wait_until_ready(url: str, workers: int, timeout_s: float = STARTUP_TIMEOUT_S):
+    """
+    Wait until the server answers health checks from every worker.
+
+    Args:
+        url (str): The server's base URL.
+        workers (int): Worker processes expected to answer.
+        timeout_s (float): Seconds to wait.
+
+    Raises:
+        TimeoutError: If the workers are not ready in time.
+    """
+    deadline = time.monotonic() + timeout_s
+    seen = set()
+    while time.monotonic() < deadline:
+        try:
+            # Connections are not reused, so the kernel spreads them over workers.
+            seen.add(httpx.get(f"{url}/health", timeout=1.0).json()["pid"])
+            if len(seen) >= workers:
+                return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise TimeoutError(f"server at {url} did not start in {timeout_s:.0f}s")
+
+
+async def run_load(url: str, concurrency: int, duration_s: float, model: str = "stub") -> dict:
+    """
+    Keep ``concurrency`` requests in flight against ``/v1/ask`` for a while.
+
+    Args:
+        url (str): The server's base URL.
+        concurrency (int): Requests in flight.
+        duration_s (float): Seconds to run.
+        model (str): The backend to ask.
+
+    Returns:
+        dict: Request counts by status, throughput and latency percentiles.
+    """
+    latencies = []
+    statuses = collections.Counter()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60.0) as client:
+        started = time.perf_counter()
+        deadline = started + duration_s
+
+        async def user(offset: int):
+            position = offset
+            while time.perf_counter() < deadline:
+                question = QUESTIONS[position % len(QUESTIONS)]
+                position += concurrency
+                sent = time.perf_counter()
+                response = await client.post("/v1/ask", json={"question": question,
+                                                               "model": model})
+                statuses[response.status_code] += 1
+                if response.status_code == 200:
+                    latencies.append((time.perf_counter() - sent) * 1000)
+
+        await asyncio.gather(*(user(offset) for offset in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "requests": sum(statuses.values()),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_second": round(statuses[200] / elapsed, 1),
+        "p50_ms": round(quantiles[49], 3),
+        "p95_ms": round(quantiles[94], 3),
+        "p99_ms": round(quantiles[98], 3),
+    }
+
+
+def main(argv: list = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv).
+
+    Returns:
+        int: Exit status; 1 if no request succeeded.
+    """
+    parser = argparse.ArgumentParser(description="Load-test the API with the stub backend.")
+    parser.add_argument("--url", default=None, help="target a running server instead")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="server worker processes (ignored with --url)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds of unmeasured load")
+    parser.add_argument("--max-queue", type=int, default=None,
+                        help="server queue bound, to observe 429s (ignored with --url)")
+    args = parser.parse_args(argv)
+
+    server = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        extra = ["--max-queue", str(args.max_queue)] if args.max_queue is not None else []
+        server = start_server(port, args.workers, extra)
+    try:
+        wait_until_ready(url, 1 if args.url else args.workers)
+        if args.warmup > 0:
+            asyncio.run(run_load(url, args.concurrency, args.warmup))
+        summary = asyncio.run(run_load(url, args.concurrency, args.duration))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    workers = None if args.url else args.workers
+    summary.update({
+        "workers": workers,
+        "concurrency": args.concurrency,
+        "cpu_count": os.cpu_count(),
+        "requests_per_second_per_worker": (
+            round(summary["requests_per_second"] / workers, 1) if workers else None
+        ),
+    })
+    print(json.dumps(summary, indent=2))
+    return 0 if summary["statuses"].get("200") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
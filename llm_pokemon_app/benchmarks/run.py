@@ -0,0 +1,91 @@
+"""
+Command-line runner for the benchmark suite.
+
+Usage:
+    python -m llm_pokemon_app.benchmarks.run                   # compare with baselines
+    python -m llm_pokemon_app.benchmarks.run --full            # also at 100x (minutes)
+    python -m llm_pokemon_app.benchmarks.run --scales 1 10 100 --filter retriever
+    python -m llm_pokemon_app.benchmarks.run --update-baseline  # store new baselines
+
+Exits with status 1 when a benchmark regresses beyond the tolerance.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+
+from llm_pokemon_app.benchmarks.harness import (
+    DEFAULT_REPEAT, DEFAULT_SCALES, DEFAULT_TOLERANCE, FULL_SCALES, compare, load_baselines,
+    run_benchmarks, save_baselines,
+)
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+
+BENCHMARK_MODULES = (
+    "llm_pokemon_app.benchmarks.bench_loading",
+    "llm_pokemon_app.benchmarks.bench_retrieval",
+    "llm_pokemon_app.benchmarks.bench_generation",
+)
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DATASET_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src", "excel_files", "final_pokemon_dataset.csv",
+)
+
+
+def main(argv: list = None) -> int:
+    """
+    Run the benchmarks and compare them with the stored baselines.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv).
+
+    Returns:
+        int: Exit status; 1 if any benchmark regressed.
+    """
+    parser = argparse.ArgumentParser(description="Run the Pokémon Go app benchmarks.")
+    parser.add_argument("--scales", type=int, nargs="+", default=None,
+                        help=f"scale factors (default: {' '.join(map(str, DEFAULT_SCALES))})")
+    parser.add_argument("--full", action="store_true",
+                        help=f"run at scales {' '.join(map(str, FULL_SCALES))}; the 100x "
+                             "copy takes several minutes")
+    parser.add_argument("--filter", nargs="*", default=None,
+                        help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown before failing (0.5 = 50%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--dataset", default=DATASET_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+    if args.scales is None:
+        args.scales = list(FULL_SCALES if args.full else DEFAULT_SCALES)
+
+    for module in BENCHMARK_MODULES:
+        importlib.import_module(module)
+    base = PokemonDataLoader.load_csv(args.dataset)
+    if isinstance(base, str):
+        parser.error(base)
+
+    baselines = load_baselines(args.baseline)
+
+    def report(key, stats):
+        baseline = baselines.get(key, {}).get("median_ms")
+        change = f"{stats['median_ms'] / baseline - 1:+.0%}" if baseline else "new"
+        print(f"{key:48} {stats['median_ms']:12.4f} ms  {change:>6}  ({stats['rows']} rows)")
+
+    results = run_benchmarks(base, args.scales, args.filter, args.repeat, report=report)
+    if args.update_baseline:
+        save_baselines(args.baseline, results, baselines)
+        print(f"Baselines written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baselines, args.tolerance)
+    for key, baseline_ms, current_ms in regressions:
+        print(f"REGRESSION {key}: {current_ms:.4f} ms vs baseline {baseline_ms:.4f} ms",
+              file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
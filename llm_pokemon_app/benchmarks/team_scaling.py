@@ -0,0 +1,89 @@
+"""
+Scaling of the parallel team search with the number of worker processes.
+
+Runs the same uncached search with 1, 2, ... worker processes and reports the
+wall time and speedup of each. Results are identical for every worker count;
+the script checks this too.
+
+Usage:
+    python -m llm_pokemon_app.benchmarks.team_scaling --workers 1 2 4 --candidates 400
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from llm_pokemon_app.benchmarks.run import DATASET_PATH
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.utils.team_search import TeamSearch
+
+
+def time_search(search: TeamSearch, workers: int, candidates: int, top_n: int,
+                repeat: int) -> tuple:
+    """
+    Time an uncached search.
+
+    Args:
+        search (TeamSearch): The search.
+        workers (int): Worker processes.
+        candidates (int): Species considered.
+        top_n (int): Teams to find.
+        repeat (int): Runs; the fastest counts.
+
+    Returns:
+        tuple: ``(seconds, scores)`` of the fastest run.
+    """
+    runs = []
+    for _ in range(max(repeat, 1)):
+        started = time.perf_counter()
+        # pylint: disable-next=protected-access
+        teams = search._search(top_n, None, workers, candidates)
+        runs.append((time.perf_counter() - started, [team["SCORE"] for team in teams]))
+    return min(runs, key=lambda run: run[0])
+
+
+def main(argv: list = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv).
+
+    Returns:
+        int: Exit status; 1 if worker counts disagree on the result.
+    """
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Measure team search scaling across cores.")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, max(cpus // 2, 1), cpus}))
+    parser.add_argument("--candidates", type=int, default=400)
+    parser.add_argument("--top-n", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--dataset", default=DATASET_PATH)
+    args = parser.parse_args(argv)
+
+    data = PokemonDataLoader.load_csv(args.dataset)
+    if isinstance(data, str):
+        print(data, file=sys.stderr)
+        return 1
+    search = PokemonRetriever(data).team_search
+
+    runs = []
+    for workers in args.workers:
+        seconds, scores = time_search(search, workers, args.candidates, args.top_n, args.repeat)
+        runs.append({"workers": workers, "seconds": round(seconds, 4), "scores": scores})
+    for run in runs:
+        run["speedup"] = round(runs[0]["seconds"] / run["seconds"], 2)
+    consistent = all(run["scores"] == runs[0]["scores"] for run in runs)
+    print(json.dumps({
+        "candidates": args.candidates, "cpu_count": cpus, "consistent": consistent,
+        "runs": runs,
+    }, indent=2))
+    return 0 if consistent else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,11 +10,56 @@ import streamlit as st # type: ignore
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 
-from llm_pokemon_app.src.models.rag_model import RAGModel
-from llm_pokemon_app.src.models.openai_model import OpenAIModel
-from llm_pokemon_app.src.models.huggingface_model import HuggingFaceModel
-from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
-from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.models.backends import (
+    API_KEY_HUGGINGFACE, API_KEY_OPENAI, BACKENDS, get_backend,
+)
+from llm_pokemon_app.src.resources import DATASET_PATH, build_response_cache, build_retriever
+from llm_pokemon_app.src.utils.metrics import METRICS, serve_metrics
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
+from llm_pokemon_app.src.utils.streaming import TimedStream
+
+RETRIEVER_KEY = ("retriever", DATASET_PATH)
+RESPONSE_CACHE_KEY = ("response-cache",)
+# Port for the Prometheus scrape endpoint when POKEMON_METRICS is enabled.
+METRICS_PORT_ENV = "POKEMON_METRICS_PORT"
+
+
+# Model backends pull in openai and transformers/torch; they are imported on
+# first use so a cold start only pays for streamlit. Backend classes are
+# resolved through BACKENDS when accessed, so backends registered after this
+# module is imported are found too.
+def __getattr__(name: str):
+    """
+    Import a registered backend's class on first access (PEP 562).
+
+    Args:
+        name (str): The attribute name.
+
+    Returns:
+        Any: The backend class, cached as a module global.
+
+    Raises:
+        AttributeError: If no registered backend has this class name.
+    """
+    spec = next((spec for spec in BACKENDS.values() if spec.class_name == name), None)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = spec.load()
+    globals()[name] = value
+    return value
+
+
+def lazy(name: str):
+    """
+    Resolve a lazily imported name through the module, honouring patches.
+
+    Args:
+        name (str): A registered backend's class name.
+
+    Returns:
+        Any: The imported (or patched) object.
+    """
+    return getattr(sys.modules[__name__], name)
 
 
 class LLMApp:
@@ -34,19 +79,32 @@ class LLMApp:
     @staticmethod
     def build_retriever():
         """
-        Build and store the retriever (run once for RAG model).
-        This method loads Pokémon Go data from a CSV and initializes the PokémonRetriever.
+        Build the retriever (run once per process for the RAG model, see RETRIEVER_KEY).
+        This method loads Pokémon Go data from a CSV (through its cached snapshot)
+        and initializes the PokémonRetriever. When the POKEMON_SHARED_DATASET
+        environment variable is set, the snapshot is memory-mapped and shared
+        with other worker processes instead.
         """
-        data_loader = PokemonDataLoader()
-        pokemon_data = data_loader.load_csv(
-            "src/excel_files/final_pokemon_dataset.csv"
-        )  # Path to your CSV
-        return PokemonRetriever(pokemon_data)
+        return build_retriever(DATASET_PATH)
+
+    @staticmethod
+    def build_response_cache():
+        """
+        Build the response cache shared by the OpenAI and RAG models.
+        When the POKEMON_RESPONSE_CACHE environment variable names a SQLite
+        file, cached answers also persist across restarts and processes.
+        """
+        return build_response_cache()
 
     def main(self):
         """Main method to run the Streamlit app."""
         st.title("Pokémon Go LLM App")
 
+        metrics_port = os.environ.get(METRICS_PORT_ENV)
+        if METRICS.enabled and metrics_port:
+            REGISTRY.get_or_create(("metrics-server", metrics_port),
+                                   lambda: serve_metrics(int(metrics_port)))
+
         # Secure input for API keys
         self.openai_api_key = st.text_input(
             "Enter your OpenAI API Key:", type="password"
@@ -55,35 +113,74 @@ class LLMApp:
             "Enter your Hugging Face API Key:", type="password"
         )
 
-        # Select between models
+        # Select between the registered model backends
         self.model_choice = st.selectbox(
-            "Choose Model", ["OpenAI", "Hugging Face", "RAG with Pokémon Data"]
+            "Choose Model", [spec.label for spec in BACKENDS.values() if spec.selectable]
         )
 
+        # Drop the cached retriever so the next RAG answer reloads the dataset
+        if st.sidebar.button("Reload Pokémon data"):
+            REGISTRY.invalidate(RETRIEVER_KEY)
+
         # Question input
         question = st.text_input("Ask a question about Pokémon Go:")
+        stream = st.checkbox("Stream the response as it is generated")
 
         # Handle model choices and run the respective model
         if st.button("Get Answer") and question:
-            if self.model_choice == "OpenAI" and self.openai_api_key:
-                model = OpenAIModel(self.openai_api_key)
-                response = model.get_response(question)
-            elif self.model_choice == "Hugging Face" and self.huggingface_api_key:
-                model = HuggingFaceModel(self.huggingface_api_key)
-                response = model.get_response(question)
-            elif self.model_choice == "RAG with Pokémon Data" and self.openai_api_key:
-                # Build the retriever once
-                if self.retriever is None:
-                    self.retriever = self.build_retriever()
-
-                # Use RAG model with the retriever
-                model = RAGModel(self.openai_api_key, self.retriever)
-                response = model.get_response(question)
+            model = self.create_model()
+            if model is None:
+                st.write("Response:", "Please provide a valid API key and choose a model.")
+            elif stream:
+                self.render_stream(model, question)
             else:
-                response = "Please provide a valid API key and choose a model."
+                st.write("Response:", model.get_response(question))
+
+    def create_model(self):
+        """
+        Create the selected backend with the resources it declares.
 
-            st.write("Response:", response)
+        Returns:
+            ModelBackend | None: The model, or None if the choice is unknown
+            or its API key is missing.
+        """
+        try:
+            spec = get_backend(self.model_choice)
+        except ValueError:
+            return None
+        api_key = {
+            API_KEY_OPENAI: self.openai_api_key,
+            API_KEY_HUGGINGFACE: self.huggingface_api_key,
+        }.get(spec.api_key)
+        if spec.api_key and not api_key:
+            return None
+
+        # Build the retriever once per process; it survives script reruns
+        if spec.needs_retriever and self.retriever is None:
+            self.retriever = REGISTRY.get_or_create(RETRIEVER_KEY, self.build_retriever)
+        cache = (
+            REGISTRY.get_or_create(RESPONSE_CACHE_KEY, self.build_response_cache)
+            if spec.uses_cache else None
+        )
+        return spec.create(lazy(spec.class_name), api_key, self.retriever, cache)
 
+    @staticmethod
+    def render_stream(model, question: str):
+        """
+        Render a model's response incrementally and report its latency.
+
+        Args:
+            model (ModelBackend): The chosen model.
+            question (str): The user's question.
+        """
+        st.write("Response:")
+        timed = TimedStream(model.stream_response(question))
+        st.write_stream(timed)
+        if timed.first_token_ms is not None:
+            st.caption(
+                f"Time to first token: {timed.first_token_ms:.0f} ms "
+                f"(complete after {timed.total_ms:.0f} ms)"
+            )
 
 if __name__ == "__main__":
     app = LLMApp()
@@ -0,0 +1,214 @@
+"""
+This module provides a batch mode for answering many Pokémon Go questions offline,
+e.g. for evaluation runs. Questions are read from a JSONL or CSV file, identical
+prompts are deduplicated, retrieval runs for all of them in one pass, and
+generation is dispatched with bounded concurrency and an optional rate limit.
+Results are streamed to a JSONL file as they complete, with per-item timings.
+
+Usage:
+    python -m llm_pokemon_app.src.batch questions.jsonl -o answers.jsonl --model rag
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+
+from llm_pokemon_app.src.models.backends import BACKENDS, get_backend
+from llm_pokemon_app.src.resources import API_KEY_ENV, DATASET_PATH, build_retriever
+from llm_pokemon_app.src.utils.concurrency import RateLimiter, gather_bounded
+from llm_pokemon_app.src.utils.metrics import METRICS
+from llm_pokemon_app.src.utils.response_cache import ResponseCache, normalize_prompt
+
+DEFAULT_CONCURRENCY = 8
+
+def read_questions(path: str) -> list:
+    """
+    Read questions from a JSONL or CSV file.
+
+    JSONL lines are either objects with a "question" (and optional "id") field
+    or bare JSON strings. CSV files need a "question" column and may have an
+    "id" column. Items without an id are numbered by position.
+
+    Args:
+        path (str): The input file.
+
+    Returns:
+        list: Dicts with "id" and "question" keys.
+
+    Raises:
+        ValueError: If the file type is unsupported or an item has no question.
+    """
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as handle:
+            rows = [json.loads(line) for line in handle if line.strip()]
+        rows = [row if isinstance(row, dict) else {"question": row} for row in rows]
+    elif path.endswith(".csv"):
+        with open(path, encoding="utf-8", newline="") as handle:
+            rows = list(csv.DictReader(handle))
+    else:
+        raise ValueError(f"Unsupported question file (expected .jsonl or .csv): {path}")
+
+    items = []
+    for position, row in enumerate(rows):
+        question = row.get("question")
+        if not question:
+            raise ValueError(f"Item {position} has no question")
+        items.append({"id": row.get("id", position), "question": question})
+    return items
+
+
+async def run_batch(model, items: list, output, max_concurrency: int = DEFAULT_CONCURRENCY,
+                    limiter: RateLimiter = None) -> dict:
+    """
+    Answer a batch of questions and stream one JSON line per item to ``output``.
+
+    Items whose prompts normalize to the same text share one generation.
+    Models that retrieve (RAG) retrieve every context in one pass through
+    ``retrieve_contexts`` before generation starts. A generation that raises (e.g. an API or rate
+    limit error) is written as an ``error`` record and counted in the summary;
+    the other items still run.
+
+    Args:
+        model (ModelBackend): The model answering the questions.
+        items (list): Dicts with "id" and "question" keys.
+        output (TextIO): Where result lines are written, in completion order.
+        max_concurrency (int): Maximum number of generations in flight.
+        limiter (RateLimiter): Optional limit on generations started per second.
+
+    Returns:
+        dict: Run summary with counts and timings.
+    """
+    started = time.perf_counter()
+    groups = {}
+    for item in items:
+        groups.setdefault(normalize_prompt(str(item["question"])), []).append(item)
+    groups = list(groups.values())
+    prompts = [group[0]["question"] for group in groups]
+
+    retrieval_started = time.perf_counter()
+    contexts = model.retrieve_contexts(prompts)
+    retrieval_ms = (time.perf_counter() - retrieval_started) * 1000
+    errors = 0
+
+    async def answer(position: int):
+        nonlocal errors
+        if limiter is not None:
+            await limiter.acquire()
+        generation_started = time.perf_counter()
+        result = {}
+        try:
+            result["answer"] = await model.agenerate(prompts[position], contexts[position])
+        except Exception as error:  # pylint: disable=broad-except
+            result["error"] = f"{type(error).__name__}: {error}"
+        finished = time.perf_counter()
+        response = result.get("answer")
+        if response is None or str(response).startswith("Error:"):
+            errors += len(groups[position])
+        for duplicate, item in enumerate(groups[position]):
+            record = {
+                "id": item["id"],
+                "question": item["question"],
+                **result,
+                "deduplicated": duplicate > 0,
+                "queue_ms": round((generation_started - started) * 1000, 3),
+                "generation_ms": round((finished - generation_started) * 1000, 3),
+            }
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+
+    await gather_bounded(answer, range(len(prompts)), max_concurrency)
+    elapsed = time.perf_counter() - started
+    return {
+        "items": len(items),
+        "unique_prompts": len(prompts),
+        "errors": errors,
+        "retrieval_ms": round(retrieval_ms, 3),
+        "elapsed_s": round(elapsed, 3),
+        "items_per_second": round(len(items) / elapsed, 3) if elapsed else 0.0,
+    }
+
+
+def build_model(model_name: str, api_key: str = None, dataset_path: str = DATASET_PATH,
+                cache: ResponseCache = None, chunk_rows: int = None):
+    """
+    Build a registered model backend for a batch run.
+
+    Args:
+        model_name (str): The backend name, e.g. "rag", "openai" or "stub".
+        api_key (str): The API key, for backends that need one.
+        dataset_path (str): Dataset for backends that need a retriever.
+        cache (ResponseCache): Optional response cache.
+        chunk_rows (int): Stream the dataset in chunks of this many rows instead
+            of loading it whole, for datasets too large to parse at once.
+            Whole CSV files are loaded through the snapshot cache; Parquet and
+            Excel files are loaded directly.
+
+    Returns:
+        ModelBackend: The model.
+
+    Raises:
+        ValueError: If the backend is unknown, the dataset has an unsupported
+            file type or it cannot be loaded.
+    """
+    spec = get_backend(model_name)
+    retriever = build_retriever(dataset_path, chunk_rows) if spec.needs_retriever else None
+    return spec.create(api_key=api_key, retriever=retriever, cache=cache)
+
+
+def main(argv: list = None) -> int:
+    """
+    Command-line entry point. API keys are read from OPENAI_API_KEY or
+    HUGGINGFACE_API_KEY, depending on the backend.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv).
+
+    Returns:
+        int: Exit status; 1 if any item failed.
+    """
+    parser = argparse.ArgumentParser(description="Answer a file of Pokémon Go questions.")
+    parser.add_argument("questions", help="JSONL or CSV file of questions")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file for the answers")
+    parser.add_argument("--model", choices=sorted(BACKENDS), default="rag")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=None,
+                        help="maximum requests started per second")
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--dataset", default=DATASET_PATH)
+    parser.add_argument("--chunk-rows", type=int, default=None,
+                        help="stream the dataset (CSV, Parquet or Excel) in chunks of this size")
+    parser.add_argument("--cache-db", default=None,
+                        help="SQLite response cache shared across runs")
+    parser.add_argument("--metrics", default=None,
+                        help="record per-stage metrics and write them to this JSON file")
+    args = parser.parse_args(argv)
+    if args.metrics:
+        METRICS.enable()
+
+    key_env = API_KEY_ENV.get(get_backend(args.model).api_key)
+    api_key = os.environ.get(key_env) if key_env else None
+    if key_env and not api_key:
+        parser.error(f"{key_env} is not set")
+    try:
+        items = read_questions(args.questions)
+        cache = ResponseCache(sqlite_path=args.cache_db) if args.cache_db else None
+        model = build_model(args.model, api_key, args.dataset, cache, args.chunk_rows)
+        limiter = RateLimiter(args.rate, args.burst) if args.rate else None
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        summary = asyncio.run(run_batch(model, items, output, args.concurrency, limiter))
+    print(json.dumps(summary), file=sys.stderr)
+    if args.metrics:
+        with open(args.metrics, "w", encoding="utf-8") as handle:
+            handle.write(METRICS.to_json())
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+This module provides incremental assembly of a Pokémon Go dataset from chunks.
+Each chunk streamed by ``PokemonDataLoader.iter_chunks`` is reduced to its compact
+typed columns, per-row move DPS and BM25 term counts as it arrives; combining the
+chunks merges the categorical dictionaries instead of re-parsing any text. Parsing
+and text indexing hold a single chunk at a time, whatever the size of the source
+file; the compact dataset and its indexes still have to fit in memory.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from llm_pokemon_app.src.utils.bm25 import BM25Builder
+from llm_pokemon_app.src.utils.langchain_helpers import (
+    LEXICAL_COLUMNS, PokemonRetriever, build_dps_index, compute_move_dps,
+)
+
+
+class ChunkedDatasetBuilder:
+    """
+    Accumulates dataset chunks into one typed DataFrame, its DPS index and its
+    BM25 index.
+    """
+
+    def __init__(self):
+        """Initialize an empty builder."""
+        self.columns = None
+        self.rows = 0
+        self._parts = {}
+        self._fast_dps = []
+        self._charge_dps = []
+        self._lexical = BM25Builder(LEXICAL_COLUMNS)
+
+    def add(self, chunk: pd.DataFrame):
+        """
+        Add a chunk.
+
+        Args:
+            chunk (pd.DataFrame): Rows with the dataset schema.
+
+        Raises:
+            ValueError: If the chunk's columns differ from the first chunk's.
+        """
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self._parts = {column: [] for column in self.columns}
+        elif list(chunk.columns) != self.columns:
+            raise ValueError("All chunks must have the same columns")
+
+        fast_dps, charge_dps = compute_move_dps(chunk)
+        self._fast_dps.append(fast_dps)
+        self._charge_dps.append(charge_dps)
+        self._lexical.add(chunk)
+        for column in self.columns:
+            # Keep only the column arrays; the chunk frame itself can be freed.
+            self._parts[column].append(chunk[column].array)
+        self.rows += len(chunk)
+
+    def build(self) -> tuple:
+        """
+        Combine the chunks added so far.
+
+        The per-chunk parts are released column by column while combining, so
+        at most one column exists twice.
+
+        Returns:
+            tuple: ``(data, dps_index, lexical_index)`` for
+            ``PokemonRetriever(data, dps_index=..., lexical_index=...)``.
+
+        Raises:
+            ValueError: If no chunk was added.
+        """
+        if self.columns is None:
+            raise ValueError("No chunks were added")
+        data = {}
+        for column in self.columns:
+            parts = self._parts.pop(column)
+            if all(isinstance(part, pd.Categorical) for part in parts):
+                # Merge the chunks' dictionaries; codes are remapped, not re-parsed.
+                # Sorted, so the categories do not depend on the chunk size.
+                data[column] = union_categoricals(parts, sort_categories=True)
+            else:
+                data[column] = pd.concat([pd.Series(part) for part in parts], ignore_index=True)
+        dps_index = build_dps_index(np.concatenate(self._fast_dps),
+                                    np.concatenate(self._charge_dps))
+        self._fast_dps, self._charge_dps = [], []
+        lexical_index = self._lexical.build()
+        self._lexical = BM25Builder(LEXICAL_COLUMNS)
+        return pd.DataFrame(data), dps_index, lexical_index
+
+
+def build_retriever(chunks) -> PokemonRetriever:
+    """
+    Build a retriever from a stream of dataset chunks.
+
+    Only one chunk is ever held in its parsed form; the name indexes are
+    built over the combined compact columns.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks with the dataset schema,
+            e.g. from ``PokemonDataLoader.iter_chunks``.
+
+    Returns:
+        PokemonRetriever: A retriever over all chunks.
+    """
+    builder = ChunkedDatasetBuilder()
+    for chunk in chunks:
+        builder.add(chunk)
+    data, dps_index, lexical_index = builder.build()
+    return PokemonRetriever(data, dps_index=dps_index, lexical_index=lexical_index)
@@ -0,0 +1,146 @@
+"""
+This module provides a row-level diff between two versions of the Pokémon dataset.
+Rows are matched by a key (Pokédex ID, name and moveset); a matched row whose other
+columns changed is an update, an unmatched old row a delete and an unmatched new
+row an insert. Both versions are hashed column-wise with pandas, so diffing is a
+few vectorized passes, and the result maps old row positions to new ones so that
+indexes over the old version can be patched instead of rebuilt.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Columns identifying a row across dataset versions.
+DIFF_KEY = ("ID", "NAME", "FAST_MOVE", "CHARGE_MOVE")
+
+
+def _row_hashes(data: pd.DataFrame, columns: list) -> np.ndarray:
+    """
+    Hash the values of some columns per row.
+
+    Args:
+        data (pd.DataFrame): The dataset.
+        columns (list): The columns to hash.
+
+    Returns:
+        np.ndarray: uint64 hash per row; equal values hash equally whatever the
+        categories of a categorical column.
+    """
+    return pd.util.hash_pandas_object(data[columns], index=False).to_numpy()
+
+
+def _keyed(hashes: np.ndarray) -> pd.Index:
+    """
+    Make row keys unique by numbering repeated keys in row order.
+
+    Args:
+        hashes (np.ndarray): Key hash per row.
+
+    Returns:
+        pd.Index: A uint64 key per row mixing the hash and its occurrence.
+    """
+    keys = pd.Index(hashes)
+    if not keys.has_duplicates:
+        return keys
+    order = np.argsort(hashes, kind="stable")
+    ordered = hashes[order]
+    first = np.concatenate([[True], ordered[1:] != ordered[:-1]])
+    ranks = np.arange(len(hashes))
+    occurrence = np.empty(len(hashes), dtype=np.uint64)
+    occurrence[order] = ranks - np.maximum.accumulate(np.where(first, ranks, 0))
+    # Odd multiplier: distinct occurrences of one hash never collide.
+    return pd.Index(hashes ^ (occurrence * np.uint64(0x9E3779B97F4A7C15)))
+
+
+class DatasetDiff:
+    """
+    The row changes between an old and a new version of the dataset.
+
+    Attributes:
+        old_to_new (np.ndarray): Read-only new position of each old row, -1 for
+            deleted and updated rows.
+        added (np.ndarray): Read-only ascending new positions of inserted and
+            updated rows: the rows indexes must (re)index.
+        removed (np.ndarray): Read-only ascending old positions of deleted and
+            updated rows: the rows indexes must drop.
+        inserted (int): Rows only in the new version.
+        updated (int): Rows in both versions whose values changed.
+        deleted (int): Rows only in the old version.
+        reordered (bool): Whether unchanged rows changed their relative order.
+    """
+
+    def __init__(self, old_to_new: np.ndarray, added: np.ndarray, updated: int):
+        """
+        Initialize the diff.
+
+        Args:
+            old_to_new (np.ndarray): New position of each old row, -1 if none.
+            added (np.ndarray): New positions of inserted and updated rows.
+            updated (int): How many of ``added`` are updates.
+        """
+        self.old_to_new = old_to_new
+        self.added = added
+        self.removed = np.flatnonzero(old_to_new < 0)
+        for array in (self.old_to_new, self.added, self.removed):
+            array.setflags(write=False)
+        self.updated = updated
+        self.inserted = len(added) - updated
+        self.deleted = len(self.removed) - updated
+        kept = old_to_new[old_to_new >= 0]
+        self.reordered = bool(np.any(np.diff(kept) < 0))
+
+    def __bool__(self) -> bool:
+        """Whether any row changed."""
+        return bool(len(self.added) or len(self.removed) or self.reordered)
+
+    def summary(self) -> dict:
+        """
+        Count the changes.
+
+        Returns:
+            dict: ``inserted``, ``updated`` and ``deleted`` row counts.
+        """
+        return {"inserted": self.inserted, "updated": self.updated, "deleted": self.deleted}
+
+
+def diff_datasets(old: pd.DataFrame, new: pd.DataFrame, key: tuple = DIFF_KEY) -> DatasetDiff:
+    """
+    Diff two versions of the dataset by key.
+
+    Rows sharing a key are matched in row order, so duplicated keys are
+    handled like distinct rows.
+
+    Args:
+        old (pd.DataFrame): The version the indexes were built over.
+        new (pd.DataFrame): The new version.
+        key (tuple): Columns identifying a row; missing ones are skipped.
+
+    Returns:
+        DatasetDiff: The changes.
+
+    Raises:
+        ValueError: If the versions have different columns or share no key
+            column; indexes must then be rebuilt.
+    """
+    if list(old.columns) != list(new.columns):
+        raise ValueError("dataset columns changed; the indexes must be rebuilt")
+    key_columns = [column for column in key if column in new.columns]
+    if not key_columns:
+        raise ValueError(f"dataset has none of the key columns {', '.join(key)}")
+    value_columns = [column for column in new.columns if column not in key_columns]
+
+    old_positions = _keyed(_row_hashes(old, key_columns)).get_indexer(
+        _keyed(_row_hashes(new, key_columns))
+    )
+    matched = old_positions >= 0
+    changed = np.zeros(len(new), dtype=bool)
+    if value_columns:
+        # Matched rows share their key, so only the other columns can differ.
+        changed[matched] = (
+            _row_hashes(old, value_columns)[old_positions[matched]]
+            != _row_hashes(new, value_columns)[matched]
+        )
+    kept = matched & ~changed
+    old_to_new = np.full(len(old), -1, dtype=np.int64)
+    old_to_new[old_positions[kept]] = np.flatnonzero(kept)
+    return DatasetDiff(old_to_new, np.flatnonzero(~kept), int(changed.sum()))
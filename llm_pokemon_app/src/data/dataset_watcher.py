@@ -0,0 +1,176 @@
+"""
+This module provides a watcher that keeps a live retriever in sync with its dataset
+file. The file is polled for a new size or modification time, so no file-system
+notification package is needed. A changed file is loaded once it has stopped
+changing for one poll, diffed against the data being served and applied as a
+patch to a copy of the retriever, which is then swapped in; questions already
+being answered finish on the version they started with.
+"""
+
+import os
+import threading
+import time
+
+from llm_pokemon_app.src.data.dataset_diff import diff_datasets
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.utils.metrics import METRICS
+
+DEFAULT_INTERVAL_S = 2.0
+RELOADS = "pokemon_dataset_reloads_total"
+
+
+def file_signature(file_path: str):
+    """
+    Identify the current contents of a file cheaply.
+
+    Args:
+        file_path (str): The file.
+
+    Returns:
+        tuple | None: ``(size, mtime_ns)``, or None if the file is missing.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def rebuilt(retriever: PokemonRetriever, data) -> PokemonRetriever:
+    """
+    Build a retriever over new data from scratch, with the same search features.
+
+    Args:
+        retriever (PokemonRetriever): The retriever being replaced.
+        data (pd.DataFrame): The new dataset version.
+
+    Returns:
+        PokemonRetriever: The new retriever.
+    """
+    replacement = PokemonRetriever(data)
+    if retriever.vector_search_enabled:
+        replacement.enable_vector_search(lazy=retriever.vector_index is None)
+    return replacement
+
+
+class DatasetWatcher:
+    """
+    Reloads a ``LiveRetriever`` when its dataset file changes.
+
+    ``check`` polls once and can be called directly; ``start`` polls from a
+    daemon thread every ``interval_s`` seconds.
+    """
+
+    def __init__(self, file_path: str, live, interval_s: float = DEFAULT_INTERVAL_S,
+                 loader=None):
+        """
+        Initialize the watcher; the file as it is now counts as loaded.
+
+        Args:
+            file_path (str): The dataset file.
+            live (LiveRetriever): The retriever to keep in sync.
+            interval_s (float): Seconds between polls of the background thread.
+            loader (Callable[[str], pd.DataFrame | str]): Loads the file,
+                returning an error message on failure; ``load_csv`` by default.
+        """
+        self.file_path = file_path
+        self.live = live
+        self.interval_s = interval_s
+        self.loader = loader or PokemonDataLoader.load_csv
+        self.last_reload = None
+        self.last_error = None
+        self._loaded = file_signature(file_path)
+        self._pending = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self):
+        """
+        Poll the file once, reloading it if it changed and has settled.
+
+        A change is only loaded when the next poll sees the same size and
+        modification time, so a file that is still being written is not
+        mistaken for a dataset that lost rows.
+
+        Returns:
+            dict | None: The reload summary (see ``reload``), or None if
+            nothing was reloaded.
+        """
+        signature = file_signature(self.file_path)
+        if signature is None or signature == self._loaded:
+            self._pending = None
+            return None
+        if signature != self._pending:
+            self._pending = signature
+            return None
+        self._loaded, self._pending = signature, None
+        return self.reload()
+
+    def reload(self):
+        """
+        Load the file and apply it to the live retriever.
+
+        The new data is diffed against the data being served and the indexes
+        are patched; a change of columns rebuilds them instead. A file that
+        fails to load leaves the retriever as it was.
+
+        Returns:
+            dict | None: ``mode`` ("patch", "rebuild" or "unchanged"), the
+            inserted, updated and deleted row counts of a patch, ``seconds``
+            and the live ``version``; None if the file failed to load (see
+            ``last_error``).
+        """
+        started = time.perf_counter()
+        data = self.loader(self.file_path)
+        if isinstance(data, str):
+            self.last_error = data
+            METRICS.increment(RELOADS, mode="error")
+            return None
+
+        summary = {}
+
+        def rebuild(retriever):
+            try:
+                diff = diff_datasets(retriever.data, data)
+            except ValueError:
+                summary["mode"] = "rebuild"
+                return rebuilt(retriever, data)
+            summary.update(diff.summary(), mode="patch" if diff else "unchanged")
+            return retriever.patched(data, diff) if diff else retriever
+
+        with METRICS.span("dataset.reload"):
+            self.live.update(rebuild)
+        summary.update(seconds=time.perf_counter() - started, version=self.live.version)
+        METRICS.increment(RELOADS, mode=summary["mode"])
+        self.last_reload, self.last_error = summary, None
+        return summary
+
+    def start(self):
+        """Start polling from a daemon thread (once)."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="dataset-watcher",
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """
+        Stop the polling thread.
+
+        Args:
+            timeout (float): Seconds to wait for a reload in progress.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        """Poll until stopped; a failed reload is recorded and retried on the next change."""
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.check()
+            except Exception as error:  # pylint: disable=broad-except
+                self.last_error = f"{type(error).__name__}: {error}"
+                METRICS.increment(RELOADS, mode="error")
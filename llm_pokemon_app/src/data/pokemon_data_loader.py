@@ -1,9 +1,65 @@
 """
 This module provides a class for loading Pokémon Go data from multiple file formats.
 Supported formats include CSV, Excel, and Parquet, with appropriate error handling.
+CSV files can also be loaded through a cached binary snapshot to skip text parsing,
+and any format can be streamed in chunks for datasets too large to parse at once.
+Every loader applies the dataset schema: names, types and moves are categoricals,
+move statistics float32, the Pokédex ID a zero-padded string, and the stray
+index column written by ``to_csv`` is dropped.
 """
 
+import glob
+import hashlib
+import os
+import re
+import shutil
+
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq  # type: ignore # pylint: disable=import-error
+
+from llm_pokemon_app.src.utils.metrics import traced
+
+# Bump when the loaded frame changes shape, so existing snapshots are rebuilt.
+SNAPSHOT_VERSION = 2
+SNAPSHOT_DIR_NAME = ".snapshots"
+SNAPSHOT_KEY_PATTERN = re.compile(r"[0-9a-f]{16}")
+
+# Column dtypes of the dataset; columns absent from a file are skipped.
+CATEGORICAL_COLUMNS = (
+    "NAME", "TYPE_ONE", "TYPE_TWO", "FAST_MOVE", "FAST_MOVE_TYPE", "CHARGE_MOVE",
+    "CHARGED_MOVE_TYPE",
+)
+FLOAT_COLUMNS = (
+    "FAST_MOVE_POWER", "FAST_ENERGY_BOOST", "FAST_MOVE_DURATION", "CHARGE_MOVE_POWER",
+    "CHARGE_MOVE_ENERGY_COST", "CHARGE_MOVE_DURATION", "DAMAGE WINDOW START",
+)
+DATASET_SCHEMA = {
+    "ID": "string",
+    **{column: "category" for column in CATEGORICAL_COLUMNS},
+    **{column: "float32" for column in FLOAT_COLUMNS},
+}
+REQUIRED_COLUMNS = ("NAME",)
+# Pokédex numbers are written with leading zeros ("0001").
+ID_WIDTH = 4
+DEFAULT_CHUNK_ROWS = 50_000
+
+
+def column_values(data: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    Read a numeric dataset column as float64, for arithmetic on derived values.
+
+    float32 columns are widened as stored; derived values (e.g. DPS) are then
+    computed in float64.
+
+    Args:
+        data (pd.DataFrame): Pokémon dataset.
+        column (str): Name of the column.
+
+    Returns:
+        np.ndarray: The values, NaN where missing.
+    """
+    return data[column].to_numpy(dtype=np.float64, na_value=np.nan)
 
 
 class PokemonDataLoader:
@@ -14,6 +70,40 @@ class PokemonDataLoader:
     """
 
     @staticmethod
+    def apply_schema(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop unnamed index columns and cast columns to ``DATASET_SCHEMA``.
+
+        Args:
+            data (pd.DataFrame): Loaded Pokémon Go data.
+
+        Returns:
+            pd.DataFrame: The data with the schema's dtypes.
+
+        Raises:
+            ValueError: If a required column is missing or a value does not fit
+                its column's dtype.
+        """
+        unnamed = [column for column in data.columns if str(column).startswith("Unnamed:")]
+        if unnamed:
+            data = data.drop(columns=unnamed)
+        missing = [column for column in REQUIRED_COLUMNS if column not in data.columns]
+        if missing:
+            raise ValueError(f"missing required columns: {', '.join(missing)}")
+
+        if "ID" in data.columns and pd.api.types.is_numeric_dtype(data["ID"]):
+            data = data.assign(ID=data["ID"].astype("Int64").astype("string").str.zfill(ID_WIDTH))
+        casts = {
+            column: dtype for column, dtype in DATASET_SCHEMA.items()
+            if column in data.columns and data[column].dtype != dtype
+        }
+        try:
+            return data.astype(casts) if casts else data
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"column does not match the schema: {error}") from error
+
+    @staticmethod
+    @traced("loader.load_csv")
     def load_csv(file_path: str) -> pd.DataFrame:
         """
         Load Pokémon Go data from a CSV file.
@@ -25,7 +115,11 @@ class PokemonDataLoader:
             pd.DataFrame: Loaded Pokémon Go data as a pandas DataFrame.
         """
         try:
-            return pd.read_csv(file_path)
+            # Parse straight into the schema's dtypes instead of casting afterwards,
+            # skipping the unnamed index column.
+            data = pd.read_csv(file_path, dtype=DATASET_SCHEMA,
+                               usecols=lambda column: not column.startswith("Unnamed:"))
+            return PokemonDataLoader.apply_schema(data)
         except FileNotFoundError as error:
             return f"File not found: {str(error)}"
         except pd.errors.EmptyDataError as error:
@@ -34,9 +128,12 @@ class PokemonDataLoader:
             return f"Parser error: {str(error)}"
         except pd.errors.DtypeWarning as error:
             return f"Data type warning: {str(error)}"
+        except ValueError as error:
+            return f"Schema error: {str(error)}"
         # Removed broad exception handling here.
 
     @staticmethod
+    @traced("loader.load_excel")
     def load_excel(file_path: str) -> pd.DataFrame:
         """
         Load Pokémon Go data from an Excel file.
@@ -48,16 +145,21 @@ class PokemonDataLoader:
             pd.DataFrame: Loaded Pokémon Go data as a pandas DataFrame.
         """
         try:
-            return pd.read_excel(file_path)
+            data = pd.read_excel(file_path)
         except FileNotFoundError as error:
             return f"File not found: {str(error)}"
         except pd.errors.EmptyDataError as error:
             return f"Empty data error: {str(error)}"
         except ValueError as error:
             return f"Value error: {str(error)}"
+        try:
+            return PokemonDataLoader.apply_schema(data)
+        except ValueError as error:
+            return f"Schema error: {str(error)}"
         # Removed broad exception handling here.
 
     @staticmethod
+    @traced("loader.load_parquet")
     def load_parquet(file_path: str) -> pd.DataFrame:
         """
         Load Pokémon Go data from a Parquet file.
@@ -69,10 +171,189 @@ class PokemonDataLoader:
             pd.DataFrame: Loaded Pokémon Go data as a pandas DataFrame.
         """
         try:
-            return pd.read_parquet(file_path)
+            data = pd.read_parquet(file_path)
         except FileNotFoundError as error:
             return f"File not found: {str(error)}"
         except pd.errors.EmptyDataError as error:
             return f"Empty data error: {str(error)}"
         except OSError as error:
             return f"OS error: {str(error)}"
+        try:
+            return PokemonDataLoader.apply_schema(data)
+        except ValueError as error:
+            return f"Schema error: {str(error)}"
+
+    @staticmethod
+    def iter_chunks(file_path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        """
+        Stream Pokémon Go data from a CSV, Parquet or Excel file in chunks.
+
+        CSV files are read ``chunk_rows`` lines at a time, Parquet files batch
+        by batch and Excel workbooks row by row in read-only mode, so only one
+        chunk is ever parsed in memory. Each chunk gets the dataset schema.
+
+        Args:
+            file_path (str): The path to a .csv, .parquet or .xlsx file.
+            chunk_rows (int): Maximum rows per chunk.
+
+        Yields:
+            pd.DataFrame: Chunks in file order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the format is unsupported, ``chunk_rows`` is below 1
+                or a chunk does not fit the schema.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == ".csv":
+            with pd.read_csv(file_path, dtype=DATASET_SCHEMA, chunksize=chunk_rows,
+                             usecols=lambda column: not column.startswith("Unnamed:")) as reader:
+                for chunk in reader:
+                    yield PokemonDataLoader.apply_schema(chunk)
+        elif extension == ".parquet":
+            for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunk_rows):
+                yield PokemonDataLoader.apply_schema(batch.to_pandas())
+        elif extension in (".xlsx", ".xlsm"):
+            yield from PokemonDataLoader._iter_excel_chunks(file_path, chunk_rows)
+        else:
+            raise ValueError(f"Unsupported file type for chunked loading: {file_path}")
+
+    @staticmethod
+    def _iter_excel_chunks(file_path: str, chunk_rows: int):
+        """
+        Stream the first sheet of an Excel workbook in chunks.
+
+        Args:
+            file_path (str): The path to the workbook.
+            chunk_rows (int): Maximum rows per chunk.
+
+        Yields:
+            pd.DataFrame: Chunks with the dataset schema.
+        """
+        # openpyxl is the optional engine pandas uses for .xlsx files.
+        from openpyxl import load_workbook  # pylint: disable=import-outside-toplevel
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            # Name blank headers like pandas does, so the index column is dropped.
+            columns = [
+                f"Unnamed: {position}" if name is None else str(name)
+                for position, name in enumerate(header)
+            ]
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) == chunk_rows:
+                    yield PokemonDataLoader.apply_schema(pd.DataFrame(batch, columns=columns))
+                    batch = []
+            if batch:
+                yield PokemonDataLoader.apply_schema(pd.DataFrame(batch, columns=columns))
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def snapshot_path(file_path: str, cache_dir: str = None) -> str:
+        """
+        Build the snapshot path for a source file.
+
+        The file name embeds a key derived from the source's absolute path,
+        size and modification time, so editing the source invalidates it.
+
+        Args:
+            file_path (str): The path to the source file.
+            cache_dir (str): Directory holding snapshots. Defaults to a
+                ``.snapshots`` directory next to the source file.
+
+        Returns:
+            str: The snapshot path.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+        """
+        source = os.path.abspath(file_path)
+        stat = os.stat(source)
+        key = hashlib.sha1(
+            f"{source}|{stat.st_size}|{stat.st_mtime_ns}|{SNAPSHOT_VERSION}".encode()
+        ).hexdigest()[:16]
+        directory = cache_dir or os.path.join(os.path.dirname(source), SNAPSHOT_DIR_NAME)
+        stem = os.path.splitext(os.path.basename(source))[0]
+        return os.path.join(directory, f"{stem}.{key}.arrow")
+
+    @classmethod
+    @traced("loader.load_csv_cached")
+    def load_csv_cached(cls, file_path: str, cache_dir: str = None) -> pd.DataFrame:
+        """
+        Load Pokémon Go data from a CSV file through a binary snapshot.
+
+        A fresh snapshot (Arrow IPC) is read directly; otherwise the CSV is
+        parsed with ``load_csv`` and a new snapshot is written for next time.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            cache_dir (str): Directory holding snapshots, see ``snapshot_path``.
+
+        Returns:
+            pd.DataFrame: Loaded Pokémon Go data as a pandas DataFrame.
+        """
+        try:
+            snapshot = cls.snapshot_path(file_path, cache_dir)
+        except FileNotFoundError as error:
+            return f"File not found: {str(error)}"
+
+        if os.path.exists(snapshot):
+            try:
+                return pd.read_feather(snapshot)
+            except (OSError, ValueError):
+                pass  # Unreadable snapshot; rebuild it from the CSV below.
+
+        data = cls.load_csv(file_path)
+        if isinstance(data, pd.DataFrame):
+            cls._write_snapshot(data, snapshot)
+        return data
+
+    @staticmethod
+    def _write_snapshot(data: pd.DataFrame, snapshot: str):
+        """
+        Write a snapshot atomically and remove stale snapshots of the same file.
+
+        Failures are ignored: the snapshot is only a cache.
+
+        Args:
+            data (pd.DataFrame): The loaded data.
+            snapshot (str): The snapshot path from ``snapshot_path``.
+        """
+        directory = os.path.dirname(snapshot)
+        temporary = f"{snapshot}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Uncompressed so the file can also be memory-mapped.
+            data.to_feather(temporary, compression="uncompressed")
+            os.replace(temporary, snapshot)
+        except (OSError, ValueError, ImportError):
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            return
+
+        # Remove older snapshots and their sidecars (indexes derived from them).
+        stem = os.path.basename(snapshot).rsplit(".", 2)[0]
+        current = snapshot[:-len(".arrow")]
+        for stale in glob.glob(os.path.join(directory, f"{glob.escape(stem)}.*")):
+            if stale.startswith(current) or stale.endswith(".tmp"):
+                continue
+            # Only keyed snapshot files; the cache directory may hold the source too.
+            key = os.path.basename(stale)[len(stem) + 1:].split(".", 1)[0]
+            if not SNAPSHOT_KEY_PATTERN.fullmatch(key):
+                continue
+            try:
+                if os.path.isdir(stale):
+                    shutil.rmtree(stale)
+                else:
+                    os.remove(stale)
+            except OSError:
+                pass
@@ -0,0 +1,118 @@
+"""
+This module provides a memory-mapped Pokémon Go dataset shared between processes.
+The dataset snapshot and its derived arrays are written once as uncompressed Arrow
+IPC files; every worker maps them read-only, so the operating system keeps a single
+copy in the page cache no matter how many workers attach.
+
+Only the dataset columns and the per-row DPS arrays are shared. The other indexes
+(BM25 postings, the name index and resolver, the ranking partitions, the matchup
+and energy-cycle tables) are Python objects or derived from them, and each worker
+still builds its own: about 10 MB and half a second for the bundled dataset. The
+semantic index is persisted to disk separately and loaded by each worker (about
+6 MB) rather than rebuilt, but not shared.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa  # type: ignore # pylint: disable=import-error
+
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+
+INDEX_SUFFIX = ".index.arrow"
+
+
+class SharedDataset:
+    """
+    A Pokémon Go dataset published as memory-mapped Arrow IPC files.
+
+    Publishing is idempotent and atomic (write to a temporary file, then
+    rename), so concurrently starting workers can all call ``attach`` safely.
+    """
+
+    def __init__(self, file_path: str, cache_dir: str = None):
+        """
+        Locate the shared files for a source CSV.
+
+        Args:
+            file_path (str): The path to the source CSV file.
+            cache_dir (str): Directory holding snapshots, see
+                ``PokemonDataLoader.snapshot_path``.
+        """
+        self.file_path = file_path
+        self.cache_dir = cache_dir
+        self.data_path = PokemonDataLoader.snapshot_path(file_path, cache_dir)
+        self.index_path = self.data_path[:-len(".arrow")] + INDEX_SUFFIX
+
+    @staticmethod
+    def _map_table(path: str) -> pa.Table:
+        """
+        Memory-map an Arrow IPC file without copying its buffers.
+
+        Args:
+            path (str): The Arrow IPC file.
+
+        Returns:
+            pa.Table: A table backed by the mapped file.
+        """
+        with pa.memory_map(path, "r") as source:
+            return pa.ipc.open_file(source).read_all()
+
+    @staticmethod
+    def _publish(table: pa.Table, path: str):
+        """
+        Write a table as an uncompressed Arrow IPC file, atomically.
+
+        Args:
+            table (pa.Table): The table to write.
+            path (str): Destination path.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with pa.OSFile(temporary, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temporary, path)
+
+    def attach(self) -> pd.DataFrame:
+        """
+        Map the dataset snapshot, publishing it first if needed.
+
+        Returns:
+            pd.DataFrame: Arrow-backed columns that reference the mapped file.
+
+        Raises:
+            ValueError: If the source CSV cannot be loaded.
+            OSError: If the snapshot could not be written or mapped.
+        """
+        if not os.path.exists(self.data_path):
+            # The cached loader writes the snapshot in the same Arrow IPC layout.
+            data = PokemonDataLoader.load_csv_cached(self.file_path, self.cache_dir)
+            if not isinstance(data, pd.DataFrame):
+                raise ValueError(data)
+        return self._map_table(self.data_path).to_pandas(types_mapper=pd.ArrowDtype)
+
+    def attach_index(self, build) -> dict:
+        """
+        Map the derived index arrays, publishing them first if needed.
+
+        Args:
+            build (Callable[[], dict]): Computes the arrays (equal-length 1-D
+                NumPy arrays keyed by name) when no index file exists yet.
+
+        Returns:
+            dict: Read-only NumPy views over the mapped file.
+        """
+        if not os.path.exists(self.index_path):
+            arrays = build()
+            self._publish(
+                pa.table({name: pa.array(values) for name, values in arrays.items()}),
+                self.index_path,
+            )
+        table = self._map_table(self.index_path)
+        index = {}
+        for name in table.column_names:
+            column = table.column(name).combine_chunks()
+            index[name] = np.asarray(column.to_numpy(zero_copy_only=True))
+        return index
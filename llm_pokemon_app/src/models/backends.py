@@ -0,0 +1,147 @@
+"""
+This module provides the registry of model backends.
+Backends are registered by module path and class name, so listing them (e.g.
+for the UI) imports nothing; a backend's module is imported only when it is
+created. New backends register here without changes to the UI code.
+"""
+
+import importlib
+
+API_KEY_OPENAI = "openai"
+API_KEY_HUGGINGFACE = "huggingface"
+
+
+class BackendSpec:  # pylint: disable=too-many-instance-attributes
+    """
+    Describes how to import and construct a backend.
+
+    Constructors receive, in order, the API key (if ``api_key`` names one)
+    and the retriever (if ``needs_retriever``), plus ``cache=`` if
+    ``uses_cache``.
+    """
+
+    def __init__(self, name: str, label: str, module: str, class_name: str, **requirements):
+        """
+        Initialize the spec.
+
+        Args:
+            name (str): Short identifier, e.g. "rag".
+            label (str): Name shown in the UI.
+            module (str): Module defining the backend class.
+            class_name (str): The backend class.
+            **requirements: ``api_key`` (str | None) names the API key kind;
+                ``needs_retriever`` (bool) and ``uses_cache`` (bool) select
+                the resources passed to the constructor; ``selectable``
+                (bool, default True) offers the backend in the UI.
+        """
+        self.name = name
+        self.label = label
+        self.module = module
+        self.class_name = class_name
+        self.api_key = requirements.get("api_key")
+        self.needs_retriever = requirements.get("needs_retriever", False)
+        self.uses_cache = requirements.get("uses_cache", False)
+        self.selectable = requirements.get("selectable", True)
+
+    def load(self):
+        """
+        Import the backend class.
+
+        Returns:
+            type: The backend class.
+        """
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+    def create(self, backend_class=None, api_key: str = None, retriever=None, cache=None):
+        """
+        Construct the backend with the resources it declares.
+
+        Args:
+            backend_class (type): The class to construct (defaults to ``load()``).
+            api_key (str): The API key, if the backend needs one.
+            retriever (PokemonRetriever): The retriever, if the backend needs one.
+            cache (ResponseCache): The response cache, if the backend uses one.
+
+        Returns:
+            ModelBackend: The backend.
+        """
+        backend_class = backend_class or self.load()
+        args = []
+        if self.api_key:
+            args.append(api_key)
+        if self.needs_retriever:
+            args.append(retriever)
+        kwargs = {"cache": cache} if self.uses_cache else {}
+        return backend_class(*args, **kwargs)
+
+
+# Registered backends by name, in UI order.
+BACKENDS = {}
+
+
+def register_backend(spec: BackendSpec) -> BackendSpec:
+    """
+    Register (or replace) a backend.
+
+    Args:
+        spec (BackendSpec): The backend description.
+
+    Returns:
+        BackendSpec: The registered spec.
+    """
+    BACKENDS[spec.name] = spec
+    return spec
+
+
+def get_backend(name_or_label: str) -> BackendSpec:
+    """
+    Look up a backend by name or UI label.
+
+    Args:
+        name_or_label (str): The backend's name or label.
+
+    Returns:
+        BackendSpec: The spec.
+
+    Raises:
+        ValueError: If no backend matches.
+    """
+    if name_or_label in BACKENDS:
+        return BACKENDS[name_or_label]
+    for spec in BACKENDS.values():
+        if spec.label == name_or_label:
+            return spec
+    raise ValueError(f"Unknown model backend: {name_or_label}")
+
+
+def create_backend(name_or_label: str, **resources):
+    """
+    Import and construct a backend.
+
+    Args:
+        name_or_label (str): The backend's name or label.
+        **resources: ``api_key``, ``retriever`` and ``cache`` for ``BackendSpec.create``.
+
+    Returns:
+        ModelBackend: The backend.
+    """
+    return get_backend(name_or_label).create(**resources)
+
+
+register_backend(BackendSpec(
+    "openai", "OpenAI", "llm_pokemon_app.src.models.openai_model", "OpenAIModel",
+    api_key=API_KEY_OPENAI, uses_cache=True,
+))
+register_backend(BackendSpec(
+    "huggingface", "Hugging Face", "llm_pokemon_app.src.models.huggingface_model",
+    "HuggingFaceModel", api_key=API_KEY_HUGGINGFACE,
+))
+register_backend(BackendSpec(
+    "rag", "RAG with Pokémon Data", "llm_pokemon_app.src.models.rag_model", "RAGModel",
+    api_key=API_KEY_OPENAI, needs_retriever=True, uses_cache=True,
+))
+# For tests, benchmarks and offline batch runs; not offered in the UI.
+register_backend(BackendSpec(
+    "stub", "Local stub (offline)", "llm_pokemon_app.src.models.local_stub_model",
+    "LocalStubModel", needs_retriever=True, uses_cache=True, selectable=False,
+))
@@ -0,0 +1,126 @@
+"""
+This module provides the interface shared by every model backend.
+Backends implement ``get_response`` and declare capability flags; the async,
+streaming, batch and retrieval methods have generic fallbacks that backends with
+native support (async clients, token streams, batching engines, RAG) override.
+"""
+
+import abc
+import asyncio
+
+from llm_pokemon_app.src.utils.concurrency import DEFAULT_MAX_CONCURRENCY, answer_all
+
+
+class ModelBackend(abc.ABC):
+    """
+    Base class for model backends.
+
+    ``get_response`` is abstract, so a backend that does not implement it
+    fails when it is instantiated rather than on its first question.
+
+    Capability flags describe native support, not availability: every
+    method works on every backend, but the fallbacks run ``get_response`` in
+    a thread (async), yield the whole response as one chunk (streaming) or
+    answer prompts one by one (batch).
+    """
+
+    supports_async = False
+    supports_streaming = False
+    supports_batch = False
+    is_local = False
+
+    @abc.abstractmethod
+    def get_response(self, prompt: str) -> str:
+        """
+        Answer a prompt.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Returns:
+            str: The response.
+        """
+
+    async def aget_response(self, prompt: str) -> str:
+        """
+        Answer a prompt without blocking the event loop.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Returns:
+            str: The response.
+        """
+        return await asyncio.to_thread(self.get_response, prompt)
+
+    def retrieve_contexts(self, queries) -> list:
+        """
+        Retrieve the context of many prompts in one pass, for ``agenerate``.
+
+        Backends that answer from retrieved data (RAG) override this; the
+        others have no context to retrieve.
+
+        Args:
+            queries (Iterable[str]): The prompts.
+
+        Returns:
+            list: One context per prompt, in order; None without retrieval.
+        """
+        return [None for _ in queries]
+
+    async def agenerate(self, prompt: str,
+                        context: str = None) -> str:  # pylint: disable=unused-argument
+        """
+        Answer a prompt whose context was returned by ``retrieve_contexts``.
+
+        Args:
+            prompt (str): The input prompt/question.
+            context (str): The retrieved context; None without retrieval.
+
+        Returns:
+            str: The response.
+        """
+        return await self.aget_response(prompt)
+
+    def stream_response(self, prompt: str):
+        """
+        Stream the response to a prompt.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Yields:
+            str: Chunks of the response.
+        """
+        yield self.get_response(prompt)
+
+    def get_responses(self, prompts: list,
+                      max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list:
+        """
+        Answer many prompts; must not be called from a running event loop.
+
+        Args:
+            prompts (list): The prompts.
+            max_concurrency (int): Maximum requests in flight for async backends.
+
+        Returns:
+            list: One response per prompt, in order.
+        """
+        if self.supports_async:
+            return answer_all(self, prompts, max_concurrency)
+        return [self.get_response(prompt) for prompt in prompts]
+
+    @classmethod
+    def capabilities(cls) -> dict:
+        """
+        Report the backend's capability flags.
+
+        Returns:
+            dict: Flag name to value.
+        """
+        return {
+            "async": cls.supports_async,
+            "streaming": cls.supports_streaming,
+            "batch": cls.supports_batch,
+            "local": cls.is_local,
+        }
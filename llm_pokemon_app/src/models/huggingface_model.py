@@ -3,28 +3,101 @@ This module provides a HuggingFace model class for generating responses
 using a causal language model (TinyLlama) via the Hugging Face API.
 """
 
-from transformers import AutoTokenizer, AutoModelForCausalLM
+import os
+import threading
 
+from transformers import AutoTokenizer, AutoModelForCausalLM, TextIteratorStreamer
 
-class HuggingFaceModel:
+from llm_pokemon_app.src.models.base import ModelBackend
+from llm_pokemon_app.src.models.local_inference import DEFAULT_MAX_NEW_TOKENS, LocalInferenceEngine
+from llm_pokemon_app.src.utils.concurrency import DEFAULT_MAX_CONCURRENCY
+from llm_pokemon_app.src.utils.metrics import METRICS
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
+
+MODEL_NAME = "TinyLlama/TinyLlama_v1.1"
+# When set (e.g. "8"), backends are served by the shared micro-batching engine
+# with this batch size, including the ones the app, server and batch runs create.
+LOCAL_ENGINE_ENV = "POKEMON_HF_BATCH_SIZE"
+
+
+class HuggingFaceModel(ModelBackend):
     """
     A class to interact with the Hugging Face API and
     generate responses using a pre-trained causal
     language model (TinyLlama).
     """
 
-    def __init__(self, api_key: str):
+    supports_streaming = True
+    supports_batch = True
+    is_local = True
+
+    def __init__(self, api_key: str, engine: "LocalInferenceEngine" = None):
         """
         Initialize the Hugging Face model with the provided API key.
 
         Args:
             api_key (str): The Hugging Face API key.
+            engine (LocalInferenceEngine): Optional batching engine that serves
+                ``get_response`` instead of one ``generate`` call per prompt.
         """
         self.api_key = api_key
 
-        # Load the tokenizer and model for causal language modeling
-        self.tokenizer = AutoTokenizer.from_pretrained("TinyLlama/TinyLlama_v1.1")
-        self.model = AutoModelForCausalLM.from_pretrained("TinyLlama/TinyLlama_v1.1")
+        # Load the tokenizer and model for causal language modeling once per process
+        self.tokenizer, self.model = self.load_pretrained()
+        if engine is None and os.environ.get(LOCAL_ENGINE_ENV):
+            engine = self.shared_engine(max_batch_size=int(os.environ[LOCAL_ENGINE_ENV]))
+        self.engine = engine
+
+    @staticmethod
+    def load_pretrained() -> tuple:
+        """
+        Load the tokenizer and model, once per process.
+
+        Returns:
+            tuple: The tokenizer and the model.
+        """
+        tokenizer = REGISTRY.get_or_create(
+            ("hf-tokenizer", MODEL_NAME), lambda: AutoTokenizer.from_pretrained(MODEL_NAME)
+        )
+        model = REGISTRY.get_or_create(
+            ("hf-model", MODEL_NAME), lambda: AutoModelForCausalLM.from_pretrained(MODEL_NAME)
+        )
+        return tokenizer, model
+
+    @classmethod
+    def shared_engine(cls, **engine_options) -> "LocalInferenceEngine":
+        """
+        Return the process-wide batching engine for a set of options.
+
+        One engine is kept per process for each set of options, so concurrent
+        callers (threads of a server or batch run) share micro-batches.
+
+        Args:
+            **engine_options: Options for ``LocalInferenceEngine`` such as
+                max_batch_size, max_new_tokens, num_threads and quantize.
+
+        Returns:
+            LocalInferenceEngine: The engine.
+        """
+        tokenizer, model = cls.load_pretrained()
+        return REGISTRY.get_or_create(
+            ("hf-engine", MODEL_NAME, tuple(sorted(engine_options.items()))),
+            lambda: LocalInferenceEngine(model, tokenizer, **engine_options),
+        )
+
+    @classmethod
+    def with_local_engine(cls, api_key: str, **engine_options) -> "HuggingFaceModel":
+        """
+        Create a model whose responses are served by a shared batching engine.
+
+        Args:
+            api_key (str): The Hugging Face API key.
+            **engine_options: Options for ``shared_engine``.
+
+        Returns:
+            HuggingFaceModel: The model.
+        """
+        return cls(api_key, cls.shared_engine(**engine_options))
 
     def get_response(self, prompt: str) -> str:
         """
@@ -37,16 +110,25 @@ class HuggingFaceModel:
             str: The human-readable response from the Hugging Face model.
         """
         try:
+            if self.engine is not None:
+                with METRICS.span("huggingface.generate"):
+                    return self.engine.generate(prompt)
+
             # Tokenize the input prompt
             inputs = self.tokenizer(prompt, return_tensors="pt")
 
             # Generate text using the model,
             # setting pad_token_id to eos_token_id for open-end generation
-            outputs = self.model.generate(
-                **inputs,
-                max_length=100,
-                pad_token_id=self.tokenizer.eos_token_id,
-            )
+            with METRICS.span("huggingface.generate"):
+                outputs = self.model.generate(
+                    **inputs,
+                    max_new_tokens=DEFAULT_MAX_NEW_TOKENS,
+                    pad_token_id=self.tokenizer.eos_token_id,
+                )
+            if METRICS.enabled:
+                prompt_tokens = int(inputs["input_ids"].shape[-1])
+                METRICS.record_tokens(MODEL_NAME, prompt_tokens,
+                                      int(outputs.shape[-1]) - prompt_tokens)
 
             # Decode the generated tokens into a human-readable response
             response_text = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
@@ -55,3 +137,69 @@ class HuggingFaceModel:
 
         except (ValueError, RuntimeError) as error:
             return f"Error: {str(error)}"
+
+    def get_responses(self, prompts: list,
+                      max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list:
+        """
+        Answer many prompts, batched by the local engine when one is attached.
+
+        Args:
+            prompts (list): The prompts.
+            max_concurrency (int): Unused; the engine sizes its own batches.
+
+        Returns:
+            list: One response per prompt, in order.
+        """
+        if self.engine is None:
+            return [self.get_response(prompt) for prompt in prompts]
+        futures = [self.engine.submit(prompt) for prompt in prompts]
+        responses = []
+        for future in futures:
+            try:
+                responses.append(future.result())
+            except (ValueError, RuntimeError) as error:
+                responses.append(f"Error: {str(error)}")
+        return responses
+
+    def stream_response(self, prompt: str):
+        """
+        Stream the generated text for the given prompt as tokens are decoded.
+
+        Generation runs in a background thread feeding a TextIteratorStreamer.
+        Unlike ``get_response``, the prompt itself is not echoed.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Yields:
+            str: Decoded text chunks.
+        """
+        errors = []
+        try:
+            inputs = self.tokenizer(prompt, return_tensors="pt")
+            streamer = TextIteratorStreamer(
+                self.tokenizer, skip_prompt=True, skip_special_tokens=True
+            )
+        except (ValueError, RuntimeError) as error:
+            yield f"Error: {str(error)}"
+            return
+
+        def generate():
+            try:
+                self.model.generate(
+                    **inputs,
+                    max_new_tokens=DEFAULT_MAX_NEW_TOKENS,
+                    pad_token_id=self.tokenizer.eos_token_id,
+                    streamer=streamer,
+                )
+            except (ValueError, RuntimeError) as error:
+                errors.append(error)
+                # Unblock the consumer waiting on the streamer.
+                streamer.end()
+
+        worker = threading.Thread(target=generate, daemon=True)
+        worker.start()
+        yield from streamer
+        worker.join()
+        if errors:
+            yield f"Error: {str(errors[0])}"
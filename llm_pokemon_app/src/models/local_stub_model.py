@@ -0,0 +1,178 @@
+"""
+This module provides a deterministic local stand-in for the LLM backends.
+It runs the same retrieval as RAGModel but answers with a fixed template instead
+of calling an API, optionally after a simulated latency, so benchmarks and
+offline runs exercise the whole pipeline without network access or cost.
+"""
+
+import asyncio
+import hashlib
+import time
+
+from llm_pokemon_app.src.models.base import ModelBackend
+from llm_pokemon_app.src.utils.query_router import QueryRouter
+from llm_pokemon_app.src.utils.response_cache import ResponseCache, normalize_prompt
+
+MODEL_NAME = "local-stub"
+
+
+class LocalStubModel(ModelBackend):
+    """
+    A backend whose answer depends only on the prompt and retrieved context.
+    """
+
+    supports_async = True
+    supports_streaming = True
+    supports_batch = True
+    is_local = True
+
+    def __init__(self, retriever=None, cache: "ResponseCache" = None, latency_ms: float = 0.0):
+        """
+        Initialize the stub.
+
+        Args:
+            retriever (PokemonRetriever): Optional retriever; without one the
+                answer is built from the prompt alone.
+            cache (ResponseCache): Optional cache for repeated prompts.
+            latency_ms (float): Simulated generation latency per response.
+        """
+        self.router = QueryRouter(retriever) if retriever is not None else None
+        self.cache = cache
+        self.latency_ms = latency_ms
+
+    def retrieve_context(self, query: str) -> str:
+        """
+        Retrieve the context RAGModel would send for a query.
+
+        Args:
+            query (str): The user input question.
+
+        Returns:
+            str: The context, or an empty string without a retriever.
+        """
+        return self.router.route(query)[1] if self.router is not None else ""
+
+    def retrieve_contexts(self, queries) -> list:
+        """
+        Retrieve contexts for many queries in one pass.
+
+        Args:
+            queries (Iterable[str]): The user input questions.
+
+        Returns:
+            list: One context per query, in input order.
+        """
+        if self.router is None:
+            return ["" for _ in queries]
+        return [context for _, context in self.router.route_many(queries)]
+
+    @staticmethod
+    def render(prompt: str, context: str) -> str:
+        """
+        Build the deterministic answer for a prompt and its context.
+
+        Args:
+            prompt (str): The input prompt/question.
+            context (str): The retrieved context.
+
+        Returns:
+            str: The answer.
+        """
+        digest = hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()[:8]
+        return f"Stub answer {digest}: {context}" if context else f"Stub answer {digest}."
+
+    def get_response(self, prompt: str) -> str:
+        """
+        Answer a prompt after the simulated latency.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Returns:
+            str: The deterministic answer.
+        """
+        context = self.retrieve_context(prompt)
+        key = self._key(prompt, context)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            return cached
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        return self._store(key, self.render(prompt, context))
+
+    async def aget_response(self, prompt: str) -> str:
+        """
+        Answer a prompt, sleeping on the event loop for the simulated latency.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Returns:
+            str: The deterministic answer.
+        """
+        # Retrieval runs in a worker thread, as in RAGModel.
+        context = await asyncio.to_thread(self.retrieve_context, prompt)
+        return await self.agenerate(prompt, context)
+
+    async def agenerate(self, prompt: str, context: str) -> str:
+        """
+        Answer a prompt whose context is already retrieved.
+
+        Args:
+            prompt (str): The input prompt/question.
+            context (str): The retrieved context.
+
+        Returns:
+            str: The deterministic answer.
+        """
+        key = self._key(prompt, context)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            return cached
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return self._store(key, self.render(prompt, context))
+
+    def stream_response(self, prompt: str):
+        """
+        Stream the answer word by word.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Yields:
+            str: Words of the answer, each followed by its separator.
+        """
+        words = self.get_response(prompt).split(" ")
+        for position, word in enumerate(words):
+            yield word if position == len(words) - 1 else word + " "
+
+    def _key(self, prompt: str, context: str):
+        """
+        Build the cache key for a request, or None without a cache.
+
+        Args:
+            prompt (str): The input prompt/question.
+            context (str): The retrieved context.
+
+        Returns:
+            str | None: The key.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.make_key(f"stub:{MODEL_NAME}", prompt, context)
+
+    def _store(self, key, response: str) -> str:
+        """
+        Cache a response when caching is enabled.
+
+        Args:
+            key (str | None): The cache key.
+            response (str): The response.
+
+        Returns:
+            str: The response.
+        """
+        if key is not None:
+            self.cache.set(key, response)
+        return response
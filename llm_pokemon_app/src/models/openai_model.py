@@ -3,22 +3,56 @@ This module provides an interface to interact with OpenAI's GPT models via an AP
 It uses the OpenAI API to send prompts and retrieve responses from the GPT models.
 """
 
-from openai import OpenAI  # type: ignore # pylint: disable=import-error
+from openai import AsyncOpenAI, OpenAI  # type: ignore # pylint: disable=import-error
 
+from llm_pokemon_app.src.models.base import ModelBackend
+from llm_pokemon_app.src.utils.concurrency import LoopLocal
+from llm_pokemon_app.src.utils.metrics import METRICS
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY, api_key_digest
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
+from llm_pokemon_app.src.utils.streaming import stream_completion
 
-class OpenAIModel:
+MODEL_NAME = "gpt-4o-mini"
+MAX_TOKENS = 150
+
+
+class OpenAIModel(ModelBackend):
     """
     A class to interact with OpenAI's GPT models using the provided API key.
     """
 
-    def __init__(self, api_key: str):
+    supports_async = True
+    supports_streaming = True
+    supports_batch = True
+
+    def __init__(self, api_key: str, cache: "ResponseCache" = None):
         """
         Initialize the OpenAI model with the provided API key.
 
         Args:
             api_key (str): The OpenAI API key.
+            cache (ResponseCache): Optional cache for repeated prompts.
+        """
+        self.cache = cache
+        # Clients (and their connection pools) are shared per API key.
+        self.client = REGISTRY.get_or_create(
+            ("openai-client", api_key_digest(api_key)), lambda: OpenAI(api_key=api_key)
+        )
+        # Async clients are created on first use, one per event loop.
+        self._async_clients = REGISTRY.get_or_create(
+            ("openai-async-client", api_key_digest(api_key)),
+            lambda: LoopLocal(lambda: AsyncOpenAI(api_key=api_key)),
+        )
+
+    @property
+    def async_client(self) -> "AsyncOpenAI":
+        """
+        The async client of the running event loop.
+
+        Returns:
+            AsyncOpenAI: The client shared by every model on this loop.
         """
-        self.client = OpenAI(api_key=api_key)
+        return self._async_clients.get()
 
     def get_response(self, prompt: str) -> str:
         """
@@ -31,27 +65,112 @@ class OpenAIModel:
             str: The response from OpenAI.
         """
         try:
-            # Sending a request to the GPT-4 model
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a helpful assistant with expert knowledge of Pokémon Go. "
-                            "Keep your response to 150 tokens only."
-                        )
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=150
-            )
-            # Extracting the assistant's response content
-            message_content = response.choices[0].message.content
-
-            return message_content
+            if self.cache is None:
+                return self._complete(prompt)
+            key = self.cache.make_key(f"openai:{MODEL_NAME}", prompt, max_tokens=MAX_TOKENS)
+            return self.cache.get_or_compute(key, lambda: self._complete(prompt))
+        except (ValueError, TypeError) as error:
+            return f"Error: {str(error)}"
+
+    def stream_response(self, prompt: str):
+        """
+        Stream the response for the given prompt as it is generated.
+
+        A cached response is yielded as a single chunk; a streamed response
+        is cached once it completes.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Yields:
+            str: Text chunks of the response from OpenAI.
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(f"openai:{MODEL_NAME}", prompt, max_tokens=MAX_TOKENS)
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+        try:
+            yield from stream_completion(self.client, self._request(prompt), self.cache, key)
+        except (ValueError, TypeError) as error:
+            yield f"Error: {str(error)}"
+
+    async def aget_response(self, prompt: str) -> str:
+        """
+        Async variant of ``get_response``; the event loop is free while waiting.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Returns:
+            str: The response from OpenAI.
+        """
+        try:
+            if self.cache is None:
+                return await self._acomplete(prompt)
+            key = self.cache.make_key(f"openai:{MODEL_NAME}", prompt, max_tokens=MAX_TOKENS)
+            return await self.cache.aget_or_compute(key, lambda: self._acomplete(prompt))
         except (ValueError, TypeError) as error:
             return f"Error: {str(error)}"
+
+    @staticmethod
+    def _request(prompt: str) -> dict:
+        """
+        Build the chat completion request for a prompt.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Returns:
+            dict: Keyword arguments for ``chat.completions.create``.
+        """
+        return {
+            "model": MODEL_NAME,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "You are a helpful assistant with expert knowledge of Pokémon Go. "
+                        "Keep your response to 150 tokens only."
+                    )
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": MAX_TOKENS,
+        }
+
+    def _complete(self, prompt: str) -> str:
+        """
+        Send the prompt to the OpenAI API.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Returns:
+            str: The response from OpenAI.
+        """
+        with METRICS.span("openai.generate"):
+            response = self.client.chat.completions.create(**self._request(prompt))
+        METRICS.record_usage(MODEL_NAME, response)
+        # Extracting the assistant's response content
+        return response.choices[0].message.content
+
+    async def _acomplete(self, prompt: str) -> str:
+        """
+        Send the prompt to the OpenAI API without blocking the event loop.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Returns:
+            str: The response from OpenAI.
+        """
+        with METRICS.span("openai.generate"):
+            response = await self.async_client.chat.completions.create(**self._request(prompt))
+        METRICS.record_usage(MODEL_NAME, response)
+        return response.choices[0].message.content
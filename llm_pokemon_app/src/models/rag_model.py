@@ -3,62 +3,98 @@ This module provides a RAG (Retrieval-Augmented Generation) model
 that combines Pokémon Go data retrieval with OpenAI API response generation.
 """
 
-from openai import OpenAI
+import asyncio
 
+from openai import AsyncOpenAI, OpenAI
+
+from llm_pokemon_app.src.models.base import ModelBackend
 from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever  # type: ignore # pylint: disable=import-error
+from llm_pokemon_app.src.utils.concurrency import LoopLocal
+from llm_pokemon_app.src.utils.metrics import METRICS, traced
+from llm_pokemon_app.src.utils.query_router import QueryRouter
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY, api_key_digest
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
+from llm_pokemon_app.src.utils.streaming import stream_completion
+
+MODEL_NAME = "gpt-4o-mini"
+MAX_TOKENS = 150
+TEMPERATURE = 0.7
 
 
-class RAGModel:
+class RAGModel(ModelBackend):
     """
     A class to interact with both a retriever for Pokémon Go data
     and the OpenAI API for generating responses.
     """
 
-    def __init__(self, api_key: str, retriever: "PokemonRetriever"):
+    supports_async = True
+    supports_streaming = True
+    supports_batch = True
+
+    def __init__(self, api_key: str, retriever: "PokemonRetriever",
+                 cache: "ResponseCache" = None):
         """
         Initialize the RAG model with OpenAI API and Pokémon Go retriever.
 
         Args:
             api_key (str): OpenAI API key for GPT models.
             retriever (PokemonRetriever): A retriever object to retrieve Pokémon data.
+            cache (ResponseCache): Optional cache for repeated prompts. The
+                retrieved context is part of the key, so a data reload never
+                serves stale answers.
         """
-        self.client = OpenAI(api_key=api_key)
+        self.cache = cache
+        # Clients (and their connection pools) are shared per API key.
+        self.client = REGISTRY.get_or_create(
+            ("openai-client", api_key_digest(api_key)), lambda: OpenAI(api_key=api_key)
+        )
+        # Async clients are created on first use, one per event loop.
+        self._async_clients = REGISTRY.get_or_create(
+            ("openai-async-client", api_key_digest(api_key)),
+            lambda: LoopLocal(lambda: AsyncOpenAI(api_key=api_key)),
+        )
         self.retriever = retriever
+        self.router = QueryRouter(retriever)
+
+    @property
+    def async_client(self) -> "AsyncOpenAI":
+        """
+        The async client of the running event loop.
+
+        Returns:
+            AsyncOpenAI: The client shared by every model on this loop.
+        """
+        return self._async_clients.get()
 
     def retrieve_context(self, query: str) -> str:
         """
         Retrieve relevant Pokémon data from the dataset based on the query.
 
+        The query router picks the cheapest engine for the question: the
+        structured DPS and name indexes, BM25, or semantic search.
+
         Args:
             query (str): The user input question.
 
         Returns:
             str: A context string with relevant information from the Pokémon Go dataset.
         """
-        if "highest dps" in query.lower():
-            highest_dps_pokemon = self.retriever.retrieve_highest_dps()
-            return (
-                f"The Pokémon with the highest DPS is {highest_dps_pokemon['NAME']} "
-                f"with a DPS of {highest_dps_pokemon['TOTAL_DPS']}."
-            )
+        _, context = self.router.route(query)
+        return context
 
-        if "moves" in query.lower():
-            pokemon_name = query.split()[-1]
-            moves = self.retriever.retrieve_by_name(pokemon_name)
-            if not moves.empty:
-                moves_info = moves.iloc[0]
-                return (
-                    f"{moves_info['NAME']}'s moves: {moves_info['FAST_MOVE']} "
-                    f"(Fast, Power: {moves_info['FAST_MOVE_POWER']}, "
-                    f"Type: {moves_info['FAST_MOVE_TYPE']}), "
-                    f"{moves_info['CHARGE_MOVE']} "
-                    f"(Charge, Power: {moves_info['CHARGE_MOVE_POWER']}, "
-                    f"Type: {moves_info['CHARGED_MOVE_TYPE']})."
-                )
-            return "Sorry, I couldn't find the moves for that Pokémon."
+    def retrieve_contexts(self, queries) -> list:
+        """
+        Retrieve contexts for many queries in one pass.
+
+        Args:
+            queries (Iterable[str]): The user input questions.
 
-        return "Sorry, I couldn't find any relevant data."
+        Returns:
+            list: One context string per query, in input order.
+        """
+        return [context for _, context in self.router.route_many(queries)]
 
+    @traced("rag.get_response")
     def get_response(self, prompt: str) -> str:
         """
         Get the response from the RAG model by combining retrieval and OpenAI API generation.
@@ -71,26 +107,162 @@ class RAGModel:
         """
         try:
             # Step 1: Retrieve context from the Pokémon dataset
-            context = self.retrieve_context(prompt)
+            with METRICS.span("rag.retrieve"):
+                context = self.retrieve_context(prompt)
 
             # Step 2: Use OpenAI API to generate a response with the context
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a helpful assistant with expert knowledge of Pokémon Go. "
-                            f"Keep your response to 150 tokens only. Additional context: {context}."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=150,
-                temperature=0.7,
+            if self.cache is None:
+                return self._complete(prompt, context)
+            key = self.cache.make_key(
+                f"rag:{MODEL_NAME}", prompt, context,
+                max_tokens=MAX_TOKENS, temperature=TEMPERATURE,
             )
+            return self.cache.get_or_compute(key, lambda: self._complete(prompt, context))
+
+        except (ValueError, RuntimeError) as error:
+            return f"Error: {str(error)}"
+
+    def stream_response(self, prompt: str):
+        """
+        Stream the RAG response for the given prompt as it is generated.
 
-            return response.choices[0].message.content
+        Retrieval completes before the first chunk; a cached response is
+        yielded as a single chunk and a streamed one is cached on completion.
 
+        Args:
+            prompt (str): The input prompt/question.
+
+        Yields:
+            str: Text chunks of the generated response.
+        """
+        try:
+            with METRICS.span("rag.retrieve"):
+                context = self.retrieve_context(prompt)
+            key = None
+            if self.cache is not None:
+                key = self.cache.make_key(
+                    f"rag:{MODEL_NAME}", prompt, context,
+                    max_tokens=MAX_TOKENS, temperature=TEMPERATURE,
+                )
+                cached = self.cache.get(key)
+                if cached is not None:
+                    yield cached
+                    return
+            yield from stream_completion(
+                self.client, self._request(prompt, context), self.cache, key
+            )
+
+        except (ValueError, RuntimeError) as error:
+            yield f"Error: {str(error)}"
+
+    async def aget_response(self, prompt: str) -> str:
+        """
+        Async variant of ``get_response``.
+
+        Retrieval runs in a worker thread: semantic lookups and counter or
+        team questions can take long enough to stall other requests.
+
+        Args:
+            prompt (str): The input prompt/question.
+
+        Returns:
+            str: The generated response augmented with retrieved data.
+        """
+        try:
+            with METRICS.span("rag.retrieve"):
+                context = await asyncio.to_thread(self.retrieve_context, prompt)
         except (ValueError, RuntimeError) as error:
             return f"Error: {str(error)}"
+        return await self.agenerate(prompt, context)
+
+    async def agenerate(self, prompt: str, context: str) -> str:
+        """
+        Generate a response for a prompt whose context is already retrieved.
+
+        Batch runs retrieve contexts for many prompts in one pass and then
+        call this directly.
+
+        Args:
+            prompt (str): The input prompt/question.
+            context (str): The retrieved Pokémon data.
+
+        Returns:
+            str: The generated response augmented with retrieved data.
+        """
+        try:
+            if self.cache is None:
+                return await self._acomplete(prompt, context)
+            key = self.cache.make_key(
+                f"rag:{MODEL_NAME}", prompt, context,
+                max_tokens=MAX_TOKENS, temperature=TEMPERATURE,
+            )
+            return await self.cache.aget_or_compute(
+                key, lambda: self._acomplete(prompt, context)
+            )
+
+        except (ValueError, RuntimeError) as error:
+            return f"Error: {str(error)}"
+
+    @staticmethod
+    def _request(prompt: str, context: str) -> dict:
+        """
+        Build the chat completion request for a prompt and its context.
+
+        Args:
+            prompt (str): The input prompt/question.
+            context (str): The retrieved Pokémon data.
+
+        Returns:
+            dict: Keyword arguments for ``chat.completions.create``.
+        """
+        return {
+            "model": MODEL_NAME,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "You are a helpful assistant with expert knowledge of Pokémon Go. "
+                        f"Keep your response to 150 tokens only. Additional context: {context}."
+                    ),
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": MAX_TOKENS,
+            "temperature": TEMPERATURE,
+        }
+
+    def _complete(self, prompt: str, context: str) -> str:
+        """
+        Send the prompt and its retrieved context to the OpenAI API.
+
+        Args:
+            prompt (str): The input prompt/question.
+            context (str): The retrieved Pokémon data.
+
+        Returns:
+            str: The generated response.
+        """
+        with METRICS.span("rag.prompt"):
+            request = self._request(prompt, context)
+        with METRICS.span("rag.generate"):
+            response = self.client.chat.completions.create(**request)
+        METRICS.record_usage(MODEL_NAME, response)
+        return response.choices[0].message.content
+
+    async def _acomplete(self, prompt: str, context: str) -> str:
+        """
+        Send the prompt and its context without blocking the event loop.
+
+        Args:
+            prompt (str): The input prompt/question.
+            context (str): The retrieved Pokémon data.
+
+        Returns:
+            str: The generated response.
+        """
+        with METRICS.span("rag.prompt"):
+            request = self._request(prompt, context)
+        with METRICS.span("rag.generate"):
+            response = await self.async_client.chat.completions.create(**request)
+        METRICS.record_usage(MODEL_NAME, response)
+        return response.choices[0].message.content
@@ -0,0 +1,107 @@
+"""
+This module provides the configuration and resources shared by the entry points:
+the Streamlit app, the HTTP server and batch runs. They build the retriever and
+the response cache the same way, from the same environment variables.
+
+The data stack (pandas, the retriever) is imported when a retriever is built,
+so importing this module keeps the app's cold start light.
+"""
+
+import os
+
+from llm_pokemon_app.src.models.backends import API_KEY_HUGGINGFACE, API_KEY_OPENAI
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
+
+DATASET_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "excel_files", "final_pokemon_dataset.csv"
+)
+# When set, workers memory-map one shared snapshot of a CSV dataset.
+SHARED_DATASET_ENV = "POKEMON_SHARED_DATASET"
+# A SQLite file that persists cached answers across restarts and processes.
+RESPONSE_CACHE_ENV = "POKEMON_RESPONSE_CACHE"
+API_KEY_ENV = {API_KEY_OPENAI: "OPENAI_API_KEY", API_KEY_HUGGINGFACE: "HUGGINGFACE_API_KEY"}
+# Whole-file loaders by extension, as PokemonDataLoader method names (CSV goes
+# through the snapshot cache).
+DATASET_LOADERS = {
+    ".csv": "load_csv_cached",
+    ".parquet": "load_parquet",
+    ".xlsx": "load_excel",
+    ".xlsm": "load_excel",
+}
+
+
+def vector_index_path(dataset_path: str) -> str:
+    """
+    Build the directory of the semantic index persisted for a dataset.
+
+    The index sits next to the dataset's snapshot and shares its key, so
+    editing the dataset invalidates it.
+
+    Args:
+        dataset_path (str): The dataset file.
+
+    Returns:
+        str: The index directory.
+    """
+    # pylint: disable=import-outside-toplevel
+    from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+
+    snapshot = PokemonDataLoader.snapshot_path(dataset_path)
+    return snapshot[:-len(".arrow")] + ".vectors"
+
+
+def build_retriever(dataset_path: str = DATASET_PATH, chunk_rows: int = None):
+    """
+    Load a dataset and build the retriever, with semantic search enabled.
+
+    With POKEMON_SHARED_DATASET set, a CSV dataset is memory-mapped from one
+    snapshot shared by every worker process instead of each loading a copy.
+    The semantic index is persisted next to the dataset's snapshot, and built
+    or loaded on the first semantic lookup (only questions without a lexical
+    match make one).
+
+    Args:
+        dataset_path (str): The dataset (CSV, Parquet or Excel).
+        chunk_rows (int): Stream the dataset in chunks of this many rows instead
+            of loading it whole, for datasets too large to parse at once.
+
+    Returns:
+        PokemonRetriever: The retriever.
+
+    Raises:
+        ValueError: If the dataset has an unsupported file type or cannot be loaded.
+    """
+    # pylint: disable=import-outside-toplevel
+    from llm_pokemon_app.src.data.chunked_dataset import build_retriever as build_chunked
+    from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+    from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+
+    extension = os.path.splitext(dataset_path)[1].lower()
+    if extension not in DATASET_LOADERS:
+        raise ValueError(f"Unsupported dataset file type (expected .csv, .parquet or "
+                         f".xlsx): {dataset_path}")
+    if chunk_rows:
+        retriever = build_chunked(PokemonDataLoader.iter_chunks(dataset_path, chunk_rows))
+    elif extension == ".csv" and os.environ.get(SHARED_DATASET_ENV):
+        retriever = PokemonRetriever.from_shared(dataset_path)
+    else:
+        data = getattr(PokemonDataLoader, DATASET_LOADERS[extension])(dataset_path)
+        if isinstance(data, str):
+            raise ValueError(data)
+        retriever = PokemonRetriever(data)
+    # Chunked and whole loads hold the same rows, so they share the persisted index.
+    retriever.enable_vector_search(vector_index_path(dataset_path), lazy=True)
+    return retriever
+
+
+def build_response_cache() -> ResponseCache:
+    """
+    Build the response cache shared by the cached backends.
+
+    When POKEMON_RESPONSE_CACHE names a SQLite file, cached answers also
+    persist across restarts and processes.
+
+    Returns:
+        ResponseCache: The cache.
+    """
+    return ResponseCache(sqlite_path=os.environ.get(RESPONSE_CACHE_ENV))
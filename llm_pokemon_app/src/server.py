@@ -0,0 +1,499 @@
+"""
+This module provides an HTTP API (FastAPI) for retrieval and the model backends.
+Each worker process loads the retriever and the configured models once at startup
+and reuses them for every request. Requests hold a slot of a bounded admission
+queue: when every slot is busy and the queue is full the server answers 429
+instead of queueing without limit, and every request has a deadline (504).
+Answers are returned as JSON or streamed as server-sent events. With a reload
+interval, each worker watches the dataset file and patches its retriever in
+place of a restart.
+
+Usage:
+    python -m llm_pokemon_app.src.server --port 8000 --workers 4 --preload stub,rag
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import uvicorn  # type: ignore # pylint: disable=import-error
+from fastapi import FastAPI, HTTPException, Request  # type: ignore # pylint: disable=import-error
+from fastapi.responses import PlainTextResponse  # type: ignore # pylint: disable=import-error
+from pydantic import BaseModel  # type: ignore # pylint: disable=import-error
+from sse_starlette.sse import EventSourceResponse  # type: ignore # pylint: disable=import-error
+from starlette.concurrency import iterate_in_threadpool  # type: ignore # pylint: disable=import-error
+
+from llm_pokemon_app.src.data.dataset_watcher import DatasetWatcher
+from llm_pokemon_app.src.models.backends import BACKENDS, get_backend
+from llm_pokemon_app.src.resources import (
+    API_KEY_ENV, DATASET_PATH, build_response_cache, build_retriever,
+)
+from llm_pokemon_app.src.utils.concurrency import AdmissionQueue
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.utils.live_retriever import LiveRetriever
+from llm_pokemon_app.src.utils.metrics import METRICS
+from llm_pokemon_app.src.utils.query_router import QueryRouter
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
+
+# Settings are passed to worker processes through the environment.
+SERVER_ENV = {
+    "dataset_path": "POKEMON_SERVER_DATASET",
+    "max_concurrency": "POKEMON_SERVER_MAX_CONCURRENCY",
+    "max_queue": "POKEMON_SERVER_MAX_QUEUE",
+    "timeout_s": "POKEMON_SERVER_TIMEOUT",
+    "preload": "POKEMON_SERVER_PRELOAD",
+    "reload_interval_s": "POKEMON_SERVER_RELOAD_INTERVAL",
+}
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_MAX_QUEUE = 256
+DEFAULT_TIMEOUT_S = 30.0
+# Seconds a rejected client is asked to wait before retrying.
+RETRY_AFTER_S = 1
+REQUESTS = "pokemon_http_requests_total"
+
+
+class ServerSettings:
+    """
+    Configuration of one server worker.
+    """
+
+    def __init__(self, dataset_path: str = DATASET_PATH,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_queue: int = DEFAULT_MAX_QUEUE, timeout_s: float = DEFAULT_TIMEOUT_S,
+                 preload: tuple = (), reload_interval_s: float = 0.0):
+        """
+        Initialize the settings.
+
+        Args:
+            dataset_path (str): Dataset for the retriever.
+            max_concurrency (int): Requests processed at once per worker.
+            max_queue (int): Requests waiting for a slot before new ones get 429.
+            timeout_s (float): Deadline per request, including time queued.
+            preload (tuple): Backend names created at startup rather than on
+                their first request.
+            reload_interval_s (float): Seconds between checks of the dataset
+                file for changes; 0 never reloads it.
+        """
+        self.dataset_path = dataset_path
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.timeout_s = timeout_s
+        self.preload = tuple(preload)
+        self.reload_interval_s = reload_interval_s
+
+    @classmethod
+    def from_env(cls, environ: dict = None) -> "ServerSettings":
+        """
+        Read the settings from ``SERVER_ENV`` variables, with defaults for unset ones.
+
+        Args:
+            environ (dict): The environment (defaults to os.environ).
+
+        Returns:
+            ServerSettings: The settings.
+        """
+        environ = os.environ if environ is None else environ
+        preload = environ.get(SERVER_ENV["preload"], "")
+        return cls(
+            dataset_path=environ.get(SERVER_ENV["dataset_path"], DATASET_PATH),
+            max_concurrency=int(environ.get(SERVER_ENV["max_concurrency"],
+                                            DEFAULT_MAX_CONCURRENCY)),
+            max_queue=int(environ.get(SERVER_ENV["max_queue"], DEFAULT_MAX_QUEUE)),
+            timeout_s=float(environ.get(SERVER_ENV["timeout_s"], DEFAULT_TIMEOUT_S)),
+            preload=tuple(name for name in preload.split(",") if name),
+            reload_interval_s=float(environ.get(SERVER_ENV["reload_interval_s"], 0.0)),
+        )
+
+    def to_env(self) -> dict:
+        """
+        Render the settings as ``SERVER_ENV`` variables, see ``from_env``.
+
+        Returns:
+            dict: Variable name to value.
+        """
+        values = {**vars(self), "preload": ",".join(self.preload)}
+        return {variable: str(values[name]) for name, variable in SERVER_ENV.items()}
+
+
+class QuestionRequest(BaseModel):
+    """Body of the retrieval and answer endpoints."""
+
+    question: str
+    model: str = "rag"
+
+
+class AdmittedEventSourceResponse(EventSourceResponse):  # pylint: disable=abstract-method
+    """
+    An event stream that holds its admission slot until the response ends.
+
+    The slot is released however the response ends, including when the
+    client disconnects before the first event and the stream is never
+    iterated.
+    """
+
+    def __init__(self, content, stack: AsyncExitStack):
+        """
+        Initialize the response.
+
+        Args:
+            content (AsyncIterable[dict]): The events.
+            stack (AsyncExitStack): Holds the admission slot.
+        """
+        super().__init__(content)
+        self.stack = stack
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.stack.aclose()
+
+
+class ServerState:
+    """
+    The warm resources of one worker: retriever, models and admission queue.
+    """
+
+    def __init__(self, settings: ServerSettings):
+        """
+        Initialize the state; resources are created on first use or by ``warm_up``.
+
+        Args:
+            settings (ServerSettings): The worker configuration.
+        """
+        self.settings = settings
+        self.queue = AdmissionQueue(settings.max_concurrency, settings.max_queue)
+        self.started = time.time()
+
+    @property
+    def retriever(self) -> PokemonRetriever:
+        """
+        The process-wide retriever over the configured dataset.
+
+        Returns:
+            PokemonRetriever | LiveRetriever: The retriever; a live handle
+            when the dataset is reloaded.
+        """
+        path = self.settings.dataset_path
+        if self.settings.reload_interval_s > 0:
+            return REGISTRY.get_or_create(("retriever", path),
+                                          lambda: LiveRetriever(build_retriever(path)))
+        return REGISTRY.get_or_create(("retriever", path), lambda: build_retriever(path))
+
+    @property
+    def watcher(self) -> DatasetWatcher:
+        """
+        The watcher reloading the retriever when the dataset file changes.
+
+        Returns:
+            DatasetWatcher | None: The watcher, None when reloading is off.
+        """
+        if self.settings.reload_interval_s <= 0:
+            return None
+        path = self.settings.dataset_path
+        return REGISTRY.get_or_create(
+            ("dataset-watcher", path),
+            lambda: DatasetWatcher(path, self.retriever, self.settings.reload_interval_s),
+        )
+
+    @property
+    def router(self) -> QueryRouter:
+        """
+        The query router over the retriever.
+
+        Returns:
+            QueryRouter: The router.
+        """
+        path = self.settings.dataset_path
+        return REGISTRY.get_or_create(("router", path), lambda: QueryRouter(self.retriever))
+
+    def model(self, name: str):
+        """
+        Return a backend, creating it on first use.
+
+        API keys are read from OPENAI_API_KEY or HUGGINGFACE_API_KEY.
+
+        Args:
+            name (str): The backend name.
+
+        Returns:
+            ModelBackend: The backend.
+
+        Raises:
+            KeyError: If no backend has this name.
+            ValueError: If the backend's API key is not set.
+        """
+        if name not in BACKENDS:
+            raise KeyError(name)
+        return REGISTRY.get_or_create(self.model_key(name), lambda: self._create_model(name))
+
+    def model_key(self, name: str) -> tuple:
+        """
+        Build the registry key of a backend, which is bound to this dataset.
+
+        Args:
+            name (str): The backend name.
+
+        Returns:
+            tuple: The key.
+        """
+        return ("server-model", name, self.settings.dataset_path)
+
+    def _create_model(self, name: str):
+        """
+        Construct a backend with the resources it declares.
+
+        Args:
+            name (str): The backend name.
+
+        Returns:
+            ModelBackend: The backend.
+
+        Raises:
+            ValueError: If the backend's API key is not set.
+        """
+        spec = get_backend(name)
+        key_env = API_KEY_ENV.get(spec.api_key)
+        api_key = os.environ.get(key_env) if key_env else None
+        if key_env and not api_key:
+            raise ValueError(f"{key_env} is not set")
+        retriever = self.retriever if spec.needs_retriever else None
+        cache = (
+            REGISTRY.get_or_create(("response-cache",), build_response_cache)
+            if spec.uses_cache else None
+        )
+        return spec.create(api_key=api_key, retriever=retriever, cache=cache)
+
+    def warm_up(self):
+        """Build the retriever and the preloaded models before serving."""
+        _ = self.router
+        for name in self.settings.preload:
+            self.model(name)
+        if self.watcher is not None:
+            self.watcher.start()
+
+    def dataset_status(self):
+        """
+        Describe the dataset reloads of this worker.
+
+        Returns:
+            dict | None: The live ``version``, ``last_reload`` summary and
+            ``last_error``; None when reloading is off.
+        """
+        watcher = self.watcher
+        if watcher is None:
+            return None
+        return {"version": watcher.live.version, "last_reload": watcher.last_reload,
+                "last_error": watcher.last_error}
+
+    def lookup_model(self, name: str):
+        """
+        Resolve a backend for a request, mapping failures to HTTP errors.
+
+        Args:
+            name (str): The backend name.
+
+        Returns:
+            ModelBackend: The backend.
+
+        Raises:
+            HTTPException: 404 for an unknown backend, 503 for a missing API key.
+        """
+        try:
+            return self.model(name)
+        except KeyError as error:
+            raise HTTPException(404, f"Unknown model backend: {name}") from error
+        except ValueError as error:
+            raise HTTPException(503, f"Model backend {name} is unavailable: {error}") from error
+
+    @asynccontextmanager
+    async def admitted(self, route: str):
+        """
+        Hold an admission slot, rejecting the request when the queue is full.
+
+        Args:
+            route (str): The route, for the request counter.
+
+        Yields:
+            None
+
+        Raises:
+            HTTPException: 429 with Retry-After when the queue is full.
+        """
+        try:
+            async with self.queue.slot():
+                yield
+        except asyncio.QueueFull as error:
+            METRICS.increment(REQUESTS, route=route, status="429")
+            raise HTTPException(429, "Server is at capacity, retry later",
+                                headers={"Retry-After": str(RETRY_AFTER_S)}) from error
+
+
+def create_app(settings: ServerSettings = None) -> FastAPI:
+    """
+    Build the API; uvicorn calls this once per worker process.
+
+    Args:
+        settings (ServerSettings): The configuration (read from the
+            environment when omitted, as in worker processes).
+
+    Returns:
+        FastAPI: The application.
+    """
+    state = ServerState(settings or ServerSettings.from_env())
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        # Load everything before the first request instead of during it.
+        await asyncio.to_thread(state.warm_up)
+        yield
+        if state.watcher is not None:
+            await asyncio.to_thread(state.watcher.stop)
+
+    app = FastAPI(title="Pokémon Go LLM API", lifespan=lifespan)
+    app.state.server = state
+
+    async def answer(question: QuestionRequest) -> dict:
+        # A backend's first use loads its client or model weights.
+        model = await asyncio.to_thread(state.lookup_model, question.model)
+        started = time.perf_counter()
+        async with state.admitted("/v1/ask"):
+            queued_ms = (time.perf_counter() - started) * 1000
+            response = await model.aget_response(question.question)
+        # Backends report upstream failures as an "Error: ..." answer.
+        if isinstance(response, str) and response.startswith("Error:"):
+            METRICS.increment(REQUESTS, route="/v1/ask", status="502")
+            raise HTTPException(502, response)
+        METRICS.increment(REQUESTS, route="/v1/ask", status="200")
+        return {
+            "model": question.model,
+            "answer": response,
+            "queue_ms": round(queued_ms, 3),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - state.started, 3),
+            "in_flight": min(state.queue.admitted, state.queue.max_concurrency),
+            "queued": state.queue.waiting,
+            "dataset": state.dataset_status(),
+        }
+
+    @app.get("/v1/backends")
+    async def backends() -> list:
+        return [
+            {"name": spec.name, "label": spec.label, "api_key": spec.api_key,
+             "loaded": state.model_key(spec.name) in REGISTRY}
+            for spec in BACKENDS.values()
+        ]
+
+    @app.post("/v1/retrieve")
+    async def retrieve(question: QuestionRequest) -> dict:
+        async with state.admitted("/v1/retrieve"):
+            intent, context = await asyncio.to_thread(state.router.route, question.question)
+        METRICS.increment(REQUESTS, route="/v1/retrieve", status="200")
+        return {"intent": intent, "context": context}
+
+    @app.post("/v1/ask")
+    async def ask(question: QuestionRequest) -> dict:
+        try:
+            return await asyncio.wait_for(answer(question), state.settings.timeout_s)
+        except asyncio.TimeoutError as error:
+            METRICS.increment(REQUESTS, route="/v1/ask", status="504")
+            raise HTTPException(504, "The model did not answer in time") from error
+
+    @app.post("/v1/ask/stream")
+    async def ask_stream(question: QuestionRequest, request: Request):
+        model = await asyncio.to_thread(state.lookup_model, question.model)
+        deadline = time.monotonic() + state.settings.timeout_s
+        stack = AsyncExitStack()
+        # Admission is decided before the stream starts so a rejection is a 429.
+        try:
+            await asyncio.wait_for(stack.enter_async_context(state.admitted("/v1/ask/stream")),
+                                   state.settings.timeout_s)
+        except asyncio.TimeoutError as error:
+            await stack.aclose()
+            raise HTTPException(504, "The model did not answer in time") from error
+
+        async def events():
+            started = time.perf_counter()
+            # Backends stream synchronously (blocking network or model calls).
+            chunks = iterate_in_threadpool(model.stream_response(question.question))
+            while True:
+                try:
+                    # The deadline also covers a backend that hangs between chunks.
+                    chunk = await asyncio.wait_for(anext(chunks),
+                                                   max(deadline - time.monotonic(), 0))
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    METRICS.increment(REQUESTS, route="/v1/ask/stream", status="504")
+                    yield {"event": "error", "data": json.dumps({"error": "timeout"})}
+                    return
+                if await request.is_disconnected():
+                    return
+                yield {"event": "token", "data": chunk}
+            METRICS.increment(REQUESTS, route="/v1/ask/stream", status="200")
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+            yield {"event": "done", "data": json.dumps({"elapsed_ms": elapsed_ms})}
+
+        return AdmittedEventSourceResponse(events(), stack)
+
+    @app.get("/metrics")
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(METRICS.to_prometheus())
+
+    return app
+
+
+def main(argv: list = None) -> int:
+    """
+    Command-line entry point: serve the API with uvicorn.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv).
+
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(description="Serve the Pokémon Go LLM API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes, each with its own warm state")
+    parser.add_argument("--dataset", default=DATASET_PATH)
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help="requests processed at once per worker")
+    parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE,
+                        help="requests waiting per worker before answering 429")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_S,
+                        help="seconds per request, including time queued")
+    parser.add_argument("--preload", default="",
+                        help="comma-separated backends to load at startup, e.g. stub,rag")
+    parser.add_argument("--reload-interval", type=float, default=0.0,
+                        help="seconds between checks of the dataset for changes (0: never)")
+    args = parser.parse_args(argv)
+    preload = tuple(name for name in args.preload.split(",") if name)
+    unknown = [name for name in preload if name not in BACKENDS]
+    if unknown:
+        parser.error(f"unknown backends: {', '.join(unknown)}")
+
+    settings = ServerSettings(args.dataset, args.max_concurrency, args.max_queue,
+                              args.timeout, preload, args.reload_interval)
+    # Worker processes build their own app from these variables.
+    os.environ.update(settings.to_env())
+    uvicorn.run("llm_pokemon_app.src.server:create_app", factory=True, host=args.host,
+                port=args.port, workers=args.workers, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""
+This module provides a BM25 inverted index over textual renderings of dataset rows.
+Each row's text is the concatenation of selected columns (name, types, move names,
+move types). Columns are tokenized per distinct value, so building the index over
+the full dataset only tokenizes a few hundred strings. ``BM25Builder`` indexes a
+dataset chunk by chunk, and ``BM25Index.patched`` re-indexes only changed rows.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list:
+    """
+    Split text into lower-cased alphanumeric tokens.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        list: The tokens.
+    """
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class BM25Index:
+    """
+    An Okapi BM25 index with per-posting weights precomputed at build time.
+
+    Because BM25 term weights depend only on the term and the document, a
+    query is a weighted sum over the postings of its terms. The (term, row,
+    count) triples and row lengths behind the weights are kept, so the index
+    can be patched when rows change.
+    """
+
+    def __init__(self, postings: dict, row_count: int, triples: tuple = None,
+                 lengths: np.ndarray = None, columns: tuple = (), k1: float = 1.2,
+                 b: float = 0.75):
+        """
+        Initialize the index from precomputed postings.
+
+        Args:
+            postings (dict): Mapping of term to ``(rows, weights)`` arrays.
+            row_count (int): Number of indexed rows.
+            triples (tuple): ``(tokens, terms, rows, frequencies)`` behind the
+                postings, see ``from_triples``; required by ``patched``.
+            lengths (np.ndarray): Token count per row; required by ``patched``.
+            columns (tuple): Columns forming each row's text.
+            k1 (float): BM25 term-frequency saturation of the weights.
+            b (float): BM25 length normalization of the weights.
+        """
+        self._postings = postings
+        self.row_count = row_count
+        self._triples = triples
+        self._lengths = lengths
+        self.columns = columns
+        self.k1 = k1
+        self.b = b
+
+    @classmethod
+    def from_triples(cls, tokens: list, terms: np.ndarray, rows: np.ndarray,
+                     frequencies: np.ndarray, lengths: np.ndarray, columns: tuple = (),
+                     k1: float = 1.2, b: float = 0.75) -> "BM25Index":
+        """
+        Compute the posting weights of (term, row, count) triples.
+
+        Args:
+            tokens (list): Token of each term id.
+            terms (np.ndarray): Term id per triple, sorted by term then row.
+            rows (np.ndarray): Row per triple.
+            frequencies (np.ndarray): Occurrences of the term in the row.
+            lengths (np.ndarray): Token count per row.
+            columns (tuple): Columns forming each row's text.
+            k1 (float): BM25 term-frequency saturation.
+            b (float): BM25 length normalization.
+
+        Returns:
+            BM25Index: The index.
+        """
+        row_count = len(lengths)
+        average_length = (lengths.mean() if row_count else 0.0) or 1.0
+        document_frequency = np.bincount(terms, minlength=len(tokens))
+        idf = np.log(1 + (row_count - document_frequency + 0.5) / (document_frequency + 0.5))
+        norm = k1 * (1 - b + b * lengths[rows] / average_length)
+        weights = idf[terms] * frequencies * (k1 + 1) / (frequencies + norm)
+        postings = {}
+        bounds = np.flatnonzero(np.diff(terms)) + 1
+        for start, stop in zip(np.concatenate([[0], bounds]),
+                               np.concatenate([bounds, [len(terms)]])):
+            if stop > start:
+                postings[tokens[terms[start]]] = (rows[start:stop], weights[start:stop])
+        return cls(postings, row_count, (tokens, terms, rows, frequencies), lengths, columns,
+                   k1, b)
+
+    @classmethod
+    def from_columns(cls, data: pd.DataFrame, columns: tuple,
+                     k1: float = 1.2, b: float = 0.75) -> "BM25Index":
+        """
+        Index every row of a DataFrame as the text of the given columns.
+
+        Args:
+            data (pd.DataFrame): The dataset.
+            columns (tuple): Columns forming each row's text; missing ones are skipped.
+            k1 (float): BM25 term-frequency saturation.
+            b (float): BM25 length normalization.
+
+        Returns:
+            BM25Index: The index.
+        """
+        builder = BM25Builder(columns)
+        builder.add(data)
+        return builder.build(k1, b)
+
+    def scores(self, query: str) -> np.ndarray:
+        """
+        Score every row against a query.
+
+        Args:
+            query (str): The query text.
+
+        Returns:
+            np.ndarray: BM25 score per row (zero for rows sharing no term).
+        """
+        scores = np.zeros(self.row_count, dtype=np.float64)
+        for token in set(tokenize(query)):
+            posting = self._postings.get(token)
+            if posting is not None:
+                scores += np.bincount(posting[0], posting[1], minlength=self.row_count)
+        return scores
+
+    def search(self, query: str, top_k: int = 5, candidates: np.ndarray = None) -> tuple:
+        """
+        Find the best-scoring rows for a query.
+
+        Args:
+            query (str): The query text.
+            top_k (int): Number of rows to return.
+            candidates (np.ndarray): Optional row positions to restrict the search to.
+
+        Returns:
+            tuple: ``(positions, scores)`` arrays, best first, only rows with a
+            positive score.
+        """
+        scores = self.scores(query)
+        pool = np.arange(self.row_count) if candidates is None else np.asarray(candidates)
+        pool = pool[scores[pool] > 0]
+        if len(pool) == 0 or top_k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        if len(pool) > top_k:
+            pool = pool[np.argpartition(-scores[pool], top_k - 1)[:top_k]]
+        # Ties keep dataset order.
+        pool = pool[np.lexsort((pool, -scores[pool]))]
+        return pool, scores[pool]
+
+    def patched(self, data: pd.DataFrame, old_to_new: np.ndarray,
+                added: np.ndarray) -> "BM25Index":
+        """
+        Build the index of a new dataset version from this one.
+
+        Only the added rows are tokenized; the triples of the other rows are
+        renumbered. Every weight is recomputed (in one vectorized pass)
+        because the row count and average length changed, so the result
+        scores like a fresh build. This index is left untouched.
+
+        Args:
+            data (pd.DataFrame): The new dataset version.
+            old_to_new (np.ndarray): New position of each indexed row, -1 for
+                rows that were deleted or changed.
+            added (np.ndarray): Ascending positions of the rows of ``data`` to index.
+
+        Returns:
+            BM25Index: The index over ``data``.
+
+        Raises:
+            ValueError: If this index was built without its triples.
+        """
+        if self._triples is None or self._lengths is None:
+            raise ValueError("index has no term triples; rebuild it instead")
+        tokens, terms, rows, frequencies = self._triples
+        builder = BM25Builder(self.columns)
+        builder.add(data.iloc[added])
+        new_tokens, new_terms, new_rows, new_frequencies = builder.triples()
+        vocabulary = {token: term for term, token in enumerate(tokens)}
+        term_ids = np.array(
+            [vocabulary.setdefault(token, len(vocabulary)) for token in new_tokens] + [-1],
+            dtype=np.int64,
+        )
+
+        lengths = np.zeros(len(data), dtype=np.float64)
+        kept = np.flatnonzero(old_to_new >= 0)
+        lengths[old_to_new[kept]] = self._lengths[kept]
+        lengths[added] = builder.lengths
+        rows = old_to_new[rows]
+        present = rows >= 0
+        terms, rows, frequencies = terms[present], rows[present], frequencies[present]
+        new_terms, new_rows = term_ids[new_terms], added[new_rows]
+        if np.any(np.diff(old_to_new[kept]) < 0):
+            # Rows were reordered: sort every triple again.
+            terms = np.concatenate([terms, new_terms])
+            rows = np.concatenate([rows, new_rows])
+            frequencies = np.concatenate([frequencies, new_frequencies])
+            order = np.lexsort((rows, terms))
+            terms, rows, frequencies = terms[order], rows[order], frequencies[order]
+        else:
+            # Renumbering kept the (term, row) order: insert the new triples.
+            keys = terms * len(data) + rows
+            new_keys = new_terms * len(data) + new_rows
+            order = np.argsort(new_keys, kind="stable")
+            inserts = np.searchsorted(keys, new_keys[order])
+            terms = np.insert(terms, inserts, new_terms[order])
+            rows = np.insert(rows, inserts, new_rows[order])
+            frequencies = np.insert(frequencies, inserts, new_frequencies[order])
+        return BM25Index.from_triples(list(vocabulary), terms, rows, frequencies, lengths,
+                                      self.columns, self.k1, self.b)
+
+
+class BM25Builder:
+    """
+    Builds a ``BM25Index`` from consecutive chunks of a dataset.
+
+    Term frequencies are counted per chunk, so the expansion of rows into
+    their terms never exceeds one chunk; only the compact (term, row, count)
+    triples are kept until ``build``.
+    """
+
+    def __init__(self, columns: tuple):
+        """
+        Initialize an empty builder.
+
+        Args:
+            columns (tuple): Columns forming each row's text; missing ones are skipped.
+        """
+        self.columns = columns
+        self.row_count = 0
+        self._vocabulary = {}
+        self._terms, self._rows, self._frequencies, self._lengths = [], [], [], []
+
+    def add(self, data: pd.DataFrame):
+        """
+        Index the rows of a chunk, numbered after the rows already added.
+
+        Args:
+            data (pd.DataFrame): The next rows of the dataset.
+        """
+        row_count = len(data)
+        vocabulary = self._vocabulary
+        term_chunks, row_chunks = [], []
+        lengths = np.zeros(row_count, dtype=np.float64)
+        for column in self.columns:
+            if column not in data.columns:
+                continue
+            codes, uniques = pd.factorize(data[column], use_na_sentinel=True)
+            value_terms = [
+                [vocabulary.setdefault(token, len(vocabulary)) for token in tokenize(value)]
+                for value in uniques
+            ]
+            # CSR layout of the terms of each distinct value; NaN (-1) has none.
+            counts = np.array([len(terms) for terms in value_terms] + [0], dtype=np.int64)
+            starts = np.concatenate([[0], np.cumsum(counts[:-1])])
+            flat_terms = np.array(
+                [term for terms in value_terms for term in terms], dtype=np.int64
+            )
+            row_lengths = counts[codes]
+            lengths += row_lengths
+            total = int(row_lengths.sum())
+            if total == 0:
+                continue
+            # Expand each row's value into its term ids without a Python loop.
+            first = np.repeat(starts[codes], row_lengths)
+            row_starts = np.cumsum(row_lengths) - row_lengths
+            offsets = np.arange(total) - np.repeat(row_starts, row_lengths)
+            term_chunks.append(flat_terms[first + offsets])
+            row_chunks.append(np.repeat(np.arange(row_count, dtype=np.int64), row_lengths))
+
+        if term_chunks:
+            # Sorted by term, then row: the order ``triples`` relies on.
+            keys, frequencies = np.unique(
+                np.concatenate(term_chunks) * row_count + np.concatenate(row_chunks),
+                return_counts=True,
+            )
+            self._terms.append(keys // row_count)
+            self._rows.append(keys % row_count + self.row_count)
+            self._frequencies.append(frequencies)
+        self._lengths.append(lengths)
+        self.row_count += row_count
+
+    def build(self, k1: float = 1.2, b: float = 0.75) -> BM25Index:
+        """
+        Compute the posting weights over every row added.
+
+        Args:
+            k1 (float): BM25 term-frequency saturation.
+            b (float): BM25 length normalization.
+
+        Returns:
+            BM25Index: The index.
+        """
+        return BM25Index.from_triples(*self.triples(), self.lengths, self.columns, k1, b)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """
+        The token count of every row added.
+
+        Returns:
+            np.ndarray: float64 length per row.
+        """
+        if not self._lengths:
+            return np.zeros(0, dtype=np.float64)
+        return np.concatenate(self._lengths)
+
+    def triples(self) -> tuple:
+        """
+        Collect the (term, row, count) triples of every row added.
+
+        Returns:
+            tuple: ``(tokens, terms, rows, frequencies)``: the token of each
+            term id, then term ids, rows and counts sorted by term and row.
+        """
+        tokens = list(self._vocabulary)
+        if not self._terms:
+            empty = np.empty(0, dtype=np.int64)
+            return tokens, empty, empty, empty
+        terms = np.concatenate(self._terms)
+        # Chunks hold increasing rows, so a stable sort by term keeps each
+        # posting list in row order.
+        order = np.argsort(terms, kind="stable")
+        return (tokens, terms[order], np.concatenate(self._rows)[order],
+                np.concatenate(self._frequencies)[order])
@@ -0,0 +1,215 @@
+"""
+This module provides helpers for answering many questions concurrently on one
+event loop. Async API clients are kept per event loop (their connection pools
+cannot cross loops) and shared by every model on that loop, and a bounded
+executor keeps at most ``max_concurrency`` requests in flight. A token bucket
+rate limiter caps the request rate, and an admission queue sheds load once a
+bounded number of requests are already waiting.
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+import weakref
+
+DEFAULT_MAX_CONCURRENCY = 32
+
+
+class LoopLocal:
+    """
+    Lazily create one resource per running event loop.
+
+    Resources are dropped together with their loop, so repeated
+    ``asyncio.run`` calls never reuse a connection pool bound to a closed loop.
+    """
+
+    def __init__(self, factory):
+        """
+        Initialize the holder.
+
+        Args:
+            factory (Callable[[], Any]): Creates the resource for a loop.
+        """
+        self._factory = factory
+        self._resources = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        Return the resource of the running event loop, creating it if needed.
+
+        Returns:
+            Any: The resource.
+
+        Raises:
+            RuntimeError: If no event loop is running.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._resources:
+                self._resources[loop] = self._factory()
+            return self._resources[loop]
+
+
+class RateLimiter:
+    """
+    An async token bucket for use within one event loop.
+
+    ``acquire`` returns immediately while tokens remain and otherwise sleeps
+    until the bucket refills, so bursts of ``burst`` requests are allowed
+    and the long-run rate never exceeds ``rate`` per second.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate (float): Tokens added per second.
+            burst (int): Bucket capacity.
+            clock (Callable[[], float]): Monotonic time source.
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate and burst must be positive")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        while True:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AdmissionQueue:
+    """
+    Bounded concurrency with a bounded wait queue, for use within one event loop.
+
+    Up to ``max_concurrency`` holders run at once and up to ``max_queue`` more
+    wait for a slot; anything beyond that is rejected immediately instead of
+    queueing without limit, so overload turns into fast failures (e.g. HTTP 429)
+    rather than ever-growing latency.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int = 0):
+        """
+        Initialize the queue.
+
+        Args:
+            max_concurrency (int): Maximum holders running at once.
+            max_queue (int): Maximum holders waiting for a slot.
+
+        Raises:
+            ValueError: If max_concurrency is below 1 or max_queue is negative.
+        """
+        if max_concurrency < 1 or max_queue < 0:
+            raise ValueError("max_concurrency must be at least 1 and max_queue not negative")
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.admitted = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @property
+    def waiting(self) -> int:
+        """
+        Count the admitted holders still waiting for a slot.
+
+        Returns:
+            int: The queue length.
+        """
+        return max(0, self.admitted - self.max_concurrency)
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """
+        Hold a slot for the duration of the ``async with`` block.
+
+        Yields:
+            None
+
+        Raises:
+            asyncio.QueueFull: If every slot is busy and the queue is full.
+        """
+        if self.admitted >= self.max_concurrency + self.max_queue:
+            raise asyncio.QueueFull
+        self.admitted += 1
+        try:
+            async with self._semaphore:
+                yield
+        finally:
+            self.admitted -= 1
+
+
+async def gather_bounded(function, items, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list:
+    """
+    Await ``function(item)`` for every item with bounded concurrency.
+
+    A fixed pool of workers pulls items in order, so memory stays constant no
+    matter how many items are submitted.
+
+    Args:
+        function (Callable[[Any], Awaitable]): The coroutine function to apply.
+        items (Iterable): The inputs.
+        max_concurrency (int): Maximum number of calls in flight.
+
+    Returns:
+        list: The results, in input order.
+
+    Raises:
+        ValueError: If max_concurrency is not positive.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    items = list(items)
+    results = [None] * len(items)
+    pending = iter(enumerate(items))
+
+    async def worker():
+        for position, item in pending:
+            results[position] = await function(item)
+
+    await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(items)))))
+    return results
+
+
+async def answer_concurrently(model, questions,
+                              max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list:
+    """
+    Answer questions concurrently with a model's ``aget_response``.
+
+    Args:
+        model (OpenAIModel | RAGModel): The model answering the questions.
+        questions (Iterable[str]): The questions.
+        max_concurrency (int): Maximum number of requests in flight.
+
+    Returns:
+        list: One response per question, in input order.
+    """
+    return await gather_bounded(model.aget_response, questions, max_concurrency)
+
+
+def answer_all(model, questions, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list:
+    """
+    Synchronous entry point for ``answer_concurrently``.
+
+    Args:
+        model (OpenAIModel | RAGModel): The model answering the questions.
+        questions (Iterable[str]): The questions.
+        max_concurrency (int): Maximum number of requests in flight.
+
+    Returns:
+        list: One response per question, in input order.
+    """
+    return asyncio.run(answer_concurrently(model, questions, max_concurrency))
@@ -3,40 +3,645 @@ This module provides a class for retrieving Pokémon Go data from a dataset.
 It supports retrieving Pokémon by name and calculating the highest DPS (damage per second).
 """
 
+import itertools
+import threading
+
+import numpy as np
 import pandas as pd
 
+from llm_pokemon_app.src.data.pokemon_data_loader import column_values
+from llm_pokemon_app.src.utils.bm25 import BM25Index
+from llm_pokemon_app.src.utils.energy_cycle import CYCLE_COLUMNS
+from llm_pokemon_app.src.utils.matchups import (
+    MATCHUP_COLUMNS, NO_TYPE, MatchupEngine, type_code,
+)
+from llm_pokemon_app.src.utils.metrics import traced
+from llm_pokemon_app.src.utils.name_index import NameIndex, normalize_name
+from llm_pokemon_app.src.utils.name_resolver import NameResolver
+from llm_pokemon_app.src.utils.team_search import TeamSearch
+from llm_pokemon_app.src.utils.vector_store import PokemonVectorIndex
+
+# Ranking filters and the dataset columns each one matches against.
+DPS_FILTER_COLUMNS = {
+    "pokemon_type": ("TYPE_ONE", "TYPE_TWO"),
+    "fast_move_type": ("FAST_MOVE_TYPE",),
+    "charged_move_type": ("CHARGED_MOVE_TYPE",),
+    "name": ("NAME",),
+}
+
+# DPS columns rankings can be ordered by; TOTAL_DPS is the default.
+DPS_SORT_COLUMNS = ("TOTAL_DPS", "FAST_DPS", "CHARGE_DPS")
+
+# The move a single-move ranking is about. A Pokémon's fast move has the same DPS
+# whatever its charge move, so these rankings list each (NAME, move) pair once.
+DPS_SORT_MOVES = {"FAST_DPS": "FAST_MOVE", "CHARGE_DPS": "CHARGE_MOVE"}
+
+# Columns rendered as each row's text for lexical (BM25) search.
+LEXICAL_COLUMNS = (
+    "NAME", "TYPE_ONE", "TYPE_TWO", "FAST_MOVE", "FAST_MOVE_TYPE", "CHARGE_MOVE",
+    "CHARGED_MOVE_TYPE",
+)
+
+
+def _column_ratio(data: pd.DataFrame, numerator: str, denominator: str) -> np.ndarray:
+    """
+    Divide two numeric dataset columns into a float64 array.
+
+    Args:
+        data (pd.DataFrame): Pokémon dataset.
+        numerator (str): Name of the numerator column.
+        denominator (str): Name of the denominator column.
+
+    Returns:
+        np.ndarray: Element-wise ratio, NaN where either value is missing.
+    """
+    top = column_values(data, numerator)
+    bottom = column_values(data, denominator)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return top / bottom
+
+
+def compute_move_dps(data: pd.DataFrame) -> tuple:
+    """
+    Compute the fast and charge move DPS of every row.
+
+    Rows are independent, so this also works chunk by chunk.
+
+    Args:
+        data (pd.DataFrame): Pokémon dataset (or a chunk of it).
+
+    Returns:
+        tuple: ``(fast_dps, charge_dps)`` float64 arrays, NaN where not computable.
+    """
+    return (
+        _column_ratio(data, "FAST_MOVE_POWER", "FAST_MOVE_DURATION"),
+        _column_ratio(data, "CHARGE_MOVE_POWER", "CHARGE_MOVE_DURATION"),
+    )
+
+
+def compute_dps_index(data: pd.DataFrame) -> dict:
+    """
+    Compute FAST_DPS, CHARGE_DPS and TOTAL_DPS for every row, plus DPS_ORDER:
+    the row positions by descending TOTAL_DPS, with rows lacking a DPS last.
+
+    Args:
+        data (pd.DataFrame): Pokémon dataset.
+
+    Returns:
+        dict: Read-only NumPy arrays keyed by name.
+    """
+    return build_dps_index(*compute_move_dps(data))
+
+
+def build_dps_index(fast_dps: np.ndarray, charge_dps: np.ndarray) -> dict:
+    """
+    Build the DPS index from per-row move DPS, see ``compute_dps_index``.
+
+    Args:
+        fast_dps (np.ndarray): Fast move DPS per row.
+        charge_dps (np.ndarray): Charge move DPS per row.
+
+    Returns:
+        dict: Read-only NumPy arrays keyed by name.
+    """
+    total_dps = fast_dps + charge_dps
+    # A stable sort keeps the first row on ties, matching idxmax semantics.
+    order = np.argsort(-total_dps, kind="stable")
+    index = {
+        "FAST_DPS": fast_dps,
+        "CHARGE_DPS": charge_dps,
+        "TOTAL_DPS": total_dps,
+        "DPS_ORDER": order,
+    }
+    for array in index.values():
+        array.setflags(write=False)
+    return index
+
 
 class PokemonRetriever:
     """
     A class to retrieve Pokémon data from a dataset.
 
     This class allows for retrieving Pokémon by name and determining the Pokémon
-    with the highest DPS (Damage Per Second).
+    with the highest DPS (Damage Per Second). DPS values are computed once at
+    construction into read-only NumPy arrays, so ranking queries never write to
+    the shared dataset.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    @traced("retriever.build")
+    def __init__(self, data: pd.DataFrame, dps_index: dict = None,
+                 lexical_index: BM25Index = None, name_index: NameIndex = None,
+                 name_resolver: NameResolver = None):
         """
         Initialize the Pokémon retriever with the provided dataset.
 
         Args:
             data (pd.DataFrame): Pokémon dataset as a pandas DataFrame.
+            dps_index (dict): Optional precomputed arrays from ``compute_dps_index``,
+                e.g. attached from a shared snapshot.
+            lexical_index (BM25Index): Optional prebuilt BM25 index over
+                ``LEXICAL_COLUMNS``, e.g. built chunk by chunk.
+            name_index (NameIndex): Optional prebuilt index over the NAME column.
+            name_resolver (NameResolver): Optional prebuilt resolver over the
+                distinct names.
         """
         self.data = data
+        self.name_index = NameIndex(data["NAME"]) if name_index is None else name_index
+        if name_resolver is None:
+            name_resolver = NameResolver(data["NAME"].dropna().unique())
+        self.name_resolver = name_resolver
+        if lexical_index is None:
+            lexical_index = BM25Index.from_columns(data, LEXICAL_COLUMNS)
+        self.lexical_index = lexical_index
+        self.vector_index = None
+        self.vector_search_enabled = False
+        self._vector_directory = None
+        self._vector_lock = threading.Lock()
+        self._matchups = None
+        self._cycle_index = None
+        self._highest_dps_row = None
+        self._team_search = None
+        self._rankings = {}
+        self._build_dps_index(dps_index)
+
+    @classmethod
+    def from_shared(cls, file_path: str, cache_dir: str = None) -> "PokemonRetriever":
+        """
+        Build a retriever over a memory-mapped snapshot shared between processes.
+
+        The first process publishes the dataset snapshot and its DPS index;
+        every process then maps both read-only instead of holding its own copy.
+        The text, name, ranking and matchup indexes are still built per
+        process (see ``SharedDataset``).
+
+        Args:
+            file_path (str): The path to the source CSV file.
+            cache_dir (str): Directory holding snapshots.
+
+        Returns:
+            PokemonRetriever: A retriever over the shared data.
+        """
+        # pylint: disable=import-outside-toplevel
+        from llm_pokemon_app.src.data.shared_dataset import SharedDataset
+
+        shared = SharedDataset(file_path, cache_dir)
+        data = shared.attach()
+        return cls(data, dps_index=shared.attach_index(lambda: compute_dps_index(data)))
+
+    @traced("retriever.patch")
+    def patched(self, data: pd.DataFrame, diff) -> "PokemonRetriever":
+        """
+        Build a retriever over a new dataset version by patching this one's indexes.
+
+        Only the rows the diff inserted or changed are tokenized, hashed and
+        have their move DPS computed; the entries of the other rows are
+        renumbered. Rankings, matchups and energy cycles are then recomputed
+        in vectorized passes. This retriever is left untouched (copy-on-write),
+        so queries running on it keep a consistent view until the caller
+        swaps in the result (see ``LiveRetriever``).
+
+        Args:
+            data (pd.DataFrame): The new dataset version.
+            diff (DatasetDiff): ``diff_datasets(self.data, data)``.
+
+        Returns:
+            PokemonRetriever: A retriever answering like one built over ``data``.
+        """
+        old_to_new, added = diff.old_to_new, diff.added
+        changed_names = [
+            name for name in itertools.chain(self.data["NAME"].iloc[diff.removed],
+                                             data["NAME"].iloc[added])
+            if pd.notna(name)
+        ]
+        shown = {str(name) for name in changed_names}
+
+        kept = np.flatnonzero(old_to_new >= 0)
+        fast_dps = np.empty(len(data), dtype=np.float64)
+        charge_dps = np.empty(len(data), dtype=np.float64)
+        fast_dps[old_to_new[kept]] = self.fast_dps[kept]
+        charge_dps[old_to_new[kept]] = self.charge_dps[kept]
+        fast_dps[added], charge_dps[added] = compute_move_dps(data.iloc[added])
+
+        retriever = PokemonRetriever(
+            data,
+            dps_index=build_dps_index(fast_dps, charge_dps),
+            lexical_index=self.lexical_index.patched(data, old_to_new, added),
+            name_index=self.name_index.patched(
+                data["NAME"], old_to_new, {normalize_name(name) for name in shown}
+            ),
+            name_resolver=self.name_resolver.patched(data["NAME"].dropna().unique()),
+        )
+        if self.vector_index is not None:
+            retriever.vector_index = self.vector_index.patched(data, retriever.total_dps, shown)
+            retriever.vector_search_enabled = True
+        elif self.vector_search_enabled:
+            # The persisted index holds the old rows, so build over the new ones.
+            retriever.enable_vector_search(lazy=True)
+        return retriever
+
+    def _build_dps_index(self, dps_index: dict = None):
+        """
+        Install the per-row DPS arrays and the rows ordered by descending
+        TOTAL_DPS (rows without a DPS sort last). The energy-cycle metrics are
+        built on first use (see ``cycle_index``).
+
+        Args:
+            dps_index (dict): Precomputed arrays from ``compute_dps_index``.
+                Computed from the dataset when omitted.
+        """
+        if dps_index is None:
+            dps_index = compute_dps_index(self.data)
+        self.fast_dps = dps_index["FAST_DPS"]
+        self.charge_dps = dps_index["CHARGE_DPS"]
+        self.total_dps = dps_index["TOTAL_DPS"]
+        self._dps_order = dps_index["DPS_ORDER"]
+        self._dps_ranked_count = int(np.count_nonzero(~np.isnan(self.total_dps)))
+        self._rankings["TOTAL_DPS"] = self._build_ranking(self._dps_order,
+                                                          self._dps_ranked_count)
+
+    @property
+    def dps_index(self) -> dict:
+        """
+        The read-only DPS arrays, in the format accepted by the constructor.
+
+        Returns:
+            dict: FAST_DPS, CHARGE_DPS and TOTAL_DPS per row, and DPS_ORDER.
+        """
+        return {
+            "FAST_DPS": self.fast_dps,
+            "CHARGE_DPS": self.charge_dps,
+            "TOTAL_DPS": self.total_dps,
+            "DPS_ORDER": self._dps_order,
+        }
+
+    def _ranking(self, sort_by: str) -> dict:
+        """
+        The presorted order and filter partitions of one DPS column.
+
+        The TOTAL_DPS ranking is built with the retriever; the others are
+        built on first use and kept. The fast and charge move rankings hold the
+        best row of each (NAME, move) pair only.
+
+        Args:
+            sort_by (str): One of ``DPS_SORT_COLUMNS``.
+
+        Returns:
+            dict: See ``_build_ranking``.
+
+        Raises:
+            ValueError: If ``sort_by`` is not a DPS column.
+        """
+        ranking = self._rankings.get(sort_by)
+        if ranking is None:
+            if sort_by not in DPS_SORT_COLUMNS:
+                raise ValueError(f"Unknown DPS sort column: {sort_by}")
+            values = self.dps_index[sort_by]
+            # A stable sort keeps the first row on ties, as for TOTAL_DPS.
+            order = np.argsort(-values, kind="stable")
+            ranked_count = int(np.count_nonzero(~np.isnan(values)))
+            move = DPS_SORT_MOVES.get(sort_by)
+            if move in self.data.columns and "NAME" in self.data.columns:
+                order, ranked_count = self._first_per_move(order, ranked_count, move)
+            order.setflags(write=False)
+            ranking = self._build_ranking(order, ranked_count)
+            self._rankings[sort_by] = ranking
+        return ranking
+
+    def _first_per_move(self, order: np.ndarray, ranked_count: int,
+                        move: str) -> tuple:
+        """
+        Keep the best ranked row of each (NAME, move) pair.
+
+        Args:
+            order (np.ndarray): Row positions by descending value, rows without
+                a value last.
+            ranked_count (int): Number of rows with a value.
+            move (str): The move column, FAST_MOVE or CHARGE_MOVE.
+
+        Returns:
+            tuple[np.ndarray, int]: The order with the kept rows first, in rank
+            order, and their count.
+        """
+        ranked = order[:ranked_count]
+        # Missing names or moves get code -1 and are kept apart by the shift.
+        names = pd.factorize(self.data["NAME"])[0][ranked].astype(np.int64) + 1
+        moves = pd.factorize(self.data[move])[0][ranked].astype(np.int64) + 1
+        pairs = names * (int(moves.max(initial=0)) + 1) + moves
+        keep = np.zeros(ranked_count, dtype=bool)
+        # np.unique returns each pair's first index, which is its best rank.
+        keep[np.unique(pairs, return_index=True)[1]] = True
+        deduplicated = np.concatenate([ranked[keep], ranked[~keep], order[ranked_count:]])
+        return deduplicated, int(np.count_nonzero(keep))
+
+    def _build_ranking(self, order: np.ndarray, ranked_count: int) -> dict:
+        """
+        Build a ranking over rows presorted by a DPS column.
+
+        Args:
+            order (np.ndarray): Row positions by descending value, rows without
+                a value last.
+            ranked_count (int): Number of rows with a value.
+
+        Returns:
+            dict: ``order``, ``count`` and, per filter, the ``partitions`` and
+            value ``codes`` of the ranked rows (see ``_build_dps_partitions``).
+        """
+        partitions, codes = self._build_dps_partitions(order[:ranked_count])
+        return {"order": order, "count": ranked_count, "partitions": partitions,
+                "codes": codes}
+
+    def _rows_for_ranks(self, ranks: np.ndarray, sort_by: str = "TOTAL_DPS") -> pd.DataFrame:
+        """
+        Materialize the rows at the given DPS ranks with their DPS and
+        energy-cycle columns.
+
+        Args:
+            ranks (np.ndarray): Positions in descending ``sort_by`` order.
+            sort_by (str): The DPS column the ranks refer to.
+
+        Returns:
+            pd.DataFrame: The rows, in the order of ``ranks``.
+        """
+        positions = self._ranking(sort_by)["order"][ranks]
+        return self.data.iloc[positions].assign(
+            FAST_DPS=self.fast_dps[positions],
+            CHARGE_DPS=self.charge_dps[positions],
+            TOTAL_DPS=self.total_dps[positions],
+            **{column: self.cycle_index[column][positions] for column in CYCLE_COLUMNS},
+        )
+
+    def _build_dps_partitions(self, ranked_positions: np.ndarray) -> tuple:
+        """
+        Partition the DPS ranks by every filter value. Each partition is the
+        ascending array of ranks (positions in DPS order) whose row matches the
+        value, so the first k entries of a partition are its top-k rows.
+
+        Args:
+            ranked_positions (np.ndarray): Row positions in DPS order.
+
+        Returns:
+            tuple: ``(partitions, codes)``: per filter, the mapping of
+            normalized value to ranks and the ``(vocabulary, code matrix)``.
+        """
+        partitions = {}
+        value_codes = {}
+        for key, columns in DPS_FILTER_COLUMNS.items():
+            columns = [column for column in columns if column in self.data.columns]
+            if not columns:
+                continue
+            vocabulary = {}
+            codes = []
+            for column in columns:
+                # Factorize raw values first so only distinct values get normalized.
+                column_codes, uniques = pd.factorize(self.data[column], use_na_sentinel=True)
+                remap = np.array(
+                    [
+                        vocabulary.setdefault(str(value).strip().lower(), len(vocabulary))
+                        for value in uniques
+                    ] + [-1],
+                    dtype=np.int64,
+                )
+                codes.append(remap[column_codes[ranked_positions]])
+            stacked = np.vstack(codes)
+            stacked.setflags(write=False)
+            value_codes[key] = (vocabulary, stacked)
+            partitions[key] = self._group_ranks(stacked, vocabulary)
+        return partitions, value_codes
 
-    def retrieve_by_name(self, pokemon_name: str) -> pd.DataFrame:
+    @staticmethod
+    def _group_ranks(codes: np.ndarray, vocabulary: dict) -> dict:
+        """
+        Group ranks by value code with a single sort.
+
+        Args:
+            codes (np.ndarray): Code matrix of shape (columns, ranks), -1 for missing.
+            vocabulary (dict): Mapping of normalized value to code.
+
+        Returns:
+            dict: Mapping of normalized value to its read-only ascending ranks.
+        """
+        width = codes.shape[1]
+        ranks = np.tile(np.arange(width, dtype=np.int64), codes.shape[0])
+        flat = codes.ravel()
+        present = flat >= 0
+        # One sorted key per (code, rank) pair; unique also dedupes rows that
+        # match the same value in both columns.
+        keys = np.unique(flat[present] * width + ranks[present])
+        key_codes = keys // width
+        bounds = np.flatnonzero(np.diff(key_codes)) + 1
+        groups = {}
+        for group in np.split(keys, bounds):
+            if len(group):
+                group_ranks = group % width
+                group_ranks.setflags(write=False)
+                groups[int(group[0] // width)] = group_ranks
+        empty = np.empty(0, dtype=np.int64)
+        return {value: groups.get(code, empty) for value, code in vocabulary.items()}
+
+    @traced("retriever.retrieve_by_name")
+    def retrieve_by_name(self, pokemon_name: str, exact: bool = False) -> pd.DataFrame:
         """
         Retrieve Pokémon data based on the Pokémon's name.
 
+        Matching is case-insensitive and literal (the name is not a pattern).
+
         Args:
-            pokemon_name (str): Name of the Pokémon.
+            pokemon_name (str): Name of the Pokémon, or part of it.
+            exact (bool): Match the whole name instead of any substring.
 
         Returns:
             pd.DataFrame: A filtered DataFrame with matching Pokémon rows.
         """
-        return self.data[
-            self.data["NAME"].str.contains(pokemon_name, case=False, na=False)
-        ]
+        if exact:
+            positions = self.name_index.exact(pokemon_name)
+        else:
+            positions = self.name_index.substring(pokemon_name)
+        return self.data.iloc[positions]
+
+    def resolve_name(self, question: str):
+        """
+        Resolve the Pokémon name mentioned anywhere in a question, tolerating typos.
+
+        Args:
+            question (str): The user's question.
+
+        Returns:
+            str | None: The dataset name, or None if no Pokémon is recognized.
+        """
+        return self.name_resolver.resolve(question)
+
+    @property
+    def matchups(self) -> MatchupEngine:
+        """
+        The matchup engine over the dataset, built on first use.
+
+        Returns:
+            MatchupEngine: The engine.
+        """
+        if self._matchups is None:
+            self._matchups = MatchupEngine(self.data)
+        return self._matchups
+
+    @property
+    def cycle_index(self) -> dict:
+        """
+        The energy-cycle metrics of every moveset, built with the matchup
+        engine on first use. Move damage includes STAB; type effectiveness
+        against the target is neutral.
+
+        Returns:
+            dict: Read-only arrays keyed by ``CYCLE_COLUMNS``.
+        """
+        if self._cycle_index is None:
+            self._cycle_index = self.matchups.cycles.evaluate()
+        return self._cycle_index
+
+    @property
+    def team_search(self) -> TeamSearch:
+        """
+        The team search over the dataset's cycle DPS, built on first use.
+
+        Returns:
+            TeamSearch: The search.
+        """
+        if self._team_search is None:
+            self._team_search = TeamSearch(self.data, self.cycle_index["CYCLE_DPS"])
+        return self._team_search
+
+    @traced("retriever.retrieve_teams")
+    def retrieve_teams(self, top_n: int = 3, pokemon_type: str = None) -> list:
+        """
+        Retrieve the best teams of three Pokémon.
+
+        Args:
+            top_n (int): Number of teams.
+            pokemon_type (str): Only Pokémon of this type.
+
+        Returns:
+            list: Teams, best first (see ``TeamSearch.search``).
+        """
+        return self.team_search.search(top_n, pokemon_type)
+
+    def defender_types(self, defender: str) -> tuple:
+        """
+        Resolve a defender to its types.
+
+        Args:
+            defender (str): A Pokémon name (matched exactly, case-insensitively)
+                or a type name.
+
+        Returns:
+            tuple: The type names, empty if the defender is not recognized.
+        """
+        positions = self.name_index.exact(defender)
+        if len(positions):
+            row = self.data.iloc[positions[0]]
+            return tuple(
+                str(row[column]) for column in ("TYPE_ONE", "TYPE_TWO")
+                if column in self.data.columns and pd.notna(row[column])
+            )
+        return (defender,) if type_code(defender) != NO_TYPE else ()
+
+    @traced("retriever.retrieve_counters")
+    def retrieve_counters(self, defender, top_k: int = 5, unique: bool = True) -> pd.DataFrame:
+        """
+        Retrieve the movesets dealing the most damage per second to a defender.
+
+        Movesets are ranked by energy-aware cycle DPS with STAB and type
+        effectiveness (see ``MatchupEngine``).
+
+        Args:
+            defender (str | tuple): A Pokémon name or type name, or a tuple of
+                the defender's type names.
+            top_k (int): Number of movesets to return.
+            unique (bool): Return only the best moveset of each Pokémon.
 
+        Returns:
+            pd.DataFrame: The movesets, best first, with CYCLE_DPS,
+            FAST_EFFECTIVENESS, CHARGE_EFFECTIVENESS and FIRST_CHARGE_S
+            columns; empty if the defender is not recognized.
+        """
+        types = self.defender_types(defender) if isinstance(defender, str) else tuple(defender)
+        if all(type_code(value) == NO_TYPE for value in types):
+            positions = np.empty(0, dtype=np.int64)
+            columns = {column: np.empty(0) for column in MATCHUP_COLUMNS}
+        else:
+            matchup = self.matchups.against(types)
+            positions = matchup["BEST_PER_NAME" if unique else "ORDER"][:max(top_k, 0)]
+            columns = {column: matchup[column][positions] for column in MATCHUP_COLUMNS}
+        return self.data.iloc[positions].assign(**columns)
+
+    def enable_vector_search(self, directory: str = None,
+                             lazy: bool = False) -> PokemonVectorIndex:
+        """
+        Build (or load a persisted) semantic index for ``retrieve_similar``.
+
+        Args:
+            directory (str): Where the index is persisted. Built in memory only
+                when omitted.
+            lazy (bool): Defer building or loading the index to the first
+                ``retrieve_similar`` call.
+
+        Returns:
+            PokemonVectorIndex: The installed index; None when deferred.
+        """
+        self._vector_directory = directory
+        self.vector_search_enabled = True
+        return None if lazy else self._load_vector_index()
+
+    def _load_vector_index(self) -> PokemonVectorIndex:
+        """
+        Build (or load) the semantic index once, for ``enable_vector_search``.
+
+        Returns:
+            PokemonVectorIndex: The installed index.
+        """
+        with self._vector_lock:
+            if self.vector_index is None:
+                if self._vector_directory is None:
+                    self.vector_index = PokemonVectorIndex.build(self.data, self.total_dps)
+                else:
+                    self.vector_index = PokemonVectorIndex.load_or_build(
+                        self.data, self._vector_directory, self.total_dps
+                    )
+            return self.vector_index
+
+    @traced("retriever.retrieve_similar")
+    def retrieve_similar(self, query: str, top_k: int = 3) -> list:
+        """
+        Retrieve the Pokémon documents semantically closest to a question.
+
+        Args:
+            query (str): The user's question.
+            top_k (int): Number of documents to return.
+
+        Returns:
+            list: ``(score, name, document)`` tuples, most similar first; empty
+            when vector search is not enabled.
+        """
+        if not self.vector_search_enabled:
+            return []
+        return self._load_vector_index().search(query, top_k)
+
+    @traced("retriever.retrieve_lexical")
+    def retrieve_lexical(self, query: str, top_k: int = 5,
+                         pokemon_name: str = None) -> pd.DataFrame:
+        """
+        Retrieve the rows whose name, types and moves best match a question (BM25).
+
+        Args:
+            query (str): The user's question.
+            top_k (int): Number of rows to return.
+            pokemon_name (str): Restrict the search to this Pokémon's rows.
+
+        Returns:
+            pd.DataFrame: Matching rows, best first, with a BM25_SCORE column.
+        """
+        candidates = None if pokemon_name is None else self.name_index.exact(pokemon_name)
+        positions, scores = self.lexical_index.search(query, top_k, candidates)
+        return self.data.iloc[positions].assign(BM25_SCORE=scores)
+
+    @traced("retriever.retrieve_highest_dps")
     def retrieve_highest_dps(self) -> pd.Series:
         """
         Retrieve the Pokémon with the highest DPS (calculated as Power / Duration
@@ -44,15 +649,96 @@ class PokemonRetriever:
 
         Returns:
             pd.Series: The row of the Pokémon with the highest DPS.
+
+        Raises:
+            ValueError: If no row has a computable DPS.
         """
-        # Calculate DPS for each Pokémon (Fast DPS + Charge DPS)
-        self.data["FAST_DPS"] = (
-            self.data["FAST_MOVE_POWER"] / self.data["FAST_MOVE_DURATION"]
-        )
-        self.data["CHARGE_DPS"] = (
-            self.data["CHARGE_MOVE_POWER"] / self.data["CHARGE_MOVE_DURATION"]
-        )
-        self.data["TOTAL_DPS"] = self.data["FAST_DPS"] + self.data["CHARGE_DPS"]
+        if not self._dps_ranked_count:
+            raise ValueError("No Pokémon in the dataset has a computable DPS.")
+        if self._highest_dps_row is None:
+            self._highest_dps_row = self._rows_for_ranks(np.arange(1)).iloc[0]
+        return self._highest_dps_row
+
+    @traced("retriever.retrieve_top_dps")
+    def retrieve_top_dps(self, top_k: int = 10, sort_by: str = "TOTAL_DPS",
+                         **filters: str) -> pd.DataFrame:
+        """
+        Retrieve the Pokémon movesets with the highest DPS, optionally filtered.
+
+        Filters are matched case-insensitively against presorted partitions, so
+        a query only reads the rows it returns (plus the rows rejected by the
+        other filters when several are combined).
+
+        Args:
+            top_k (int): Number of rows to return.
+            sort_by (str): The DPS column to rank by: ``TOTAL_DPS``,
+                ``FAST_DPS`` or ``CHARGE_DPS``.
+            **filters (str): Any of ``pokemon_type`` (TYPE_ONE or TYPE_TWO),
+                ``fast_move_type``, ``charged_move_type`` and ``name`` (exact
+                Pokémon name).
+
+        Returns:
+            pd.DataFrame: Up to ``top_k`` rows in descending ``sort_by`` order
+            (rows without that DPS are left out), including the FAST_DPS,
+            CHARGE_DPS and TOTAL_DPS columns and the energy-cycle columns
+            CYCLE_DPS, TDO, ENERGY_PER_SECOND and FIRST_CHARGE_S (see
+            ``EnergyCycleSimulator``).
+
+        Raises:
+            ValueError: If an unknown filter or sort column is given.
+        """
+        top_k = max(0, top_k)
+        active = {key: value for key, value in filters.items() if value is not None}
+        unknown = set(active) - set(DPS_FILTER_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown DPS filters: {', '.join(sorted(unknown))}")
+        ranking = self._ranking(sort_by)
+        if not active:
+            return self._rows_for_ranks(np.arange(min(top_k, ranking["count"])), sort_by)
+        return self._rows_for_ranks(self._filtered_ranks(top_k, active, ranking), sort_by)
+
+    @staticmethod
+    def _filtered_ranks(top_k: int, filters: dict, ranking: dict) -> np.ndarray:
+        """
+        Find the best ``top_k`` ranks that satisfy every filter.
+
+        Args:
+            top_k (int): Number of ranks to return.
+            filters (dict): Mapping of filter name to requested value.
+            ranking (dict): The ranking to search (see ``_build_ranking``).
+
+        Returns:
+            np.ndarray: Ascending ranks of the matching rows.
+        """
+        empty = np.empty(0, dtype=np.int64)
+        requested = []
+        for key, value in filters.items():
+            normalized = str(value).strip().lower()
+            partition = ranking["partitions"].get(key, {}).get(normalized)
+            if partition is None:
+                return empty
+            requested.append((key, normalized, partition))
+
+        # Walk the smallest partition and check the remaining filters by code.
+        requested.sort(key=lambda item: len(item[2]))
+        _, _, candidates = requested[0]
+        checks = [
+            (ranking["codes"][key][1], ranking["codes"][key][0][value])
+            for key, value, _ in requested[1:]
+        ]
+        if not checks:
+            return candidates[:top_k]
 
-        # Find the Pokémon with the highest total DPS
-        return self.data.loc[self.data["TOTAL_DPS"].idxmax()]
+        matches = []
+        found = 0
+        chunk = max(top_k * 4, 64)
+        for start in range(0, len(candidates), chunk):
+            block = candidates[start:start + chunk]
+            mask = np.ones(len(block), dtype=bool)
+            for codes, code in checks:
+                mask &= (codes[:, block] == code).any(axis=0)
+            matches.append(block[mask])
+            found += int(mask.sum())
+            if found >= top_k:
+                break
+        return np.concatenate(matches)[:top_k] if matches else empty
@@ -0,0 +1,69 @@
+"""
+This module provides a live handle to a PokemonRetriever that can be replaced
+while it serves questions. Retrievers are never modified once built: a reload
+builds a new one (patched from the current one) and the handle swaps it in with
+a single reference assignment, so a lookup sees either the old indexes or the
+new ones, never a half-built mix.
+"""
+
+import threading
+
+
+class LiveRetriever:
+    """
+    A handle to the current retriever, replaced atomically on reload.
+
+    Attribute access is forwarded to the current retriever, so the handle
+    stands in for one. Callers making several lookups for one answer should
+    read ``current`` once and use it throughout (``QueryRouter`` does), so a
+    swap between two lookups cannot mix dataset versions.
+    """
+
+    def __init__(self, retriever):
+        """
+        Initialize the handle.
+
+        Args:
+            retriever (PokemonRetriever): The retriever to serve first.
+        """
+        self._current = retriever
+        self.version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def current(self):
+        """
+        The retriever serving new lookups.
+
+        Returns:
+            PokemonRetriever: The retriever.
+        """
+        return self._current
+
+    def update(self, rebuild):
+        """
+        Replace the retriever with one derived from it.
+
+        ``rebuild`` runs while lookups keep using the current retriever;
+        concurrent updates are serialized so none is lost.
+
+        Args:
+            rebuild (Callable[[PokemonRetriever], PokemonRetriever]): Builds the
+                new retriever from the current one; returning it unchanged
+                keeps it (and the version).
+
+        Returns:
+            PokemonRetriever: The retriever now being served.
+        """
+        with self._lock:
+            retriever = rebuild(self._current)
+            if retriever is not self._current:
+                self._current = retriever
+                self.version += 1
+            return retriever
+
+    def __getattr__(self, name: str):
+        """Forward attributes the handle lacks to the current retriever."""
+        if name == "_current":
+            raise AttributeError(name)
+        return getattr(self._current, name)
@@ -0,0 +1,242 @@
+"""
+This module provides a matchup engine: how much damage every moveset in the dataset
+deals per second to a given defender. Damage follows Pokémon Go's type rules (18x18
+effectiveness chart, 1.6 / 0.625 / 0.390625 multipliers, 1.2 STAB), and DPS is the
+energy-aware cycle DPS of ``EnergyCycleSimulator``. All movesets are evaluated
+against one defender in a single NumPy pass, and the result is cached per defender typing
+(at most 171 typings exist, so the cache needs no eviction).
+
+Attack and defense stats are not in the dataset, so damage is move power times
+the multipliers; rankings are comparable across movesets, absolute numbers are not
+in-game damage.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from llm_pokemon_app.src.utils.energy_cycle import EnergyCycleSimulator, optional_values
+
+TYPES = (
+    "Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting", "Poison", "Ground",
+    "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon", "Dark", "Steel", "Fairy",
+)
+# Misspellings found in the dataset.
+TYPE_ALIASES = {"eletric": "Electric", "steal": "Steel"}
+SUPER_EFFECTIVE = 1.6
+NOT_VERY_EFFECTIVE = 0.625
+# Go has no immunities; "no effect" matchups take the resistance twice.
+IMMUNE = 0.390625
+STAB = 1.2
+
+# Attacking type: (super effective against, not very effective against, no effect on).
+TYPE_CHART = {
+    "Normal": ((), ("Rock", "Steel"), ("Ghost",)),
+    "Fire": (("Grass", "Ice", "Bug", "Steel"), ("Fire", "Water", "Rock", "Dragon"), ()),
+    "Water": (("Fire", "Ground", "Rock"), ("Water", "Grass", "Dragon"), ()),
+    "Electric": (("Water", "Flying"), ("Electric", "Grass", "Dragon"), ("Ground",)),
+    "Grass": (
+        ("Water", "Ground", "Rock"),
+        ("Fire", "Grass", "Poison", "Flying", "Bug", "Dragon", "Steel"), (),
+    ),
+    "Ice": (("Grass", "Ground", "Flying", "Dragon"), ("Fire", "Water", "Ice", "Steel"), ()),
+    "Fighting": (
+        ("Normal", "Ice", "Rock", "Dark", "Steel"),
+        ("Poison", "Flying", "Psychic", "Bug", "Fairy"), ("Ghost",),
+    ),
+    "Poison": (("Grass", "Fairy"), ("Poison", "Ground", "Rock", "Ghost"), ("Steel",)),
+    "Ground": (
+        ("Fire", "Electric", "Poison", "Rock", "Steel"), ("Grass", "Bug"), ("Flying",),
+    ),
+    "Flying": (("Grass", "Fighting", "Bug"), ("Electric", "Rock", "Steel"), ()),
+    "Psychic": (("Fighting", "Poison"), ("Psychic", "Steel"), ("Dark",)),
+    "Bug": (
+        ("Grass", "Psychic", "Dark"),
+        ("Fire", "Fighting", "Poison", "Flying", "Ghost", "Steel", "Fairy"), (),
+    ),
+    "Rock": (("Fire", "Ice", "Flying", "Bug"), ("Fighting", "Ground", "Steel"), ()),
+    "Ghost": (("Psychic", "Ghost"), ("Dark",), ("Normal",)),
+    "Dragon": (("Dragon",), ("Steel",), ("Fairy",)),
+    "Dark": (("Psychic", "Ghost"), ("Fighting", "Dark", "Fairy"), ()),
+    "Steel": (("Ice", "Rock", "Fairy"), ("Fire", "Water", "Electric", "Steel"), ()),
+    "Fairy": (("Fighting", "Dragon", "Dark"), ("Fire", "Poison", "Steel"), ()),
+}
+# Code of missing or unknown types; its row and column of the chart are neutral.
+NO_TYPE = len(TYPES)
+# Per-row arrays of a matchup, as added to retrieved rows.
+MATCHUP_COLUMNS = ("CYCLE_DPS", "FAST_EFFECTIVENESS", "CHARGE_EFFECTIVENESS", "FIRST_CHARGE_S")
+
+
+def build_effectiveness() -> np.ndarray:
+    """
+    Build the effectiveness matrix from ``TYPE_CHART``.
+
+    Returns:
+        np.ndarray: Read-only (19, 19) multipliers indexed by
+        ``[attacking type, defending type]``; the last row and column
+        (``NO_TYPE``) are neutral.
+    """
+    matrix = np.ones((NO_TYPE + 1, NO_TYPE + 1), dtype=np.float64)
+    codes = {name: code for code, name in enumerate(TYPES)}
+    for attacker, groups in TYPE_CHART.items():
+        for multiplier, defenders in zip((SUPER_EFFECTIVE, NOT_VERY_EFFECTIVE, IMMUNE), groups):
+            for defender in defenders:
+                matrix[codes[attacker], codes[defender]] = multiplier
+    matrix.setflags(write=False)
+    return matrix
+
+
+EFFECTIVENESS = build_effectiveness()
+
+
+def type_code(value) -> int:
+    """
+    Map a type name to its code, tolerating case and known misspellings.
+
+    Args:
+        value (Any): The type name (or a missing value).
+
+    Returns:
+        int: The index in ``TYPES``, or ``NO_TYPE``.
+    """
+    if not isinstance(value, str):
+        return NO_TYPE
+    name = value.strip().lower()
+    name = TYPE_ALIASES.get(name, name).lower()
+    for code, candidate in enumerate(TYPES):
+        if candidate.lower() == name:
+            return code
+    return NO_TYPE
+
+
+def type_codes(data: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    Map a type column to codes, normalizing each distinct value once.
+
+    Args:
+        data (pd.DataFrame): Pokémon dataset.
+        column (str): The type column.
+
+    Returns:
+        np.ndarray: Codes per row; ``NO_TYPE`` where missing or unknown.
+    """
+    if column not in data.columns:
+        return np.full(len(data), NO_TYPE, dtype=np.int64)
+    codes, uniques = pd.factorize(data[column], use_na_sentinel=True)
+    remap = np.array([type_code(value) for value in uniques] + [NO_TYPE], dtype=np.int64)
+    return remap[codes]
+
+
+class MatchupEngine:
+    """
+    Cycle DPS of every moveset against any defender, cached per defender typing.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Precompute the defender-independent parts of every moveset.
+
+        Args:
+            data (pd.DataFrame): Pokémon dataset.
+        """
+        self.row_count = len(data)
+        attacker_one = type_codes(data, "TYPE_ONE")
+        attacker_two = type_codes(data, "TYPE_TWO")
+        self.fast_type = type_codes(data, "FAST_MOVE_TYPE")
+        self.charge_type = type_codes(data, "CHARGED_MOVE_TYPE")
+
+        def stab(move_type):
+            same = (move_type != NO_TYPE) & (
+                (move_type == attacker_one) | (move_type == attacker_two)
+            )
+            return np.where(same, STAB, 1.0)
+
+        self.cycles = EnergyCycleSimulator(
+            data,
+            fast_damage=optional_values(data, "FAST_MOVE_POWER") * stab(self.fast_type),
+            charge_damage=optional_values(data, "CHARGE_MOVE_POWER") * stab(self.charge_type),
+        )
+        self._name_codes = pd.factorize(data["NAME"])[0] if "NAME" in data.columns else None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def defender_key(types) -> tuple:
+        """
+        Normalize a defender typing into its cache key.
+
+        Args:
+            types (Iterable[str]): One or two type names; unknown or missing
+                ones are ignored.
+
+        Returns:
+            tuple: The sorted distinct type codes.
+
+        Raises:
+            ValueError: If no known type is given.
+        """
+        key = tuple(sorted({type_code(value) for value in types} - {NO_TYPE}))
+        if not key:
+            raise ValueError(f"No known Pokémon type in {list(types)!r}")
+        return key
+
+    def against(self, types) -> dict:
+        """
+        Evaluate every moveset against a defender.
+
+        Args:
+            types (Iterable[str]): The defender's one or two types.
+
+        Returns:
+            dict: Read-only arrays: FAST_EFFECTIVENESS and CHARGE_EFFECTIVENESS
+            (type multipliers per row), CYCLE_DPS, FIRST_CHARGE_S (seconds until
+            the first charge move hits, NaN if it never does), ORDER (rows by
+            descending CYCLE_DPS, rows without a DPS last) and BEST_PER_NAME
+            (the best row of each Pokémon, in ORDER).
+
+        Raises:
+            ValueError: If no known type is given.
+        """
+        key = self.defender_key(types)
+        matchup = self._cache.get(key)
+        if matchup is None:
+            matchup = self._evaluate(key)
+            with self._lock:
+                matchup = self._cache.setdefault(key, matchup)
+        return matchup
+
+    def _evaluate(self, key: tuple) -> dict:
+        """
+        Compute the matchup arrays for one defender typing.
+
+        Args:
+            key (tuple): Type codes from ``defender_key``.
+
+        Returns:
+            dict: See ``against``.
+        """
+        # Multiplier of each attacking type against the defender.
+        versus = np.prod(EFFECTIVENESS[:, list(key)], axis=1)
+        fast_effectiveness = versus[self.fast_type]
+        charge_effectiveness = versus[self.charge_type]
+        cycle_dps = self.cycles.cycle_dps(fast_effectiveness, charge_effectiveness)
+        # A stable sort keeps dataset order on ties; NaN sorts last.
+        order = np.argsort(-cycle_dps, kind="stable")
+        order = order[:int(np.count_nonzero(~np.isnan(cycle_dps)))]
+        if self._name_codes is None:
+            best_per_name = order
+        else:
+            _, first = np.unique(self._name_codes[order], return_index=True)
+            best_per_name = order[np.sort(first)]
+        matchup = {
+            "FAST_EFFECTIVENESS": fast_effectiveness,
+            "CHARGE_EFFECTIVENESS": charge_effectiveness,
+            "CYCLE_DPS": cycle_dps,
+            "FIRST_CHARGE_S": self.cycles.first_charge_s,
+            "ORDER": order,
+            "BEST_PER_NAME": best_per_name,
+        }
+        for array in matchup.values():
+            array.setflags(write=False)
+        return matchup
@@ -0,0 +1,384 @@
+"""
+This module provides an in-process metrics and tracing layer.
+Spans time the pipeline stages (load, retrieve, prompt, generate) into latency
+histograms and keep a bounded log of recent spans with their parent stage;
+token counts and cache lookups are recorded alongside. Everything is off by
+default: while disabled a span is a shared no-op context manager, so the
+instrumented code pays for one attribute check. Metrics are exported as
+Prometheus text, a JSON snapshot, or served over HTTP by ``serve_metrics``.
+
+Enable with the POKEMON_METRICS=1 environment variable or ``METRICS.enable()``.
+"""
+
+import bisect
+import collections
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_ENV = "POKEMON_METRICS"
+STAGE_SECONDS = "pokemon_stage_seconds"
+STAGE_ERRORS = "pokemon_stage_errors_total"
+TOKENS = "pokemon_tokens"
+CACHE_REQUESTS = "pokemon_cache_requests_total"
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+TOKEN_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+RECENT_SPANS = 256
+_NO_SPAN = contextlib.nullcontext()
+
+
+class Histogram:
+    """
+    Counts of observations per upper bound, with their total and sum.
+    """
+
+    def __init__(self, buckets: tuple):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets (tuple): Sorted upper bounds; larger values fall in +Inf.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """
+        Record one observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict:
+        """
+        Summarize the histogram.
+
+        Returns:
+            dict: Count, sum, mean and cumulative counts per upper bound.
+        """
+        cumulative, running = {}, 0
+        for bound, count in zip(list(self.buckets) + ["+Inf"], self.counts):
+            running += count
+            cumulative[str(bound)] = running
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+            "buckets": cumulative,
+        }
+
+
+class Metrics:
+    """
+    A thread-safe registry of counters and histograms keyed by name and labels.
+    """
+
+    def __init__(self, enabled: bool = False, recent_spans: int = RECENT_SPANS):
+        """
+        Initialize the registry.
+
+        Args:
+            enabled (bool): Whether recording starts enabled.
+            recent_spans (int): How many finished spans the trace log keeps.
+        """
+        self.enabled = enabled
+        self._counters = {}
+        self._histograms = {}
+        self._spans = collections.deque(maxlen=recent_spans)
+        # A context variable (not a thread-local) so concurrent asyncio tasks
+        # on one thread each see their own enclosing stage.
+        self._active = contextvars.ContextVar("active_stage", default=None)
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """Start recording."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording; recorded values are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """Drop every recorded value."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._spans.clear()
+
+    def span(self, stage: str):
+        """
+        Time a pipeline stage.
+
+        Args:
+            stage (str): The stage name, e.g. "rag.retrieve".
+
+        Returns:
+            ContextManager: Records the stage's latency when enabled; a no-op otherwise.
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return self._span(stage)
+
+    @contextlib.contextmanager
+    def _span(self, stage: str):
+        """
+        Record a span's latency, parent stage and failure.
+
+        Args:
+            stage (str): The stage name.
+
+        Yields:
+            None
+        """
+        parent = self._active.get()
+        token = self._active.set(stage)
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._active.reset(token)
+            self.observe(STAGE_SECONDS, elapsed, LATENCY_BUCKETS, stage=stage)
+            if failed:
+                self.increment(STAGE_ERRORS, stage=stage)
+            with self._lock:
+                self._spans.append({
+                    "stage": stage,
+                    "parent": parent,
+                    "started": round(time.time() - elapsed, 6),
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "error": failed,
+                })
+
+    def increment(self, name: str, amount: float = 1, **labels):
+        """
+        Add to a counter.
+
+        Args:
+            name (str): The counter name.
+            amount (float): The increment.
+            **labels: Label values identifying the series.
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, buckets: tuple = LATENCY_BUCKETS, **labels):
+        """
+        Record a value in a histogram.
+
+        Args:
+            name (str): The histogram name.
+            value (float): The observed value.
+            buckets (tuple): Upper bounds, used when the series is created.
+            **labels: Label values identifying the series.
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def record_tokens(self, model: str, prompt: int = None, completion: int = None):
+        """
+        Record the token counts of one generation.
+
+        Args:
+            model (str): The model name.
+            prompt (int): Prompt tokens, if known.
+            completion (int): Generated tokens, if known.
+        """
+        for kind, count in (("prompt", prompt), ("completion", completion)):
+            if isinstance(count, int):
+                self.observe(TOKENS, count, TOKEN_BUCKETS, model=model, kind=kind)
+
+    def record_usage(self, model: str, response):
+        """
+        Record the token counts reported by a chat completion.
+
+        Args:
+            model (str): The model name.
+            response (ChatCompletion): The response; ignored without ``usage``.
+        """
+        usage = getattr(response, "usage", None) if self.enabled else None
+        if usage is not None:
+            self.record_tokens(model, getattr(usage, "prompt_tokens", None),
+                               getattr(usage, "completion_tokens", None))
+
+    def snapshot(self) -> dict:
+        """
+        Capture every recorded value.
+
+        Returns:
+            dict: Counters, histograms, cache hit rates and the recent spans.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: histogram.snapshot() for key, histogram in self._histograms.items()}
+            spans = list(self._spans)
+
+        lookups = {}
+        for (name, labels), value in counters.items():
+            if name == CACHE_REQUESTS:
+                labels = dict(labels)
+                totals = lookups.setdefault(labels.get("cache", ""), {"hit": 0, "miss": 0})
+                totals[labels.get("result", "miss")] += value
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(counters.items())
+            ],
+            "histograms": [
+                {"name": name, "labels": dict(labels), **summary}
+                for (name, labels), summary in sorted(histograms.items())
+            ],
+            "cache_hit_rate": {
+                cache: totals["hit"] / (totals["hit"] + totals["miss"])
+                for cache, totals in lookups.items() if totals["hit"] + totals["miss"]
+            },
+            "recent_spans": spans,
+        }
+
+    def to_json(self) -> str:
+        """
+        Export the snapshot as JSON.
+
+        Returns:
+            str: The JSON document.
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Export counters and histograms in the Prometheus text format.
+
+        Returns:
+            str: The exposition text.
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                (key, histogram.snapshot()) for key, histogram in self._histograms.items()
+            )
+
+        lines, typed = [], set()
+        for (name, labels), value in counters:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_labels(labels)} {value}")
+        for (name, labels), summary in histograms:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            for bound, count in summary["buckets"].items():
+                lines.append(f"{name}_bucket{_labels(labels + (('le', bound),))} {count}")
+            lines.append(f"{name}_sum{_labels(labels)} {summary['sum']}")
+            lines.append(f"{name}_count{_labels(labels)} {summary['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: tuple) -> str:
+    """
+    Render label pairs in the Prometheus text format.
+
+    Args:
+        labels (tuple): ``(name, value)`` pairs.
+
+    Returns:
+        str: ``{name="value",...}``, or an empty string without labels.
+    """
+    if not labels:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(
+            name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for name, value in labels
+    )
+    return "{" + rendered + "}"
+
+
+METRICS = Metrics(enabled=os.environ.get(METRICS_ENV, "") not in ("", "0", "false"))
+
+
+def traced(stage: str):
+    """
+    Decorate a function so each call is recorded as a span of ``METRICS``.
+
+    Args:
+        stage (str): The stage name.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return function(*args, **kwargs)
+            with METRICS.span(stage):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1", metrics: Metrics = METRICS):
+    """
+    Serve ``/metrics`` (Prometheus text) and ``/metrics.json`` from a daemon thread.
+
+    Args:
+        port (int): The port; 0 picks a free one.
+        host (str): The interface to bind.
+        metrics (Metrics): The registry to export.
+
+    Returns:
+        ThreadingHTTPServer: The running server; ``server_address`` holds the port.
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Answers scrapes of the metrics endpoints."""
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """Send the requested export."""
+            if self.path == "/metrics":
+                body, content_type = metrics.to_prometheus(), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, content_type = metrics.to_json(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            """Keep scrapes out of the application log."""
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,231 @@
+"""
+This module provides an index over Pokémon names for exact and substring lookups.
+Names are normalized once at build time, so queries never scan the dataset.
+"""
+
+import itertools
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+# Sorts after every character a normalized name can contain.
+_SUFFIX_SENTINEL = chr(0x10FFFF)
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a Pokémon name for lookups.
+
+    Args:
+        name (str): The raw name.
+
+    Returns:
+        str: The stripped, lower-cased name.
+    """
+    return str(name).strip().lower()
+
+
+class NameIndex:
+    """
+    An index mapping Pokémon names to dataset row positions.
+
+    Exact lookups use a hash map of normalized name to row positions. Substring
+    lookups use a suffix array over the distinct names: every suffix that starts
+    with the query identifies a name containing it.
+    """
+
+    def __init__(self, names: pd.Series):
+        """
+        Build the index from the dataset's NAME column.
+
+        Args:
+            names (pd.Series): Pokémon names, one per dataset row.
+        """
+        codes, uniques = pd.factorize(names, use_na_sentinel=True)
+        positions = self._group_positions(codes, len(uniques))
+
+        self._exact = {}
+        for name, name_positions in zip(uniques, positions):
+            key = normalize_name(name)
+            if key in self._exact:
+                # Names differing only by case or whitespace share one entry.
+                name_positions = np.union1d(self._exact[key], name_positions)
+                name_positions.setflags(write=False)
+            self._exact[key] = name_positions
+
+        self.names = tuple(self._exact)
+        self._positions = tuple(self._exact.values())
+        suffixes = self._suffix_entries(enumerate(self.names))
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._suffix_names = np.array([name_id for _, name_id in suffixes], dtype=np.int64)
+
+    @staticmethod
+    def _suffix_entries(named_ids) -> list:
+        """
+        List the suffixes of some names in sorted order.
+
+        Args:
+            named_ids (Iterable[tuple]): ``(name_id, name)`` pairs.
+
+        Returns:
+            list: Sorted ``(suffix, name_id)`` pairs.
+        """
+        return sorted(
+            (name[start:], name_id) for name_id, name in named_ids for start in range(len(name))
+        )
+
+    def patched(self, names: pd.Series, old_to_new: np.ndarray, touched) -> "NameIndex":
+        """
+        Build the index of a new dataset version from this one.
+
+        Names without changed rows keep their positions, renumbered; only the
+        touched names are grouped again. The suffix array is reused when the
+        set of names is unchanged and merged otherwise, so the result answers
+        every lookup like a fresh build. This index is left untouched.
+
+        Args:
+            names (pd.Series): The new version's NAME column.
+            old_to_new (np.ndarray): New position of each indexed row, -1 for
+                rows that were deleted or changed.
+            touched (set): Normalized names of the deleted, changed and added rows.
+
+        Returns:
+            NameIndex: The index over ``names``.
+        """
+        # pylint: disable=protected-access  # fills in a new instance of this class
+        codes, uniques = pd.factorize(names, use_na_sentinel=True)
+        keys = [normalize_name(name) for name in uniques]
+        touched_codes = [code for code, key in enumerate(keys) if key in touched]
+        local = np.full(len(keys) + 1, -1, dtype=np.int64)
+        local[touched_codes] = np.arange(len(touched_codes))
+        selected = np.flatnonzero(local[codes] >= 0)
+        groups = self._group_positions(local[codes[selected]], len(touched_codes))
+
+        regrouped = {}
+        for code, group in zip(touched_codes, groups):
+            key = keys[code]
+            positions = selected[group]
+            if key in regrouped:
+                positions = np.union1d(regrouped[key], positions)
+            positions.setflags(write=False)
+            regrouped[key] = positions
+
+        kept_rows = old_to_new[old_to_new >= 0]
+        # Remapped positions stay ascending unless rows were reordered.
+        reordered = bool(np.any(np.diff(kept_rows) < 0))
+        index = NameIndex.__new__(NameIndex)
+        index._exact = {}
+        for key in dict.fromkeys(keys):
+            positions = regrouped.get(key)
+            if positions is None:
+                positions = old_to_new[self._exact[key]]
+                if reordered:
+                    positions = np.sort(positions)
+                positions.setflags(write=False)
+            index._exact[key] = positions
+        index.names = tuple(index._exact)
+        index._positions = tuple(index._exact.values())
+        if index.names == self.names:
+            index._suffixes, index._suffix_names = self._suffixes, self._suffix_names
+            return index
+
+        ids = {name: name_id for name_id, name in enumerate(index.names)}
+        remap = np.array([ids.get(name, -1) for name in self.names] + [-1], dtype=np.int64)
+        suffix_ids = remap[self._suffix_names]
+        kept = suffix_ids >= 0
+        suffixes = list(itertools.compress(self._suffixes, kept))
+        old_names = set(self.names)
+        entries = self._suffix_entries(
+            (ids[name], name) for name in index.names if name not in old_names
+        )
+        # Insert the (few) new suffixes into the sorted run of the kept ones.
+        inserts = [bisect_left(suffixes, suffix) for suffix, _ in entries]
+        index._suffixes = []
+        start = 0
+        for position, (suffix, _) in zip(inserts, entries):
+            index._suffixes.extend(suffixes[start:position])
+            index._suffixes.append(suffix)
+            start = position
+        index._suffixes.extend(suffixes[start:])
+        index._suffix_names = np.insert(
+            suffix_ids[kept], inserts, [name_id for _, name_id in entries]
+        ).astype(np.int64)
+        return index
+
+    @staticmethod
+    def _group_positions(codes: np.ndarray, count: int) -> list:
+        """
+        Group row positions by name code.
+
+        Args:
+            codes (np.ndarray): Name code per row, -1 for missing names.
+            count (int): Number of distinct names.
+
+        Returns:
+            list: Read-only ascending row positions for each code.
+        """
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(count + 1))
+        groups = []
+        for code in range(count):
+            group = order[bounds[code]:bounds[code + 1]]
+            group.setflags(write=False)
+            groups.append(group)
+        return groups
+
+    def exact(self, name: str) -> np.ndarray:
+        """
+        Look up the rows whose name equals ``name`` (case-insensitive).
+
+        Args:
+            name (str): The Pokémon name.
+
+        Returns:
+            np.ndarray: Ascending row positions, empty when there is no match.
+        """
+        return self._exact.get(normalize_name(name), np.empty(0, dtype=np.int64))
+
+    def matching_names(self, fragment: str) -> list:
+        """
+        List the normalized names containing ``fragment``.
+
+        Args:
+            fragment (str): The substring to search for (case-insensitive).
+
+        Returns:
+            list: Matching normalized names, in index order.
+        """
+        return [self.names[name_id] for name_id in self._matching_ids(fragment)]
+
+    def _matching_ids(self, fragment: str) -> np.ndarray:
+        """
+        Find the ids of names containing ``fragment`` via the suffix array.
+
+        Args:
+            fragment (str): The substring to search for.
+
+        Returns:
+            np.ndarray: Sorted unique name ids.
+        """
+        key = normalize_name(fragment)
+        start = bisect_left(self._suffixes, key)
+        stop = bisect_left(self._suffixes, key + _SUFFIX_SENTINEL, lo=start)
+        return np.unique(self._suffix_names[start:stop])
+
+    def substring(self, fragment: str) -> np.ndarray:
+        """
+        Look up the rows whose name contains ``fragment`` (case-insensitive).
+
+        Args:
+            fragment (str): The substring to search for.
+
+        Returns:
+            np.ndarray: Ascending row positions, empty when there is no match.
+        """
+        name_ids = self._matching_ids(fragment)
+        if len(name_ids) == 0:
+            return np.empty(0, dtype=np.int64)
+        if len(name_ids) == 1:
+            return self._positions[name_ids[0]]
+        return np.sort(np.concatenate([self._positions[name_id] for name_id in name_ids]))
@@ -0,0 +1,268 @@
+"""
+This module provides fuzzy resolution of Pokémon names mentioned in free-text questions.
+It combines exact phrase lookups with a character trigram index and edit-distance
+re-ranking, so misspelled names still resolve to a dataset name.
+"""
+
+import re
+
+import numpy as np
+
+NAME_TOKEN_PATTERN = re.compile(r"[\w'%♀♂]+(?:-[\w'%♀♂]+)*")
+
+# Question words that never start or end a fuzzy-matched name.
+STOPWORDS = frozenset({
+    "a", "against", "an", "and", "are", "attack", "attackers", "attacks", "best", "can",
+    "charge", "charged", "counter", "counters", "do", "does", "dps", "fast", "for", "get",
+    "good", "great", "has", "have", "highest", "how", "i", "in", "is", "it", "its", "learn",
+    "league", "master", "me", "move", "moves", "moveset", "movesets", "my", "of", "on", "or",
+    "pokemon", "pokémon", "raid", "should", "strong", "strongest", "team", "the", "to", "top",
+    "type", "ultra", "use", "vs", "what", "what's", "which", "who", "with",
+})
+
+
+def phrase_tokens(text: str) -> list:
+    """
+    Split text into lower-cased name tokens, dropping punctuation and possessives.
+
+    Args:
+        text (str): A Pokémon name or a question.
+
+    Returns:
+        list: The tokens, e.g. ``["mr", "mime"]`` for "Mr. Mime's".
+    """
+    tokens = NAME_TOKEN_PATTERN.findall(text.lower().replace(".", ""))
+    return [token[:-2] if token.endswith("'s") else token for token in tokens]
+
+
+def trigrams(text: str) -> set:
+    """
+    Collect the character trigrams of a padded phrase.
+
+    Args:
+        text (str): The phrase.
+
+    Returns:
+        set: Distinct trigrams.
+    """
+    padded = f"  {text} "
+    return {padded[start:start + 3] for start in range(len(padded) - 2)}
+
+
+def edit_distance(source: str, target: str, limit: int) -> int:
+    """
+    Compute the Levenshtein distance, stopping early once it exceeds ``limit``.
+
+    Args:
+        source (str): First string.
+        target (str): Second string.
+        limit (int): Largest distance of interest.
+
+    Returns:
+        int: The distance, or ``limit + 1`` if it is larger than ``limit``.
+    """
+    if abs(len(source) - len(target)) > limit:
+        return limit + 1
+    previous = list(range(len(target) + 1))
+    for row, source_char in enumerate(source, start=1):
+        current = [row]
+        for column, target_char in enumerate(target, start=1):
+            current.append(min(
+                previous[column] + 1,
+                current[column - 1] + 1,
+                previous[column - 1] + (source_char != target_char),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class NameResolver:
+    """
+    Resolve Pokémon names mentioned anywhere in a question.
+
+    Exact phrases are looked up in a hash map first (longest phrase wins). If
+    none match, candidate spans are scored against a trigram inverted index and
+    the best few candidates are re-ranked by edit distance.
+    """
+
+    def __init__(self, names, max_fuzzy_words: int = 3, candidates: int = 5):
+        """
+        Build the phrase map and trigram index.
+
+        Args:
+            names (Iterable[str]): Distinct Pokémon names as shown to users.
+            max_fuzzy_words (int): Longest span (in words) tried for fuzzy matches.
+            candidates (int): Trigram candidates re-ranked by edit distance per span.
+        """
+        self.max_fuzzy_words = max_fuzzy_words
+        self.candidates = candidates
+        self._phrases = {}
+        self._name_keys = {}
+        for name in names:
+            key = self._name_keys[str(name)] = " ".join(phrase_tokens(str(name)))
+            if key:
+                self._phrases.setdefault(key, str(name))
+        self._keys = tuple(self._phrases)
+        self._max_words = max((key.count(" ") + 1 for key in self._keys), default=0)
+
+        postings = {}
+        for name_id, key in enumerate(self._keys):
+            for gram in trigrams(key):
+                postings.setdefault(gram, []).append(name_id)
+        self._postings = {
+            gram: np.array(ids, dtype=np.int64) for gram, ids in postings.items()
+        }
+        self._gram_counts = np.array([len(trigrams(key)) for key in self._keys], dtype=np.int64)
+
+    def patched(self, names) -> "NameResolver":
+        """
+        Build the resolver of a new set of names from this one.
+
+        Only phrases that are new get their trigrams extracted; the trigram
+        postings of the others are renumbered. Names keep the order given, as
+        in a fresh build, so ties between candidates break the same way. This
+        resolver is left untouched, and returned as is when nothing changed.
+
+        Args:
+            names (Iterable[str]): Distinct Pokémon names as shown to users.
+
+        Returns:
+            NameResolver: The resolver over ``names``.
+        """
+        # pylint: disable=protected-access  # fills in a new instance of this class
+        phrases = {}
+        name_keys = {}
+        for name in names:
+            name = str(name)
+            key = self._name_keys.get(name)
+            if key is None:
+                key = " ".join(phrase_tokens(name))
+            name_keys[name] = key
+            if key:
+                phrases.setdefault(key, name)
+        if phrases == self._phrases and tuple(phrases) == self._keys:
+            return self
+
+        resolver = NameResolver.__new__(NameResolver)
+        resolver.max_fuzzy_words = self.max_fuzzy_words
+        resolver.candidates = self.candidates
+        resolver._phrases = phrases
+        resolver._name_keys = name_keys
+        resolver._keys = tuple(phrases)
+        resolver._max_words = max((key.count(" ") + 1 for key in resolver._keys), default=0)
+        ids = {key: key_id for key_id, key in enumerate(resolver._keys)}
+        remap = np.array([ids.get(key, -1) for key in self._keys] + [-1], dtype=np.int64)
+
+        new_keys = [key for key in resolver._keys if key not in self._phrases]
+        added = {}
+        for key in new_keys:
+            for gram in trigrams(key):
+                added.setdefault(gram, []).append(ids[key])
+        postings = {}
+        for gram in set(self._postings) | set(added):
+            gram_ids = remap[self._postings[gram]] if gram in self._postings else remap[:0]
+            gram_ids = gram_ids[gram_ids >= 0]
+            if gram in added:
+                gram_ids = np.concatenate([gram_ids, np.array(added[gram], dtype=np.int64)])
+            if len(gram_ids):
+                postings[gram] = gram_ids
+        resolver._postings = postings
+        gram_counts = np.zeros(len(resolver._keys), dtype=np.int64)
+        kept = remap[:-1] >= 0
+        gram_counts[remap[:-1][kept]] = self._gram_counts[kept]
+        for key in new_keys:
+            gram_counts[ids[key]] = len(trigrams(key))
+        resolver._gram_counts = gram_counts
+        return resolver
+
+    def resolve(self, question: str):
+        """
+        Resolve the Pokémon name mentioned in a question.
+
+        Args:
+            question (str): The user's question.
+
+        Returns:
+            str | None: The dataset name, or None if no name is recognized.
+        """
+        tokens = phrase_tokens(question)
+        exact = self._resolve_exact(tokens)
+        if exact is not None:
+            return exact
+        return self._resolve_fuzzy(tokens)
+
+    def _resolve_exact(self, tokens: list):
+        """
+        Find the longest token span that is exactly a known name.
+
+        Args:
+            tokens (list): Question tokens.
+
+        Returns:
+            str | None: The matching name, if any.
+        """
+        for width in range(min(self._max_words, len(tokens)), 0, -1):
+            for start in range(len(tokens) - width + 1):
+                name = self._phrases.get(" ".join(tokens[start:start + width]))
+                if name is not None:
+                    return name
+        return None
+
+    def _resolve_fuzzy(self, tokens: list):
+        """
+        Find the closest known name to any candidate span of the question.
+
+        Args:
+            tokens (list): Question tokens.
+
+        Returns:
+            str | None: The best name within the edit-distance tolerance.
+        """
+        matches = []
+        for width in range(1, self.max_fuzzy_words + 1):
+            for start in range(len(tokens) - width + 1):
+                span = tokens[start:start + width]
+                if span[0] in STOPWORDS or span[-1] in STOPWORDS:
+                    continue
+                phrase = " ".join(span)
+                if len(phrase) < 4:
+                    continue
+                match = self._closest(phrase)
+                if match is not None:
+                    matches.append(match)
+        # Prefer fewer edits relative to length, then longer names.
+        return min(matches)[1] if matches else None
+
+    def _closest(self, phrase: str):
+        """
+        Re-rank the trigram candidates for a phrase by edit distance.
+
+        Args:
+            phrase (str): A normalized span of the question.
+
+        Returns:
+            tuple | None: ``((relative distance, -length), name)`` for the best
+            candidate within tolerance, otherwise None.
+        """
+        grams = trigrams(phrase)
+        lists = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not lists:
+            return None
+        shared = np.bincount(np.concatenate(lists), minlength=len(self._keys))
+        # Dice similarity of trigram sets; top candidates only.
+        scores = 2.0 * shared / (self._gram_counts + len(grams))
+        count = min(self.candidates, len(scores))
+        top = np.argpartition(-scores, count - 1)[:count]
+
+        limit = max(1, len(phrase) // 4)
+        ranked = []
+        for name_id in top:
+            if shared[name_id] == 0:
+                continue
+            key = self._keys[name_id]
+            distance = edit_distance(phrase, key, limit)
+            if distance <= limit:
+                ranked.append(((distance / len(key), -len(key)), self._phrases[key]))
+        return min(ranked) if ranked else None
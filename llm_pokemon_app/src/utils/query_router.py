@@ -0,0 +1,438 @@
+"""
+This module provides a query router that sends each question to the cheapest
+retrieval engine able to answer it. Numeric and ranking questions go to the
+structured indexes of PokemonRetriever, counter questions ("best counter to
+Dragonite") to its matchup engine, team questions to its team search, free-text
+questions to the BM25 index (narrowed to the mentioned Pokémon when one is
+recognized), and only questions BM25 cannot match fall through to semantic
+vector search. Over a ``LiveRetriever``, each call routes against one dataset
+version even if a reload swaps it meanwhile.
+"""
+
+import re
+
+import numpy as np
+
+from llm_pokemon_app.src.utils.energy_cycle import DEFAULT_BATTLE_S
+from llm_pokemon_app.src.utils.live_retriever import LiveRetriever
+
+POKEMON_TYPES = (
+    "normal", "fire", "water", "grass", "electric", "ice", "fighting", "poison", "ground",
+    "flying", "psychic", "bug", "rock", "ghost", "dragon", "dark", "steel", "fairy",
+)
+TYPE_PATTERN = re.compile(r"\b(" + "|".join(POKEMON_TYPES) + r")\b")
+TOP_K_PATTERN = re.compile(r"\btop\s+(\d+)\b")
+COUNTER_PATTERN = re.compile(r"\b(counters?|against|beats?|versus|vs)\b")
+TEAM_PATTERN = re.compile(r"\bteams?\b")
+DEFAULT_TOP_K = 5
+DEFAULT_TEAMS = 3
+MAX_TEAMS = 10
+MAX_TOP_K = 25
+LEXICAL_TOP_K = 5
+
+INTENT_HIGHEST_DPS = "highest_dps"
+INTENT_RANKING = "ranking"
+INTENT_COUNTERS = "counters"
+INTENT_TEAMS = "teams"
+INTENT_MOVES = "moves"
+INTENT_FREE_TEXT = "free_text"
+
+NO_DATA_MESSAGE = "Sorry, I couldn't find any relevant data."
+# How rankings by each DPS column are labelled.
+SORT_LABELS = {"TOTAL_DPS": "DPS", "FAST_DPS": "fast move DPS", "CHARGE_DPS": "charge move DPS"}
+MOVESET_COLUMNS = ("NAME", "FAST_MOVE", "FAST_MOVE_TYPE", "CHARGE_MOVE", "CHARGED_MOVE_TYPE")
+
+
+def parse_ranking_query(query: str):
+    """
+    Detect "top N" / "best <type>" ranking questions.
+
+    Args:
+        query (str): The user input question.
+
+    Returns:
+        tuple | None: ``(top_k, filters, sort_by)`` for ``retrieve_top_dps``,
+        or None when the question is not a ranking question. Questions about a
+        fast or charge move rank by that move's DPS.
+    """
+    lowered = query.lower()
+    top_match = TOP_K_PATTERN.search(lowered)
+    type_match = TYPE_PATTERN.search(lowered)
+    if top_match is None and not ("best" in lowered and type_match):
+        return None
+
+    top_k = min(int(top_match.group(1)), MAX_TOP_K) if top_match else DEFAULT_TOP_K
+    filters = {}
+    sort_by = "TOTAL_DPS"
+    if "fast move" in lowered:
+        sort_by = "FAST_DPS"
+    elif "charge move" in lowered or "charged move" in lowered:
+        sort_by = "CHARGE_DPS"
+    if type_match:
+        if sort_by == "FAST_DPS":
+            filters["fast_move_type"] = type_match.group(1)
+        elif sort_by == "CHARGE_DPS":
+            filters["charged_move_type"] = type_match.group(1)
+        else:
+            filters["pokemon_type"] = type_match.group(1)
+    return top_k, filters, sort_by
+
+
+def classify(query: str) -> tuple:
+    """
+    Classify a question into an intent without touching any index.
+
+    Args:
+        query (str): The user input question.
+
+    Returns:
+        tuple: ``(intent, params)`` where params are intent-specific.
+    """
+    lowered = query.lower()
+    if COUNTER_PATTERN.search(lowered):
+        return INTENT_COUNTERS, None
+    if TEAM_PATTERN.search(lowered):
+        top_match = TOP_K_PATTERN.search(lowered)
+        type_match = TYPE_PATTERN.search(lowered)
+        return INTENT_TEAMS, (
+            min(int(top_match.group(1)), MAX_TEAMS) if top_match else DEFAULT_TEAMS,
+            type_match.group(1) if type_match else None,
+        )
+    if "highest dps" in lowered:
+        return INTENT_HIGHEST_DPS, None
+    ranking = parse_ranking_query(query)
+    if ranking is not None:
+        return INTENT_RANKING, ranking
+    if "moves" in lowered:
+        return INTENT_MOVES, None
+    return INTENT_FREE_TEXT, None
+
+
+def records(rows, columns: tuple) -> list:
+    """
+    Read result rows as dicts, column by column.
+
+    ``iterrows`` builds a Series per row, which is slow on frames mixing
+    categorical, string and float columns; this reads each column once.
+
+    Args:
+        rows (pd.DataFrame): The result rows.
+        columns (tuple): Columns to read; missing ones read as None.
+
+    Returns:
+        list: One dict per row.
+    """
+    values = [
+        rows[column].to_numpy() if column in rows.columns else [None] * len(rows)
+        for column in columns
+    ]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def cycle_summary(row: dict) -> str:
+    """
+    Describe a moveset's energy-cycle metrics, if it has them.
+
+    Args:
+        row (dict): A result row with CYCLE_DPS and TDO.
+
+    Returns:
+        str: ", cycle DPS x, y damage in 180 s", or "" without a cycle DPS.
+    """
+    cycle_dps = row.get("CYCLE_DPS")
+    if cycle_dps is None or not np.isfinite(cycle_dps):
+        return ""
+    return (
+        f", cycle DPS {cycle_dps:.2f}, {row['TDO']:.0f} damage in {DEFAULT_BATTLE_S:.0f} s"
+    )
+
+
+class QueryRouter:
+    """
+    Route questions to the structured, lexical or semantic retrieval engine
+    of a PokemonRetriever and render the result as LLM context.
+    """
+
+    def __init__(self, retriever):
+        """
+        Initialize the router.
+
+        Args:
+            retriever (PokemonRetriever | LiveRetriever): The retriever whose
+                indexes answer questions.
+        """
+        self.retriever = retriever
+
+    def pinned(self) -> "QueryRouter":
+        """
+        A router over the current version of a live retriever.
+
+        Returns:
+            QueryRouter: A router whose lookups all use one retriever (this
+            router itself unless the retriever is a ``LiveRetriever``).
+        """
+        if isinstance(self.retriever, LiveRetriever):
+            return QueryRouter(self.retriever.current)
+        return self
+
+    def route(self, query: str) -> tuple:
+        """
+        Answer a question from the cheapest engine that can handle it.
+
+        Args:
+            query (str): The user input question.
+
+        Returns:
+            tuple: ``(intent, context)``; context is a string for the LLM prompt.
+        """
+        router = self.pinned()
+        if router is not self:
+            return router.route(query)
+        intent, params = self._classify(query)
+        return intent, self._context(intent, params, query)
+
+    def route_many(self, queries) -> list:
+        """
+        Route many questions in one pass, running each distinct lookup once.
+
+        Questions that need the same lookup (the highest DPS, the same
+        ranking, the moves of the same Pokémon) share one context.
+
+        Args:
+            queries (Iterable[str]): The user input questions.
+
+        Returns:
+            list: One ``(intent, context)`` tuple per question, in input order.
+        """
+        router = self.pinned()
+        if router is not self:
+            return router.route_many(queries)
+        contexts = {}
+        routed = []
+        for query in queries:
+            intent, params = self._classify(query)
+            if intent == INTENT_RANKING:
+                key = (intent, params[0], tuple(sorted(params[1].items())), params[2])
+            elif intent == INTENT_FREE_TEXT:
+                key = (intent, query)
+            else:
+                key = (intent, params)
+            if key not in contexts:
+                contexts[key] = self._context(intent, params, query)
+            routed.append((intent, contexts[key]))
+        return routed
+
+    def _classify(self, query: str) -> tuple:
+        """
+        Classify a question, resolving the Pokémon name for moves questions and
+        the defender for counter questions.
+
+        Args:
+            query (str): The user input question.
+
+        Returns:
+            tuple: ``(intent, params)``; params is the resolved name for moves
+            and the defender (a name or a tuple of types) for counters.
+        """
+        intent, params = classify(query)
+        if intent == INTENT_MOVES:
+            params = self.retriever.resolve_name(query)
+        elif intent == INTENT_COUNTERS:
+            params = self._defender(query)
+            if params is None:
+                # Not a recognizable matchup: answer from the text indexes.
+                return self._classify(COUNTER_PATTERN.sub(" ", query.lower()))
+        return intent, params
+
+    def _defender(self, query: str):
+        """
+        Find the defender of a counter question.
+
+        Types win when the question is about a type ("counters to dragon
+        types"); otherwise the named Pokémon does, then any mentioned types.
+
+        Args:
+            query (str): The user input question.
+
+        Returns:
+            str | tuple | None: A Pokémon name, up to two type names, or None.
+        """
+        types = tuple(dict.fromkeys(TYPE_PATTERN.findall(query.lower())))[:2]
+        if types and "type" in query.lower():
+            return types
+        return self.retriever.resolve_name(query) or types or None
+
+    def _context(self, intent: str, params, query: str) -> str:
+        """
+        Run the lookup for a classified question.
+
+        Args:
+            intent (str): The question's intent.
+            params (Any): Intent-specific parameters from ``_classify``.
+            query (str): The user input question.
+
+        Returns:
+            str: The context for the LLM prompt.
+        """
+        if intent == INTENT_HIGHEST_DPS:
+            return self._highest_dps_context()
+        if intent == INTENT_RANKING:
+            return self._ranking_context(*params)
+        if intent == INTENT_MOVES:
+            return self._moves_context(params)
+        if intent == INTENT_COUNTERS:
+            return self._counters_context(params)
+        if intent == INTENT_TEAMS:
+            return self._teams_context(*params)
+        return self._free_text_context(query)
+
+    def _highest_dps_context(self) -> str:
+        """Describe the Pokémon with the highest DPS."""
+        highest_dps_pokemon = self.retriever.retrieve_highest_dps()
+        return (
+            f"The Pokémon with the highest DPS is {highest_dps_pokemon['NAME']} "
+            f"with a DPS of {highest_dps_pokemon['TOTAL_DPS']}."
+        )
+
+    def _ranking_context(self, top_k: int, filters: dict, sort_by: str = "TOTAL_DPS") -> str:
+        """
+        List the top DPS movesets matching the filters.
+
+        Args:
+            top_k (int): Number of movesets.
+            filters (dict): Filters for ``retrieve_top_dps``.
+            sort_by (str): The DPS column to rank by.
+
+        Returns:
+            str: A numbered ranking.
+        """
+        ranked = self.retriever.retrieve_top_dps(top_k, sort_by, **filters)
+        if ranked.empty:
+            return "Sorry, I couldn't find any Pokémon matching that ranking."
+        label = SORT_LABELS[sort_by]
+        lines = [
+            f"{position}. {row['NAME']} ({row['FAST_MOVE']} / {row['CHARGE_MOVE']}): "
+            + (f"{label} {row[sort_by]:.2f}, " if sort_by != "TOTAL_DPS" else "")
+            + f"DPS {row['TOTAL_DPS']:.2f}{cycle_summary(row)}"
+            for position, row in enumerate(records(ranked, (
+                "NAME", "FAST_MOVE", "CHARGE_MOVE", "TOTAL_DPS", "CYCLE_DPS", "TDO", sort_by,
+            )), start=1)
+        ]
+        return f"Top Pokémon by {label}:\n" + "\n".join(lines)
+
+    def _counters_context(self, defender) -> str:
+        """
+        List the best counters to a defender.
+
+        Args:
+            defender (str | tuple): A Pokémon name or a tuple of type names.
+
+        Returns:
+            str: A numbered ranking with type multipliers.
+        """
+        counters = self.retriever.retrieve_counters(defender, DEFAULT_TOP_K)
+        if counters.empty:
+            return "Sorry, I couldn't find counters for that Pokémon."
+        types = (
+            self.retriever.defender_types(defender) if isinstance(defender, str) else defender
+        )
+        target = "/".join(value.title() for value in types)
+        if isinstance(defender, str):
+            target = f"{defender} ({target})"
+        lines = [
+            f"{position}. {row['NAME']} ({row['FAST_MOVE']} / {row['CHARGE_MOVE']}): "
+            f"cycle DPS {row['CYCLE_DPS']:.2f}, fast x{row['FAST_EFFECTIVENESS']:.2f}, "
+            f"charge x{row['CHARGE_EFFECTIVENESS']:.2f}"
+            for position, row in enumerate(records(counters, (
+                "NAME", "FAST_MOVE", "CHARGE_MOVE", "CYCLE_DPS", "FAST_EFFECTIVENESS",
+                "CHARGE_EFFECTIVENESS",
+            )), start=1)
+        ]
+        return (
+            f"Best counters against {target}, by cycle DPS with STAB and type "
+            "effectiveness:\n" + "\n".join(lines)
+        )
+
+    def _teams_context(self, top_n: int, pokemon_type: str) -> str:
+        """
+        List the best teams of three.
+
+        Args:
+            top_n (int): Number of teams.
+            pokemon_type (str): Only Pokémon of this type, or None.
+
+        Returns:
+            str: A numbered list of teams with their coverage.
+        """
+        teams = self.retriever.retrieve_teams(top_n, pokemon_type)
+        if not teams:
+            return "Sorry, I couldn't build a team from the data."
+        lines = []
+        for position, team in enumerate(teams, start=1):
+            members = ", ".join(
+                f"{row['NAME']} ({row['FAST_MOVE']} / {row['CHARGE_MOVE']})"
+                for row in records(team["MEMBERS"], ("NAME", "FAST_MOVE", "CHARGE_MOVE"))
+            )
+            lines.append(
+                f"{position}. {members}: score {team['SCORE']:.2f}; super effective against "
+                f"{len(team['COVERAGE'])}/18 types, resists {len(team['RESISTS'])}/18, "
+                f"shared weaknesses: {', '.join(team['SHARED_WEAKNESSES']) or 'none'}"
+            )
+        subject = f"{pokemon_type.title()} teams" if pokemon_type else "Teams"
+        return (
+            f"{subject} of three scored on cycle DPS, type coverage and resistances (CP "
+            "limits of leagues are not in the data):\n" + "\n".join(lines)
+        )
+
+    def _moves_context(self, pokemon_name: str) -> str:
+        """
+        Describe a moveset of the Pokémon named in the question.
+
+        Args:
+            pokemon_name (str): The resolved Pokémon name, or None.
+
+        Returns:
+            str: The moveset description.
+        """
+        moves = (
+            self.retriever.retrieve_by_name(pokemon_name, exact=True)
+            if pokemon_name else None
+        )
+        if moves is not None and not moves.empty:
+            moves_info = moves.iloc[0]
+            return (
+                f"{moves_info['NAME']}'s moves: {moves_info['FAST_MOVE']} "
+                f"(Fast, Power: {moves_info['FAST_MOVE_POWER']}, "
+                f"Type: {moves_info['FAST_MOVE_TYPE']}), "
+                f"{moves_info['CHARGE_MOVE']} "
+                f"(Charge, Power: {moves_info['CHARGE_MOVE_POWER']}, "
+                f"Type: {moves_info['CHARGED_MOVE_TYPE']})."
+            )
+        return "Sorry, I couldn't find the moves for that Pokémon."
+
+    def _free_text_context(self, query: str) -> str:
+        """
+        Answer a free-text question with BM25, falling back to semantic search.
+
+        Args:
+            query (str): The user input question.
+
+        Returns:
+            str: Matching movesets or documents.
+        """
+        pokemon_name = self.retriever.resolve_name(query)
+        rows = self.retriever.retrieve_lexical(query, LEXICAL_TOP_K, pokemon_name=pokemon_name)
+        if not rows.empty:
+            lines = [
+                f"{row['NAME']}: {row['FAST_MOVE']} ({row['FAST_MOVE_TYPE']}) / "
+                f"{row['CHARGE_MOVE']} ({row['CHARGED_MOVE_TYPE']})"
+                for row in records(rows, MOVESET_COLUMNS)
+            ]
+            return "Relevant Pokémon movesets:\n" + "\n".join(lines)
+
+        similar = self.retriever.retrieve_similar(query)
+        if similar:
+            return "Relevant Pokémon data:\n" + "\n".join(
+                document for _, _, document in similar
+            )
+        return NO_DATA_MESSAGE
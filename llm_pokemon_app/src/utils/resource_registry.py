@@ -0,0 +1,93 @@
+"""
+This module provides a process-wide registry for expensive shared resources.
+Streamlit reruns the app script on every interaction; resources kept here (the
+retriever, API clients, model weights) survive those reruns until invalidated.
+"""
+
+import hashlib
+import threading
+
+
+def api_key_digest(api_key: str) -> str:
+    """
+    Derive a registry key component from an API key without storing the key.
+
+    Args:
+        api_key (str): The API key.
+
+    Returns:
+        str: A short SHA-256 hex digest of the key.
+    """
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class ResourceRegistry:
+    """
+    A thread-safe cache of resources created on first use.
+
+    Each key has its own lock, so a slow factory (e.g. loading model weights)
+    only blocks callers waiting for that same resource, and concurrent callers
+    never create it twice.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._resources = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, factory):
+        """
+        Return the resource stored under ``key``, creating it if needed.
+
+        Args:
+            key (Hashable): Identifies the resource.
+            factory (Callable[[], Any]): Creates the resource on a miss.
+
+        Returns:
+            Any: The cached resource.
+        """
+        try:
+            return self._resources[key]
+        except KeyError:
+            pass
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._resources:
+                self._resources[key] = factory()
+            return self._resources[key]
+
+    def invalidate(self, key) -> bool:
+        """
+        Drop one resource so the next ``get_or_create`` rebuilds it.
+
+        Args:
+            key (Hashable): Identifies the resource.
+
+        Returns:
+            bool: True if a resource was dropped.
+        """
+        with self._lock:
+            return self._resources.pop(key, None) is not None
+
+    def clear(self):
+        """Drop every resource."""
+        with self._lock:
+            self._resources.clear()
+
+    def __contains__(self, key) -> bool:
+        """
+        Check whether a resource is currently cached.
+
+        Args:
+            key (Hashable): Identifies the resource.
+
+        Returns:
+            bool: True if cached.
+        """
+        return key in self._resources
+
+
+# The registry shared by the whole process.
+REGISTRY = ResourceRegistry()
@@ -0,0 +1,267 @@
+"""
+This module provides a cache for LLM responses.
+Entries are keyed on the model, the normalized prompt, the retrieved context and
+the generation parameters. A bounded in-memory LRU tier with a TTL answers
+repeated questions in microseconds; an optional SQLite tier shares entries
+between processes and restarts. Expired rows are dropped when the database is
+opened, when one is read, and by a purge that runs at most every few minutes
+as new rows are written.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from llm_pokemon_app.src.utils.metrics import CACHE_REQUESTS, METRICS
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# Minimum seconds between purges of the expired rows of the SQLite tier.
+PURGE_INTERVAL_S = 300.0
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Normalize a prompt so trivially different spellings share a cache entry.
+
+    Args:
+        prompt (str): The user's prompt.
+
+    Returns:
+        str: The lower-cased prompt with collapsed whitespace and no trailing
+        punctuation.
+    """
+    return WHITESPACE_PATTERN.sub(" ", prompt).strip().rstrip("?!. ").lower()
+
+
+class ResponseCache:  # pylint: disable=too-many-instance-attributes
+    """
+    A two-tier (memory LRU, optional SQLite) response cache with a TTL.
+
+    All methods are thread-safe. Hit and miss counts are kept per tier and
+    reported by ``stats``.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0,
+                 sqlite_path: str = None, clock=time.time):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Capacity of the in-memory tier.
+            ttl_seconds (float): Lifetime of an entry in both tiers.
+            sqlite_path (str): Optional SQLite database for the on-disk tier.
+            clock (Callable[[], float]): Wall-clock source, injectable for tests.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        self._database = None
+        self._next_purge = None
+        if sqlite_path is not None:
+            self._database = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._database.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._database.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+            )
+            self._delete_expired(self._clock())
+            self._database.commit()
+
+    @property
+    def persistent(self) -> bool:
+        """
+        Whether the cache has a SQLite tier, whose lookups do disk I/O.
+
+        Returns:
+            bool: True with a SQLite tier.
+        """
+        return self._database is not None
+
+    @staticmethod
+    def make_key(model: str, prompt: str, context: str = "", **params) -> str:
+        """
+        Build a cache key.
+
+        Args:
+            model (str): Identifies the backend and model, e.g. "rag:gpt-4o-mini".
+            prompt (str): The user's prompt (normalized before hashing).
+            context (str): Retrieved context included in the request.
+            **params: Generation parameters such as max_tokens and temperature.
+
+        Returns:
+            str: A SHA-256 hex digest.
+        """
+        payload = json.dumps(
+            [model, normalize_prompt(prompt), context, params], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """
+        Look up a fresh entry, promoting disk hits into memory.
+
+        Args:
+            key (str): A key from ``make_key``.
+
+        Returns:
+            str | None: The cached response, or None on a miss.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    METRICS.increment(CACHE_REQUESTS, cache="response", result="hit")
+                    return value
+                del self._entries[key]
+
+            if self._database is not None:
+                row = self._database.execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    self._remember(key, row[0], row[1])
+                    self._stats["disk_hits"] += 1
+                    METRICS.increment(CACHE_REQUESTS, cache="response", result="hit")
+                    return row[0]
+                if row is not None:
+                    # Expired: drop the row now rather than wait for the next purge.
+                    self._database.execute(
+                        "DELETE FROM responses WHERE key = ? AND expires_at <= ?", (key, now)
+                    )
+                    self._database.commit()
+
+            self._stats["misses"] += 1
+            METRICS.increment(CACHE_REQUESTS, cache="response", result="miss")
+            return None
+
+    def set(self, key: str, value: str):
+        """
+        Store a response in every tier, purging expired rows from disk when due.
+
+        Args:
+            key (str): A key from ``make_key``.
+            value (str): The response.
+        """
+        now = self._clock()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if self._database is not None:
+                if now >= self._next_purge:
+                    self._delete_expired(now)
+                self._database.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at),
+                )
+                self._database.commit()
+
+    def _delete_expired(self, now: float):
+        """
+        Delete the expired rows of the SQLite tier (the caller commits).
+
+        Expired rows are already skipped on read; deleting them keeps the
+        database from growing in a long-running process. The next purge is
+        due ``PURGE_INTERVAL_S`` later, so writes rarely pay for a scan.
+
+        Args:
+            now (float): The current time on the cache clock.
+        """
+        self._database.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        self._next_purge = now + PURGE_INTERVAL_S
+
+    def _remember(self, key: str, value: str, expires_at: float):
+        """
+        Insert into the memory tier, evicting the least recently used entry.
+
+        Args:
+            key (str): The cache key.
+            value (str): The response.
+            expires_at (float): Expiry time on the cache clock.
+        """
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get_or_compute(self, key: str, compute) -> str:
+        """
+        Return the cached response or compute and store it.
+
+        Exceptions raised by ``compute`` propagate and nothing is stored, so
+        failed requests are never cached.
+
+        Args:
+            key (str): A key from ``make_key``.
+            compute (Callable[[], str]): Produces the response on a miss.
+
+        Returns:
+            str: The response.
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    async def aget_or_compute(self, key: str, compute) -> str:
+        """
+        Async variant of ``get_or_compute``.
+
+        With a SQLite tier, lookups and writes run in a worker thread so disk
+        I/O never blocks the event loop.
+
+        Args:
+            key (str): A key from ``make_key``.
+            compute (Callable[[], Awaitable[str]]): Produces the response on a miss.
+
+        Returns:
+            str: The response.
+        """
+        value = await asyncio.to_thread(self.get, key) if self.persistent else self.get(key)
+        if value is None:
+            value = await compute()
+            if value is not None:
+                if self.persistent:
+                    await asyncio.to_thread(self.set, key, value)
+                else:
+                    self.set(key, value)
+        return value
+
+    def clear(self):
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self._database is not None:
+                self._database.execute("DELETE FROM responses")
+                self._database.commit()
+
+    def stats(self) -> dict:
+        """
+        Report hit/miss metrics.
+
+        Returns:
+            dict: Counters per tier, the overall hit rate and the memory size.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        return stats
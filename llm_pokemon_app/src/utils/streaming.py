@@ -0,0 +1,75 @@
+"""
+This module provides helpers for streaming model output token by token.
+Chat completions are requested with ``stream=True`` and their text deltas are
+yielded as they arrive; TimedStream records time to first token and total
+generation time for any such stream.
+"""
+
+import time
+
+
+def stream_completion(client, request: dict, cache=None, key: str = None):
+    """
+    Yield the text deltas of a streamed chat completion.
+
+    Args:
+        client (OpenAI): The API client.
+        request (dict): Keyword arguments for ``chat.completions.create``.
+        cache (ResponseCache): Optional cache that receives the full text
+            once the stream completes.
+        key (str): The cache key for the request.
+
+    Yields:
+        str: Text deltas in order.
+    """
+    parts = []
+    for chunk in client.chat.completions.create(**request, stream=True):
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            yield delta
+    if cache is not None and key is not None and parts:
+        cache.set(key, "".join(parts))
+
+
+class TimedStream:
+    """
+    Wrap a token stream and record its timings while it is consumed.
+
+    After iteration, ``first_token_ms`` is the time from the start of
+    iteration to the first non-empty chunk (None if there was none),
+    ``total_ms`` the time to exhaustion and ``text`` the joined output.
+    """
+
+    def __init__(self, chunks, clock=time.perf_counter):
+        """
+        Initialize the wrapper.
+
+        Args:
+            chunks (Iterable[str]): The token stream.
+            clock (Callable[[], float]): Time source in seconds.
+        """
+        self._chunks = chunks
+        self._clock = clock
+        self.first_token_ms = None
+        self.total_ms = None
+        self.text = ""
+
+    def __iter__(self):
+        """
+        Yield the chunks of the wrapped stream, timing them.
+
+        Yields:
+            str: The chunks, unchanged.
+        """
+        started = self._clock()
+        parts = []
+        for chunk in self._chunks:
+            if chunk and self.first_token_ms is None:
+                self.first_token_ms = (self._clock() - started) * 1000
+            parts.append(chunk)
+            yield chunk
+        self.total_ms = (self._clock() - started) * 1000
+        self.text = "".join(parts)
@@ -0,0 +1,319 @@
+"""
+This module provides a search for the best teams of three Pokémon. Each species
+takes part with its best moveset (by cycle DPS), and a team is scored on its
+offense, the types its moves hit super effectively, the attacking types at least
+one member resists and the weaknesses members share.
+
+Types are 18-bit masks, so a team's coverage is an OR and a popcount. The
+search is a branch-and-bound over (first, second) members, which scores all
+third members at once with NumPy and skips any pair whose optimistic bound
+cannot reach the current top-N. First members are spread over a process pool.
+
+The dataset has no CP or base stats, so league CP caps and bulk are not
+modelled; teams are ranked on moves and typing alone.
+"""
+
+import concurrent.futures
+import heapq
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from llm_pokemon_app.src.utils.matchups import (
+    EFFECTIVENESS, NO_TYPE, TYPES, type_code, type_codes,
+)
+
+TEAM_SIZE = 3
+DEFAULT_TOP_N = 3
+# Species considered, best cycle DPS first; the search is cubic in this.
+DEFAULT_CANDIDATES = 150
+TEAM_WORKERS_ENV = "POKEMON_TEAM_WORKERS"
+# Each term is at most 1 per team (offense is the mean DPS relative to the best).
+SCORE_WEIGHTS = {"offense": 1.0, "coverage": 1.0, "resistance": 1.0, "shared_weakness": 1.0}
+SHADOW_PREFIX = "Shadow "
+TEAM_COLUMNS = ("NAME", "TYPE_ONE", "TYPE_TWO", "FAST_MOVE", "CHARGE_MOVE", "CYCLE_DPS")
+# Bit counts of every 18-bit type mask.
+POPCOUNT = sum((np.arange(1 << NO_TYPE) >> bit) & 1 for bit in range(NO_TYPE)).astype(np.float64)
+# Slack for bounds computed in a different order than the scores they bound.
+_SLACK = 1e-9
+
+_WORKER_ARRAYS = {}
+
+
+def type_masks(type_one: np.ndarray, type_two: np.ndarray, fast_type: np.ndarray,
+               charge_type: np.ndarray) -> tuple:
+    """
+    Encode each candidate's typing and moves as type bit masks.
+
+    Args:
+        type_one (np.ndarray): Codes of the first type (see ``type_codes``).
+        type_two (np.ndarray): Codes of the second type.
+        fast_type (np.ndarray): Codes of the fast move types.
+        charge_type (np.ndarray): Codes of the charge move types.
+
+    Returns:
+        tuple: ``(cover, resist, weak)`` int64 arrays: defending types hit
+        super effectively by either move, attacking types resisted, and
+        attacking types the candidate is weak to.
+    """
+    bits = 1 << np.arange(NO_TYPE, dtype=np.int64)
+    # Multiplier of each attacking type (rows) against each candidate (columns).
+    taken = EFFECTIVENESS[:NO_TYPE, type_one] * EFFECTIVENESS[:NO_TYPE, type_two]
+    dealt = (EFFECTIVENESS[fast_type, :NO_TYPE] > 1) | (EFFECTIVENESS[charge_type, :NO_TYPE] > 1)
+    return dealt @ bits, bits @ (taken < 1), bits @ (taken > 1)
+
+
+def mask_types(mask: int) -> list:
+    """
+    Decode a type bit mask.
+
+    Args:
+        mask (int): The mask.
+
+    Returns:
+        list: The type names, in ``TYPES`` order.
+    """
+    return [name for code, name in enumerate(TYPES) if mask >> code & 1]
+
+
+def _search(arrays: dict, firsts, top_n: int, threshold: float = -np.inf) -> list:
+    """
+    Find the best teams whose first member is one of ``firsts``.
+
+    Args:
+        arrays (dict): ``offense``, ``cover``, ``resist`` and ``weak`` per
+            candidate (offense descending) and the suffix ORs
+            ``cover_after`` and ``resist_after``.
+        firsts (Iterable[int]): Candidate indexes of the first member.
+        top_n (int): Teams to keep.
+        threshold (float): Score a team must reach to be kept, e.g. the
+            N-th best score found elsewhere.
+
+    Returns:
+        list: ``(score, -i, -j, -k)`` keys of up to ``top_n`` teams; a greater
+        key is a better team (ties go to stronger first members).
+    """
+    offense, cover, resist, weak = (arrays[key] for key in ("offense", "cover", "resist", "weak"))
+    cover_after, resist_after = arrays["cover_after"], arrays["resist_after"]
+    coverage = SCORE_WEIGHTS["coverage"] / NO_TYPE
+    resistance = SCORE_WEIGHTS["resistance"] / NO_TYPE
+    shared = SCORE_WEIGHTS["shared_weakness"] / NO_TYPE
+    count = len(offense)
+    heap = []
+
+    def floor() -> float:
+        return heap[0][0] if len(heap) >= top_n else threshold
+
+    for i in firsts:
+        if i > count - TEAM_SIZE:
+            continue
+        bound = (offense[i] + offense[i + 1] + offense[i + 2]
+                 + coverage * POPCOUNT[cover[i] | cover_after[i + 1]]
+                 + resistance * POPCOUNT[resist[i] | resist_after[i + 1]])
+        if bound + _SLACK < floor():
+            continue
+        for j in range(i + 1, count - 1):
+            cover_ij, resist_ij = cover[i] | cover[j], resist[i] | resist[j]
+            weak_ij, shared_ij = weak[i] | weak[j], weak[i] & weak[j]
+            # Later members have less offense and can only add shared weaknesses.
+            bound = (offense[i] + offense[j] + offense[j + 1]
+                     + coverage * POPCOUNT[cover_ij | cover_after[j + 1]]
+                     + resistance * POPCOUNT[resist_ij | resist_after[j + 1]]
+                     - shared * POPCOUNT[shared_ij])
+            if bound + _SLACK < floor():
+                continue
+            thirds = slice(j + 1, count)
+            scores = (offense[i] + offense[j] + offense[thirds]
+                      + coverage * POPCOUNT[cover_ij | cover[thirds]]
+                      + resistance * POPCOUNT[resist_ij | resist[thirds]]
+                      - shared * POPCOUNT[shared_ij | (weak_ij & weak[thirds])])
+            for offset in np.flatnonzero(scores >= floor()):
+                key = (float(scores[offset]), -i, -j, -(j + 1 + int(offset)))
+                if len(heap) < top_n:
+                    heapq.heappush(heap, key)
+                elif key > heap[0]:
+                    heapq.heapreplace(heap, key)
+    return heap
+
+
+def _init_worker(arrays: dict):
+    """Install the candidate arrays in a pool process."""
+    _WORKER_ARRAYS.update(arrays)
+
+
+def _search_in_worker(firsts: list, top_n: int, threshold: float) -> list:
+    """Run ``_search`` over the arrays installed by ``_init_worker``."""
+    return _search(_WORKER_ARRAYS, firsts, top_n, threshold)
+
+
+class TeamSearch:
+    """
+    Top teams of three over the best moveset of each species, cached per query.
+    """
+
+    def __init__(self, data: pd.DataFrame, cycle_dps: np.ndarray):
+        """
+        Initialize the search.
+
+        Args:
+            data (pd.DataFrame): Pokémon dataset.
+            cycle_dps (np.ndarray): Cycle DPS per row, e.g. from
+                ``EnergyCycleSimulator.evaluate``.
+        """
+        self.data = data
+        self.cycle_dps = cycle_dps
+        self._codes = {
+            column: type_codes(data, column)
+            for column in ("TYPE_ONE", "TYPE_TWO", "FAST_MOVE_TYPE", "CHARGED_MOVE_TYPE")
+        }
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def candidates(self, pokemon_type: str = None,
+                   max_candidates: int = DEFAULT_CANDIDATES) -> np.ndarray:
+        """
+        Pick the best moveset of each species, best cycle DPS first.
+
+        Args:
+            pokemon_type (str): Only species of this type.
+            max_candidates (int): Species to keep.
+
+        Returns:
+            np.ndarray: Row positions of the candidates.
+        """
+        ranked = np.flatnonzero(np.isfinite(self.cycle_dps))
+        if pokemon_type is not None:
+            wanted = type_code(pokemon_type)
+            ranked = ranked[(self._codes["TYPE_ONE"][ranked] == wanted)
+                            | (self._codes["TYPE_TWO"][ranked] == wanted)]
+        ranked = ranked[np.argsort(-self.cycle_dps[ranked], kind="stable")]
+        if "NAME" in self.data.columns:
+            # Shadow forms share their species' moves, so they count as the species.
+            codes, names = pd.factorize(self.data["NAME"])
+            species = pd.factorize(pd.Index(names.astype(str)).str.removeprefix(SHADOW_PREFIX))[0]
+            _, first = np.unique(species[codes[ranked]], return_index=True)
+            ranked = ranked[np.sort(first)]
+        return ranked[:max_candidates]
+
+    def arrays(self, positions: np.ndarray) -> dict:
+        """
+        Build the search arrays of some candidates.
+
+        Args:
+            positions (np.ndarray): Row positions, by descending cycle DPS.
+
+        Returns:
+            dict: The arrays ``_search`` reads.
+        """
+        codes = {column: values[positions] for column, values in self._codes.items()}
+        cover, resist, weak = type_masks(codes["TYPE_ONE"], codes["TYPE_TWO"],
+                                         codes["FAST_MOVE_TYPE"], codes["CHARGED_MOVE_TYPE"])
+        dps = self.cycle_dps[positions]
+        scale = SCORE_WEIGHTS["offense"] / (TEAM_SIZE * dps[0]) if len(dps) and dps[0] > 0 else 0.0
+
+        def suffix_or(masks):
+            after = np.zeros(len(masks) + 1, dtype=np.int64)
+            after[:-1] = np.bitwise_or.accumulate(masks[::-1])[::-1]
+            return after
+
+        return {
+            "offense": dps * scale, "cover": cover, "resist": resist, "weak": weak,
+            "cover_after": suffix_or(cover), "resist_after": suffix_or(resist),
+        }
+
+    def search(self, top_n: int = DEFAULT_TOP_N, pokemon_type: str = None,
+               workers: int = None, max_candidates: int = DEFAULT_CANDIDATES) -> list:
+        """
+        Find the best teams, searching in parallel when ``workers`` > 1.
+
+        Results do not depend on the number of workers.
+
+        Args:
+            top_n (int): Teams to return.
+            pokemon_type (str): Only species of this type.
+            workers (int): Processes; ``POKEMON_TEAM_WORKERS`` (default 1)
+                when omitted. One searches in this process.
+            max_candidates (int): Species considered.
+
+        Returns:
+            list: Teams, best first, as dicts with SCORE, MEMBERS (a DataFrame
+            of ``TEAM_COLUMNS``), COVERAGE, RESISTS and SHARED_WEAKNESSES
+            (type name lists).
+        """
+        key = (top_n, pokemon_type and pokemon_type.strip().lower(), max_candidates)
+        teams = self._cache.get(key)
+        if teams is None:
+            teams = self._search(top_n, pokemon_type, workers, max_candidates)
+            with self._lock:
+                teams = self._cache.setdefault(key, teams)
+        return teams
+
+    def _search(self, top_n: int, pokemon_type: str, workers: int,
+                max_candidates: int) -> list:
+        """
+        Run the search, see ``search``.
+
+        Args:
+            top_n (int): Teams to return.
+            pokemon_type (str): Only species of this type.
+            workers (int): Processes.
+            max_candidates (int): Species considered.
+
+        Returns:
+            list: See ``search``.
+        """
+        if workers is None:
+            workers = int(os.environ.get(TEAM_WORKERS_ENV, "1"))
+        positions = self.candidates(pokemon_type, max_candidates)
+        if top_n < 1 or len(positions) < TEAM_SIZE:
+            return []
+        arrays = self.arrays(positions)
+        # The strongest first member alone sets a threshold every worker can prune with.
+        keys = _search(arrays, [0], top_n)
+        firsts = range(1, len(positions) - TEAM_SIZE + 1)
+        if workers > 1:
+            threshold = keys[0][0] if len(keys) >= top_n else -np.inf
+            # Interleaved slices: early first members have the most work.
+            slices = [list(firsts[start::workers * 4]) for start in range(workers * 4)]
+            with concurrent.futures.ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(arrays,)
+            ) as executor:
+                for found in executor.map(_search_in_worker, slices, [top_n] * len(slices),
+                                          [threshold] * len(slices)):
+                    keys.extend(found)
+        else:
+            keys.extend(_search(arrays, firsts, top_n, keys[0][0] if len(keys) >= top_n
+                                else -np.inf))
+        return [self._team(key, positions, arrays) for key in heapq.nlargest(top_n, keys)]
+
+    def _team(self, key: tuple, positions: np.ndarray, arrays: dict) -> dict:
+        """
+        Describe a team found by the search.
+
+        Args:
+            key (tuple): The ``(score, -i, -j, -k)`` key.
+            positions (np.ndarray): Row positions of the candidates.
+            arrays (dict): The search arrays.
+
+        Returns:
+            dict: See ``search``.
+        """
+        members = [-index for index in key[1:]]
+        rows = self.data.iloc[positions[members]].assign(
+            CYCLE_DPS=self.cycle_dps[positions[members]]
+        )
+        cover = resist = weak = shared = 0
+        for member in members:
+            shared |= weak & int(arrays["weak"][member])
+            cover |= int(arrays["cover"][member])
+            resist |= int(arrays["resist"][member])
+            weak |= int(arrays["weak"][member])
+        return {
+            "SCORE": key[0],
+            "MEMBERS": rows[[column for column in TEAM_COLUMNS if column in rows.columns]],
+            "COVERAGE": mask_types(cover),
+            "RESISTS": mask_types(resist),
+            "SHARED_WEAKNESSES": mask_types(shared),
+        }
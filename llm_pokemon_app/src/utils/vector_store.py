@@ -0,0 +1,446 @@
+"""
+This module provides semantic retrieval over per-Pokémon documents.
+Documents are embedded offline with a deterministic hashing vectorizer (word,
+word-bigram and character-trigram features with IDF weighting) and searched with
+a FAISS inner-product index that is persisted to disk.
+"""
+
+import json
+import os
+import re
+import shutil
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+try:
+    import faiss  # type: ignore # pylint: disable=import-error
+except ImportError:  # pragma: no cover - faiss-cpu is pinned in requirements.txt
+    faiss = None
+
+INDEX_VERSION = 1
+WORD_PATTERN = re.compile(r"[\w'%♀♂-]+")
+
+
+class HashingVectorizer:
+    """
+    A stateless text vectorizer that hashes features into a fixed dimension.
+
+    Feature hashing uses CRC32, so vectors are identical across processes and
+    machines without storing a vocabulary. Character trigrams make queries
+    tolerant to small spelling mistakes.
+    """
+
+    def __init__(self, dimension: int = 1024):
+        """
+        Initialize the vectorizer.
+
+        Args:
+            dimension (int): Number of hashed feature buckets.
+        """
+        self.dimension = dimension
+
+    @staticmethod
+    def features(text: str) -> list:
+        """
+        Extract word, word-bigram and character-trigram features.
+
+        Args:
+            text (str): The text to featurize.
+
+        Returns:
+            list: Feature strings (with repeats).
+        """
+        words = WORD_PATTERN.findall(text.lower())
+        features = [f"w:{word}" for word in words]
+        features.extend(f"b:{first} {second}" for first, second in zip(words, words[1:]))
+        for word in words:
+            padded = f" {word} "
+            features.extend(f"c:{padded[start:start + 3]}" for start in range(len(padded) - 2))
+        return features
+
+    def hashed(self, text: str):
+        """
+        Hash the features of a text into buckets and signs.
+
+        Args:
+            text (str): The text to hash.
+
+        Returns:
+            tuple: ``(buckets, signs)`` integer and float arrays.
+        """
+        codes = np.fromiter(
+            (zlib.crc32(feature.encode("utf-8")) for feature in self.features(text)),
+            dtype=np.uint64,
+        )
+        # The top bit picks the sign so colliding features tend to cancel out.
+        signs = np.where(codes & 0x80000000, -1.0, 1.0)
+        return (codes % self.dimension).astype(np.int64), signs
+
+    def counts(self, texts: list) -> np.ndarray:
+        """
+        Hash texts into signed, sublinear term-frequency vectors.
+
+        Args:
+            texts (list): The texts to hash.
+
+        Returns:
+            np.ndarray: float32 matrix of shape (len(texts), dimension).
+        """
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            buckets, signs = self.hashed(text)
+            counts = np.bincount(buckets, weights=signs, minlength=self.dimension)
+            # Sublinear term frequency, keeping the sign of each bucket.
+            matrix[row] = np.sign(counts) * np.log1p(np.abs(counts))
+        return matrix
+
+    @staticmethod
+    def idf_from_counts(counts: np.ndarray) -> np.ndarray:
+        """
+        Compute smoothed IDF weights per bucket from corpus count vectors.
+
+        Args:
+            counts (np.ndarray): Output of ``counts`` for the corpus.
+
+        Returns:
+            np.ndarray: float32 IDF weights, one per bucket.
+        """
+        document_frequency = np.count_nonzero(counts, axis=0)
+        return (np.log((1 + len(counts)) / (1 + document_frequency)) + 1).astype(np.float32)
+
+    @staticmethod
+    def normalize(counts: np.ndarray, idf: np.ndarray = None) -> np.ndarray:
+        """
+        Apply IDF weights and L2-normalize count vectors.
+
+        Args:
+            counts (np.ndarray): Output of ``counts``.
+            idf (np.ndarray): Optional per-bucket IDF weights.
+
+        Returns:
+            np.ndarray: float32 unit vectors (zero vectors stay zero).
+        """
+        matrix = counts * idf if idf is not None else counts
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).astype(np.float32)
+
+    def transform(self, texts: list, idf: np.ndarray = None) -> np.ndarray:
+        """
+        Embed texts as L2-normalized float32 vectors.
+
+        Args:
+            texts (list): The texts to embed.
+            idf (np.ndarray): Optional per-bucket IDF weights.
+
+        Returns:
+            np.ndarray: Matrix of shape (len(texts), dimension).
+        """
+        return self.normalize(self.counts(texts), idf)
+
+
+def build_documents(data: pd.DataFrame, total_dps: np.ndarray = None) -> tuple:
+    """
+    Render one text document per Pokémon from its moveset rows.
+
+    Args:
+        data (pd.DataFrame): Pokémon dataset.
+        total_dps (np.ndarray): Optional TOTAL_DPS per row, used to name the
+            best moveset of each Pokémon.
+
+    Returns:
+        tuple: ``(names, documents)`` lists in first-appearance order.
+    """
+    def column(name):
+        if name not in data.columns:
+            return [None] * len(data)
+        return [None if pd.isna(value) else value for value in data[name].astype(object)]
+
+    dps = [None] * len(data) if total_dps is None else total_dps.tolist()
+    summaries = {}
+    for name, type_one, type_two, fast, fast_type, charge, charge_type, row_dps in zip(
+            column("NAME"), column("TYPE_ONE"), column("TYPE_TWO"), column("FAST_MOVE"),
+            column("FAST_MOVE_TYPE"), column("CHARGE_MOVE"), column("CHARGED_MOVE_TYPE"), dps):
+        if name is None:
+            continue
+        summary = summaries.setdefault(name, {
+            "types": [value for value in (type_one, type_two) if value is not None],
+            "fast": {}, "charge": {}, "best": None,
+        })
+        # Dictionaries keep first-seen order and drop repeated moves.
+        summary["fast"].setdefault(fast, fast_type)
+        summary["charge"].setdefault(charge, charge_type)
+        if row_dps is not None and np.isfinite(row_dps) and (
+                summary["best"] is None or row_dps > summary["best"][0]):
+            summary["best"] = (row_dps, fast, charge)
+
+    def moves(labels):
+        return ", ".join(
+            f"{move} ({move_type})" if move_type else f"{move}"
+            for move, move_type in labels.items() if move is not None
+        )
+
+    names, documents = [], []
+    for name, summary in summaries.items():
+        parts = [f"{name}."]
+        if summary["types"]:
+            parts.append(f"Type: {'/'.join(summary['types'])}.")
+        parts.append(f"Fast moves: {moves(summary['fast'])}.")
+        parts.append(f"Charge moves: {moves(summary['charge'])}.")
+        if summary["best"] is not None:
+            best_dps, fast, charge = summary["best"]
+            parts.append(f"Best DPS moveset: {fast} and {charge} (DPS {best_dps:.2f}).")
+        names.append(str(name))
+        documents.append(" ".join(parts))
+    return names, documents
+
+
+class PokemonVectorIndex:
+    """
+    A nearest-neighbour index over per-Pokémon documents.
+
+    Uses an exact FAISS inner-product index over normalized vectors (cosine
+    similarity), falling back to a NumPy matrix product if FAISS is missing.
+    """
+
+    def __init__(self, names: list, documents: list, vectors: np.ndarray,
+                 idf: np.ndarray, vectorizer: HashingVectorizer = None):
+        """
+        Initialize the index from embedded documents.
+
+        Args:
+            names (list): Pokémon name per document.
+            documents (list): Document texts.
+            vectors (np.ndarray): float32 document vectors, one row per document.
+            idf (np.ndarray): IDF weights used for the vectors.
+            vectorizer (HashingVectorizer): The vectorizer used for the vectors.
+        """
+        self.names = names
+        self.documents = documents
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.idf = idf
+        self.vectorizer = vectorizer or HashingVectorizer(self.vectors.shape[1])
+        self.build_seconds = 0.0
+        self._index = None
+        if faiss is not None:
+            self._index = faiss.IndexFlatIP(self.vectors.shape[1])
+            self._index.add(self.vectors)
+
+    @classmethod
+    def build(cls, data: pd.DataFrame, total_dps: np.ndarray = None,
+              dimension: int = 1024) -> "PokemonVectorIndex":
+        """
+        Build an index from the dataset.
+
+        Args:
+            data (pd.DataFrame): Pokémon dataset.
+            total_dps (np.ndarray): Optional TOTAL_DPS per row.
+            dimension (int): Hashed embedding dimension.
+
+        Returns:
+            PokemonVectorIndex: The new index, with ``build_seconds`` set.
+        """
+        started = time.perf_counter()
+        names, documents = build_documents(data, total_dps)
+        vectorizer = HashingVectorizer(dimension)
+        # Names are embedded twice so they outweigh the move lists.
+        counts = vectorizer.counts(
+            [f"{name}. {document}" for name, document in zip(names, documents)]
+        )
+        idf = vectorizer.idf_from_counts(counts)
+        index = cls(names, documents, vectorizer.normalize(counts, idf), idf, vectorizer)
+        index.build_seconds = time.perf_counter() - started
+        return index
+
+    def patched(self, data: pd.DataFrame, total_dps: np.ndarray,
+                touched) -> "PokemonVectorIndex":
+        """
+        Build the index of a new dataset version from this one.
+
+        Only the documents of touched Pokémon are rendered and hashed again.
+        Normalizing cancels any per-document scale, so dividing the stored
+        vectors by the old IDF gives vectors the new IDF can weight again. The
+        result matches a fresh build up to float32 rounding; this index is
+        left untouched.
+
+        Args:
+            data (pd.DataFrame): The new dataset version.
+            total_dps (np.ndarray): TOTAL_DPS per row of ``data``.
+            touched (set): Names (as shown) of the deleted, changed and added rows.
+
+        Returns:
+            PokemonVectorIndex: The index over ``data``, with ``build_seconds`` set.
+        """
+        started = time.perf_counter()
+        rows = data["NAME"].isin(list(touched)).to_numpy()
+        fresh = dict(zip(*build_documents(data[rows], total_dps[rows])))
+        previous = {name: doc_id for doc_id, name in enumerate(self.names)}
+        names, documents, kept, reused = [], [], [], []
+        for name in data["NAME"].dropna().unique():
+            name = str(name)
+            if name in fresh:
+                documents.append(fresh[name])
+            else:
+                kept.append(len(names))
+                reused.append(previous[name])
+                documents.append(self.documents[previous[name]])
+            names.append(name)
+
+        counts = np.empty((len(names), self.vectors.shape[1]), dtype=np.float32)
+        counts[kept] = self.vectors[reused] / self.idf
+        hashed = np.setdiff1d(np.arange(len(names)), kept)
+        counts[hashed] = self.vectorizer.counts(
+            [f"{names[doc_id]}. {documents[doc_id]}" for doc_id in hashed]
+        )
+        idf = self.vectorizer.idf_from_counts(counts)
+        index = PokemonVectorIndex(names, documents, self.vectorizer.normalize(counts, idf), idf,
+                                   self.vectorizer)
+        index.build_seconds = time.perf_counter() - started
+        return index
+
+    def save(self, directory: str):
+        """
+        Persist the index to a directory, atomically.
+
+        The files are written to a temporary directory next to the target,
+        which is then renamed into place, so workers sharing the directory
+        never read a half-written index.
+
+        Args:
+            directory (str): Destination directory (replaced if it exists).
+        """
+        directory = os.path.normpath(directory)
+        os.makedirs(os.path.dirname(directory) or ".", exist_ok=True)
+        temporary = f"{directory}.{os.getpid()}.tmp"
+        shutil.rmtree(temporary, ignore_errors=True)
+        os.makedirs(temporary)
+        try:
+            np.save(os.path.join(temporary, "vectors.npy"), self.vectors)
+            np.save(os.path.join(temporary, "idf.npy"), self.idf)
+            if self._index is not None:
+                faiss.write_index(self._index, os.path.join(temporary, "index.faiss"))
+            with open(os.path.join(temporary, "documents.json"), "w",
+                      encoding="utf-8") as handle:
+                json.dump({"version": INDEX_VERSION, "names": self.names,
+                           "documents": self.documents}, handle)
+            try:
+                os.replace(temporary, directory)
+            except OSError:
+                # A directory that is not empty cannot be replaced: move it aside
+                # first. Readers in between see no index and treat it as a miss.
+                stale = f"{directory}.{os.getpid()}.stale"
+                os.replace(directory, stale)
+                os.replace(temporary, directory)
+                shutil.rmtree(stale, ignore_errors=True)
+        finally:
+            shutil.rmtree(temporary, ignore_errors=True)
+
+    @classmethod
+    def load(cls, directory: str) -> "PokemonVectorIndex":
+        """
+        Load an index saved with ``save``.
+
+        Args:
+            directory (str): The index directory.
+
+        Returns:
+            PokemonVectorIndex: The loaded index.
+
+        Raises:
+            FileNotFoundError: If the directory does not hold an index.
+            ValueError: If the index was written by an incompatible version.
+        """
+        with open(os.path.join(directory, "documents.json"), encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if payload.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported vector index version: {payload.get('version')}")
+        vectors = np.load(os.path.join(directory, "vectors.npy"))
+        index = cls(payload["names"], payload["documents"], vectors,
+                    np.load(os.path.join(directory, "idf.npy")))
+        faiss_path = os.path.join(directory, "index.faiss")
+        if faiss is not None and os.path.exists(faiss_path):
+            index._index = faiss.read_index(faiss_path)  # pylint: disable=protected-access
+        return index
+
+    @classmethod
+    def load_or_build(cls, data: pd.DataFrame, directory: str,
+                      total_dps: np.ndarray = None) -> "PokemonVectorIndex":
+        """
+        Load a persisted index, or build and persist one.
+
+        An index that is missing, incompatible or unreadable (e.g. truncated)
+        counts as a cache miss.
+
+        Args:
+            data (pd.DataFrame): Pokémon dataset used when building.
+            directory (str): The index directory.
+            total_dps (np.ndarray): Optional TOTAL_DPS per row.
+
+        Returns:
+            PokemonVectorIndex: The index.
+        """
+        try:
+            return cls.load(directory)
+        except (OSError, ValueError, KeyError, RuntimeError, EOFError):
+            index = cls.build(data, total_dps)
+            try:
+                index.save(directory)
+            except OSError:
+                pass  # Persisting is only a cache.
+            return index
+
+    def search(self, query: str, top_k: int = 3) -> list:
+        """
+        Find the documents most similar to a query.
+
+        Args:
+            query (str): The user's question.
+            top_k (int): Number of documents to return.
+
+        Returns:
+            list: ``(score, name, document)`` tuples, most similar first.
+        """
+        top_k = min(top_k, len(self.documents))
+        if top_k <= 0:
+            return []
+        vector = self.vectorizer.transform([query], self.idf)
+        if self._index is not None:
+            scores, ids = self._index.search(vector, top_k)
+            scores, ids = scores[0], ids[0]
+        else:
+            similarities = self.vectors @ vector[0]
+            ids = np.argsort(-similarities, kind="stable")[:top_k]
+            scores = similarities[ids]
+        return [
+            (float(score), self.names[doc_id], self.documents[doc_id])
+            for score, doc_id in zip(scores, ids) if doc_id >= 0
+        ]
+
+
+def measure_vector_index(index: PokemonVectorIndex, queries: list, top_k: int = 3) -> dict:
+    """
+    Measure query latency and recall@k of an index.
+
+    Args:
+        index (PokemonVectorIndex): The index to measure.
+        queries (list): ``(query, expected_name)`` pairs.
+        top_k (int): Cut-off for recall.
+
+    Returns:
+        dict: build_seconds, mean_query_ms, p95_query_ms and recall_at_k.
+    """
+    latencies, hits = [], 0
+    for query, expected in queries:
+        started = time.perf_counter()
+        results = index.search(query, top_k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        hits += any(name == expected for _, name, _ in results)
+    return {
+        "build_seconds": index.build_seconds,
+        "mean_query_ms": float(np.mean(latencies)) if latencies else 0.0,
+        "p95_query_ms": float(np.percentile(latencies, 95)) if latencies else 0.0,
+        "recall_at_k": hits / len(queries) if queries else 0.0,
+    }
@@ -4,6 +4,17 @@ import sys
 from unittest.mock import patch, MagicMock
 
 from llm_pokemon_app.src.app import LLMApp 
+from llm_pokemon_app.src.models.backends import BACKENDS, BackendSpec, register_backend
+from llm_pokemon_app.src.models.base import ModelBackend
+
+
+class EchoModel(ModelBackend):
+
+    def __init__(self, retriever):
+        self.retriever = retriever
+
+    def get_response(self, prompt):
+        return prompt
 
 
 class TestLLMApp(unittest.TestCase):
@@ -77,6 +88,59 @@ class TestLLMApp(unittest.TestCase):
         # Assert st.write was called with expected values
         mock_write.assert_called_with("Response:", "Mewtwo has the highest DPS.")
 
+    @patch('llm_pokemon_app.src.app.st.caption')
+    @patch('llm_pokemon_app.src.app.st.write_stream')
+    @patch('llm_pokemon_app.src.app.st.checkbox')
+    @patch('llm_pokemon_app.src.app.st.write')
+    @patch('llm_pokemon_app.src.app.st.button')
+    @patch('llm_pokemon_app.src.app.st.selectbox')
+    @patch('llm_pokemon_app.src.app.st.text_input')
+    @patch('llm_pokemon_app.src.app.OpenAIModel')
+    def test_streamed_response(self, mock_openai_model, mock_text_input, mock_selectbox,
+                               mock_button, mock_write, mock_checkbox, mock_write_stream,
+                               mock_caption):
+        # With streaming enabled the chunks are rendered incrementally
+        mock_text_input.side_effect = ["fake_openai_api_key", "", "Best Pokémon?"]
+        mock_selectbox.return_value = "OpenAI"
+        mock_button.return_value = True
+        mock_checkbox.return_value = True
+        mock_openai_model.return_value.stream_response.return_value = iter(["Mew", "two"])
+        mock_write_stream.side_effect = lambda stream: "".join(stream)
+
+        app = LLMApp()
+        app.main()
+
+        mock_write.assert_called_with("Response:")
+        mock_write_stream.assert_called_once()
+        mock_openai_model.return_value.get_response.assert_not_called()
+        self.assertIn("Time to first token", mock_caption.call_args[0][0])
+
+    @patch('llm_pokemon_app.src.app.LLMApp.build_retriever')
+    @patch('llm_pokemon_app.src.app.st.write')
+    @patch('llm_pokemon_app.src.app.st.button')
+    @patch('llm_pokemon_app.src.app.st.selectbox')
+    @patch('llm_pokemon_app.src.app.st.text_input')
+    def test_backend_registered_after_import(self, mock_text_input, mock_selectbox,
+                                             mock_button, mock_write, mock_build_retriever):
+        # Backends registered after the app is imported are offered and built
+        mock_text_input.side_effect = ["", "", "What is the highest DPS Pokémon?"]
+        mock_selectbox.return_value = "Echo"
+        mock_button.return_value = True
+        register_backend(BackendSpec("echo", "Echo", __name__, "EchoModel",
+                                     needs_retriever=True))
+
+        app = LLMApp()
+        try:
+            with patch.dict('llm_pokemon_app.src.app.REGISTRY._resources', clear=True):
+                app.main()
+        finally:
+            BACKENDS.pop("echo")
+
+        offered = mock_selectbox.call_args[0][1]
+        self.assertIn("Echo", offered)
+        self.assertNotIn("Local stub (offline)", offered)
+        self.assertIs(app.retriever, mock_build_retriever.return_value)
+        mock_write.assert_called_with("Response:", "What is the highest DPS Pokémon?")
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+import sys
+import unittest
+from unittest.mock import MagicMock
+from llm_pokemon_app.src.models.backends import (
+    BACKENDS, BackendSpec, create_backend, get_backend, register_backend,
+)
+from llm_pokemon_app.src.models.base import ModelBackend
+from llm_pokemon_app.src.models.local_stub_model import LocalStubModel
+from llm_pokemon_app.src.models.openai_model import OpenAIModel
+from llm_pokemon_app.src.models.rag_model import RAGModel
+
+
+class EchoBackend(ModelBackend):
+
+    def __init__(self, cache=None):
+        self.cache = cache
+
+    def get_response(self, prompt):
+        return prompt[::-1]
+
+
+class TestBackends(unittest.TestCase):
+
+    def tearDown(self):
+        BACKENDS.pop("echo", None)
+
+    def test_builtin_backends(self):
+        self.assertEqual(list(BACKENDS)[:3], ["openai", "huggingface", "rag"])
+        self.assertIs(get_backend("RAG with Pokémon Data"), BACKENDS["rag"])
+        self.assertIs(BACKENDS["openai"].load(), OpenAIModel)
+        self.assertIs(BACKENDS["rag"].load(), RAGModel)
+        with self.assertRaises(ValueError):
+            get_backend("no such backend")
+
+    def test_create_passes_declared_resources(self):
+        backend_class = MagicMock()
+        BACKENDS["rag"].create(backend_class, "key", "retriever", "cache")
+        backend_class.assert_called_once_with("key", "retriever", cache="cache")
+
+        backend_class.reset_mock()
+        BACKENDS["huggingface"].create(backend_class, "key", "retriever", "cache")
+        backend_class.assert_called_once_with("key")
+
+    def test_register_new_backend(self):
+        # A new backend plugs in without touching the UI or batch code
+        register_backend(BackendSpec(
+            "echo", "Echo", __name__, "EchoBackend", uses_cache=True,
+        ))
+        backend = create_backend("Echo", cache="cache")
+
+        self.assertIsInstance(backend, EchoBackend)
+        self.assertEqual(backend.cache, "cache")
+        self.assertEqual(backend.get_responses(["ab", "cd"]), ["ba", "dc"])
+        self.assertEqual(list(backend.stream_response("ab")), ["ba"])
+
+    def test_get_response_is_abstract(self):
+        # A backend without get_response cannot be instantiated
+        class Incomplete(ModelBackend):
+            supports_async = True
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_capabilities(self):
+        self.assertEqual(
+            OpenAIModel.capabilities(),
+            {"async": True, "streaming": True, "batch": True, "local": False},
+        )
+        self.assertTrue(LocalStubModel.capabilities()["local"])
+        self.assertFalse(EchoBackend.capabilities()["async"])
+
+
+if __name__ == '__main__':
+    unittest.main()
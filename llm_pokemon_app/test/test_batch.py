@@ -0,0 +1,208 @@
+import asyncio
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from llm_pokemon_app.src import batch
+from llm_pokemon_app.src.models.base import ModelBackend
+from llm_pokemon_app.src.resources import vector_index_path
+from llm_pokemon_app.src.utils.concurrency import RateLimiter
+
+
+class FakeRAGModel(ModelBackend):
+    """Records calls instead of contacting an API."""
+
+    def __init__(self):
+        self.retrieved = []
+        self.generated = []
+
+    def retrieve_contexts(self, queries):
+        self.retrieved.append(list(queries))
+        return [f"context for {query}" for query in queries]
+
+    async def agenerate(self, prompt, context):
+        self.generated.append((prompt, context))
+        await asyncio.sleep(0)
+        if "raise" in prompt:
+            raise RuntimeError("rate limited")
+        return "Error: boom" if "fail" in prompt else f"answer to {prompt}"
+
+    def get_response(self, prompt):
+        raise AssertionError("batch runs generate from the retrieved contexts")
+
+
+class FakeOpenAIModel(ModelBackend):
+
+    def get_response(self, prompt):
+        return prompt.upper()
+
+    async def aget_response(self, prompt):
+        return prompt.upper()
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        return path
+
+    def test_read_questions_jsonl_and_csv(self):
+        jsonl = self.write("q.jsonl", '{"id": "a", "question": "Best fire?"}\n\n"Mewtwo moves?"\n')
+        csv_path = self.write("q.csv", "id,question\nx,Best water?\n")
+
+        self.assertEqual(batch.read_questions(jsonl), [
+            {"id": "a", "question": "Best fire?"}, {"id": 1, "question": "Mewtwo moves?"},
+        ])
+        self.assertEqual(batch.read_questions(csv_path), [{"id": "x", "question": "Best water?"}])
+
+    def test_read_questions_rejects_bad_input(self):
+        with self.assertRaises(ValueError):
+            batch.read_questions(self.write("q.txt", "hello"))
+        with self.assertRaises(ValueError):
+            batch.read_questions(self.write("q.jsonl", '{"id": 1}\n'))
+
+    def test_run_batch_dedupes_and_streams(self):
+        # Equivalent prompts share one retrieval and one generation
+        model = FakeRAGModel()
+        items = [
+            {"id": 1, "question": "Best fire type?"},
+            {"id": 2, "question": "best fire type"},
+            {"id": 3, "question": "please fail"},
+        ]
+        output = io.StringIO()
+
+        summary = asyncio.run(batch.run_batch(model, items, output, max_concurrency=2))
+
+        records = {record["id"]: record for record in map(json.loads, output.getvalue().splitlines())}
+        self.assertEqual(model.retrieved, [["Best fire type?", "please fail"]])
+        self.assertEqual(len(model.generated), 2)
+        self.assertEqual(records[2]["answer"], "answer to Best fire type?")
+        self.assertTrue(records[2]["deduplicated"])
+        self.assertFalse(records[1]["deduplicated"])
+        self.assertIn("generation_ms", records[3])
+        self.assertEqual(
+            (summary["items"], summary["unique_prompts"], summary["errors"]), (3, 2, 1)
+        )
+
+    def test_run_batch_records_exceptions_and_continues(self):
+        # A generation that raises becomes an error record; the others are still answered
+        items = [
+            {"id": 1, "question": "please raise"},
+            {"id": 2, "question": "Please raise!"},
+            {"id": 3, "question": "Best water type?"},
+        ]
+        output = io.StringIO()
+
+        summary = asyncio.run(batch.run_batch(FakeRAGModel(), items, output, max_concurrency=1))
+
+        records = {record["id"]: record for record in map(json.loads, output.getvalue().splitlines())}
+        self.assertEqual(records[1]["error"], "RuntimeError: rate limited")
+        self.assertEqual(records[2]["question"], "Please raise!")
+        self.assertNotIn("answer", records[1])
+        self.assertEqual(records[3]["answer"], "answer to Best water type?")
+        self.assertEqual(summary["errors"], 2)
+
+    def test_run_batch_without_retrieval(self):
+        output = io.StringIO()
+        asyncio.run(batch.run_batch(FakeOpenAIModel(), [{"id": 0, "question": "hi"}], output))
+        self.assertEqual(json.loads(output.getvalue())["answer"], "HI")
+
+    def test_rate_limiter(self):
+        # Five requests at 50/s with no burst take at least four refill periods
+        async def acquire_all():
+            limiter = RateLimiter(rate=50, burst=1)
+            for _ in range(5):
+                await limiter.acquire()
+
+        started = time.perf_counter()
+        asyncio.run(acquire_all())
+        self.assertGreaterEqual(time.perf_counter() - started, 0.07)
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+
+    @patch('llm_pokemon_app.src.batch.build_model')
+    def test_main_writes_output(self, mock_build_model):
+        mock_build_model.return_value = FakeOpenAIModel()
+        questions = self.write("q.jsonl", '"one"\n"two"\n')
+        output = os.path.join(self.directory.name, "answers.jsonl")
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "fake_api_key"}):
+            status = batch.main([questions, "-o", output, "--model", "openai"])
+
+        self.assertEqual(status, 0)
+        with open(output, encoding="utf-8") as handle:
+            self.assertEqual(len(handle.readlines()), 2)
+        self.assertEqual(mock_build_model.call_args[0][:2], ("openai", "fake_api_key"))
+
+    def test_stub_backend_end_to_end(self):
+        # The stub backend runs real retrieval over a dataset without an API key
+        dataset = self.write("pokemon.csv", (
+            "NAME,TYPE_ONE,FAST_MOVE,FAST_MOVE_POWER,FAST_MOVE_DURATION,"
+            "CHARGE_MOVE,CHARGE_MOVE_POWER,CHARGE_MOVE_DURATION\n"
+            "Mewtwo,Psychic,Confusion,20,1.6,Psystrike,90,2.3\n"
+            "Pidgey,Normal,Tackle,5,0.5,Twister,45,2.8\n"
+        ))
+        questions = self.write("q.jsonl", '"What is the highest DPS Pokémon?"\n')
+        output = os.path.join(self.directory.name, "answers.jsonl")
+
+        with patch.dict(os.environ, {}, clear=True):
+            status = batch.main([questions, "-o", output, "--model", "stub",
+                                 "--dataset", dataset])
+
+        self.assertEqual(status, 0)
+        with open(output, encoding="utf-8") as handle:
+            self.assertIn("Mewtwo", json.loads(handle.readline())["answer"])
+
+    def test_stub_backend_loads_dataset_by_extension(self):
+        # Parquet datasets are loaded whole without --chunk-rows; unknown types are rejected
+        dataset = os.path.join(self.directory.name, "pokemon.parquet")
+        pd.DataFrame({
+            'NAME': ['Mewtwo', 'Pidgey'], 'TYPE_ONE': ['Psychic', 'Normal'],
+            'FAST_MOVE': ['Confusion', 'Tackle'], 'FAST_MOVE_POWER': [20.0, 5.0],
+            'FAST_MOVE_DURATION': [1.6, 0.5], 'CHARGE_MOVE': ['Psystrike', 'Twister'],
+            'CHARGE_MOVE_POWER': [90.0, 45.0], 'CHARGE_MOVE_DURATION': [2.3, 2.8],
+        }).to_parquet(dataset)
+
+        model = batch.build_model("stub", dataset_path=dataset)
+
+        self.assertIn("Mewtwo", model.get_response("What is the highest DPS Pokémon?"))
+        with self.assertRaisesRegex(ValueError, "Unsupported dataset file type"):
+            batch.build_model("stub", dataset_path=self.write("pokemon.txt", "NAME\nMew\n"))
+
+    def test_stub_backend_chunked_dataset(self):
+        # --chunk-rows streams the dataset instead of loading it at once
+        dataset = self.write("pokemon.csv", (
+            "NAME,TYPE_ONE,FAST_MOVE,FAST_MOVE_POWER,FAST_MOVE_DURATION,"
+            "CHARGE_MOVE,CHARGE_MOVE_POWER,CHARGE_MOVE_DURATION\n"
+            "Pidgey,Normal,Tackle,5,0.5,Twister,45,2.8\n"
+            "Mewtwo,Psychic,Confusion,20,1.6,Psystrike,90,2.3\n"
+        ))
+        # The second question has no lexical match, so it falls back to semantic search
+        questions = self.write("q.jsonl", '"What is the highest DPS Pokémon?"\n"xyzzy"\n')
+        output = os.path.join(self.directory.name, "answers.jsonl")
+
+        with patch.dict(os.environ, {}, clear=True):
+            status = batch.main([questions, "-o", output, "--model", "stub",
+                                 "--dataset", dataset, "--chunk-rows", "1"])
+
+        self.assertEqual(status, 0)
+        with open(output, encoding="utf-8") as handle:
+            self.assertIn("Mewtwo", json.loads(handle.readline())["answer"])
+        # The semantic index is persisted for the dataset like a whole load's
+        self.assertTrue(os.path.isdir(vector_index_path(dataset)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+from llm_pokemon_app.benchmarks import harness
+from llm_pokemon_app.benchmarks.harness import (
+    compare, load_baselines, measure, run_benchmarks, save_baselines, synthetic_dataset,
+)
+# Imported for their side effect of registering benchmarks.
+from llm_pokemon_app.benchmarks import bench_generation, bench_loading, bench_retrieval  # noqa: F401
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+
+    def setUp(self):
+        self.data = pd.DataFrame({
+            'NAME': ['Charizard', 'Mewtwo', 'Garchomp'],
+            'TYPE': ['Fire', 'Psychic', 'Dragon'],
+            'FAST_MOVE': ['Fire Spin', 'Confusion', 'Mud Shot'],
+            'FAST_MOVE_POWER': [14.0, 20.0, 5.0],
+            'CHARGE_MOVE': ['Blast Burn', 'Psystrike', 'Earthquake'],
+            'CHARGE_MOVE_POWER': [110.0, 90.0, 120.0],
+            'TOTAL_DPS': [20.0, 30.5, 25.0],
+        })
+
+    def test_synthetic_dataset_scales_rows_and_names(self):
+        scaled = synthetic_dataset(self.data, 4)
+
+        self.assertEqual(len(scaled), 12)
+        self.assertEqual(scaled['NAME'].nunique(), 12)
+        self.assertIn('Mewtwo Clone 3', set(scaled['NAME']))
+        pd.testing.assert_frame_equal(scaled.iloc[:3].astype({'NAME': str}),
+                                      PokemonDataLoader.apply_schema(self.data).astype({'NAME': str}))
+        self.assertEqual(scaled['NAME'].dtype, 'category')
+        ratio = scaled['FAST_MOVE_POWER'].iloc[3:].to_numpy() / ([14.0, 20.0, 5.0] * 3)
+        self.assertTrue(((ratio >= 0.9) & (ratio <= 1.1)).all())
+
+    def test_measure_reports_per_call_times(self):
+        stats = measure(lambda: None, repeat=3, min_time=0.001)
+
+        self.assertEqual(stats['rounds'], 3)
+        self.assertGreaterEqual(stats['number'], 1)
+        self.assertLessEqual(stats['min_ms'], stats['median_ms'])
+
+    def test_compare_flags_regressions_beyond_tolerance_and_floor(self):
+        baselines = {'a[x1]': {'median_ms': 10.0}, 'b[x1]': {'median_ms': 0.01},
+                     'c[x1]': {'median_ms': 10.0}}
+        results = {'a[x1]': {'median_ms': 16.0}, 'b[x1]': {'median_ms': 0.05},
+                   'c[x1]': {'median_ms': 14.0}, 'new[x1]': {'median_ms': 99.0}}
+
+        self.assertEqual(compare(results, baselines, tolerance=0.5),
+                         [('a[x1]', 10.0, 16.0)])
+
+    def test_baselines_round_trip_and_merge(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baselines.json')
+            self.assertEqual(load_baselines(path), {})
+
+            save_baselines(path, {'a[x1]': {'median_ms': 1.0, 'number': 10}})
+            save_baselines(path, {'b[x1]': {'median_ms': 2.0}}, load_baselines(path))
+
+            self.assertEqual(load_baselines(path),
+                             {'a[x1]': {'median_ms': 1.0}, 'b[x1]': {'median_ms': 2.0}})
+
+    def test_registered_benchmarks_run(self):
+        data = pd.read_csv(os.path.join(os.path.dirname(harness.__file__), '..', 'src',
+                                        'excel_files', 'final_pokemon_dataset.csv'), nrows=40)
+        reported = []
+        names = [name for name in harness.BENCHMARKS if name != 'loader.load_excel']
+
+        results = run_benchmarks(data, scales=(1, 2), names=names, repeat=1,
+                                 min_time=0.0, report=lambda key, _: reported.append(key))
+
+        self.assertEqual(set(results), {f'{name}[x{scale}]' for name in names
+                                        for scale in (1, 2)})
+        self.assertEqual(reported, list(results))
+        self.assertEqual(results['retriever.build[x2]']['rows'], 80)
+
+    def test_stored_baselines_cover_registered_benchmarks(self):
+        baselines = load_baselines(os.path.join(os.path.dirname(harness.__file__),
+                                                'baselines.json'))
+
+        for name in harness.BENCHMARKS:
+            self.assertIn(f'{name}[x1]', baselines)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import math
+import unittest
+import pandas as pd
+import numpy as np
+from llm_pokemon_app.src.utils.bm25 import BM25Builder, BM25Index, tokenize
+
+
+class TestBM25Index(unittest.TestCase):
+
+    def setUp(self):
+        # Rows rendered as name, types and moves
+        self.sample_data = pd.DataFrame({
+            'NAME': ['Charizard', 'Charizard', 'Blastoise', 'Dragonite'],
+            'TYPE_ONE': ['Fire', 'Fire', 'Water', 'Dragon'],
+            'FAST_MOVE': ['Fire Spin', 'Dragon Breath', 'Water Gun', 'Dragon Tail'],
+            'CHARGE_MOVE': ['Blast Burn', 'Dragon Claw', 'Hydro Cannon', None],
+        })
+        self.columns = ('NAME', 'TYPE_ONE', 'FAST_MOVE', 'CHARGE_MOVE', 'MISSING')
+        self.index = BM25Index.from_columns(self.sample_data, self.columns)
+
+    def test_tokenize(self):
+        # Tokens are lower-cased and split on punctuation
+        self.assertEqual(tokenize("Ho-Oh's Sacred Fire!"), ['ho', 'oh', 's', 'sacred', 'fire'])
+
+    def test_scores_match_reference_formula(self):
+        # Precomputed posting weights reproduce Okapi BM25 exactly
+        texts = [
+            [token for value in row if pd.notna(value) for token in tokenize(value)]
+            for row in self.sample_data.itertuples(index=False)
+        ]
+        average = sum(len(text) for text in texts) / len(texts)
+
+        def reference(query, text):
+            score = 0.0
+            for term in set(tokenize(query)):
+                frequency = text.count(term)
+                if frequency:
+                    count = sum(term in other for other in texts)
+                    idf = math.log(1 + (len(texts) - count + 0.5) / (count + 0.5))
+                    score += idf * frequency * 2.2 / (
+                        frequency + 1.2 * (0.25 + 0.75 * len(text) / average)
+                    )
+            return score
+
+        scores = self.index.scores("dragon claw charizard")
+        for row, text in enumerate(texts):
+            self.assertAlmostEqual(scores[row], reference("dragon claw charizard", text))
+
+    def test_search_ranks_and_filters(self):
+        # Results are best first, positive only, and can be restricted
+        positions, scores = self.index.search("dragon claw", 5)
+        self.assertEqual(list(positions), [1, 3])
+        self.assertTrue(scores[0] >= scores[1] > 0)
+
+        positions, _ = self.index.search("dragon", 5, candidates=[2, 3])
+        self.assertEqual(list(positions), [3])
+
+        positions, _ = self.index.search("mewtwo", 5)
+        self.assertEqual(len(positions), 0)
+
+    def test_builder_chunks_match_full_index(self):
+        # Indexing chunk by chunk gives the same scores as one pass
+        builder = BM25Builder(self.columns)
+        for start in range(0, len(self.sample_data), 3):
+            builder.add(self.sample_data.iloc[start:start + 3])
+        chunked = builder.build()
+
+        self.assertEqual(chunked.row_count, 4)
+        for query in ("dragon claw charizard", "water gun", "fire"):
+            np.testing.assert_array_equal(chunked.scores(query), self.index.scores(query))
+
+    def test_patched_matches_fresh_build(self):
+        # Patching renumbers kept rows and indexes added ones, like a rebuild
+        mewtwo = pd.DataFrame({'NAME': ['Mewtwo'], 'TYPE_ONE': ['Psychic'],
+                               'FAST_MOVE': ['Confusion'], 'CHARGE_MOVE': ['Psystrike']})
+        changed = self.sample_data.iloc[[3]].assign(CHARGE_MOVE='Dragon Claw')
+        cases = (
+            # Kept rows in their old order
+            ([0, 2], [0, -1, 1, -1]),
+            # Blastoise moved before Charizard
+            ([2, 0], [1, -1, 0, -1]),
+        )
+        for kept, old_to_new in cases:
+            data = pd.concat([self.sample_data.iloc[kept], mewtwo, changed], ignore_index=True)
+            patched = self.index.patched(data, np.array(old_to_new), np.array([2, 3]))
+            fresh = BM25Index.from_columns(data, self.columns)
+
+            self.assertEqual(patched.row_count, 4)
+            for query in ("dragon claw charizard", "psystrike mewtwo", "water fire", "tail"):
+                np.testing.assert_array_equal(patched.scores(query), fresh.scores(query))
+        np.testing.assert_array_equal(self.index.scores("mewtwo"), np.zeros(4))
+
+
+if __name__ == '__main__':
+    unittest.main()
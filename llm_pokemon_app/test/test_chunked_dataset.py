@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from llm_pokemon_app.src.data.chunked_dataset import ChunkedDatasetBuilder, build_retriever
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+
+DATASET_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'excel_files',
+                            'final_pokemon_dataset.csv')
+
+
+class TestChunkedDataset(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # A slice of the real dataset, so chunks disagree on their categories
+        cls.data = PokemonDataLoader.apply_schema(pd.read_csv(DATASET_PATH, nrows=300))
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.csv_path = os.path.join(cls.directory.name, 'pokemon.csv')
+        cls.parquet_path = os.path.join(cls.directory.name, 'pokemon.parquet')
+        cls.data.to_csv(cls.csv_path, index=False)
+        cls.data.to_parquet(cls.parquet_path, index=False)
+        cls.full = PokemonRetriever(PokemonDataLoader.load_csv(cls.csv_path))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def assert_same_retriever(self, retriever):
+        pd.testing.assert_frame_equal(retriever.data, self.full.data, check_categorical=False)
+        np.testing.assert_array_equal(retriever.total_dps, self.full.total_dps)
+        np.testing.assert_array_equal(retriever._dps_order, self.full._dps_order)
+        for query in ("dragon claw", "psychic confusion"):
+            np.testing.assert_array_equal(retriever.lexical_index.scores(query),
+                                          self.full.lexical_index.scores(query))
+        self.assertEqual(retriever.retrieve_highest_dps()['NAME'],
+                         self.full.retrieve_highest_dps()['NAME'])
+        name = self.full.data.iloc[250]['NAME']
+        pd.testing.assert_frame_equal(retriever.retrieve_by_name(name),
+                                      self.full.retrieve_by_name(name), check_categorical=False)
+
+    def test_build_retriever_matches_full_load(self):
+        # CSV and Parquet streams build the same retriever as a full load
+        for path in (self.csv_path, self.parquet_path):
+            with self.subTest(path=path):
+                retriever = build_retriever(PokemonDataLoader.iter_chunks(path, 64))
+                self.assert_same_retriever(retriever)
+
+    def test_categoricals_are_merged(self):
+        # Chunk dictionaries are unioned; the result is independent of chunk size
+        built = [
+            ChunkedDatasetBuilder() for _ in range(2)
+        ]
+        for builder, chunk_rows in zip(built, (7, 100)):
+            for chunk in PokemonDataLoader.iter_chunks(self.csv_path, chunk_rows):
+                builder.add(chunk)
+        small, large = (builder.build()[0] for builder in built)
+
+        self.assertEqual(small['NAME'].dtype, 'category')
+        self.assertEqual(list(small['NAME'].cat.categories), list(large['NAME'].cat.categories))
+        self.assertEqual(list(small['NAME']), list(self.data['NAME']))
+
+    def test_builder_errors(self):
+        builder = ChunkedDatasetBuilder()
+        with self.assertRaises(ValueError):
+            builder.build()
+
+        builder.add(self.data.iloc[:2])
+        with self.assertRaises(ValueError):
+            builder.add(self.data.iloc[2:4, 1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
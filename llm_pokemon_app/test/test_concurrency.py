@@ -0,0 +1,191 @@
+import asyncio
+import json
+import os
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+from llm_pokemon_app.src.models.openai_model import OpenAIModel
+from llm_pokemon_app.src.models.rag_model import RAGModel
+from llm_pokemon_app.src.utils.concurrency import (
+    AdmissionQueue, LoopLocal, answer_all, answer_concurrently, gather_bounded,
+)
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
+
+
+class StubCompletionServer(ThreadingHTTPServer):
+    """A local OpenAI-compatible server that echoes the user message."""
+
+    daemon_threads = True
+
+    def __init__(self, delay=0.05):
+        super().__init__(("127.0.0.1", 0), StubCompletionHandler)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = []
+        self.connections = set()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class StubCompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+            server.requests.append(body)
+            server.connections.add(self.client_address)
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+        payload = json.dumps({
+            "id": "stub", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{
+                "index": 0, "finish_reason": "stop",
+                "message": {
+                    "role": "assistant", "content": "echo: " + body["messages"][-1]["content"],
+                },
+            }],
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConcurrency(unittest.TestCase):
+
+    def setUp(self):
+        REGISTRY.clear()
+        self.server = StubCompletionServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.environment = patch.dict(os.environ, {"OPENAI_BASE_URL": self.server.base_url})
+        self.environment.start()
+
+    def tearDown(self):
+        self.environment.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_answer_all_bounded_and_ordered(self):
+        # Answers come back in order with at most max_concurrency requests in flight
+        questions = [f"question {number}" for number in range(20)]
+
+        answers = answer_all(OpenAIModel(api_key="fake_api_key"), questions, max_concurrency=5)
+
+        self.assertEqual(answers, [f"echo: {question}" for question in questions])
+        self.assertGreater(self.server.peak, 1)
+        self.assertLessEqual(self.server.peak, 5)
+        # Connections are pooled rather than opened per request
+        self.assertLessEqual(len(self.server.connections), 5)
+
+    def test_async_cache_skips_repeated_questions(self):
+        cache = ResponseCache()
+        model = OpenAIModel(api_key="fake_api_key", cache=cache)
+
+        answers = answer_all(model, ["Best attacker?"] * 3, max_concurrency=1)
+
+        self.assertEqual(answers, ["echo: Best attacker?"] * 3)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_rag_aget_response_sends_context(self):
+        retriever = MagicMock()
+        retriever.retrieve_highest_dps.return_value = {'NAME': 'Mewtwo', 'TOTAL_DPS': 30.5}
+        model = RAGModel(api_key="fake_api_key", retriever=retriever)
+
+        answer = asyncio.run(model.aget_response("What is the highest DPS Pokémon?"))
+
+        self.assertEqual(answer, "echo: What is the highest DPS Pokémon?")
+        self.assertIn("Mewtwo", self.server.requests[0]["messages"][0]["content"])
+
+    def test_clients_shared_per_loop(self):
+        # Models with the same key share one async client per event loop
+        first = OpenAIModel(api_key="fake_api_key")
+        second = RAGModel(api_key="fake_api_key", retriever=MagicMock())
+
+        async def clients():
+            return first.async_client, second.async_client
+
+        same_loop = asyncio.run(clients())
+        other_loop = asyncio.run(clients())
+        self.assertIs(same_loop[0], same_loop[1])
+        self.assertIsNot(same_loop[0], other_loop[0])
+
+
+class TestGatherBounded(unittest.TestCase):
+
+    def test_results_in_order(self):
+        async def double(value):
+            await asyncio.sleep(0.001 * (5 - value))
+            return value * 2
+
+        self.assertEqual(asyncio.run(gather_bounded(double, range(5), 2)), [0, 2, 4, 6, 8])
+        self.assertEqual(asyncio.run(gather_bounded(double, [], 2)), [])
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(gather_bounded(asyncio.sleep, [0], 0))
+
+    def test_answer_concurrently_uses_aget_response(self):
+        model = MagicMock()
+
+        async def aget_response(question):
+            return question.upper()
+
+        model.aget_response = aget_response
+        self.assertEqual(asyncio.run(answer_concurrently(model, ["a", "b"])), ["A", "B"])
+
+    def test_loop_local_requires_running_loop(self):
+        with self.assertRaises(RuntimeError):
+            LoopLocal(object).get()
+
+
+class TestAdmissionQueue(unittest.TestCase):
+
+    def test_rejects_beyond_slots_and_queue(self):
+        # Two run, one waits, the fourth is rejected; slots free up afterwards
+        queue = AdmissionQueue(max_concurrency=2, max_queue=1)
+        release = None
+        outcomes = []
+
+        async def hold():
+            try:
+                async with queue.slot():
+                    await release.wait()
+                outcomes.append('done')
+            except asyncio.QueueFull:
+                outcomes.append('rejected')
+
+        async def run():
+            nonlocal release
+            release = asyncio.Event()
+            tasks = [asyncio.create_task(hold()) for _ in range(4)]
+            await asyncio.sleep(0.01)
+            waiting = queue.waiting
+            release.set()
+            await asyncio.gather(*tasks)
+            return waiting
+
+        self.assertEqual(asyncio.run(run()), 1)
+        self.assertEqual(sorted(outcomes), ['done', 'done', 'done', 'rejected'])
+        self.assertEqual(queue.admitted, 0)
+        with self.assertRaises(ValueError):
+            AdmissionQueue(max_concurrency=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
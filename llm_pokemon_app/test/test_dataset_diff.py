@@ -0,0 +1,65 @@
+import unittest
+import pandas as pd
+from llm_pokemon_app.src.data.dataset_diff import diff_datasets
+
+
+class TestDiffDatasets(unittest.TestCase):
+
+    def setUp(self):
+        # Rows are keyed by ID, NAME and moveset
+        self.old = pd.DataFrame({
+            'ID': ['0006', '0006', '0009', '0149'],
+            'NAME': ['Charizard', 'Charizard', 'Blastoise', 'Dragonite'],
+            'FAST_MOVE': ['Fire Spin', 'Wing Attack', 'Water Gun', 'Dragon Tail'],
+            'CHARGE_MOVE': ['Blast Burn', 'Blast Burn', 'Hydro Cannon', 'Outrage'],
+            'FAST_MOVE_POWER': [14.0, 8.0, 5.0, 15.0],
+        })
+
+    def test_inserts_updates_and_deletes(self):
+        # Blastoise is deleted, Dragonite updated and Mewtwo inserted
+        new = pd.concat([
+            self.old.iloc[[0, 1]],
+            self.old.iloc[[3]].assign(FAST_MOVE_POWER=13.0),
+            pd.DataFrame({'ID': ['0150'], 'NAME': ['Mewtwo'], 'FAST_MOVE': ['Confusion'],
+                          'CHARGE_MOVE': ['Psystrike'], 'FAST_MOVE_POWER': [20.0]}),
+        ], ignore_index=True)
+
+        diff = diff_datasets(self.old, new)
+
+        self.assertEqual(diff.summary(), {'inserted': 1, 'updated': 1, 'deleted': 1})
+        self.assertEqual(list(diff.old_to_new), [0, 1, -1, -1])
+        self.assertEqual(list(diff.added), [2, 3])
+        self.assertEqual(list(diff.removed), [2, 3])
+        self.assertFalse(diff.reordered)
+        self.assertTrue(diff)
+
+    def test_unchanged_and_reordered(self):
+        # Categorical dtypes do not count as changes; moved rows are flagged
+        self.assertFalse(diff_datasets(self.old, self.old.astype({'NAME': 'category'})))
+
+        diff = diff_datasets(self.old, self.old.iloc[[1, 0, 2, 3]].reset_index(drop=True))
+        self.assertEqual(list(diff.old_to_new), [1, 0, 2, 3])
+        self.assertEqual(len(diff.added), 0)
+        self.assertTrue(diff.reordered)
+        self.assertTrue(diff)
+
+    def test_duplicate_keys_match_in_order(self):
+        # Repeated keys are matched occurrence by occurrence
+        old = self.old.iloc[[0, 0, 2]].reset_index(drop=True)
+        new = old.iloc[[0, 2]].reset_index(drop=True)
+
+        diff = diff_datasets(old, new)
+
+        self.assertEqual(list(diff.old_to_new), [0, -1, 1])
+        self.assertEqual(diff.summary(), {'inserted': 0, 'updated': 0, 'deleted': 1})
+
+    def test_changed_columns_raise(self):
+        # A schema change cannot be patched
+        with self.assertRaises(ValueError):
+            diff_datasets(self.old, self.old.drop(columns=['FAST_MOVE_POWER']))
+        with self.assertRaises(ValueError):
+            diff_datasets(self.old[['FAST_MOVE_POWER']], self.old[['FAST_MOVE_POWER']])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from llm_pokemon_app.src.data.dataset_watcher import DatasetWatcher, file_signature
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.utils.live_retriever import LiveRetriever
+
+
+class TestDatasetWatcher(unittest.TestCase):
+
+    def setUp(self):
+        # A dataset file served through a live retriever
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'pokemon.csv')
+        self.data = pd.DataFrame({
+            'ID': ['0006', '0009', '0149'],
+            'NAME': ['Charizard', 'Blastoise', 'Dragonite'],
+            'FAST_MOVE_POWER': [14.0, 5.0, 15.0],
+            'FAST_MOVE_DURATION': [1.1, 0.5, 1.1],
+            'CHARGE_MOVE_POWER': [110.0, 80.0, 110.0],
+            'CHARGE_MOVE_DURATION': [3.3, 1.9, 3.9],
+        })
+        self.write(self.data)
+        self.live = LiveRetriever(PokemonRetriever(pd.read_csv(self.path, dtype={'ID': str})))
+        self.watcher = DatasetWatcher(self.path, self.live, interval_s=0.01,
+                                      loader=self.load)
+
+    def tearDown(self):
+        self.watcher.stop()
+        self.directory.cleanup()
+
+    def load(self, path):
+        if not os.path.exists(path):
+            return f"File not found: {path}"
+        return pd.read_csv(path, dtype={'ID': str})
+
+    def write(self, data, mtime_ns=None):
+        data.to_csv(self.path, index=False)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def touch(self, data):
+        # Bump the modification time so the change is seen on any file system
+        size, mtime_ns = file_signature(self.path)
+        self.write(data, mtime_ns + 1_000_000_000)
+        return size
+
+    def test_change_is_patched_once_settled(self):
+        # The first poll sees the change, the second applies it as a patch
+        old = self.live.current
+        self.touch(pd.concat([self.data.iloc[[0, 2]].assign(FAST_MOVE_POWER=[14.0, 20.0]),
+                              self.data.iloc[[1]].assign(ID='0150', NAME='Mewtwo')],
+                             ignore_index=True))
+
+        self.assertIsNone(self.watcher.check())
+        summary = self.watcher.check()
+
+        self.assertEqual(summary['mode'], 'patch')
+        self.assertEqual((summary['inserted'], summary['updated'], summary['deleted']), (1, 1, 1))
+        self.assertEqual(summary['version'], 1)
+        self.assertEqual(list(self.live.retrieve_by_name('mewtwo')['NAME']), ['Mewtwo'])
+        self.assertTrue(self.live.retrieve_by_name('Blastoise').empty)
+        self.assertEqual(list(old.retrieve_by_name('Blastoise')['NAME']), ['Blastoise'])
+        self.assertIsNone(self.watcher.check())
+
+    def test_rewritten_identical_file_keeps_retriever(self):
+        # A new modification time with the same rows changes nothing
+        old = self.live.current
+        self.touch(self.data)
+        self.watcher.check()
+
+        self.assertEqual(self.watcher.check()['mode'], 'unchanged')
+        self.assertIs(self.live.current, old)
+        self.assertEqual(self.live.version, 0)
+
+    def test_changed_columns_rebuild(self):
+        # A schema change cannot be patched, so the indexes are rebuilt
+        self.touch(self.data.assign(EXTRA=1))
+        self.watcher.check()
+
+        summary = self.watcher.check()
+
+        self.assertEqual(summary['mode'], 'rebuild')
+        self.assertIn('EXTRA', self.live.data.columns)
+
+    def test_load_error_keeps_retriever(self):
+        # A file that fails to load is reported and the old data kept serving
+        old = self.live.current
+        os.remove(self.path)
+        self.assertIsNone(self.watcher.reload())
+
+        self.assertIn('File not found', self.watcher.last_error)
+        self.assertIs(self.live.current, old)
+        self.assertIsNone(self.watcher.check())
+
+    def test_background_thread_reloads(self):
+        # The polling thread applies a change without explicit checks
+        self.touch(self.data.iloc[[0, 1]])
+        self.watcher.start()
+        for _ in range(500):
+            if self.live.version:
+                break
+            self.watcher._stop.wait(0.01)  # pylint: disable=protected-access
+        self.watcher.stop(timeout=5)
+
+        self.assertEqual(self.live.version, 1)
+        self.assertEqual(self.watcher.last_reload['deleted'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+import pandas as pd
+from llm_pokemon_app.src.utils.energy_cycle import CYCLE_COLUMNS, EnergyCycleSimulator
+
+
+def simulate(row, battle_s):
+    # One attacker, move by move: the reference the closed form must match
+    end = battle_s + 1e-9  # moves ending exactly at the end of the window count
+    charges = row['CHARGE_MOVE_ENERGY_COST'] > 0 and row['FAST_ENERGY_BOOST'] > 0
+    now = stored = damage = 0.0
+    while True:
+        if charges and stored >= row['CHARGE_MOVE_ENERGY_COST']:
+            if now + row['DAMAGE WINDOW START'] <= end:
+                damage += row['CHARGE_MOVE_POWER']
+            stored -= row['CHARGE_MOVE_ENERGY_COST']
+            now += row['CHARGE_MOVE_DURATION']
+        else:
+            now += row['FAST_MOVE_DURATION']
+            if now > end:
+                return damage
+            damage += row['FAST_MOVE_POWER']
+            stored += row['FAST_ENERGY_BOOST']
+        if now > end:
+            return damage
+
+
+class TestEnergyCycleSimulator(unittest.TestCase):
+
+    def setUp(self):
+        self.data = pd.DataFrame({
+            'FAST_MOVE_POWER': [6.0, 16.0, 5.0, 12.0, 4.0, None],
+            'FAST_ENERGY_BOOST': [15.0, 8.0, 0.0, 8.0, 6.0, 10.0],
+            'FAST_MOVE_DURATION': [1.0, 1.1, 0.5, 0.9, 0.5, None],
+            'CHARGE_MOVE_POWER': [140.0, 150.0, 35.0, 60.0, 35.0, 50.0],
+            'CHARGE_MOVE_ENERGY_COST': [50.0, 50.0, 33.0, 50.0, 0.0, 50.0],
+            'CHARGE_MOVE_DURATION': [2.5, 3.6, 2.2, 1.9, 2.2, 2.0],
+            'DAMAGE WINDOW START': [1.7, 3.0, 1.0, 1.3, 1.2, 1.0],
+        })
+        self.simulator = EnergyCycleSimulator(self.data)
+
+    def test_cycle_dps(self):
+        # A cycle is cost / energy fast moves and one charge move
+        dps = self.simulator.cycle_dps()
+
+        self.assertAlmostEqual(dps[0], (50 / 15 * 6 + 140) / (50 / 15 * 1.0 + 2.5))
+        # No fast energy or no charge cost: the fast move alone
+        self.assertAlmostEqual(dps[2], 5.0 / 0.5)
+        self.assertAlmostEqual(dps[4], 4.0 / 0.5)
+        self.assertTrue(np.isnan(dps[5]))
+        # Multipliers scale each move's damage
+        boosted = self.simulator.cycle_dps(2.0, np.ones(6))
+        self.assertAlmostEqual(boosted[0], (50 / 15 * 12 + 140) / (50 / 15 * 1.0 + 2.5))
+
+    def test_battle_damage_matches_move_by_move_simulation(self):
+        # Whole moves only, including a charge landing exactly at the end of the window
+        for battle_s in (3.0, 47.3, 180.0):
+            damage = self.simulator.battle_damage(battle_s)
+            for row in range(5):
+                expected = simulate(self.data.iloc[row], battle_s)
+                self.assertAlmostEqual(damage[row], expected, msg=(battle_s, row))
+            self.assertTrue(np.isnan(damage[5]))
+
+    def test_evaluate(self):
+        metrics = self.simulator.evaluate(180.0)
+
+        self.assertEqual(tuple(metrics), CYCLE_COLUMNS)
+        self.assertAlmostEqual(metrics['ENERGY_PER_SECOND'][0], 15.0)
+        # Four whole fast moves pay for the first charge move
+        self.assertAlmostEqual(metrics['FIRST_CHARGE_S'][0], 4 * 1.0 + 1.7)
+        self.assertTrue(np.isnan(metrics['FIRST_CHARGE_S'][2]))
+        self.assertFalse(metrics['TDO'].flags.writeable)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,9 +5,14 @@ from unittest.mock import patch, MagicMock
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
 from llm_pokemon_app.src.models.huggingface_model import HuggingFaceModel
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
 
 class TestHuggingFaceModel(unittest.TestCase):
 
+    def setUp(self):
+        # Start every test without cached clients or model weights
+        REGISTRY.clear()
+
     @patch('llm_pokemon_app.src.models.huggingface_model.AutoTokenizer.from_pretrained')
     @patch('llm_pokemon_app.src.models.huggingface_model.AutoModelForCausalLM.from_pretrained')
     def test_get_response_success(self, mock_model, mock_tokenizer):
@@ -33,5 +38,48 @@ class TestHuggingFaceModel(unittest.TestCase):
         # Assert that the response is as expected
         self.assertEqual(response, "Hello, this is a generated response.")
 
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoTokenizer.from_pretrained')
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoModelForCausalLM.from_pretrained')
+    def test_weights_loaded_once_per_process(self, mock_model, mock_tokenizer):
+        # A second instance reuses the cached tokenizer and model
+        first = HuggingFaceModel(api_key="fake_api_key")
+        second = HuggingFaceModel(api_key="other_api_key")
+
+        mock_model.assert_called_once()
+        mock_tokenizer.assert_called_once()
+        self.assertIs(first.model, second.model)
+
+    @patch('llm_pokemon_app.src.models.huggingface_model.TextIteratorStreamer')
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoTokenizer.from_pretrained')
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoModelForCausalLM.from_pretrained')
+    def test_stream_response(self, mock_model, mock_tokenizer, mock_streamer):
+        # Chunks come from the streamer fed by generate() in a background thread
+        mock_streamer.return_value = iter(["Mewtwo ", "is ", "strong."])
+        mock_tokenizer.return_value = MagicMock(return_value={"input_ids": [[1, 2]]})
+
+        model = HuggingFaceModel(api_key="fake_api_key")
+        chunks = list(model.stream_response("Who is strong?"))
+
+        self.assertEqual(chunks, ["Mewtwo ", "is ", "strong."])
+        generate_kwargs = mock_model.return_value.generate.call_args.kwargs
+        self.assertIs(generate_kwargs["streamer"], mock_streamer.return_value)
+        self.assertEqual(generate_kwargs["input_ids"], [[1, 2]])
+
+    @patch('llm_pokemon_app.src.models.huggingface_model.TextIteratorStreamer')
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoTokenizer.from_pretrained')
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoModelForCausalLM.from_pretrained')
+    def test_stream_response_generation_error(self, mock_model, mock_tokenizer, mock_streamer):
+        # A failure in the generation thread ends the stream with an error chunk
+        streamer = MagicMock()
+        streamer.__iter__.return_value = iter([])
+        mock_streamer.return_value = streamer
+        mock_tokenizer.return_value = MagicMock(return_value={})
+        mock_model.return_value.generate.side_effect = RuntimeError("out of memory")
+
+        model = HuggingFaceModel(api_key="fake_api_key")
+
+        self.assertEqual(list(model.stream_response("Hi")), ["Error: out of memory"])
+        streamer.end.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
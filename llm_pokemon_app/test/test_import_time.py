@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import llm_pokemon_app.src.app as app_module
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+# Cold import budget for the app module, in microseconds (eager imports took ~3.8 s)
+IMPORT_BUDGET_US = 1_500_000
+HEAVY_MODULES = ("torch", "transformers", "tensorflow", "openai", "pandas", "numpy", "faiss")
+
+
+def profile_import(module):
+    """Import a module in a fresh interpreter and parse -X importtime output."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_app_cold_start(self):
+        # Heavy backends stay unimported until a model is selected
+        cumulative = profile_import("llm_pokemon_app.src.app")
+
+        self.assertEqual([name for name in HEAVY_MODULES if name in cumulative], [])
+        self.assertLess(cumulative["llm_pokemon_app.src.app"], IMPORT_BUDGET_US)
+
+    def test_lazy_names_resolve(self):
+        from llm_pokemon_app.src.models.openai_model import OpenAIModel
+
+        self.assertIs(app_module.lazy("OpenAIModel"), OpenAIModel)
+        with self.assertRaises(AttributeError):
+            getattr(app_module, "NotABackend")
+
+
+if __name__ == '__main__':
+    unittest.main()
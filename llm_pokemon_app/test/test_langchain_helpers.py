@@ -1,5 +1,6 @@
 import unittest
 import pandas as pd
+from llm_pokemon_app.src.data.dataset_diff import diff_datasets
 from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
 
 class TestPokemonRetriever(unittest.TestCase):
@@ -42,6 +43,13 @@ class TestPokemonRetriever(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result.iloc[0]['NAME'], 'Charizard')
 
+    def test_retrieve_by_name_exact(self):
+        # Exact matching does not return other names containing the query
+        data = self.sample_data.assign(NAME=['Bulbasaur', 'Ivysaur', 'Charizard', 'Mega Charizard X'])
+        result = PokemonRetriever(data).retrieve_by_name('charizard', exact=True)
+
+        self.assertEqual(list(result['NAME']), ['Charizard'])
+
     def test_retrieve_highest_dps(self):
         # Test retrieving Pokémon with the highest DPS
         result = self.retriever.retrieve_highest_dps()
@@ -55,6 +63,156 @@ class TestPokemonRetriever(unittest.TestCase):
         self.assertEqual(result['NAME'], 'Charizard')
         self.assertAlmostEqual(result['TOTAL_DPS'], charizard_total_dps)
 
+    def test_retrieve_highest_dps_does_not_mutate_data(self):
+        # Ranking queries must leave the shared dataset untouched
+        self.retriever.retrieve_highest_dps()
+
+        self.assertNotIn('TOTAL_DPS', self.sample_data.columns)
+        self.assertFalse(self.retriever.total_dps.flags.writeable)
+
+    def test_retrieve_top_dps(self):
+        # Test retrieving the top-k Pokémon ordered by DPS
+        result = self.retriever.retrieve_top_dps(2)
+
+        self.assertEqual(list(result['NAME']), ['Charizard', 'Charmander'])
+        self.assertTrue(result['TOTAL_DPS'].is_monotonic_decreasing)
+        self.assertEqual(len(self.retriever.retrieve_top_dps(10)), 4)
+
+    def test_retrieve_top_dps_energy_cycle_columns(self):
+        # Ranked rows carry the energy-cycle metrics of their moveset
+        data = self.sample_data.assign(FAST_ENERGY_BOOST=[10, 10, 10, 0],
+                                       CHARGE_MOVE_ENERGY_COST=[50, 50, 50, 50])
+        result = PokemonRetriever(data).retrieve_top_dps(4).set_index('NAME')
+
+        self.assertAlmostEqual(result.loc['Bulbasaur', 'CYCLE_DPS'], (5 * 7 + 50) / (5 * 1.0 + 2.5))
+        self.assertAlmostEqual(result.loc['Bulbasaur', 'ENERGY_PER_SECOND'], 10.0)
+        # Without fast move energy the charge move never fires
+        self.assertAlmostEqual(result.loc['Charizard', 'CYCLE_DPS'], 10 / 0.7)
+        self.assertEqual(result.loc['Charizard', 'TDO'], 257 * 10)
+
+    def test_energy_cycles_built_on_first_use(self):
+        # Building the retriever leaves the matchup engine and cycle metrics unbuilt
+        retriever = PokemonRetriever(self.sample_data)
+        self.assertIsNone(retriever._matchups)
+
+        self.assertEqual(retriever.retrieve_highest_dps()['NAME'], 'Charizard')
+        self.assertIsNotNone(retriever._matchups)
+        self.assertIs(retriever.cycle_index, retriever.cycle_index)
+
+    def test_retrieve_top_dps_skips_missing_values(self):
+        # Rows without a computable DPS are never ranked
+        data = self.sample_data.copy()
+        data.loc[3, 'CHARGE_MOVE_POWER'] = float('nan')
+        result = PokemonRetriever(data).retrieve_top_dps(10)
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result.iloc[0]['NAME'], 'Charmander')
+
+    def test_retrieve_top_dps_with_filters(self):
+        # Filters match either type column, case-insensitively, and combine
+        data = self.sample_data.assign(
+            TYPE_ONE=['Grass', 'Grass', 'Fire', 'Fire'],
+            TYPE_TWO=['Poison', 'Poison', None, 'Flying'],
+            FAST_MOVE_TYPE=['Grass', 'Grass', 'Fire', 'Fire'],
+            CHARGED_MOVE_TYPE=['Grass', 'Poison', 'Fire', 'Dragon'],
+        )
+        retriever = PokemonRetriever(data)
+
+        fire = retriever.retrieve_top_dps(5, pokemon_type='fire')
+        self.assertEqual(list(fire['NAME']), ['Charizard', 'Charmander'])
+
+        poison = retriever.retrieve_top_dps(1, pokemon_type='POISON')
+        self.assertEqual(list(poison['NAME']), ['Ivysaur'])
+
+        combined = retriever.retrieve_top_dps(5, pokemon_type='Fire', charged_move_type='Fire')
+        self.assertEqual(list(combined['NAME']), ['Charmander'])
+
+        by_name = retriever.retrieve_top_dps(5, name='bulbasaur')
+        self.assertEqual(list(by_name['NAME']), ['Bulbasaur'])
+
+        self.assertTrue(retriever.retrieve_top_dps(5, pokemon_type='Water').empty)
+        with self.assertRaises(ValueError):
+            retriever.retrieve_top_dps(5, generation='1')
+
+    def test_retrieve_top_dps_sorted_by_move(self):
+        # Fast and charge move rankings differ from the total DPS order
+        fast = self.retriever.retrieve_top_dps(4, sort_by='FAST_DPS')
+        charge = self.retriever.retrieve_top_dps(4, sort_by='CHARGE_DPS')
+        data = self.sample_data.assign(FAST_MOVE_POWER=[20, 8, 9, 10])
+        by_total = PokemonRetriever(data).retrieve_top_dps(2)
+        by_fast = PokemonRetriever(data).retrieve_top_dps(2, sort_by='FAST_DPS')
+
+        self.assertEqual(list(fast['NAME']), ['Charizard', 'Charmander', 'Ivysaur', 'Bulbasaur'])
+        self.assertEqual(list(charge['NAME']), ['Charizard', 'Charmander', 'Ivysaur', 'Bulbasaur'])
+        self.assertEqual(list(by_total['NAME']), ['Charizard', 'Charmander'])
+        self.assertEqual(list(by_fast['NAME']), ['Bulbasaur', 'Charizard'])
+        self.assertTrue(by_fast['FAST_DPS'].is_monotonic_decreasing)
+        with self.assertRaises(ValueError):
+            self.retriever.retrieve_top_dps(2, sort_by='CYCLE_DPS')
+
+    def test_move_rankings_list_each_move_once(self):
+        # A Pokémon's fast move is listed once, not once per charge move
+        data = pd.DataFrame({
+            'NAME': ['Arbok', 'Arbok', 'Arbok', 'Dragonite', 'Dragonite'],
+            'FAST_MOVE': ['Dragon Tail', 'Dragon Tail', 'Acid', 'Dragon Tail', 'Dragon Tail'],
+            'CHARGE_MOVE': ['Gunk Shot', 'Sludge Wave', 'Gunk Shot', 'Outrage', 'Outrage'],
+            'FAST_MOVE_POWER': [15, 15, 9, 13, 13],
+            'FAST_MOVE_DURATION': [1.1, 1.1, 0.5, 1.1, 1.1],
+            'CHARGE_MOVE_POWER': [130, 110, 130, 110, 120],
+            'CHARGE_MOVE_DURATION': [3.1, 3.2, 3.1, 3.9, 3.9],
+        })
+        retriever = PokemonRetriever(data)
+
+        fast = retriever.retrieve_top_dps(5, sort_by='FAST_DPS')
+        charge = retriever.retrieve_top_dps(5, sort_by='CHARGE_DPS')
+        by_name = retriever.retrieve_top_dps(5, sort_by='FAST_DPS', name='Dragonite')
+
+        self.assertEqual(list(zip(fast['NAME'], fast['FAST_MOVE'])), [
+            ('Arbok', 'Acid'), ('Arbok', 'Dragon Tail'), ('Dragonite', 'Dragon Tail')])
+        self.assertEqual(list(zip(charge['NAME'], charge['CHARGE_MOVE'])), [
+            ('Arbok', 'Gunk Shot'), ('Arbok', 'Sludge Wave'), ('Dragonite', 'Outrage')])
+        self.assertEqual(list(charge['CHARGE_MOVE_POWER']), [130, 110, 120])
+        self.assertEqual(len(by_name), 1)
+        self.assertEqual(len(retriever.retrieve_top_dps(5)), 5)
+
+    def test_retrieve_similar(self):
+        # Semantic search is empty until enabled, then finds the named Pokémon
+        self.assertEqual(self.retriever.retrieve_similar('Charizard'), [])
+
+        self.retriever.enable_vector_search()
+        result = self.retriever.retrieve_similar('tell me about charizard', top_k=1)
+
+        self.assertEqual(result[0][1], 'Charizard')
+
+    def test_retrieve_counters(self):
+        # Counters rank movesets by cycle DPS against the defender's types
+        data = pd.DataFrame({
+            'NAME': ['Dragonite', 'Mamoswine', 'Mamoswine', 'Charizard'],
+            'TYPE_ONE': ['Dragon', 'Ice', 'Ice', 'Fire'],
+            'TYPE_TWO': ['Flying', 'Ground', 'Ground', 'Flying'],
+            'FAST_MOVE_TYPE': ['Dragon', 'Ice', 'Ground', 'Fire'],
+            'FAST_MOVE_POWER': [16, 6, 5, 14],
+            'FAST_MOVE_DURATION': [1.1, 1.0, 0.5, 1.1],
+            'FAST_ENERGY_BOOST': [8, 15, 10, 10],
+            'CHARGED_MOVE_TYPE': ['Dragon', 'Ice', 'Ground', 'Fire'],
+            'CHARGE_MOVE_POWER': [150, 140, 100, 110],
+            'CHARGE_MOVE_DURATION': [3.6, 2.5, 2.0, 3.3],
+            'CHARGE_MOVE_ENERGY_COST': [50, 50, 50, 50],
+        })
+        retriever = PokemonRetriever(data)
+
+        counters = retriever.retrieve_counters('dragonite', top_k=2)
+        self.assertEqual(list(counters['NAME']), ['Mamoswine', 'Dragonite'])
+        self.assertAlmostEqual(counters['FAST_EFFECTIVENESS'].iloc[0], 2.56)
+        self.assertEqual(retriever.retrieve_counters('Dragonite', unique=False)['NAME'].tolist(),
+                         ['Mamoswine', 'Dragonite', 'Charizard', 'Mamoswine'])
+        by_type = retriever.retrieve_counters('Fire', top_k=1)
+        self.assertEqual(by_type['CHARGE_MOVE_POWER'].tolist(), [100])
+        self.assertAlmostEqual(by_type['CHARGE_EFFECTIVENESS'].iloc[0], 1.6)
+        self.assertEqual(retriever.retrieve_counters(('Fire', 'Flying'), top_k=1)['NAME'].tolist(),
+                         retriever.retrieve_counters('Charizard', top_k=1)['NAME'].tolist())
+        self.assertTrue(retriever.retrieve_counters('Pikachu').empty)
+
     def test_retrieve_by_name_no_match(self):
         # Test when no Pokémon matches the name
         result = self.retriever.retrieve_by_name('Pikachu')
@@ -62,5 +220,46 @@ class TestPokemonRetriever(unittest.TestCase):
         # Assert that no rows are returned
         self.assertEqual(len(result), 0)
 
+    def test_patched_matches_fresh_build(self):
+        # A patched retriever answers like a new one and leaves the old one as it was
+        data = self.sample_data.assign(ID=['0001', '0002', '0004', '0006'])
+        retriever = PokemonRetriever(data)
+        retriever.enable_vector_search()
+        new = pd.concat([
+            data.iloc[[0, 3]].assign(FAST_MOVE_POWER=[7, 20]),
+            pd.DataFrame({'NAME': ['Mewtwo'], 'FAST_MOVE_POWER': [12],
+                          'FAST_MOVE_DURATION': [0.5], 'CHARGE_MOVE_POWER': [90],
+                          'CHARGE_MOVE_DURATION': [1.5], 'ID': ['0150']}),
+        ], ignore_index=True)
+
+        patched = retriever.patched(new, diff_datasets(data, new))
+        fresh = PokemonRetriever(new)
+
+        self.assertEqual(patched.retrieve_highest_dps()['NAME'],
+                         fresh.retrieve_highest_dps()['NAME'])
+        pd.testing.assert_frame_equal(patched.retrieve_top_dps(3), fresh.retrieve_top_dps(3))
+        self.assertEqual(list(patched.retrieve_by_name('mew')['NAME']), ['Mewtwo'])
+        self.assertTrue(patched.retrieve_by_name('Ivysaur').empty)
+        self.assertEqual(list(patched.retrieve_lexical('mewtwo', 1)['NAME']), ['Mewtwo'])
+        self.assertEqual(patched.retrieve_similar('Mewtwo', 1)[0][1], 'Mewtwo')
+        self.assertEqual(list(retriever.retrieve_by_name('Ivysaur')['NAME']), ['Ivysaur'])
+        self.assertEqual(retriever.retrieve_highest_dps()['NAME'], 'Charizard')
+
+    def test_lazy_vector_search(self):
+        # A deferred semantic index is built on the first lookup, also after a patch
+        data = self.sample_data.assign(ID=['0001', '0002', '0004', '0006'])
+        retriever = PokemonRetriever(data)
+        self.assertIsNone(retriever.enable_vector_search(lazy=True))
+        new = data.iloc[[0, 3]].reset_index(drop=True)
+        patched = retriever.patched(new, diff_datasets(data, new))
+
+        self.assertIsNone(retriever.vector_index)
+        self.assertEqual(retriever.retrieve_similar('Ivysaur', 1)[0][1], 'Ivysaur')
+        self.assertIsNotNone(retriever.vector_index)
+        self.assertIsNone(patched.vector_index)
+        self.assertEqual(patched.retrieve_similar('Charizard', 1)[0][1], 'Charizard')
+        self.assertNotIn('Ivysaur', [name for _, name, _ in patched.retrieve_similar('Ivysaur', 4)])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+import threading
+import unittest
+import pandas as pd
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.utils.live_retriever import LiveRetriever
+from llm_pokemon_app.src.utils.query_router import QueryRouter
+
+
+class TestLiveRetriever(unittest.TestCase):
+
+    def setUp(self):
+        # Two dataset versions differing in their strongest moveset
+        self.old_data = pd.DataFrame({
+            'NAME': ['Charizard', 'Blastoise'],
+            'FAST_MOVE_POWER': [14, 5],
+            'FAST_MOVE_DURATION': [1.1, 0.5],
+            'CHARGE_MOVE_POWER': [150, 80],
+            'CHARGE_MOVE_DURATION': [3.3, 1.9],
+        })
+        self.new_data = self.old_data.assign(NAME=['Charizard', 'Mewtwo'],
+                                             CHARGE_MOVE_POWER=[150, 200])
+        self.live = LiveRetriever(PokemonRetriever(self.old_data))
+
+    def test_update_swaps_and_counts_versions(self):
+        # A new retriever is swapped in; returning the same one keeps the version
+        old = self.live.current
+        new = self.live.update(lambda retriever: PokemonRetriever(self.new_data))
+
+        self.assertIs(self.live.current, new)
+        self.assertEqual(self.live.version, 1)
+        self.assertIs(self.live.update(lambda retriever: retriever), new)
+        self.assertEqual(self.live.version, 1)
+        self.assertEqual(old.retrieve_highest_dps()['NAME'], 'Charizard')
+
+    def test_attributes_are_forwarded(self):
+        # The handle answers like the retriever it currently holds
+        self.assertIs(self.live.data, self.live.current.data)
+        self.assertEqual(self.live.retrieve_highest_dps()['NAME'], 'Charizard')
+        self.live.update(lambda retriever: PokemonRetriever(self.new_data))
+        self.assertEqual(self.live.retrieve_highest_dps()['NAME'], 'Mewtwo')
+        with self.assertRaises(AttributeError):
+            self.live.missing_attribute  # pylint: disable=pointless-statement
+
+    def test_router_pins_one_version_per_question(self):
+        # A swap in the middle of a question does not reach its remaining lookups
+        router = QueryRouter(self.live)
+        pinned = router.pinned()
+        self.live.update(lambda retriever: PokemonRetriever(self.new_data))
+
+        self.assertIs(pinned.retriever.data, self.old_data)
+        self.assertIs(router.pinned().retriever.data, self.new_data)
+        self.assertIn('Mewtwo', router.route("What is the highest DPS Pokémon?")[1])
+
+    def test_concurrent_updates_are_serialized(self):
+        # Every update sees the result of the previous one
+        def bump(retriever):
+            return PokemonRetriever(retriever.data)
+
+        threads = [threading.Thread(target=self.live.update, args=(bump,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.live.version, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
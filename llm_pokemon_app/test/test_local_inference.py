@@ -0,0 +1,197 @@
+import os
+import threading
+import unittest
+from unittest.mock import patch
+import torch
+from transformers import LlamaConfig, LlamaForCausalLM
+from llm_pokemon_app.src.models.backends import create_backend
+from llm_pokemon_app.src.models.huggingface_model import LOCAL_ENGINE_ENV, HuggingFaceModel
+from llm_pokemon_app.src.models.local_inference import LocalInferenceEngine, plan_batches
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
+
+PAD, EOS, VOCAB = 0, 1, 64
+
+
+class CharTokenizer:
+    """A character-level tokenizer with the parts of the HF API the engine uses."""
+
+    pad_token_id = None
+    eos_token = "</s>"
+    eos_token_id = EOS
+
+    def __init__(self):
+        self.padding_side = "right"
+
+    @property
+    def pad_token(self):
+        return None if self.pad_token_id is None else "<pad>"
+
+    @pad_token.setter
+    def pad_token(self, token):
+        self.pad_token_id = PAD if token == "<pad>" else EOS
+
+    def __call__(self, text, return_tensors=None):
+        ids = [2 + ord(character) % (VOCAB - 2) for character in text]
+        return {"input_ids": torch.tensor([ids]) if return_tensors else ids}
+
+    def pad(self, encoded, return_tensors=None):
+        sequences = encoded["input_ids"]
+        width = max(len(sequence) for sequence in sequences)
+        ids, mask = [], []
+        for sequence in sequences:
+            padding = [self.pad_token_id] * (width - len(sequence))
+            if self.padding_side == "left":
+                ids.append(padding + list(sequence))
+                mask.append([0] * len(padding) + [1] * len(sequence))
+            else:
+                ids.append(list(sequence) + padding)
+                mask.append([1] * len(sequence) + [0] * len(padding))
+        return {"input_ids": torch.tensor(ids), "attention_mask": torch.tensor(mask)}
+
+    def batch_decode(self, sequences, skip_special_tokens=False):
+        return [
+            " ".join(str(int(token)) for token in sequence
+                     if not skip_special_tokens or int(token) > EOS)
+            for sequence in sequences
+        ]
+
+
+def tiny_model():
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=VOCAB, hidden_size=16, intermediate_size=32, num_hidden_layers=1,
+        num_attention_heads=2, max_position_embeddings=128,
+        pad_token_id=PAD, eos_token_id=EOS, bos_token_id=2,
+    )
+    return LlamaForCausalLM(config).eval()
+
+
+class TestPlanBatches(unittest.TestCase):
+
+    def test_groups_similar_lengths(self):
+        self.assertEqual(plan_batches([5, 50, 6, 52, 7], max_batch_size=4), [[0, 2, 4], [1, 3]])
+
+    def test_respects_batch_size(self):
+        self.assertEqual(plan_batches([3] * 5, max_batch_size=2), [[0, 1], [2, 3], [4]])
+        self.assertEqual(plan_batches([], max_batch_size=2), [])
+
+
+class TestLocalInferenceEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.model = tiny_model()
+        self.tokenizer = CharTokenizer()
+        self.prompts = ["Mewtwo", "Best fire type", "Dragonite", "Hi"]
+
+    def reference(self, prompt):
+        # Unbatched, unpadded generation of the same prompt
+        input_ids = torch.tensor([self.tokenizer(prompt)["input_ids"]])
+        with torch.inference_mode():
+            output = self.model.generate(
+                input_ids=input_ids, attention_mask=torch.ones_like(input_ids),
+                max_new_tokens=6, pad_token_id=self.tokenizer.pad_token_id,
+            )
+        return self.tokenizer.batch_decode(output, skip_special_tokens=True)[0]
+
+    def test_batched_matches_unbatched(self):
+        engine = LocalInferenceEngine(self.model, self.tokenizer, max_new_tokens=6,
+                                      max_wait_ms=50, max_padding=1.0)
+        try:
+            results = engine.generate_many(self.prompts)
+        finally:
+            engine.close()
+
+        # The engine pads its own copy; the shared tokenizer is left as it was
+        self.assertEqual(engine.tokenizer.padding_side, "left")
+        self.assertEqual(self.tokenizer.padding_side, "right")
+        self.assertIsNone(self.tokenizer.pad_token_id)
+        self.assertEqual(results, [self.reference(prompt) for prompt in self.prompts])
+        stats = engine.stats()
+        self.assertEqual(stats["requests"], 4)
+        self.assertGreater(stats["mean_batch_size"], 1)
+        self.assertGreater(stats["tokens_per_second"], 0)
+
+    def test_concurrent_callers_share_batches(self):
+        engine = LocalInferenceEngine(self.model, self.tokenizer, max_new_tokens=4,
+                                      max_wait_ms=200, max_padding=1.0)
+        results = {}
+        barrier = threading.Barrier(4)
+
+        def call(prompt):
+            barrier.wait()
+            results[prompt] = engine.generate(prompt)
+
+        threads = [threading.Thread(target=call, args=(prompt,)) for prompt in self.prompts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        engine.close()
+
+        self.assertEqual(len(results), 4)
+        self.assertLess(engine.stats()["batches"], 4)
+
+    def test_quantize(self):
+        engine = LocalInferenceEngine(self.model, self.tokenizer, max_new_tokens=2, quantize=True)
+        try:
+            self.assertTrue(engine.generate("Mew"))
+        finally:
+            engine.close()
+        self.assertIsInstance(engine.model.model.layers[0].mlp.up_proj,
+                              torch.ao.nn.quantized.dynamic.Linear)
+
+    def test_submit_after_close_raises(self):
+        # A prompt submitted to a closed engine fails instead of waiting forever
+        engine = LocalInferenceEngine(self.model, self.tokenizer, max_new_tokens=2)
+        engine.close()
+        engine.close()
+
+        with self.assertRaises(RuntimeError):
+            engine.submit("Mew")
+
+    def test_generation_error_propagates(self):
+        engine = LocalInferenceEngine(self.model, self.tokenizer)
+        with patch.object(engine.model, "generate", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                engine.generate("Mew")
+        engine.close()
+
+
+class TestHuggingFaceModelWithEngine(unittest.TestCase):
+
+    def setUp(self):
+        REGISTRY.clear()
+
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoTokenizer.from_pretrained')
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoModelForCausalLM.from_pretrained')
+    def test_engine_shared_and_used(self, mock_model, mock_tokenizer):
+        mock_model.return_value = tiny_model()
+        mock_tokenizer.return_value = CharTokenizer()
+
+        first = HuggingFaceModel.with_local_engine("fake_api_key", max_new_tokens=3)
+        second = HuggingFaceModel.with_local_engine("fake_api_key", max_new_tokens=3)
+
+        self.assertIs(first.engine, second.engine)
+        self.assertTrue(first.get_response("Mewtwo"))
+        with patch.object(first.engine, "generate", side_effect=RuntimeError("boom")):
+            self.assertEqual(first.get_response("Mewtwo"), "Error: boom")
+        first.engine.close()
+
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoTokenizer.from_pretrained')
+    @patch('llm_pokemon_app.src.models.huggingface_model.AutoModelForCausalLM.from_pretrained')
+    def test_engine_enabled_by_environment(self, mock_model, mock_tokenizer):
+        # Backends created by the entry points use the engine when the variable is set
+        mock_model.return_value = tiny_model()
+        mock_tokenizer.return_value = CharTokenizer()
+
+        with patch.dict(os.environ, {LOCAL_ENGINE_ENV: "4"}):
+            model = create_backend("huggingface", api_key="fake_api_key")
+        plain = HuggingFaceModel("fake_api_key")
+
+        self.assertEqual(model.engine.max_batch_size, 4)
+        self.assertIsNone(plain.engine)
+        model.engine.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
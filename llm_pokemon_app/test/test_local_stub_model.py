@@ -0,0 +1,46 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+from llm_pokemon_app.src.models.local_stub_model import LocalStubModel
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
+
+
+class TestLocalStubModel(unittest.TestCase):
+
+    def setUp(self):
+        self.retriever = MagicMock()
+        self.retriever.retrieve_highest_dps.return_value = {'NAME': 'Mewtwo', 'TOTAL_DPS': 30.5}
+
+    def test_deterministic_answers(self):
+        stub = LocalStubModel()
+
+        self.assertEqual(stub.get_response("Best?"), stub.get_response("best"))
+        self.assertNotEqual(stub.get_response("Best?"), stub.get_response("Worst?"))
+        self.assertTrue(stub.get_response("Best?").startswith("Stub answer "))
+
+    def test_answer_includes_retrieved_context(self):
+        stub = LocalStubModel(self.retriever)
+
+        response = stub.get_response("What is the highest DPS Pokémon?")
+
+        self.assertIn("Mewtwo", response)
+        self.assertEqual(asyncio.run(stub.aget_response("What is the highest DPS Pokémon?")),
+                         response)
+        self.assertEqual("".join(stub.stream_response("What is the highest DPS Pokémon?")),
+                         response)
+
+    def test_batch_and_cache(self):
+        cache = ResponseCache()
+        stub = LocalStubModel(self.retriever, cache=cache, latency_ms=1)
+
+        responses = stub.get_responses(["highest dps?", "highest dps?", "other"])
+
+        self.assertEqual(responses[0], responses[1])
+        self.assertEqual(stub.retrieve_contexts(["highest dps?", "highest dps"])[0],
+                         stub.retrieve_context("highest dps"))
+        self.assertEqual(stub.get_response("highest dps"), responses[0])
+        self.assertEqual(cache.stats()["memory_hits"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
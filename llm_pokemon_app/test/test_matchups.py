@@ -0,0 +1,91 @@
+import unittest
+import numpy as np
+import pandas as pd
+from llm_pokemon_app.src.utils.matchups import (
+    EFFECTIVENESS, IMMUNE, NO_TYPE, TYPES, MatchupEngine, type_code,
+)
+
+
+def code(name):
+    return TYPES.index(name)
+
+
+class TestTypeChart(unittest.TestCase):
+
+    def test_effectiveness_matrix(self):
+        # Go multipliers, with "no effect" as a double resistance
+        self.assertEqual(EFFECTIVENESS.shape, (NO_TYPE + 1, NO_TYPE + 1))
+        self.assertEqual(EFFECTIVENESS[code('Ice'), code('Dragon')], 1.6)
+        self.assertEqual(EFFECTIVENESS[code('Fire'), code('Water')], 0.625)
+        self.assertEqual(EFFECTIVENESS[code('Dragon'), code('Fairy')], IMMUNE)
+        self.assertEqual(EFFECTIVENESS[code('Normal'), code('Normal')], 1.0)
+        self.assertTrue((EFFECTIVENESS[NO_TYPE] == 1.0).all())
+        self.assertTrue((EFFECTIVENESS[:, NO_TYPE] == 1.0).all())
+        self.assertFalse(EFFECTIVENESS.flags.writeable)
+
+    def test_type_code_normalizes_names(self):
+        self.assertEqual(type_code(' fire '), code('Fire'))
+        self.assertEqual(type_code('Eletric'), code('Electric'))
+        self.assertEqual(type_code('Steal'), code('Steel'))
+        self.assertEqual(type_code(None), NO_TYPE)
+        self.assertEqual(type_code('Shadow'), NO_TYPE)
+
+
+class TestMatchupEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.data = pd.DataFrame({
+            'NAME': ['Mamoswine', 'Mamoswine', 'Dragonite', 'Ditto', 'Missingno'],
+            'TYPE_ONE': ['Ice', 'Ice', 'Dragon', 'Normal', 'Normal'],
+            'TYPE_TWO': ['Ground', 'Ground', 'Flying', None, None],
+            'FAST_MOVE_POWER': [6.0, 5.0, 16.0, 0.0, None],
+            'FAST_MOVE_TYPE': ['Ice', 'Ground', 'Dragon', 'Normal', None],
+            'FAST_ENERGY_BOOST': [15.0, 10.0, 8.0, 0.0, None],
+            'FAST_MOVE_DURATION': [1.0, 0.5, 1.1, 2.23, None],
+            'CHARGE_MOVE_POWER': [140.0, 100.0, 150.0, 35.0, 50.0],
+            'CHARGED_MOVE_TYPE': ['Ice', 'Ground', 'Dragon', 'Normal', 'Normal'],
+            'CHARGE_MOVE_ENERGY_COST': [50.0, 50.0, 50.0, 33.0, 50.0],
+            'CHARGE_MOVE_DURATION': [2.5, 2.0, 3.6, 2.2, 2.0],
+            'DAMAGE WINDOW START': [1.7, 1.0, 3.0, 1.0, 1.0],
+        })
+        self.engine = MatchupEngine(self.data)
+
+    def test_cycle_dps_with_stab_and_effectiveness(self):
+        matchup = self.engine.against(('Dragon', 'Flying'))
+
+        # Ice against Dragon/Flying is super effective twice, plus STAB
+        fast_hit = 6.0 * 1.2 * 2.56
+        charge_hit = 140.0 * 1.2 * 2.56
+        fast_per_cycle = 50.0 / 15.0
+        expected = (fast_per_cycle * fast_hit + charge_hit) / (fast_per_cycle * 1.0 + 2.5)
+        self.assertAlmostEqual(matchup['CYCLE_DPS'][0], expected)
+        self.assertAlmostEqual(matchup['FAST_EFFECTIVENESS'][0], 2.56)
+        # Ground is neutral against Dragon and has no effect on Flying
+        self.assertAlmostEqual(matchup['CHARGE_EFFECTIVENESS'][1], IMMUNE)
+        # The first charge move waits for four whole fast moves
+        self.assertAlmostEqual(matchup['FIRST_CHARGE_S'][0], 4 * 1.0 + 1.7)
+
+    def test_moves_without_energy_or_data(self):
+        matchup = self.engine.against(('Normal',))
+
+        # No fast move energy: the charge move is never used
+        self.assertEqual(matchup['CYCLE_DPS'][3], 0.0)
+        self.assertTrue(np.isnan(matchup['FIRST_CHARGE_S'][3]))
+        # Missing fast move data: no DPS, ranked last
+        self.assertTrue(np.isnan(matchup['CYCLE_DPS'][4]))
+        self.assertNotIn(4, matchup['ORDER'])
+
+    def test_ranking_and_cache(self):
+        matchup = self.engine.against(('Flying', 'dragon'))
+
+        self.assertEqual(list(matchup['ORDER'][:2]), [0, 2])
+        # One row per Pokémon: Mamoswine's weaker Ground moveset is dropped
+        self.assertEqual(list(matchup['BEST_PER_NAME']), [0, 2, 3])
+        self.assertIs(self.engine.against(['Dragon', 'Flying', None]), matchup)
+        self.assertFalse(matchup['CYCLE_DPS'].flags.writeable)
+        with self.assertRaises(ValueError):
+            self.engine.against(('Shadow',))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import unittest
+import urllib.request
+from unittest.mock import patch, MagicMock
+import pandas as pd
+from llm_pokemon_app.src.models.rag_model import RAGModel
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.utils.metrics import (
+    CACHE_REQUESTS, METRICS, STAGE_ERRORS, STAGE_SECONDS, TOKENS, Metrics, serve_metrics,
+)
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
+
+
+def series(snapshot, section, name, **labels):
+    return [entry for entry in snapshot[section]
+            if entry['name'] == name and all(entry['labels'].get(k) == v
+                                             for k, v in labels.items())]
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_disabled_records_nothing(self):
+        metrics = Metrics()
+
+        with metrics.span('stage'):
+            pass
+        metrics.increment('counter')
+        metrics.observe('histogram', 1.0)
+
+        self.assertIs(metrics.span('a'), metrics.span('b'))
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot['counters'], snapshot['histograms'], snapshot['recent_spans']),
+                         ([], [], []))
+
+    def test_spans_record_latency_parent_and_errors(self):
+        metrics = Metrics(enabled=True)
+
+        with metrics.span('outer'):
+            with metrics.span('inner'):
+                pass
+        with self.assertRaises(ValueError):
+            with metrics.span('failing'):
+                raise ValueError('boom')
+
+        snapshot = metrics.snapshot()
+        spans = {span['stage']: span for span in snapshot['recent_spans']}
+        self.assertEqual(spans['inner']['parent'], 'outer')
+        self.assertIsNone(spans['outer']['parent'])
+        self.assertTrue(spans['failing']['error'])
+        self.assertEqual(series(snapshot, 'histograms', STAGE_SECONDS, stage='inner')[0]['count'], 1)
+        self.assertEqual(series(snapshot, 'counters', STAGE_ERRORS, stage='failing')[0]['value'], 1)
+
+    def test_concurrent_tasks_keep_their_own_parent(self):
+        metrics = Metrics(enabled=True)
+
+        async def request(name):
+            with metrics.span(name):
+                await asyncio.sleep(0.001)
+                with metrics.span(f'{name}.child'):
+                    await asyncio.sleep(0.001)
+
+        async def run():
+            await asyncio.gather(request('a'), request('b'))
+
+        asyncio.run(run())
+
+        parents = {span['stage']: span['parent'] for span in metrics.snapshot()['recent_spans']}
+        self.assertEqual(parents['a.child'], 'a')
+        self.assertEqual(parents['b.child'], 'b')
+
+    def test_prometheus_text(self):
+        metrics = Metrics(enabled=True)
+        metrics.increment('requests_total', 2, route='/ask')
+        metrics.observe('latency_seconds', 0.003, (0.001, 0.01), stage='x"y')
+
+        text = metrics.to_prometheus()
+
+        self.assertIn('# TYPE requests_total counter\nrequests_total{route="/ask"} 2', text)
+        self.assertIn('# TYPE latency_seconds histogram', text)
+        self.assertIn('latency_seconds_bucket{stage="x\\"y",le="0.001"} 0', text)
+        self.assertIn('latency_seconds_bucket{stage="x\\"y",le="0.01"} 1', text)
+        self.assertIn('latency_seconds_bucket{stage="x\\"y",le="+Inf"} 1', text)
+        self.assertIn('latency_seconds_count{stage="x\\"y"} 1', text)
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        REGISTRY.clear()
+        METRICS.reset()
+        METRICS.enable()
+
+    def tearDown(self):
+        METRICS.disable()
+        METRICS.reset()
+
+    def test_retriever_spans(self):
+        data = pd.DataFrame({
+            'NAME': ['Mewtwo'], 'TYPE_ONE': ['Psychic'], 'TYPE_TWO': [None],
+            'FAST_MOVE': ['Confusion'], 'FAST_MOVE_TYPE': ['Psychic'],
+            'FAST_MOVE_POWER': [20.0], 'FAST_MOVE_DURATION': [1.6],
+            'CHARGE_MOVE': ['Psystrike'], 'CHARGED_MOVE_TYPE': ['Psychic'],
+            'CHARGE_MOVE_POWER': [90.0], 'CHARGE_MOVE_DURATION': [2.3],
+        })
+
+        retriever = PokemonRetriever(data)
+        retriever.retrieve_highest_dps()
+
+        stages = [span['stage'] for span in METRICS.snapshot()['recent_spans']]
+        self.assertEqual(stages, ['retriever.build', 'retriever.retrieve_highest_dps'])
+
+    @patch('llm_pokemon_app.src.models.rag_model.OpenAI')
+    def test_rag_stages_tokens_and_cache(self, mock_openai):
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve_highest_dps.return_value = {'NAME': 'Mewtwo', 'TOTAL_DPS': 30.5}
+        mock_openai.return_value.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Mewtwo."))],
+            usage=MagicMock(prompt_tokens=42, completion_tokens=7),
+        )
+        model = RAGModel(api_key="fake_api_key", retriever=mock_retriever, cache=ResponseCache())
+
+        model.get_response("What is the highest DPS Pokémon?")
+        model.get_response("What is the highest DPS Pokémon?")
+
+        snapshot = METRICS.snapshot()
+        parents = {span['stage']: span['parent'] for span in snapshot['recent_spans']}
+        self.assertEqual(parents['rag.retrieve'], 'rag.get_response')
+        self.assertEqual(parents['rag.generate'], 'rag.get_response')
+        self.assertIn('rag.prompt', parents)
+        generations = series(snapshot, 'histograms', STAGE_SECONDS, stage='rag.generate')
+        self.assertEqual(generations[0]['count'], 1)
+        prompt_tokens = series(snapshot, 'histograms', TOKENS, kind='prompt')[0]
+        self.assertEqual(prompt_tokens['sum'], 42)
+        self.assertEqual(snapshot['cache_hit_rate'], {'response': 0.5})
+        self.assertTrue(series(snapshot, 'counters', CACHE_REQUESTS, result='hit'))
+
+    def test_http_endpoints(self):
+        METRICS.increment('pokemon_test_total')
+        server = serve_metrics(0)
+        try:
+            base = f'http://127.0.0.1:{server.server_address[1]}'
+            with urllib.request.urlopen(f'{base}/metrics') as response:
+                self.assertIn('pokemon_test_total 1', response.read().decode())
+            with urllib.request.urlopen(f'{base}/metrics.json') as response:
+                self.assertEqual(json.loads(response.read())['counters'][0]['value'], 1)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main()
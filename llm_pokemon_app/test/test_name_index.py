@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+import pandas as pd
+from llm_pokemon_app.src.utils.name_index import NameIndex
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        # Names as they appear in the dataset, one per moveset row
+        self.names = pd.Series([
+            'Charmander', 'Charizard', 'Charizard', 'Shadow Charizard', 'Ho-Oh', None
+        ])
+        self.index = NameIndex(self.names)
+
+    def test_exact_lookup(self):
+        # Exact lookups return every row for that name, case-insensitively
+        self.assertEqual(list(self.index.exact(' charizard ')), [1, 2])
+        self.assertEqual(len(self.index.exact('Char')), 0)
+
+    def test_substring_lookup(self):
+        # Substring lookups keep str.contains semantics in row order
+        self.assertEqual(list(self.index.substring('char')), [0, 1, 2, 3])
+        self.assertEqual(list(self.index.substring('izard')), [1, 2, 3])
+        self.assertEqual(list(self.index.substring('xyz')), [])
+
+    def test_substring_is_literal(self):
+        # Regex metacharacters are matched literally
+        self.assertEqual(list(self.index.substring('o-o')), [4])
+        self.assertEqual(list(self.index.substring('.*')), [])
+
+    def test_matching_names(self):
+        # Matching names are reported once each, normalized
+        self.assertEqual(
+            self.index.matching_names('zard'), ['charizard', 'shadow charizard']
+        )
+
+    def test_patched_matches_fresh_build(self):
+        # Charmander is deleted, a Charizard row changed and Mew added
+        names = pd.Series(['Charizard', 'Ho-Oh', 'Charizard', 'Shadow Charizard', None, 'Mew'])
+        old_to_new = np.array([-1, 0, -1, 3, 1, 4])
+        patched = self.index.patched(names, old_to_new, {'charmander', 'charizard', 'mew'})
+        fresh = NameIndex(names)
+
+        self.assertEqual(patched.names, fresh.names)
+        for fragment in ('charizard', 'char', 'm', 'o-o', 'mew', 'charmander', 'xyz'):
+            self.assertEqual(list(patched.exact(fragment)), list(fresh.exact(fragment)))
+            self.assertEqual(list(patched.substring(fragment)), list(fresh.substring(fragment)))
+            self.assertEqual(patched.matching_names(fragment), fresh.matching_names(fragment))
+        self.assertEqual(list(self.index.exact('charmander')), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from llm_pokemon_app.src.utils.name_resolver import NameResolver, edit_distance, phrase_tokens
+
+
+class TestNameResolver(unittest.TestCase):
+
+    def setUp(self):
+        # A handful of dataset names, including multi-word and punctuated ones
+        self.resolver = NameResolver([
+            'Charizard', 'Shadow Charizard', 'Garchomp', 'Mr. Mime', 'Ho-Oh', 'Mew', 'Mewtwo'
+        ])
+
+    def test_resolve_exact_anywhere_in_question(self):
+        # The name no longer has to be the last word
+        self.assertEqual(self.resolver.resolve("moves for Charizard?"), 'Charizard')
+        self.assertEqual(self.resolver.resolve("garchomp moves"), 'Garchomp')
+        self.assertEqual(self.resolver.resolve("What are Mr. Mime's moves?"), 'Mr. Mime')
+
+    def test_resolve_prefers_longest_name(self):
+        # Multi-word names beat the shorter names they contain
+        self.assertEqual(
+            self.resolver.resolve("What are Shadow Charizard's moves?"), 'Shadow Charizard'
+        )
+
+    def test_resolve_misspelled_name(self):
+        # Typos are resolved through the trigram index and edit distance
+        self.assertEqual(self.resolver.resolve("moves for charzard"), 'Charizard')
+        self.assertEqual(self.resolver.resolve("garchmop moves"), 'Garchomp')
+
+    def test_resolve_no_name(self):
+        # Questions without a Pokémon name resolve to None
+        self.assertIsNone(self.resolver.resolve("What are the best moves?"))
+        self.assertIsNone(self.resolver.resolve("moves for zzzzzz"))
+
+    def test_helpers(self):
+        # Tokens drop punctuation and possessives; distance stops at the limit
+        self.assertEqual(phrase_tokens("Mr. Mime's moves"), ['mr', 'mime', 'moves'])
+        self.assertEqual(edit_distance('charzard', 'charizard', 2), 1)
+        self.assertEqual(edit_distance('abc', 'xyzxyz', 1), 2)
+
+    def test_patched_matches_fresh_build(self):
+        # Renamed, removed and added names resolve as in a fresh build
+        names = ['Charizard', 'Garchomp', 'Mega Garchomp', 'Mr. Mime', 'Mewtwo', 'Dragonite']
+        patched = self.resolver.patched(names)
+        fresh = NameResolver(names)
+
+        for question in ("moves for charzard", "mega garchmop", "dragonit moves", "Mew?",
+                         "ho-oh moves", "What are Mr. Mime's moves?", "shadow charizard"):
+            self.assertEqual(patched.resolve(question), fresh.resolve(question))
+        self.assertEqual(self.resolver.resolve("ho-oh moves"), 'Ho-Oh')
+        self.assertIs(self.resolver.patched(reversed(list(reversed(
+            ['Charizard', 'Shadow Charizard', 'Garchomp', 'Mr. Mime', 'Ho-Oh', 'Mew', 'Mewtwo']
+        )))), self.resolver)
+
+
+if __name__ == '__main__':
+    unittest.main()
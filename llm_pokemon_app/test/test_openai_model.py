@@ -1,9 +1,15 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from llm_pokemon_app.src.models.openai_model import OpenAIModel
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
 
 class TestOpenAIModel(unittest.TestCase):
 
+    def setUp(self):
+        # Start every test without cached clients or model weights
+        REGISTRY.clear()
+
     @patch('llm_pokemon_app.src.models.openai_model.OpenAI')
     def test_get_response_success(self, mock_openai):
         # Mock OpenAI completion response
@@ -22,6 +28,53 @@ class TestOpenAIModel(unittest.TestCase):
         # Assert that the response is correct
         self.assertEqual(response, "This is a Pokémon Go response.")
 
+    @patch('llm_pokemon_app.src.models.openai_model.OpenAI')
+    def test_client_shared_per_api_key(self, mock_openai):
+        # Clients are created once per API key and reused across instances
+        mock_openai.side_effect = lambda api_key: MagicMock(api_key=api_key)
+
+        first = OpenAIModel(api_key="key_one")
+        second = OpenAIModel(api_key="key_one")
+        third = OpenAIModel(api_key="key_two")
+
+        self.assertIs(first.client, second.client)
+        self.assertIsNot(first.client, third.client)
+        self.assertEqual(mock_openai.call_count, 2)
+
+    @patch('llm_pokemon_app.src.models.openai_model.OpenAI')
+    def test_repeated_prompt_served_from_cache(self, mock_openai):
+        # Equivalent prompts reach the API only once
+        create = mock_openai.return_value.chat.completions.create
+        create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Cached answer."))]
+        )
+        cache = ResponseCache()
+        model = OpenAIModel(api_key="fake_api_key", cache=cache)
+
+        self.assertEqual(model.get_response("Best raid attacker?"), "Cached answer.")
+        self.assertEqual(model.get_response("best raid attacker"), "Cached answer.")
+        create.assert_called_once()
+        self.assertEqual(cache.stats()["memory_hits"], 1)
+
+    @patch('llm_pokemon_app.src.models.openai_model.OpenAI')
+    def test_stream_response(self, mock_openai):
+        # Deltas are yielded as they arrive and the full text is cached
+        create = mock_openai.return_value.chat.completions.create
+        create.return_value = iter([
+            MagicMock(choices=[MagicMock(delta=MagicMock(content="Mew"))]),
+            MagicMock(choices=[]),
+            MagicMock(choices=[MagicMock(delta=MagicMock(content=None))]),
+            MagicMock(choices=[MagicMock(delta=MagicMock(content="two"))]),
+        ])
+        cache = ResponseCache()
+        model = OpenAIModel(api_key="fake_api_key", cache=cache)
+
+        self.assertEqual(list(model.stream_response("Best?")), ["Mew", "two"])
+        self.assertTrue(create.call_args.kwargs["stream"])
+        # A repeat is served from the cache as one chunk
+        self.assertEqual(list(model.stream_response("best")), ["Mewtwo"])
+        create.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,10 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
+import numpy as np
 import pandas as pd
-from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader, column_values
 
 
 class TestPokemonDataLoader(unittest.TestCase):
@@ -102,6 +105,150 @@ class TestPokemonDataLoader(unittest.TestCase):
 
         self.assertEqual(result, "OS error: OS error")
 
+    # Test case 10: Cached CSV loading reuses a fresh snapshot
+    def test_load_csv_cached_reuses_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "pokemon.csv")
+            pd.DataFrame({'ID': [1, 2], 'NAME': ['Bulbasaur', 'Ivysaur']}).to_csv(
+                csv_path, index=False
+            )
+
+            first = PokemonDataLoader.load_csv_cached(csv_path)
+            snapshot = PokemonDataLoader.snapshot_path(csv_path)
+            self.assertTrue(os.path.exists(snapshot))
+
+            with patch('pandas.read_csv') as mock_read_csv:
+                second = PokemonDataLoader.load_csv_cached(csv_path)
+                mock_read_csv.assert_not_called()
+            pd.testing.assert_frame_equal(first, second)
+
+    # Test case 11: Cached CSV loading rebuilds a stale snapshot
+    def test_load_csv_cached_rebuilds_stale_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "pokemon.csv")
+            pd.DataFrame({'NAME': ['Bulbasaur']}).to_csv(csv_path, index=False)
+            PokemonDataLoader.load_csv_cached(csv_path)
+            stale = PokemonDataLoader.snapshot_path(csv_path)
+            stale_sidecar = stale[:-len(".arrow")] + ".vectors"
+            os.makedirs(stale_sidecar)
+
+            pd.DataFrame({'NAME': ['Squirtle', 'Wartortle']}).to_csv(csv_path, index=False)
+            os.utime(csv_path, ns=(1, 1))
+            result = PokemonDataLoader.load_csv_cached(csv_path)
+
+            self.assertEqual(list(result['NAME']), ['Squirtle', 'Wartortle'])
+            self.assertFalse(os.path.exists(stale))
+            self.assertFalse(os.path.exists(stale_sidecar))
+            self.assertTrue(os.path.exists(PokemonDataLoader.snapshot_path(csv_path)))
+
+    # Test case 12: Cached CSV loading of a missing file
+    def test_load_csv_cached_file_not_found(self):
+        result = PokemonDataLoader.load_csv_cached("missing_file.csv")
+
+        self.assertTrue(result.startswith("File not found:"))
+
+
+    # Test case 13: The dataset schema is applied at load time
+    def test_load_csv_applies_schema(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "pokemon.csv")
+            with open(csv_path, "w", encoding="utf-8") as handle:
+                handle.write(",ID,NAME,TYPE_ONE,FAST_MOVE_POWER\n"
+                             "0,0001,Bulbasaur,Grass,5.0\n"
+                             "15,0001,Bulbasaur,Grass,7.0\n")
+
+            result = PokemonDataLoader.load_csv(csv_path)
+
+            self.assertEqual(list(result.columns), ['ID', 'NAME', 'TYPE_ONE', 'FAST_MOVE_POWER'])
+            self.assertEqual(list(result['ID']), ['0001', '0001'])
+            self.assertEqual(result['NAME'].dtype, 'category')
+            self.assertEqual(result['TYPE_ONE'].dtype, 'category')
+            self.assertEqual(result['FAST_MOVE_POWER'].dtype, 'float32')
+
+    # Test case 14: Values that do not fit the schema are reported
+    def test_load_csv_schema_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            bad_power = os.path.join(directory, "bad_power.csv")
+            pd.DataFrame({'NAME': ['Bulbasaur'], 'FAST_MOVE_POWER': ['strong']}).to_csv(
+                bad_power, index=False
+            )
+            no_name = os.path.join(directory, "no_name.csv")
+            pd.DataFrame({'ID': [1]}).to_csv(no_name, index=False)
+
+            self.assertTrue(PokemonDataLoader.load_csv(bad_power).startswith("Schema error:"))
+            self.assertEqual(PokemonDataLoader.load_csv(no_name),
+                             "Schema error: missing required columns: NAME")
+
+    # Test case 15: Numeric IDs from other formats are zero-padded
+    @patch('pandas.read_parquet')
+    def test_load_parquet_applies_schema(self, mock_read_parquet):
+        mock_read_parquet.return_value = pd.DataFrame({
+            'Unnamed: 0': [0], 'ID': [25], 'NAME': ['Pikachu'], 'CHARGE_MOVE_POWER': [90.0]
+        })
+
+        result = PokemonDataLoader.load_parquet("valid_file.parquet")
+
+        self.assertEqual(list(result.columns), ['ID', 'NAME', 'CHARGE_MOVE_POWER'])
+        self.assertEqual(result.iloc[0]['ID'], '0025')
+        self.assertEqual(result['CHARGE_MOVE_POWER'].dtype, 'float32')
+
+
+    # Test case 16: A snapshot next to its source never removes the source
+    def test_load_csv_cached_in_source_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "pokemon.csv")
+            pd.DataFrame({'NAME': ['Bulbasaur']}).to_csv(csv_path, index=False)
+
+            PokemonDataLoader.load_csv_cached(csv_path, directory)
+            result = PokemonDataLoader.load_csv_cached(csv_path, directory)
+
+            self.assertTrue(os.path.exists(csv_path))
+            self.assertEqual(list(result['NAME']), ['Bulbasaur'])
+
+    # Test case 17: Every supported format streams in schema-typed chunks
+    def test_iter_chunks(self):
+        data = pd.DataFrame({
+            'ID': ['0001', '0002', '0003', '0004', '0005'],
+            'NAME': ['Bulbasaur', 'Ivysaur', 'Venusaur', 'Charmander', 'Charmeleon'],
+            'FAST_MOVE_POWER': [5.0, 6.0, 7.0, 8.0, 9.0],
+        })
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f"pokemon.{extension}")
+                     for extension in ("csv", "parquet", "xlsx")]
+            data.to_csv(paths[0])
+            data.to_parquet(paths[1], index=False)
+            data.to_excel(paths[2])
+
+            for path in paths:
+                chunks = list(PokemonDataLoader.iter_chunks(path, 2))
+
+                self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1], path)
+                self.assertEqual(list(chunks[0].columns), ['ID', 'NAME', 'FAST_MOVE_POWER'])
+                self.assertEqual(chunks[2].iloc[0]['ID'], '0005')
+                self.assertEqual(chunks[1]['NAME'].dtype, 'category')
+                self.assertEqual(chunks[1]['FAST_MOVE_POWER'].dtype, 'float32')
+
+    # Test case 18: Chunked loading rejects unsupported input
+    def test_iter_chunks_errors(self):
+        with self.assertRaises(ValueError):
+            list(PokemonDataLoader.iter_chunks("pokemon.json"))
+        with self.assertRaises(ValueError):
+            list(PokemonDataLoader.iter_chunks("pokemon.csv", 0))
+        with self.assertRaises(FileNotFoundError):
+            list(PokemonDataLoader.iter_chunks("missing_file.csv"))
+
+    # Test case 19: Numeric columns are widened to float64 as stored, missing values as NaN
+    def test_column_values(self):
+        data = PokemonDataLoader.apply_schema(
+            pd.DataFrame({'NAME': ['Mew', 'Pidgey'], 'FAST_MOVE_DURATION': [0.7, None]})
+        )
+
+        values = column_values(data, 'FAST_MOVE_DURATION')
+
+        self.assertEqual(values.dtype, np.float64)
+        self.assertEqual(values[0], np.float64(np.float32(0.7)))
+        self.assertTrue(np.isnan(values[1]))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
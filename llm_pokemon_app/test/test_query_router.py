@@ -0,0 +1,148 @@
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.utils.query_router import (
+    INTENT_COUNTERS, INTENT_FREE_TEXT, INTENT_HIGHEST_DPS, INTENT_MOVES, INTENT_RANKING,
+    INTENT_TEAMS, QueryRouter, classify,
+)
+
+
+class TestQueryRouter(unittest.TestCase):
+
+    def setUp(self):
+        # A small dataset with the columns every engine uses
+        self.sample_data = pd.DataFrame({
+            'NAME': ['Charizard', 'Charizard', 'Blastoise'],
+            'TYPE_ONE': ['Fire', 'Fire', 'Water'],
+            'TYPE_TWO': ['Flying', 'Flying', None],
+            'FAST_MOVE': ['Fire Spin', 'Dragon Breath', 'Water Gun'],
+            'FAST_MOVE_TYPE': ['Fire', 'Dragon', 'Water'],
+            'FAST_MOVE_POWER': [14, 6, 5],
+            'FAST_MOVE_DURATION': [1.1, 0.5, 0.5],
+            'CHARGE_MOVE': ['Blast Burn', 'Dragon Claw', 'Hydro Cannon'],
+            'CHARGED_MOVE_TYPE': ['Fire', 'Dragon', 'Water'],
+            'CHARGE_MOVE_POWER': [110, 50, 80],
+            'CHARGE_MOVE_DURATION': [3.3, 1.7, 1.9],
+        })
+        self.router = QueryRouter(PokemonRetriever(self.sample_data))
+
+    def test_classify(self):
+        # Intents are recognized without touching any index
+        self.assertEqual(classify("What is the highest DPS Pokémon?")[0], INTENT_HIGHEST_DPS)
+        self.assertEqual(
+            classify("top 3 fire attackers"),
+            (INTENT_RANKING, (3, {'pokemon_type': 'fire'}, 'TOTAL_DPS'))
+        )
+        self.assertEqual(
+            classify("best dragon fast move")[1], (5, {'fast_move_type': 'dragon'}, 'FAST_DPS')
+        )
+        self.assertEqual(classify("What are Charizard's moves?")[0], INTENT_MOVES)
+        self.assertEqual(classify("Does Charizard learn Dragon Claw?")[0], INTENT_FREE_TEXT)
+
+    def test_free_text_uses_bm25_within_named_pokemon(self):
+        # A named Pokémon narrows lexical search to its own rows
+        intent, context = self.router.route("Does Charizard learn dragon claw?")
+
+        self.assertEqual(intent, INTENT_FREE_TEXT)
+        self.assertIn("Charizard: Dragon Breath (Dragon) / Dragon Claw (Dragon)", context)
+        self.assertNotIn("Blastoise", context)
+
+    def test_free_text_lexical_across_dataset(self):
+        # Without a name, BM25 searches every row
+        _, context = self.router.route("Who knows hydro cannon?")
+
+        self.assertIn("Blastoise", context)
+
+    def test_free_text_falls_back_to_semantic(self):
+        # Questions BM25 cannot match use semantic search when enabled
+        retriever = MagicMock()
+        retriever.retrieve_lexical.return_value = pd.DataFrame()
+        retriever.retrieve_similar.return_value = [(0.5, 'Charizard', 'Charizard. Type: Fire.')]
+
+        _, context = QueryRouter(retriever).route("what is a good raid attacker?")
+
+        self.assertIn("Charizard. Type: Fire.", context)
+        retriever.retrieve_top_dps.assert_not_called()
+
+    def test_structured_intents_skip_lexical_search(self):
+        # Ranking questions never hit the BM25 or semantic engines
+        retriever = MagicMock(wraps=self.router.retriever)
+        _, context = QueryRouter(retriever).route("top 1 fire")
+
+        self.assertIn("1. Charizard (Fire Spin / Blast Burn): DPS 46.06, cycle DPS 15.27", context)
+        retriever.retrieve_lexical.assert_not_called()
+        retriever.retrieve_similar.assert_not_called()
+
+    def test_move_rankings_sort_by_move_dps(self):
+        # "best fast move" ranks by fast move DPS, not by total DPS
+        _, by_total = self.router.route("top 3 attackers")
+        _, by_fast = self.router.route("top 3 fast moves")
+
+        self.assertIn("1. Blastoise (Water Gun / Hydro Cannon): DPS 52.11", by_total)
+        self.assertTrue(by_fast.startswith("Top Pokémon by fast move DPS:"))
+        self.assertIn("1. Charizard (Fire Spin / Blast Burn): fast move DPS 12.73", by_fast)
+        self.assertIn("3. Blastoise (Water Gun / Hydro Cannon): fast move DPS 10.00", by_fast)
+        self.assertEqual(classify("best water charge move")[1],
+                         (5, {'charged_move_type': 'water'}, 'CHARGE_DPS'))
+
+    def test_counters(self):
+        # Counter questions rank by cycle DPS against the named Pokémon's types
+        intent, context = self.router.route("What counters Charizard?")
+
+        self.assertEqual(intent, INTENT_COUNTERS)
+        self.assertIn("Best counters against Charizard (Fire/Flying)", context)
+        self.assertIn("1. Blastoise (Water Gun / Hydro Cannon)", context)
+
+        # A type mentioned as a type wins over names
+        _, context = self.router.route("Who beats dragon types?")
+        self.assertIn("Best counters against Dragon", context)
+        self.assertIn("1. Charizard (Dragon Breath / Dragon Claw)", context)
+
+        # Without a defender, the question is classified as if it had no counter words
+        self.assertEqual(self.router.route("top 3 against whatever")[0], INTENT_RANKING)
+
+    def test_teams(self):
+        # Team questions use the team search; a named defender makes it a counter question
+        self.assertEqual(classify("What is the best great league team?"), (INTENT_TEAMS, (3, None)))
+        self.assertEqual(classify("top 2 water teams"), (INTENT_TEAMS, (2, 'water')))
+        self.assertEqual(self.router.route("best team against Charizard")[0], INTENT_COUNTERS)
+
+        retriever = MagicMock()
+        retriever.retrieve_teams.return_value = [{
+            'SCORE': 2.5, 'MEMBERS': self.sample_data.iloc[[0, 2]],
+            'COVERAGE': ['Grass'], 'RESISTS': ['Fire', 'Water'], 'SHARED_WEAKNESSES': [],
+        }]
+        intent, context = QueryRouter(retriever).route("best pvp team?")
+
+        self.assertEqual(intent, INTENT_TEAMS)
+        retriever.retrieve_teams.assert_called_once_with(3, None)
+        self.assertIn("1. Charizard (Fire Spin / Blast Burn), Blastoise (Water Gun / Hydro "
+                      "Cannon): score 2.50; super effective against 1/18 types, resists 2/18, "
+                      "shared weaknesses: none", context)
+        # Two species are not enough for a team
+        self.assertIn("couldn't build a team", self.router.route("best team")[1])
+
+    def test_route_many_shares_lookups(self):
+        # Questions needing the same lookup run it once, results stay in order
+        retriever = MagicMock()
+        retriever.retrieve_highest_dps.return_value = {'NAME': 'Mewtwo', 'TOTAL_DPS': 30.5}
+        retriever.resolve_name.return_value = 'Charizard'
+        router = QueryRouter(retriever)
+
+        routed = router.route_many([
+            "What is the highest DPS Pokémon?",
+            "Which has the highest DPS?",
+            "What are Charizard's moves?",
+            "Charizard moves please",
+        ])
+
+        self.assertEqual([intent for intent, _ in routed],
+                         [INTENT_HIGHEST_DPS, INTENT_HIGHEST_DPS, INTENT_MOVES, INTENT_MOVES])
+        self.assertEqual(routed[0], routed[1])
+        retriever.retrieve_highest_dps.assert_called_once()
+        retriever.retrieve_by_name.assert_called_once_with('Charizard', exact=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,18 @@
 import unittest
 from unittest.mock import patch, MagicMock
+import pandas as pd
 from llm_pokemon_app.src.models.rag_model import RAGModel
 from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
 
 
 class TestRAGModel(unittest.TestCase):
 
+    def setUp(self):
+        # Start every test without cached clients or model weights
+        REGISTRY.clear()
+
     @patch('llm_pokemon_app.src.models.rag_model.OpenAI')
     def test_get_response_success(self, mock_openai):
         # Mock the retriever
@@ -64,6 +71,82 @@ class TestRAGModel(unittest.TestCase):
         # Assert that the response is correct
         self.assertEqual(response, "Charizard has powerful fire-type moves.")
 
+    @patch('llm_pokemon_app.src.models.rag_model.OpenAI')
+    def test_retrieve_context_ranking(self, mock_openai):
+        # Ranking questions are answered from the filtered DPS index
+        data = pd.DataFrame({
+            'NAME': ['Charmander', 'Charizard', 'Squirtle'],
+            'TYPE_ONE': ['Fire', 'Fire', 'Water'],
+            'TYPE_TWO': [None, 'Flying', None],
+            'FAST_MOVE': ['Ember', 'Fire Spin', 'Bubble'],
+            'FAST_MOVE_TYPE': ['Fire', 'Fire', 'Water'],
+            'FAST_MOVE_POWER': [10, 14, 12],
+            'FAST_MOVE_DURATION': [1.0, 1.1, 1.2],
+            'CHARGE_MOVE': ['Flamethrower', 'Blast Burn', 'Aqua Tail'],
+            'CHARGED_MOVE_TYPE': ['Fire', 'Fire', 'Water'],
+            'CHARGE_MOVE_POWER': [70, 110, 50],
+            'CHARGE_MOVE_DURATION': [2.2, 3.3, 1.9],
+        })
+        model = RAGModel(api_key="fake_api_key", retriever=PokemonRetriever(data))
+
+        context = model.retrieve_context("Who are the top 1 Fire attackers?")
+        self.assertIn("1. Charizard", context)
+        self.assertNotIn("Charmander", context)
+
+        context = model.retrieve_context("What is the best water fast move?")
+        self.assertIn("Squirtle", context)
+
+    @patch('llm_pokemon_app.src.models.rag_model.OpenAI')
+    def test_retrieve_context_moves_with_typo(self, mock_openai):
+        # Misspelled names anywhere in the question still find the moves
+        data = pd.DataFrame({
+            'NAME': ['Charizard', 'Garchomp'],
+            'FAST_MOVE': ['Fire Spin', 'Dragon Tail'],
+            'FAST_MOVE_TYPE': ['Fire', 'Dragon'],
+            'FAST_MOVE_POWER': [14, 15],
+            'FAST_MOVE_DURATION': [1.1, 1.1],
+            'CHARGE_MOVE': ['Blast Burn', 'Outrage'],
+            'CHARGED_MOVE_TYPE': ['Fire', 'Dragon'],
+            'CHARGE_MOVE_POWER': [110, 110],
+            'CHARGE_MOVE_DURATION': [3.3, 3.9],
+        })
+        model = RAGModel(api_key="fake_api_key", retriever=PokemonRetriever(data))
+
+        context = model.retrieve_context("What moves does garchmop have?")
+        self.assertIn("Garchomp's moves: Dragon Tail", context)
+
+    @patch('llm_pokemon_app.src.models.rag_model.OpenAI')
+    def test_cache_keyed_on_context(self, mock_openai):
+        # A repeated question is cached until the retrieved context changes
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve_highest_dps.return_value = {'NAME': 'Mewtwo', 'TOTAL_DPS': 30.5}
+        create = mock_openai.return_value.chat.completions.create
+        create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Mewtwo."))]
+        )
+        model = RAGModel(api_key="fake_api_key", retriever=mock_retriever, cache=ResponseCache())
+
+        model.get_response("What is the highest DPS Pokémon?")
+        model.get_response("What is the highest DPS Pokémon?")
+        self.assertEqual(create.call_count, 1)
+
+        mock_retriever.retrieve_highest_dps.return_value = {'NAME': 'Rayquaza', 'TOTAL_DPS': 31}
+        model.get_response("What is the highest DPS Pokémon?")
+        self.assertEqual(create.call_count, 2)
+
+    @patch('llm_pokemon_app.src.models.rag_model.OpenAI')
+    def test_stream_response_includes_context(self, mock_openai):
+        mock_retriever = MagicMock()
+        mock_retriever.retrieve_highest_dps.return_value = {'NAME': 'Mewtwo', 'TOTAL_DPS': 30.5}
+        create = mock_openai.return_value.chat.completions.create
+        create.return_value = iter([
+            MagicMock(choices=[MagicMock(delta=MagicMock(content="Mewtwo."))]),
+        ])
+        model = RAGModel(api_key="fake_api_key", retriever=mock_retriever)
+
+        self.assertEqual(list(model.stream_response("What is the highest DPS Pokémon?")),
+                         ["Mewtwo."])
+        self.assertIn("Mewtwo", create.call_args.kwargs["messages"][0]["content"])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,66 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+from llm_pokemon_app.src.utils.resource_registry import ResourceRegistry, api_key_digest
+
+
+class TestResourceRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = ResourceRegistry()
+
+    def test_get_or_create_caches(self):
+        # The factory runs only on the first request for a key
+        factory = MagicMock(return_value="resource")
+
+        self.assertEqual(self.registry.get_or_create("key", factory), "resource")
+        self.assertEqual(self.registry.get_or_create("key", factory), "resource")
+        factory.assert_called_once()
+        self.assertIn("key", self.registry)
+
+    def test_invalidate_rebuilds(self):
+        # Invalidated resources are rebuilt on the next request
+        factory = MagicMock(side_effect=["first", "second"])
+        self.registry.get_or_create("key", factory)
+
+        self.assertTrue(self.registry.invalidate("key"))
+        self.assertFalse(self.registry.invalidate("key"))
+        self.assertEqual(self.registry.get_or_create("key", factory), "second")
+
+        self.registry.clear()
+        self.assertNotIn("key", self.registry)
+
+    def test_concurrent_callers_create_once(self):
+        # Threads racing on the same key share one slow factory call
+        calls = []
+
+        def slow_factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                self.registry.get_or_create("model", slow_factory)
+            ))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_api_key_digest(self):
+        # Digests are stable, distinct per key, and do not contain the key
+        self.assertEqual(api_key_digest("secret"), api_key_digest("secret"))
+        self.assertNotEqual(api_key_digest("secret"), api_key_digest("other"))
+        self.assertNotIn("secret", api_key_digest("secret"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from llm_pokemon_app.src.resources import (
+    SHARED_DATASET_ENV, build_retriever, vector_index_path,
+)
+
+DATASET = (
+    "NAME,TYPE_ONE,FAST_MOVE,FAST_MOVE_POWER,FAST_MOVE_DURATION,"
+    "CHARGE_MOVE,CHARGE_MOVE_POWER,CHARGE_MOVE_DURATION\n"
+    "Mewtwo,Psychic,Confusion,20,1.6,Psystrike,90,2.3\n"
+    "Pidgey,Normal,Tackle,5,0.5,Twister,45,2.8\n"
+)
+
+
+class TestBuildRetriever(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.dataset = os.path.join(self.directory.name, "pokemon.csv")
+        with open(self.dataset, "w", encoding="utf-8") as handle:
+            handle.write(DATASET)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_semantic_index_persisted_next_to_snapshot(self):
+        # Every entry point shares the index persisted for the dataset, built on first use
+        with patch.dict(os.environ, {}, clear=True):
+            retriever = build_retriever(self.dataset)
+        self.assertIsNone(retriever.vector_index)
+        self.assertFalse(os.path.isdir(vector_index_path(self.dataset)))
+
+        self.assertEqual(retriever.retrieve_similar("Mewtwo", 1)[0][1], "Mewtwo")
+        self.assertTrue(os.path.isdir(vector_index_path(self.dataset)))
+
+    def test_shared_dataset(self):
+        # With the shared dataset variable set, the snapshot is memory-mapped
+        with patch.dict(os.environ, {SHARED_DATASET_ENV: "1"}):
+            retriever = build_retriever(self.dataset)
+
+        self.assertEqual(list(retriever.data["NAME"]), ["Mewtwo", "Pidgey"])
+
+    def test_unsupported_file_type(self):
+        path = os.path.join(self.directory.name, "pokemon.txt")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write("NAME\nMew\n")
+
+        with self.assertRaisesRegex(ValueError, "Unsupported dataset file type"):
+            build_retriever(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from llm_pokemon_app.src.utils.response_cache import (
+    PURGE_INTERVAL_S, ResponseCache, normalize_prompt,
+)
+
+
+class FakeClock:
+    """A manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(max_entries=2, ttl_seconds=60, clock=self.clock)
+
+    def test_normalize_prompt(self):
+        # Case, whitespace and trailing punctuation do not change the key
+        self.assertEqual(normalize_prompt("  What is  Mewtwo's DPS? "), "what is mewtwo's dps")
+        self.assertEqual(
+            ResponseCache.make_key("m", "Best fire type?"),
+            ResponseCache.make_key("m", "best   fire type"),
+        )
+
+    def test_key_depends_on_model_context_and_params(self):
+        key = ResponseCache.make_key("m", "q", "ctx", temperature=0.7)
+        self.assertNotEqual(key, ResponseCache.make_key("other", "q", "ctx", temperature=0.7))
+        self.assertNotEqual(key, ResponseCache.make_key("m", "q", "new ctx", temperature=0.7))
+        self.assertNotEqual(key, ResponseCache.make_key("m", "q", "ctx", temperature=0.0))
+
+    def test_get_or_compute_and_stats(self):
+        compute = MagicMock(return_value="answer")
+
+        self.assertEqual(self.cache.get_or_compute("k", compute), "answer")
+        self.assertEqual(self.cache.get_or_compute("k", compute), "answer")
+        compute.assert_called_once()
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_failures_are_not_cached(self):
+        compute = MagicMock(side_effect=[RuntimeError("boom"), "answer"])
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_compute("k", compute)
+        self.assertEqual(self.cache.get_or_compute("k", compute), "answer")
+
+    def test_ttl_expiry(self):
+        self.cache.set("k", "answer")
+        self.clock.now += 59
+        self.assertEqual(self.cache.get("k"), "answer")
+        self.clock.now += 2
+        self.assertIsNone(self.cache.get("k"))
+
+    def test_lru_eviction(self):
+        self.cache.set("a", "1")
+        self.cache.set("b", "2")
+        self.cache.get("a")  # "b" is now least recently used
+        self.cache.set("c", "3")
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), "1")
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_sqlite_tier_survives_restart(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "responses.sqlite")
+            ResponseCache(sqlite_path=path, clock=self.clock).set("k", "answer")
+
+            restarted = ResponseCache(sqlite_path=path, clock=self.clock)
+            self.assertEqual(restarted.get("k"), "answer")
+            self.assertEqual(restarted.get("k"), "answer")
+            stats = restarted.stats()
+            self.assertEqual((stats["disk_hits"], stats["memory_hits"]), (1, 1))
+
+            restarted.clear()
+            self.assertIsNone(restarted.get("k"))
+
+
+    def test_sqlite_tier_deletes_expired_rows(self):
+        # Expired rows are removed on read, by the periodic purge and on open
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "responses.sqlite")
+            cache = ResponseCache(ttl_seconds=60, sqlite_path=path, clock=self.clock)
+
+            def keys():
+                return [row[0] for row in cache._database.execute(  # pylint: disable=protected-access
+                    "SELECT key FROM responses ORDER BY key").fetchall()]
+
+            cache.set("a", "first")
+            cache.set("b", "second")
+            self.clock.now += 61
+            cache.set("c", "third")
+            # Writes between purges do not scan for expired rows
+            self.assertEqual(keys(), ["a", "b", "c"])
+
+            cache._entries.clear()  # pylint: disable=protected-access
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(keys(), ["b", "c"])
+
+            self.clock.now += PURGE_INTERVAL_S
+            cache.set("d", "fourth")
+            self.assertEqual(keys(), ["d"])
+
+            self.clock.now += PURGE_INTERVAL_S
+            reopened = ResponseCache(sqlite_path=path, clock=self.clock)
+            count = reopened._database.execute(  # pylint: disable=protected-access
+                "SELECT COUNT(*) FROM responses").fetchone()[0]
+            self.assertEqual(count, 0)
+
+    def test_async_sqlite_tier_runs_off_the_event_loop(self):
+        # With a SQLite tier, aget_or_compute reads and writes in a worker thread
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(sqlite_path=os.path.join(directory, "responses.sqlite"))
+            threads = []
+            original_get = cache.get
+
+            def get(key):
+                threads.append(threading.current_thread())
+                return original_get(key)
+
+            async def compute():
+                return "answer"
+
+            with patch.object(cache, "get", side_effect=get):
+                value = asyncio.run(cache.aget_or_compute("k", compute))
+
+            self.assertEqual(value, "answer")
+            self.assertIsNot(threads[0], threading.main_thread())
+            self.assertEqual(ResponseCache(
+                sqlite_path=os.path.join(directory, "responses.sqlite")).get("k"), "answer")
+
+if __name__ == '__main__':
+    unittest.main()
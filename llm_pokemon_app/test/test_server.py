@@ -0,0 +1,221 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import httpx
+from fastapi.testclient import TestClient
+from sse_starlette.sse import AppStatus
+from llm_pokemon_app.src.server import ServerSettings, create_app
+from llm_pokemon_app.src.utils.resource_registry import REGISTRY
+
+DATASET = (
+    "NAME,TYPE_ONE,FAST_MOVE,FAST_MOVE_POWER,FAST_MOVE_DURATION,"
+    "CHARGE_MOVE,CHARGE_MOVE_POWER,CHARGE_MOVE_DURATION\n"
+    "Mewtwo,Psychic,Confusion,20,1.6,Psystrike,90,2.3\n"
+    "Pidgey,Normal,Tackle,5,0.5,Twister,45,2.8\n"
+)
+
+
+class SlowModel:
+    """Answers after a delay, holding its admission slot meanwhile."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    async def aget_response(self, prompt):
+        await asyncio.sleep(self.delay)
+        return prompt
+
+
+class FailingModel:
+    """Reports an upstream failure the way the backends do."""
+
+    async def aget_response(self, prompt):
+        return "Error: rate limit exceeded"
+
+
+class HangingModel:
+    """Streams its first chunk only after a delay."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def stream_response(self, prompt):
+        time.sleep(self.delay)
+        yield prompt
+
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        REGISTRY.clear()
+        # sse-starlette binds its shutdown event to the first event loop that streams
+        AppStatus.should_exit_event = None
+        self.directory = tempfile.TemporaryDirectory()
+        self.dataset = os.path.join(self.directory.name, "pokemon.csv")
+        with open(self.dataset, "w", encoding="utf-8") as handle:
+            handle.write(DATASET)
+
+    def tearDown(self):
+        REGISTRY.clear()
+        self.directory.cleanup()
+
+    def app(self, **settings):
+        return create_app(ServerSettings(self.dataset, **settings))
+
+    def test_warm_state_retrieve_and_ask(self):
+        # The preloaded stub answers through the retriever built at startup
+        with TestClient(self.app(preload=("stub",))) as client:
+            self.assertEqual(client.get("/health").json()["status"], "ok")
+            loaded = {entry["name"]: entry["loaded"] for entry in client.get("/v1/backends").json()}
+            self.assertTrue(loaded["stub"])
+            self.assertFalse(loaded["rag"])
+
+            retrieved = client.post("/v1/retrieve",
+                                    json={"question": "What is the highest DPS Pokémon?"})
+            answer = client.post("/v1/ask", json={"question": "What is the highest DPS Pokémon?",
+                                                  "model": "stub"})
+
+        self.assertEqual(retrieved.status_code, 200)
+        self.assertIn("Mewtwo", retrieved.json()["context"])
+        self.assertEqual(answer.status_code, 200)
+        self.assertIn("Mewtwo", answer.json()["answer"])
+
+    def test_unknown_and_unconfigured_backends(self):
+        with patch.dict(os.environ, {}, clear=True), TestClient(self.app()) as client:
+            unknown = client.post("/v1/ask", json={"question": "hi", "model": "nope"})
+            missing_key = client.post("/v1/ask", json={"question": "hi", "model": "openai"})
+
+        self.assertEqual(unknown.status_code, 404)
+        self.assertEqual(missing_key.status_code, 503)
+        self.assertIn("OPENAI_API_KEY", missing_key.json()["detail"])
+
+    def test_backend_error_is_bad_gateway(self):
+        # A backend's "Error: ..." answer is a 502, not a 200 with the error as answer
+        app = self.app()
+        with TestClient(app) as client, \
+                patch.object(app.state.server, "model", return_value=FailingModel()):
+            response = client.post("/v1/ask", json={"question": "hi", "model": "stub"})
+
+        self.assertEqual(response.status_code, 502)
+        self.assertIn("rate limit", response.json()["detail"])
+
+    def test_stream_events(self):
+        with TestClient(self.app()) as client:
+            response = client.post("/v1/ask/stream",
+                                   json={"question": "What is the highest DPS Pokémon?",
+                                         "model": "stub"})
+
+        self.assertEqual(response.status_code, 200)
+        events = [line[len("event: "):] for line in response.text.splitlines()
+                  if line.startswith("event: ")]
+        self.assertGreater(events.count("token"), 1)
+        self.assertEqual(events[-1], "done")
+        self.assertIn("Mewtwo", response.text)
+
+    def test_stream_deadline_before_first_token(self):
+        # A backend that hangs before its first chunk still gets the timeout
+        app = self.app(timeout_s=0.2)
+        state = app.state.server
+        with TestClient(app) as client, \
+                patch.object(state, "model", return_value=HangingModel(1.0)):
+            started = time.monotonic()
+            response = client.post("/v1/ask/stream", json={"question": "hi", "model": "stub"})
+            elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.8)
+        self.assertIn("event: error", response.text)
+        self.assertNotIn("event: token", response.text)
+        self.assertEqual(state.queue.admitted, 0)
+
+    def test_stream_slot_released_on_disconnect(self):
+        # A client gone before the first event does not keep its admission slot
+        app = self.app(max_concurrency=1, max_queue=0)
+        state = app.state.server
+        messages = [{"type": "http.request", "more_body": False,
+                     "body": json.dumps({"question": "hi", "model": "stub"}).encode()}]
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await asyncio.sleep(3600)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                raise OSError("connection reset")
+
+        async def run():
+            scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+                     "method": "POST", "scheme": "http", "path": "/v1/ask/stream",
+                     "raw_path": b"/v1/ask/stream", "query_string": b"", "root_path": "",
+                     "headers": [(b"content-type", b"application/json")],
+                     "client": ("test", 1), "server": ("test", 80)}
+            with patch.object(state, "model", return_value=HangingModel(0.0)):
+                with self.assertRaises(Exception):
+                    await app(scope, receive, send)
+            return state.queue.admitted
+
+        self.assertEqual(asyncio.run(run()), 0)
+
+    def test_backpressure_and_timeout(self):
+        # One slot and one queued request: the third concurrent request gets 429
+        app = self.app(max_concurrency=1, max_queue=1, timeout_s=0.5)
+        state = app.state.server
+
+        async def run(delay, count):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                with patch.object(state, "model", return_value=SlowModel(delay)):
+                    return await asyncio.gather(*(
+                        client.post("/v1/ask", json={"question": str(n), "model": "stub"})
+                        for n in range(count)
+                    ))
+
+        responses = asyncio.run(run(0.1, 3))
+        statuses = sorted(response.status_code for response in responses)
+        self.assertEqual(statuses, [200, 200, 429])
+        rejected = next(response for response in responses if response.status_code == 429)
+        self.assertEqual(rejected.headers["Retry-After"], "1")
+
+        (slow,) = asyncio.run(run(2.0, 1))
+        self.assertEqual(slow.status_code, 504)
+        self.assertEqual(state.queue.admitted, 0)
+
+    def test_dataset_reload(self):
+        # A rewritten dataset file is patched into the running worker
+        with TestClient(self.app(reload_interval_s=0.01)) as client:
+            self.assertEqual(client.get("/health").json()["dataset"]["version"], 0)
+            stat = os.stat(self.dataset)
+            with open(self.dataset, "w", encoding="utf-8") as handle:
+                handle.write(DATASET.replace("Pidgey,Normal,Tackle,5,0.5,Twister,45,2.8",
+                                             "Rayquaza,Dragon,Dragon Tail,15,1.1,Outrage,110,1.0"))
+            os.utime(self.dataset, ns=(stat.st_mtime_ns + 10**9, stat.st_mtime_ns + 10**9))
+            for _ in range(500):
+                dataset = client.get("/health").json()["dataset"]
+                if dataset["version"]:
+                    break
+                time.sleep(0.01)
+            retrieved = client.post("/v1/retrieve",
+                                    json={"question": "What is the highest DPS Pokémon?"})
+
+        self.assertEqual(dataset["version"], 1)
+        self.assertEqual(dataset["last_reload"]["mode"], "patch")
+        self.assertEqual(dataset["last_reload"]["inserted"], 1)
+        self.assertIn("Rayquaza", retrieved.json()["context"])
+
+    def test_settings_round_trip_through_environment(self):
+        settings = ServerSettings("data.csv", 4, 8, 2.5, ("stub", "rag"), 1.5)
+
+        restored = ServerSettings.from_env(settings.to_env())
+
+        self.assertEqual(vars(restored), vars(settings))
+        self.assertEqual(json.loads(json.dumps(settings.to_env()))["POKEMON_SERVER_PRELOAD"],
+                         "stub,rag")
+
+
+if __name__ == '__main__':
+    unittest.main()
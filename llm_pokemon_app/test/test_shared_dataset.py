@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+import pyarrow as pa
+from llm_pokemon_app.src.data.pokemon_data_loader import PokemonDataLoader
+from llm_pokemon_app.src.data.shared_dataset import SharedDataset
+from llm_pokemon_app.src.utils.langchain_helpers import PokemonRetriever
+
+
+class TestSharedDataset(unittest.TestCase):
+
+    def setUp(self):
+        # Write a small dataset to a temporary CSV
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.directory.name, "pokemon.csv")
+        self.sample_data = pd.DataFrame({
+            'NAME': ['Bulbasaur', 'Charmander', 'Charizard'],
+            'TYPE_ONE': ['Grass', 'Fire', 'Fire'],
+            'FAST_MOVE_POWER': [7.0, 9.0, 10.0],
+            'FAST_MOVE_DURATION': [1.0, 0.8, 0.7],
+            'CHARGE_MOVE_POWER': [50.0, 70.0, 100.0],
+            'CHARGE_MOVE_DURATION': [2.5, 2.3, 2.0],
+        })
+        self.sample_data.to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_attach_maps_without_copying(self):
+        # The first attach publishes the snapshot; later attaches only map it
+        SharedDataset(self.csv_path).attach()
+        allocated = pa.total_allocated_bytes()
+        data = SharedDataset(self.csv_path).attach()
+
+        self.assertEqual(pa.total_allocated_bytes(), allocated)
+        self.assertEqual(list(data['NAME']), ['Bulbasaur', 'Charmander', 'Charizard'])
+
+    def test_attach_index_builds_once(self):
+        # The index is computed by the first worker and mapped read-only afterwards
+        build = MagicMock(return_value={'TOTAL_DPS': pd.Series([1.0, 2.0, 3.0]).to_numpy()})
+        first = SharedDataset(self.csv_path).attach_index(build)
+        second = SharedDataset(self.csv_path).attach_index(build)
+
+        build.assert_called_once()
+        self.assertEqual(list(second['TOTAL_DPS']), list(first['TOTAL_DPS']))
+        self.assertFalse(second['TOTAL_DPS'].flags.writeable)
+
+    def test_retriever_from_shared_matches_in_memory(self):
+        # A retriever over the shared snapshot answers like an in-memory one
+        shared = PokemonRetriever.from_shared(self.csv_path)
+        local = PokemonRetriever(PokemonDataLoader.apply_schema(self.sample_data))
+
+        self.assertEqual(shared.retrieve_highest_dps()['NAME'], 'Charizard')
+        self.assertAlmostEqual(
+            shared.retrieve_highest_dps()['TOTAL_DPS'], local.retrieve_highest_dps()['TOTAL_DPS']
+        )
+        self.assertEqual(
+            list(shared.retrieve_top_dps(5, pokemon_type='fire')['NAME']),
+            ['Charizard', 'Charmander'],
+        )
+        self.assertEqual(len(shared.retrieve_by_name('char')), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import MagicMock
+from llm_pokemon_app.src.utils.response_cache import ResponseCache
+from llm_pokemon_app.src.utils.streaming import TimedStream, stream_completion
+
+
+def chunk(content):
+    return MagicMock(choices=[MagicMock(delta=MagicMock(content=content))])
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_timed_stream_records_first_token(self):
+        ticks = iter([0.0, 0.25, 1.0])
+        timed = TimedStream(iter(["", "Mew", "two"]), clock=lambda: next(ticks))
+
+        self.assertEqual(list(timed), ["", "Mew", "two"])
+        self.assertEqual(timed.first_token_ms, 250.0)
+        self.assertEqual(timed.total_ms, 1000.0)
+        self.assertEqual(timed.text, "Mewtwo")
+
+    def test_timed_stream_empty(self):
+        timed = TimedStream(iter([]))
+        self.assertEqual(list(timed), [])
+        self.assertIsNone(timed.first_token_ms)
+
+    def test_stream_completion_caches_full_text(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value = iter([chunk("a"), chunk(None), chunk("b")])
+        cache = ResponseCache()
+
+        self.assertEqual(list(stream_completion(client, {"model": "m"}, cache, "key")), ["a", "b"])
+        client.chat.completions.create.assert_called_once_with(model="m", stream=True)
+        self.assertEqual(cache.get("key"), "ab")
+
+    def test_abandoned_stream_is_not_cached(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value = iter([chunk("a"), chunk("b")])
+        cache = ResponseCache()
+
+        stream = stream_completion(client, {}, cache, "key")
+        next(stream)
+        stream.close()
+        self.assertIsNone(cache.get("key"))
+
+
+if __name__ == '__main__':
+    unittest.main()
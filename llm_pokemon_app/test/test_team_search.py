@@ -0,0 +1,106 @@
+import itertools
+import unittest
+import numpy as np
+import pandas as pd
+from llm_pokemon_app.src.utils.team_search import (
+    SCORE_WEIGHTS, TeamSearch, mask_types, type_masks,
+)
+from llm_pokemon_app.src.utils.matchups import TYPES
+
+
+def code(name):
+    return TYPES.index(name)
+
+
+class TestTeamSearch(unittest.TestCase):
+
+    def setUp(self):
+        # Twelve species with varied typings, two movesets for Charizard and a Shadow form
+        species = [
+            ('Charizard', 'Fire', 'Flying', 'Fire', 'Dragon'),
+            ('Blastoise', 'Water', None, 'Water', 'Ice'),
+            ('Venusaur', 'Grass', 'Poison', 'Grass', 'Grass'),
+            ('Raichu', 'Electric', None, 'Electric', 'Electric'),
+            ('Machamp', 'Fighting', None, 'Fighting', 'Rock'),
+            ('Gengar', 'Ghost', 'Poison', 'Ghost', 'Fighting'),
+            ('Dragonite', 'Dragon', 'Flying', 'Dragon', 'Normal'),
+            ('Metagross', 'Steel', 'Psychic', 'Steel', 'Ground'),
+            ('Tyranitar', 'Rock', 'Dark', 'Dark', 'Rock'),
+            ('Gardevoir', 'Psychic', 'Fairy', 'Psychic', 'Fairy'),
+            ('Mamoswine', 'Ice', 'Ground', 'Ice', 'Ground'),
+            ('Scizor', 'Bug', 'Steel', 'Bug', 'Bug'),
+            ('Shadow Machamp', 'Fighting', None, 'Fighting', 'Rock'),
+            ('Charizard', 'Fire', 'Flying', 'Fire', 'Fire'),
+        ]
+        self.data = pd.DataFrame(species, columns=[
+            'NAME', 'TYPE_ONE', 'TYPE_TWO', 'FAST_MOVE_TYPE', 'CHARGED_MOVE_TYPE',
+        ]).assign(FAST_MOVE=[f'Fast {n}' for n in range(14)],
+                  CHARGE_MOVE=[f'Charge {n}' for n in range(14)])
+        self.cycle_dps = np.array(
+            [15.0, 14.0, 13.5, 13.0, 12.5, 12.0, 11.5, 11.0, 10.5, 10.0, 9.5, 9.0, 20.0, 16.0]
+        )
+        self.search = TeamSearch(self.data, self.cycle_dps)
+
+    def brute_force(self, top_n):
+        positions = self.search.candidates()
+        arrays = self.search.arrays(positions)
+        scores = []
+        for team in itertools.combinations(range(len(positions)), 3):
+            cover = resist = weak = shared = 0
+            for member in team:
+                shared |= weak & int(arrays['weak'][member])
+                cover |= int(arrays['cover'][member])
+                resist |= int(arrays['resist'][member])
+                weak |= int(arrays['weak'][member])
+            score = (sum(arrays['offense'][member] for member in team)
+                     + (SCORE_WEIGHTS['coverage'] * bin(cover).count('1')
+                        + SCORE_WEIGHTS['resistance'] * bin(resist).count('1')
+                        - SCORE_WEIGHTS['shared_weakness'] * bin(shared).count('1')) / 18)
+            scores.append(round(score, 9))
+        return sorted(scores, reverse=True)[:top_n]
+
+    def test_type_masks(self):
+        cover, resist, weak = type_masks(
+            np.array([code('Dragon')]), np.array([code('Flying')]),
+            np.array([code('Ice')]), np.array([code('Ground')]),
+        )
+
+        self.assertEqual(mask_types(int(cover[0])),
+                         ['Fire', 'Electric', 'Grass', 'Poison', 'Ground', 'Flying', 'Rock',
+                          'Dragon', 'Steel'])
+        self.assertIn('Ground', mask_types(int(resist[0])))
+        self.assertEqual(mask_types(int(weak[0])), ['Ice', 'Rock', 'Dragon', 'Fairy'])
+
+    def test_candidates_are_best_moveset_per_species(self):
+        # Shadow Machamp stands in for Machamp; Charizard keeps its best moveset
+        positions = self.search.candidates()
+
+        self.assertEqual(list(positions[:2]), [12, 13])
+        self.assertNotIn(4, positions)
+        self.assertNotIn(0, positions)
+        self.assertEqual(list(self.search.candidates('dragon')), [6])
+
+    def test_search_matches_exhaustive_scoring(self):
+        teams = self.search.search(top_n=4, workers=1)
+
+        self.assertEqual([round(team['SCORE'], 9) for team in teams], self.brute_force(4))
+        self.assertEqual(len(teams[0]['MEMBERS']), 3)
+        self.assertIn('CYCLE_DPS', teams[0]['MEMBERS'].columns)
+        # Results are cached per query
+        self.assertIs(self.search.search(top_n=4), teams)
+
+    def test_parallel_search_matches_serial(self):
+        serial = TeamSearch(self.data, self.cycle_dps).search(top_n=5, workers=1)
+        parallel = TeamSearch(self.data, self.cycle_dps).search(top_n=5, workers=2)
+
+        self.assertEqual([team['SCORE'] for team in parallel], [team['SCORE'] for team in serial])
+        self.assertEqual([list(team['MEMBERS']['NAME']) for team in parallel],
+                         [list(team['MEMBERS']['NAME']) for team in serial])
+
+    def test_too_few_candidates(self):
+        self.assertEqual(self.search.search(pokemon_type='Dragon'), [])
+        self.assertEqual(self.search.search(top_n=0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from llm_pokemon_app.src.utils.vector_store import (
+    HashingVectorizer, PokemonVectorIndex, build_documents, measure_vector_index
+)
+
+
+class TestVectorStore(unittest.TestCase):
+
+    def setUp(self):
+        # Two movesets per Pokémon, as in the dataset
+        self.sample_data = pd.DataFrame({
+            'NAME': ['Charizard', 'Charizard', 'Blastoise', 'Venusaur', 'Pikachu'],
+            'TYPE_ONE': ['Fire', 'Fire', 'Water', 'Grass', 'Electric'],
+            'TYPE_TWO': ['Flying', 'Flying', None, 'Poison', None],
+            'FAST_MOVE': ['Fire Spin', 'Air Slash', 'Water Gun', 'Vine Whip', 'Thunder Shock'],
+            'FAST_MOVE_TYPE': ['Fire', 'Flying', 'Water', 'Grass', 'Electric'],
+            'CHARGE_MOVE': ['Blast Burn', 'Blast Burn', 'Hydro Cannon', 'Frenzy Plant', 'Wild Charge'],
+            'CHARGED_MOVE_TYPE': ['Fire', 'Fire', 'Water', 'Grass', 'Electric'],
+        })
+        self.index = PokemonVectorIndex.build(
+            self.sample_data, total_dps=np.array([20.0, 25.0, 18.0, 17.0, np.nan])
+        )
+
+    def test_build_documents(self):
+        # One document per Pokémon, listing each move once
+        names, documents = build_documents(
+            self.sample_data, np.array([20.0, 25.0, 18.0, 17.0, np.nan])
+        )
+
+        self.assertEqual(names, ['Charizard', 'Blastoise', 'Venusaur', 'Pikachu'])
+        self.assertEqual(documents[0].count('Blast Burn'), 2)  # charge list and best moveset
+        self.assertIn('Type: Fire/Flying.', documents[0])
+        self.assertIn('Best DPS moveset: Air Slash and Blast Burn (DPS 25.00).', documents[0])
+        self.assertNotIn('Best DPS', documents[3])
+
+    def test_search_by_name_and_moves(self):
+        # Names, misspellings and move descriptions find the right document
+        self.assertEqual(self.index.search("Tell me about Blastoise", 1)[0][1], 'Blastoise')
+        self.assertEqual(self.index.search("what does venusuar do", 1)[0][1], 'Venusaur')
+        self.assertEqual(self.index.search("who knows hydro cannon?", 1)[0][1], 'Blastoise')
+        self.assertEqual(len(self.index.search("anything", 10)), 4)
+
+    def test_vectorizer_is_deterministic(self):
+        # Hashing does not depend on process state
+        first = HashingVectorizer(128).transform(["Charizard Blast Burn"])
+        second = HashingVectorizer(128).transform(["Charizard Blast Burn"])
+
+        np.testing.assert_array_equal(first, second)
+        self.assertAlmostEqual(float(np.linalg.norm(first)), 1.0, places=5)
+
+    def test_save_and_load(self):
+        # A persisted index answers identically after loading
+        with tempfile.TemporaryDirectory() as directory:
+            self.index.save(directory)
+            loaded = PokemonVectorIndex.load(directory)
+
+            self.assertEqual(loaded.search("fire flying", 2), self.index.search("fire flying", 2))
+
+    def test_save_replaces_index_atomically(self):
+        # Saving over an index swaps the whole directory and leaves no temporaries
+        with tempfile.TemporaryDirectory() as parent:
+            directory = os.path.join(parent, 'index.vectors')
+            self.index.save(directory)
+            other = PokemonVectorIndex.build(self.sample_data.iloc[[2]])
+            other.save(directory)
+
+            self.assertEqual(PokemonVectorIndex.load(directory).names, ['Blastoise'])
+            self.assertEqual(os.listdir(parent), ['index.vectors'])
+
+    def test_load_or_build_treats_corrupt_files_as_a_miss(self):
+        # Truncated files are rebuilt instead of failing startup
+        with tempfile.TemporaryDirectory() as directory:
+            self.index.save(directory)
+            for name in ('vectors.npy', 'index.faiss'):
+                if os.path.exists(os.path.join(directory, name)):
+                    with open(os.path.join(directory, name), 'r+b') as handle:
+                        handle.truncate(8)
+
+            loaded = PokemonVectorIndex.load_or_build(
+                self.sample_data, directory, np.array([20.0, 25.0, 18.0, 17.0, np.nan])
+            )
+
+            self.assertEqual(loaded.names, self.index.names)
+            self.assertEqual(PokemonVectorIndex.load(directory).search("fire flying", 2),
+                             self.index.search("fire flying", 2))
+
+    def test_numpy_fallback_matches_faiss(self):
+        # Without FAISS the same neighbours are found with a matrix product
+        with patch('llm_pokemon_app.src.utils.vector_store.faiss', None):
+            fallback = PokemonVectorIndex(
+                self.index.names, self.index.documents, self.index.vectors, self.index.idf
+            )
+
+        self.assertEqual(
+            [name for _, name, _ in fallback.search("electric thunder", 3)],
+            [name for _, name, _ in self.index.search("electric thunder", 3)],
+        )
+
+    def test_measure_vector_index(self):
+        # Latency and recall are reported for a query set
+        metrics = measure_vector_index(
+            self.index, [("Charizard", 'Charizard'), ("Pikachu moves", 'Pikachu')], top_k=1
+        )
+
+        self.assertEqual(metrics['recall_at_k'], 1.0)
+        self.assertGreater(metrics['build_seconds'], 0.0)
+        self.assertGreater(metrics['mean_query_ms'], 0.0)
+
+    def test_patched_matches_fresh_build(self):
+        # Only touched Pokémon are re-embedded; the result matches a rebuild
+        data = pd.concat([
+            self.sample_data.iloc[[0, 2, 3]],
+            pd.DataFrame({'NAME': ['Mewtwo'], 'TYPE_ONE': ['Psychic'], 'TYPE_TWO': [None],
+                          'FAST_MOVE': ['Confusion'], 'FAST_MOVE_TYPE': ['Psychic'],
+                          'CHARGE_MOVE': ['Psystrike'], 'CHARGED_MOVE_TYPE': ['Psychic']}),
+        ], ignore_index=True)
+        total_dps = np.array([20.0, 18.0, 17.0, 30.0])
+
+        patched = self.index.patched(data, total_dps, {'Charizard', 'Pikachu', 'Mewtwo'})
+        fresh = PokemonVectorIndex.build(data, total_dps)
+
+        self.assertEqual(patched.names, fresh.names)
+        self.assertEqual(patched.documents, fresh.documents)
+        np.testing.assert_allclose(patched.vectors, fresh.vectors, atol=1e-6)
+        self.assertEqual(patched.search("psystrike", 1)[0][1], 'Mewtwo')
+        self.assertEqual(len(self.index.names), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()